@@ -119,19 +119,27 @@ class CheckSomethingTemplate:
             for i, x in imports
             if x
             not in [
+                "from concurrent.futures import ProcessPoolExecutor\n",
+                "from concurrent.futures import ThreadPoolExecutor\n",
                 "import base64\n",
+                "import bisect\n",
                 "import black\n",
                 "import collections\n",
+                "import contextvars\n",
                 "import copy\n",
                 "import datetime\n",
                 "import enum\n",
                 "import functools\n",
                 "import hashlib\n",
+                "import importlib\n",
+                "import importlib.util\n",
                 "import io\n",
                 "import itertools\n",
                 "import json\n",
                 "import logging\n",
                 "import math\n",
+                "import mmap\n",
+                "import multiprocessing\n",
                 "import os\n",
                 "import pathlib\n",
                 "import random\n",
@@ -141,6 +149,7 @@ class CheckSomethingTemplate:
                 "import sys\n",
                 "import threading\n",
                 "import typing\n",
+                "import weakref\n",
                 "import zlib\n",
             ]
         ]
@@ -176,6 +185,7 @@ if __name__ == "__main__":
             "slideshow.py",
             "sound_annotation.py",
             "true_type_font.py",
+            "true_type_font_subsetter.py",
             "unsplash.py",
             "usage_statistics.py",
             "validation_visitor.py",
@@ -44,149 +44,350 @@ For more information, please contact borb Software Corp. at this
 address: joris.schellekens.1989@gmail.com
 """
 
+import typing
+
+# fmt: off
+if typing.TYPE_CHECKING:
+    from borb.pdf.color.cmyk_color import CMYKColor
+    from borb.pdf.color.color import Color
+    from borb.pdf.color.color_scheme import ColorScheme
+    from borb.pdf.color.farrow_and_ball_color import FarrowAndBallColor
+    from borb.pdf.color.grayscale_color import GrayscaleColor
+    from borb.pdf.color.hex_color import HexColor
+    from borb.pdf.color.hsv_color import HSVColor
+    from borb.pdf.color.pantone_color import PantoneColor
+    from borb.pdf.color.rgb_color import RGBColor
+    from borb.pdf.color.x11_color import X11Color
+    from borb.pdf.document import Document
+    from borb.pdf.document_layout.a4_portrait import A4Portrait
+    from borb.pdf.document_layout.a4_portrait_invoice import A4PortraitInvoice
+    from borb.pdf.document_layout.a4_portrait_resume import A4PortraitResume
+    from borb.pdf.document_layout.document_layout import DocumentLayout
+    from borb.pdf.document_layout.slideshow import Slideshow
+    from borb.pdf.font.composite_font.composite_font import CompositeFont
+    from borb.pdf.font.font import Font
+    from borb.pdf.font.font_cache import FontCache
+    from borb.pdf.font.simple_font.simple_font import SimpleFont
+    from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
+    from borb.pdf.font.simple_font.true_type.google_true_type_font import GoogleTrueTypeFont
+    from borb.pdf.font.simple_font.true_type.true_type_font import TrueTypeFont
+    from borb.pdf.font.simple_font.type_1_font import Type1Font
+    from borb.pdf.layout_element.annotation.annotation import Annotation
+    from borb.pdf.layout_element.annotation.circle_annotation import CircleAnnotation
+    from borb.pdf.layout_element.annotation.free_text_annotation import FreeTextAnnotation
+    from borb.pdf.layout_element.annotation.highlight_annotation import HighlightAnnotation
+    from borb.pdf.layout_element.annotation.ink_annotation import InkAnnotation
+    from borb.pdf.layout_element.annotation.line_annotation import LineAnnotation
+    from borb.pdf.layout_element.annotation.link_annotation import LinkAnnotation
+    from borb.pdf.layout_element.annotation.polygon_annotation import PolygonAnnotation
+    from borb.pdf.layout_element.annotation.poly_line_annotation import PolyLineAnnotation
+    from borb.pdf.layout_element.annotation.redact_annotation import RedactAnnotation
+    from borb.pdf.layout_element.annotation.remote_go_to_annotation import RemoteGoToAnnotation
+    from borb.pdf.layout_element.annotation.rubber_stamp_annotation import RubberStampAnnotation
+    from borb.pdf.layout_element.annotation.sound_annotation import SoundAnnotation
+    from borb.pdf.layout_element.annotation.square_annotation import SquareAnnotation
+    from borb.pdf.layout_element.annotation.squiggly_annotation import SquigglyAnnotation
+    from borb.pdf.layout_element.annotation.strike_out_annotation import StrikeOutAnnotation
+    from borb.pdf.layout_element.annotation.text_annotation import TextAnnotation
+    from borb.pdf.layout_element.calendar.calendar_view import CalendarView
+    from borb.pdf.layout_element.calendar.day_view import DayView
+    from borb.pdf.layout_element.calendar.week_view import WeekView
+    from borb.pdf.layout_element.form.button import Button
+    from borb.pdf.layout_element.form.check_box import CheckBox
+    from borb.pdf.layout_element.form.country_drop_down_list import CountryDropDownList
+    from borb.pdf.layout_element.form.drop_down_list import DropDownList
+    from borb.pdf.layout_element.form.form_field import FormField
+    from borb.pdf.layout_element.form.gender_drop_down_list import GenderDropDownList
+    from borb.pdf.layout_element.form.javascript_button import JavascriptButton
+    from borb.pdf.layout_element.form.radio_button import RadioButton
+    from borb.pdf.layout_element.form.text_area import TextArea
+    from borb.pdf.layout_element.form.text_box import TextBox
+    from borb.pdf.layout_element.image.avatar import Avatar
+    from borb.pdf.layout_element.image.barcode import Barcode
+    from borb.pdf.layout_element.image.chart import Chart
+    from borb.pdf.layout_element.image.dall_e import DallE
+    from borb.pdf.layout_element.image.emoji import Emoji
+    from borb.pdf.layout_element.image.equation import Equation
+    from borb.pdf.layout_element.image.image import Image
+    from borb.pdf.layout_element.image.qr_code import QRCode
+    from borb.pdf.layout_element.image.screenshot import Screenshot
+    from borb.pdf.layout_element.image.unsplash import Unsplash
+    from borb.pdf.layout_element.image.watermark import Watermark
+    from borb.pdf.layout_element.layout_element import LayoutElement
+    from borb.pdf.layout_element.measurement_cache import MeasurementCache
+    from borb.pdf.layout_element.list.abc_ordered_list import ABCOrderedList
+    from borb.pdf.layout_element.list.list import List
+    from borb.pdf.layout_element.list.ordered_list import OrderedList
+    from borb.pdf.layout_element.list.roman_numeral_ordered_list import RomanNumeralOrderedList
+    from borb.pdf.layout_element.list.unordered_list import UnorderedList
+    from borb.pdf.layout_element.progress_bar.progress_bar import ProgressBar
+    from borb.pdf.layout_element.progress_bar.progress_square import ProgressSquare
+    from borb.pdf.layout_element.shape.horizontal_break import HorizontalBreak
+    from borb.pdf.layout_element.shape.line_art import LineArt
+    from borb.pdf.layout_element.shape.map import Map
+    from borb.pdf.layout_element.shape.map_of_africa import MapOfAfrica
+    from borb.pdf.layout_element.shape.map_of_asia import MapOfAsia
+    from borb.pdf.layout_element.shape.map_of_europe import MapOfEurope
+    from borb.pdf.layout_element.shape.map_of_north_america import MapOfNorthAmerica
+    from borb.pdf.layout_element.shape.map_of_oceania import MapOfOceania
+    from borb.pdf.layout_element.shape.map_of_south_america import MapOfSouthAmerica
+    from borb.pdf.layout_element.shape.map_of_the_contiguous_united_states_of_america import MapOfTheContiguousUnitedStatesOfAmerica
+    from borb.pdf.layout_element.shape.map_of_the_united_states_of_america import MapOfTheUnitedStatesOfAmerica
+    from borb.pdf.layout_element.shape.map_of_the_world import MapOfTheWorld
+    from borb.pdf.layout_element.shape.shape import Shape
+    from borb.pdf.layout_element.smart_art.smart_art import SmartArt
+    from borb.pdf.layout_element.space.space import Space
+    from borb.pdf.layout_element.table.fixed_column_width_table import FixedColumnWidthTable
+    from borb.pdf.layout_element.table.flexible_column_width_table import FlexibleColumnWidthTable
+    from borb.pdf.layout_element.table.table import Table
+    from borb.pdf.layout_element.table.table_util import TableUtil
+    from borb.pdf.layout_element.text.chunk import Chunk
+    from borb.pdf.layout_element.text.code_snippet import CodeSnippet
+    from borb.pdf.layout_element.text.heading import Heading
+    from borb.pdf.layout_element.text.heterogeneous_paragraph import HeterogeneousParagraph
+    from borb.pdf.layout_element.text.homogeneous_paragraph import HomogeneousParagraph
+    from borb.pdf.layout_element.text.markdown_paragraph import MarkdownParagraph
+    from borb.pdf.layout_element.text.paragraph import Paragraph
+    from borb.pdf.license.license import License
+    from borb.pdf.license.usage_statistics import UsageStatistics
+    from borb.pdf.license.version import Version
+    from borb.pdf.lipsum.lipsum import Lipsum
+    from borb.pdf.page import Page
+    from borb.pdf.page_layout.multi_column_layout import MultiColumnLayout
+    from borb.pdf.page_layout.page_layout import PageLayout
+    from borb.pdf.page_layout.single_column_layout import SingleColumnLayout
+    from borb.pdf.page_layout.three_column_layout import ThreeColumnLayout
+    from borb.pdf.page_layout.two_column_layout import TwoColumnLayout
+    from borb.pdf.page_size import PageSize
+    from borb.pdf.table_of_contents import TableOfContents
+    from borb.pdf.toolkit.event import Event
+    from borb.pdf.toolkit.filter.above.above import Above
+    from borb.pdf.toolkit.filter.above.above_image import AboveImage
+    from borb.pdf.toolkit.filter.above.above_text import AboveText
+    from borb.pdf.toolkit.filter.below.below import Below
+    from borb.pdf.toolkit.filter.below.below_image import BelowImage
+    from borb.pdf.toolkit.filter.below.below_text import BelowText
+    from borb.pdf.toolkit.filter.font.by_font import ByFont
+    from borb.pdf.toolkit.filter.font.by_font_color import ByFontColor
+    from borb.pdf.toolkit.filter.font.by_font_size import ByFontSize
+    from borb.pdf.toolkit.filter.inside.inside import Inside
+    from borb.pdf.toolkit.filter.left.left_of import LeftOf
+    from borb.pdf.toolkit.filter.left.left_of_image import LeftOfImage
+    from borb.pdf.toolkit.filter.left.left_of_text import LeftOfText
+    from borb.pdf.toolkit.filter.page.even_pages import EvenPages
+    from borb.pdf.toolkit.filter.page.odd_pages import OddPages
+    from borb.pdf.toolkit.filter.right.right_of import RightOf
+    from borb.pdf.toolkit.filter.right.right_of_image import RightOfImage
+    from borb.pdf.toolkit.filter.right.right_of_text import RightOfText
+    from borb.pdf.toolkit.pipe import Pipe
+    from borb.pdf.toolkit.pipeline import Pipeline
+    from borb.pdf.toolkit.sink.get_colors import GetColors
+    from borb.pdf.toolkit.sink.get_document_as_graphml import GetDocumentAsGraphML
+    from borb.pdf.toolkit.sink.get_events_as_json import GetEventsAsJSON
+    from borb.pdf.toolkit.sink.get_images import GetImages
+    from borb.pdf.toolkit.sink.get_keywords_by_pagewise_tf_idf import GetKeywordsByPagewiseTFIDF
+    from borb.pdf.toolkit.sink.get_regular_expression import GetRegularExpression
+    from borb.pdf.toolkit.sink.get_text import GetText
+    from borb.pdf.toolkit.sink.regex import Regex
+    from borb.pdf.toolkit.sink.sink import Sink
+    from borb.pdf.toolkit.source.operator.source import Source
+    from borb.pdf.visitor.pdf import PDF
+# fmt: on
+
+# The public names of borb.pdf are resolved lazily (on first use), so that importing borb.pdf
+# does not (eagerly) import every module, including those holding large tables of data (e.g. Emoji).
 # fmt: off
-from borb.pdf.color.cmyk_color import CMYKColor
-from borb.pdf.color.color import Color
-from borb.pdf.color.color_scheme import ColorScheme
-from borb.pdf.color.farrow_and_ball_color import FarrowAndBallColor
-from borb.pdf.color.grayscale_color import GrayscaleColor
-from borb.pdf.color.hex_color import HexColor
-from borb.pdf.color.hsv_color import HSVColor
-from borb.pdf.color.pantone_color import PantoneColor
-from borb.pdf.color.rgb_color import RGBColor
-from borb.pdf.color.x11_color import X11Color
-from borb.pdf.document import Document
-from borb.pdf.document_layout.a4_portrait import A4Portrait
-from borb.pdf.document_layout.a4_portrait_invoice import A4PortraitInvoice
-from borb.pdf.document_layout.a4_portrait_resume import A4PortraitResume
-from borb.pdf.document_layout.document_layout import DocumentLayout
-from borb.pdf.document_layout.slideshow import Slideshow
-from borb.pdf.font.composite_font.composite_font import CompositeFont
-from borb.pdf.font.font import Font
-from borb.pdf.font.simple_font.simple_font import SimpleFont
-from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
-from borb.pdf.font.simple_font.true_type.google_true_type_font import GoogleTrueTypeFont
-from borb.pdf.font.simple_font.true_type.true_type_font import TrueTypeFont
-from borb.pdf.font.simple_font.type_1_font import Type1Font
-from borb.pdf.layout_element.annotation.annotation import Annotation
-from borb.pdf.layout_element.annotation.circle_annotation import CircleAnnotation
-from borb.pdf.layout_element.annotation.free_text_annotation import FreeTextAnnotation
-from borb.pdf.layout_element.annotation.highlight_annotation import HighlightAnnotation
-from borb.pdf.layout_element.annotation.ink_annotation import InkAnnotation
-from borb.pdf.layout_element.annotation.line_annotation import LineAnnotation
-from borb.pdf.layout_element.annotation.link_annotation import LinkAnnotation
-from borb.pdf.layout_element.annotation.polygon_annotation import PolygonAnnotation
-from borb.pdf.layout_element.annotation.poly_line_annotation import PolyLineAnnotation
-from borb.pdf.layout_element.annotation.redact_annotation import RedactAnnotation
-from borb.pdf.layout_element.annotation.remote_go_to_annotation import RemoteGoToAnnotation
-from borb.pdf.layout_element.annotation.rubber_stamp_annotation import RubberStampAnnotation
-from borb.pdf.layout_element.annotation.sound_annotation import SoundAnnotation
-from borb.pdf.layout_element.annotation.square_annotation import SquareAnnotation
-from borb.pdf.layout_element.annotation.squiggly_annotation import SquigglyAnnotation
-from borb.pdf.layout_element.annotation.strike_out_annotation import StrikeOutAnnotation
-from borb.pdf.layout_element.annotation.text_annotation import TextAnnotation
-from borb.pdf.layout_element.calendar.calendar_view import CalendarView
-from borb.pdf.layout_element.calendar.calendar_view import CalendarView
-from borb.pdf.layout_element.calendar.day_view import DayView
-from borb.pdf.layout_element.calendar.day_view import DayView
-from borb.pdf.layout_element.calendar.week_view import WeekView
-from borb.pdf.layout_element.form.button import Button
-from borb.pdf.layout_element.form.check_box import CheckBox
-from borb.pdf.layout_element.form.country_drop_down_list import CountryDropDownList
-from borb.pdf.layout_element.form.drop_down_list import DropDownList
-from borb.pdf.layout_element.form.form_field import FormField
-from borb.pdf.layout_element.form.gender_drop_down_list import GenderDropDownList
-from borb.pdf.layout_element.form.javascript_button import JavascriptButton
-from borb.pdf.layout_element.form.radio_button import RadioButton
-from borb.pdf.layout_element.form.text_area import TextArea
-from borb.pdf.layout_element.form.text_box import TextBox
-from borb.pdf.layout_element.image.avatar import Avatar
-from borb.pdf.layout_element.image.barcode import Barcode
-from borb.pdf.layout_element.image.chart import Chart
-from borb.pdf.layout_element.image.dall_e import DallE
-from borb.pdf.layout_element.image.emoji import Emoji
-from borb.pdf.layout_element.image.equation import Equation
-from borb.pdf.layout_element.image.image import Image
-from borb.pdf.layout_element.image.qr_code import QRCode
-from borb.pdf.layout_element.image.screenshot import Screenshot
-from borb.pdf.layout_element.image.unsplash import Unsplash
-from borb.pdf.layout_element.image.watermark import Watermark
-from borb.pdf.layout_element.layout_element import LayoutElement
-from borb.pdf.layout_element.list.abc_ordered_list import ABCOrderedList
-from borb.pdf.layout_element.list.list import List
-from borb.pdf.layout_element.list.ordered_list import OrderedList
-from borb.pdf.layout_element.list.roman_numeral_ordered_list import RomanNumeralOrderedList
-from borb.pdf.layout_element.list.unordered_list import UnorderedList
-from borb.pdf.layout_element.progress_bar.progress_bar import ProgressBar
-from borb.pdf.layout_element.progress_bar.progress_square import ProgressSquare
-from borb.pdf.layout_element.shape.horizontal_break import HorizontalBreak
-from borb.pdf.layout_element.shape.line_art import LineArt
-from borb.pdf.layout_element.shape.map import Map
-from borb.pdf.layout_element.shape.map_of_africa import MapOfAfrica
-from borb.pdf.layout_element.shape.map_of_asia import MapOfAsia
-from borb.pdf.layout_element.shape.map_of_europe import MapOfEurope
-from borb.pdf.layout_element.shape.map_of_north_america import MapOfNorthAmerica
-from borb.pdf.layout_element.shape.map_of_oceania import MapOfOceania
-from borb.pdf.layout_element.shape.map_of_south_america import MapOfSouthAmerica
-from borb.pdf.layout_element.shape.map_of_the_contiguous_united_states_of_america import MapOfTheContiguousUnitedStatesOfAmerica
-from borb.pdf.layout_element.shape.map_of_the_united_states_of_america import MapOfTheUnitedStatesOfAmerica
-from borb.pdf.layout_element.shape.map_of_the_world import MapOfTheWorld
-from borb.pdf.layout_element.shape.shape import Shape
-from borb.pdf.layout_element.smart_art.smart_art import SmartArt
-from borb.pdf.layout_element.space.space import Space
-from borb.pdf.layout_element.table.fixed_column_width_table import FixedColumnWidthTable
-from borb.pdf.layout_element.table.flexible_column_width_table import FlexibleColumnWidthTable
-from borb.pdf.layout_element.table.table import Table
-from borb.pdf.layout_element.table.table_util import TableUtil
-from borb.pdf.layout_element.text.chunk import Chunk
-from borb.pdf.layout_element.text.code_snippet import CodeSnippet
-from borb.pdf.layout_element.text.heading import Heading
-from borb.pdf.layout_element.text.heterogeneous_paragraph import HeterogeneousParagraph
-from borb.pdf.layout_element.text.homogeneous_paragraph import HomogeneousParagraph
-from borb.pdf.layout_element.text.markdown_paragraph import MarkdownParagraph
-from borb.pdf.layout_element.text.paragraph import Paragraph
-from borb.pdf.license.license import License
-from borb.pdf.license.usage_statistics import UsageStatistics
-from borb.pdf.license.version import Version
-from borb.pdf.lipsum.lipsum import Lipsum
-from borb.pdf.page import Page
-from borb.pdf.page_layout.multi_column_layout import MultiColumnLayout
-from borb.pdf.page_layout.page_layout import PageLayout
-from borb.pdf.page_layout.single_column_layout import SingleColumnLayout
-from borb.pdf.page_layout.three_column_layout import ThreeColumnLayout
-from borb.pdf.page_layout.two_column_layout import TwoColumnLayout
-from borb.pdf.page_size import PageSize
-from borb.pdf.table_of_contents import TableOfContents
-from borb.pdf.toolkit.event import Event
-from borb.pdf.toolkit.filter.above.above import Above
-from borb.pdf.toolkit.filter.above.above_image import AboveImage
-from borb.pdf.toolkit.filter.above.above_text import AboveText
-from borb.pdf.toolkit.filter.below.below import Below
-from borb.pdf.toolkit.filter.below.below_image import BelowImage
-from borb.pdf.toolkit.filter.below.below_text import BelowText
-from borb.pdf.toolkit.filter.font.by_font import ByFont
-from borb.pdf.toolkit.filter.font.by_font_color import ByFontColor
-from borb.pdf.toolkit.filter.font.by_font_size import ByFontSize
-from borb.pdf.toolkit.filter.inside.inside import Inside
-from borb.pdf.toolkit.filter.left.left_of import LeftOf
-from borb.pdf.toolkit.filter.left.left_of_image import LeftOfImage
-from borb.pdf.toolkit.filter.left.left_of_text import LeftOfText
-from borb.pdf.toolkit.filter.page.even_pages import EvenPages
-from borb.pdf.toolkit.filter.page.odd_pages import OddPages
-from borb.pdf.toolkit.filter.right.right_of import RightOf
-from borb.pdf.toolkit.filter.right.right_of_image import RightOfImage
-from borb.pdf.toolkit.filter.right.right_of_text import RightOfText
-from borb.pdf.toolkit.pipe import Pipe
-from borb.pdf.toolkit.pipeline import Pipeline
-from borb.pdf.toolkit.sink.get_colors import GetColors
-from borb.pdf.toolkit.sink.get_document_as_graphml import GetDocumentAsGraphML
-from borb.pdf.toolkit.sink.get_events_as_json import GetEventsAsJSON
-from borb.pdf.toolkit.sink.get_images import GetImages
-from borb.pdf.toolkit.sink.get_keywords_by_pagewise_tf_idf import GetKeywordsByPagewiseTFIDF
-from borb.pdf.toolkit.sink.get_regular_expression import GetRegularExpression
-from borb.pdf.toolkit.sink.get_text import GetText
-from borb.pdf.toolkit.sink.regex import Regex
-from borb.pdf.toolkit.sink.sink import Sink
-from borb.pdf.toolkit.source.operator.source import Source
-from borb.pdf.visitor.pdf import PDF
+_LAZY_IMPORTS: typing.Dict[str, str] = {
+    "CMYKColor": "borb.pdf.color.cmyk_color",
+    "Color": "borb.pdf.color.color",
+    "ColorScheme": "borb.pdf.color.color_scheme",
+    "FarrowAndBallColor": "borb.pdf.color.farrow_and_ball_color",
+    "GrayscaleColor": "borb.pdf.color.grayscale_color",
+    "HexColor": "borb.pdf.color.hex_color",
+    "HSVColor": "borb.pdf.color.hsv_color",
+    "PantoneColor": "borb.pdf.color.pantone_color",
+    "RGBColor": "borb.pdf.color.rgb_color",
+    "X11Color": "borb.pdf.color.x11_color",
+    "Document": "borb.pdf.document",
+    "A4Portrait": "borb.pdf.document_layout.a4_portrait",
+    "A4PortraitInvoice": "borb.pdf.document_layout.a4_portrait_invoice",
+    "A4PortraitResume": "borb.pdf.document_layout.a4_portrait_resume",
+    "DocumentLayout": "borb.pdf.document_layout.document_layout",
+    "Slideshow": "borb.pdf.document_layout.slideshow",
+    "CompositeFont": "borb.pdf.font.composite_font.composite_font",
+    "Font": "borb.pdf.font.font",
+    "FontCache": "borb.pdf.font.font_cache",
+    "SimpleFont": "borb.pdf.font.simple_font.simple_font",
+    "Standard14Fonts": "borb.pdf.font.simple_font.standard_14_fonts",
+    "GoogleTrueTypeFont": "borb.pdf.font.simple_font.true_type.google_true_type_font",
+    "TrueTypeFont": "borb.pdf.font.simple_font.true_type.true_type_font",
+    "Type1Font": "borb.pdf.font.simple_font.type_1_font",
+    "Annotation": "borb.pdf.layout_element.annotation.annotation",
+    "CircleAnnotation": "borb.pdf.layout_element.annotation.circle_annotation",
+    "FreeTextAnnotation": "borb.pdf.layout_element.annotation.free_text_annotation",
+    "HighlightAnnotation": "borb.pdf.layout_element.annotation.highlight_annotation",
+    "InkAnnotation": "borb.pdf.layout_element.annotation.ink_annotation",
+    "LineAnnotation": "borb.pdf.layout_element.annotation.line_annotation",
+    "LinkAnnotation": "borb.pdf.layout_element.annotation.link_annotation",
+    "PolygonAnnotation": "borb.pdf.layout_element.annotation.polygon_annotation",
+    "PolyLineAnnotation": "borb.pdf.layout_element.annotation.poly_line_annotation",
+    "RedactAnnotation": "borb.pdf.layout_element.annotation.redact_annotation",
+    "RemoteGoToAnnotation": "borb.pdf.layout_element.annotation.remote_go_to_annotation",
+    "RubberStampAnnotation": "borb.pdf.layout_element.annotation.rubber_stamp_annotation",
+    "SoundAnnotation": "borb.pdf.layout_element.annotation.sound_annotation",
+    "SquareAnnotation": "borb.pdf.layout_element.annotation.square_annotation",
+    "SquigglyAnnotation": "borb.pdf.layout_element.annotation.squiggly_annotation",
+    "StrikeOutAnnotation": "borb.pdf.layout_element.annotation.strike_out_annotation",
+    "TextAnnotation": "borb.pdf.layout_element.annotation.text_annotation",
+    "CalendarView": "borb.pdf.layout_element.calendar.calendar_view",
+    "DayView": "borb.pdf.layout_element.calendar.day_view",
+    "WeekView": "borb.pdf.layout_element.calendar.week_view",
+    "Button": "borb.pdf.layout_element.form.button",
+    "CheckBox": "borb.pdf.layout_element.form.check_box",
+    "CountryDropDownList": "borb.pdf.layout_element.form.country_drop_down_list",
+    "DropDownList": "borb.pdf.layout_element.form.drop_down_list",
+    "FormField": "borb.pdf.layout_element.form.form_field",
+    "GenderDropDownList": "borb.pdf.layout_element.form.gender_drop_down_list",
+    "JavascriptButton": "borb.pdf.layout_element.form.javascript_button",
+    "RadioButton": "borb.pdf.layout_element.form.radio_button",
+    "TextArea": "borb.pdf.layout_element.form.text_area",
+    "TextBox": "borb.pdf.layout_element.form.text_box",
+    "Avatar": "borb.pdf.layout_element.image.avatar",
+    "Barcode": "borb.pdf.layout_element.image.barcode",
+    "Chart": "borb.pdf.layout_element.image.chart",
+    "DallE": "borb.pdf.layout_element.image.dall_e",
+    "Emoji": "borb.pdf.layout_element.image.emoji",
+    "Equation": "borb.pdf.layout_element.image.equation",
+    "Image": "borb.pdf.layout_element.image.image",
+    "QRCode": "borb.pdf.layout_element.image.qr_code",
+    "Screenshot": "borb.pdf.layout_element.image.screenshot",
+    "Unsplash": "borb.pdf.layout_element.image.unsplash",
+    "Watermark": "borb.pdf.layout_element.image.watermark",
+    "LayoutElement": "borb.pdf.layout_element.layout_element",
+    "MeasurementCache": "borb.pdf.layout_element.measurement_cache",
+    "ABCOrderedList": "borb.pdf.layout_element.list.abc_ordered_list",
+    "List": "borb.pdf.layout_element.list.list",
+    "OrderedList": "borb.pdf.layout_element.list.ordered_list",
+    "RomanNumeralOrderedList": "borb.pdf.layout_element.list.roman_numeral_ordered_list",
+    "UnorderedList": "borb.pdf.layout_element.list.unordered_list",
+    "ProgressBar": "borb.pdf.layout_element.progress_bar.progress_bar",
+    "ProgressSquare": "borb.pdf.layout_element.progress_bar.progress_square",
+    "HorizontalBreak": "borb.pdf.layout_element.shape.horizontal_break",
+    "LineArt": "borb.pdf.layout_element.shape.line_art",
+    "Map": "borb.pdf.layout_element.shape.map",
+    "MapOfAfrica": "borb.pdf.layout_element.shape.map_of_africa",
+    "MapOfAsia": "borb.pdf.layout_element.shape.map_of_asia",
+    "MapOfEurope": "borb.pdf.layout_element.shape.map_of_europe",
+    "MapOfNorthAmerica": "borb.pdf.layout_element.shape.map_of_north_america",
+    "MapOfOceania": "borb.pdf.layout_element.shape.map_of_oceania",
+    "MapOfSouthAmerica": "borb.pdf.layout_element.shape.map_of_south_america",
+    "MapOfTheContiguousUnitedStatesOfAmerica": "borb.pdf.layout_element.shape.map_of_the_contiguous_united_states_of_america",
+    "MapOfTheUnitedStatesOfAmerica": "borb.pdf.layout_element.shape.map_of_the_united_states_of_america",
+    "MapOfTheWorld": "borb.pdf.layout_element.shape.map_of_the_world",
+    "Shape": "borb.pdf.layout_element.shape.shape",
+    "SmartArt": "borb.pdf.layout_element.smart_art.smart_art",
+    "Space": "borb.pdf.layout_element.space.space",
+    "FixedColumnWidthTable": "borb.pdf.layout_element.table.fixed_column_width_table",
+    "FlexibleColumnWidthTable": "borb.pdf.layout_element.table.flexible_column_width_table",
+    "Table": "borb.pdf.layout_element.table.table",
+    "TableUtil": "borb.pdf.layout_element.table.table_util",
+    "Chunk": "borb.pdf.layout_element.text.chunk",
+    "CodeSnippet": "borb.pdf.layout_element.text.code_snippet",
+    "Heading": "borb.pdf.layout_element.text.heading",
+    "HeterogeneousParagraph": "borb.pdf.layout_element.text.heterogeneous_paragraph",
+    "HomogeneousParagraph": "borb.pdf.layout_element.text.homogeneous_paragraph",
+    "MarkdownParagraph": "borb.pdf.layout_element.text.markdown_paragraph",
+    "Paragraph": "borb.pdf.layout_element.text.paragraph",
+    "License": "borb.pdf.license.license",
+    "UsageStatistics": "borb.pdf.license.usage_statistics",
+    "Version": "borb.pdf.license.version",
+    "Lipsum": "borb.pdf.lipsum.lipsum",
+    "Page": "borb.pdf.page",
+    "MultiColumnLayout": "borb.pdf.page_layout.multi_column_layout",
+    "PageLayout": "borb.pdf.page_layout.page_layout",
+    "SingleColumnLayout": "borb.pdf.page_layout.single_column_layout",
+    "ThreeColumnLayout": "borb.pdf.page_layout.three_column_layout",
+    "TwoColumnLayout": "borb.pdf.page_layout.two_column_layout",
+    "PageSize": "borb.pdf.page_size",
+    "TableOfContents": "borb.pdf.table_of_contents",
+    "Event": "borb.pdf.toolkit.event",
+    "Above": "borb.pdf.toolkit.filter.above.above",
+    "AboveImage": "borb.pdf.toolkit.filter.above.above_image",
+    "AboveText": "borb.pdf.toolkit.filter.above.above_text",
+    "Below": "borb.pdf.toolkit.filter.below.below",
+    "BelowImage": "borb.pdf.toolkit.filter.below.below_image",
+    "BelowText": "borb.pdf.toolkit.filter.below.below_text",
+    "ByFont": "borb.pdf.toolkit.filter.font.by_font",
+    "ByFontColor": "borb.pdf.toolkit.filter.font.by_font_color",
+    "ByFontSize": "borb.pdf.toolkit.filter.font.by_font_size",
+    "Inside": "borb.pdf.toolkit.filter.inside.inside",
+    "LeftOf": "borb.pdf.toolkit.filter.left.left_of",
+    "LeftOfImage": "borb.pdf.toolkit.filter.left.left_of_image",
+    "LeftOfText": "borb.pdf.toolkit.filter.left.left_of_text",
+    "EvenPages": "borb.pdf.toolkit.filter.page.even_pages",
+    "OddPages": "borb.pdf.toolkit.filter.page.odd_pages",
+    "RightOf": "borb.pdf.toolkit.filter.right.right_of",
+    "RightOfImage": "borb.pdf.toolkit.filter.right.right_of_image",
+    "RightOfText": "borb.pdf.toolkit.filter.right.right_of_text",
+    "Pipe": "borb.pdf.toolkit.pipe",
+    "Pipeline": "borb.pdf.toolkit.pipeline",
+    "GetColors": "borb.pdf.toolkit.sink.get_colors",
+    "GetDocumentAsGraphML": "borb.pdf.toolkit.sink.get_document_as_graphml",
+    "GetEventsAsJSON": "borb.pdf.toolkit.sink.get_events_as_json",
+    "GetImages": "borb.pdf.toolkit.sink.get_images",
+    "GetKeywordsByPagewiseTFIDF": "borb.pdf.toolkit.sink.get_keywords_by_pagewise_tf_idf",
+    "GetRegularExpression": "borb.pdf.toolkit.sink.get_regular_expression",
+    "GetText": "borb.pdf.toolkit.sink.get_text",
+    "Regex": "borb.pdf.toolkit.sink.regex",
+    "Sink": "borb.pdf.toolkit.sink.sink",
+    "Source": "borb.pdf.toolkit.source.operator.source",
+    "PDF": "borb.pdf.visitor.pdf",
+}
 # fmt: on
+
+__all__ = [x for x in _LAZY_IMPORTS.keys()]
+
+
+def __dir__() -> typing.List[str]:
+    """
+    List the public names (and submodules) of borb.pdf, including those that were not resolved yet.
+
+    :return:    The (sorted) names.
+    """
+    import pathlib
+
+    submodules: typing.List[str] = [
+        x.stem
+        for x in pathlib.Path(__file__).parent.iterdir()
+        if (x.suffix == ".py" and x.stem != "__init__") or (x / "__init__.py").exists()
+    ]
+    return sorted(set([x for x in globals().keys()] + __all__ + submodules))
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Resolve (and import) a public name (or submodule) of borb.pdf on first use.
+
+    :param name:    The name to be resolved.
+    :return:        The class (or object, or submodule) the name refers to.
+    """
+    import importlib
+    import importlib.util
+
+    # IF the name is a submodule of borb.pdf (e.g. borb.pdf.toolkit)
+    # THEN import it, along with the modules (of public names) it contains (as `import borb.pdf` used to do)
+    if name not in _LAZY_IMPORTS:
+        if (
+            name.startswith("__")
+            or importlib.util.find_spec(f"{__name__}.{name}") is None
+        ):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        submodule: typing.Any = importlib.import_module(f"{__name__}.{name}")
+        for x in _LAZY_IMPORTS.values():
+            if x.startswith(f"{__name__}.{name}."):
+                importlib.import_module(x)
+        return submodule
+
+    value: typing.Any = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -12,10 +12,12 @@ Instances of this class can be serialized to standard PDF format for viewing, sh
 """
 
 import datetime
+import pathlib
 import typing
 
 from borb.pdf.conformance import Conformance
 from borb.pdf.page import Page
+from borb.pdf.page_index import PageIndex
 from borb.pdf.primitives import name, hexstr, PDFType, datestr
 
 
@@ -59,6 +61,11 @@ class Document(dict):
         self.__conformance_at_create: typing.Optional[Conformance] = conformance
         self.__on_non_conformance_print_warning: bool = on_non_conformance_print_warning
         self.__on_non_conformance_throw_assert: bool = on_non_conformance_throw_assert
+        self.__measurement_cache: typing.Optional["MeasurementCache"] = None  # type: ignore[name-defined]
+        self.__source: typing.Optional["Buffer"] = None  # type: ignore[name-defined]
+        self.__source_path: typing.Optional[pathlib.Path] = None
+        self.__source_startxref: typing.Optional[int] = None
+        self.__page_index: PageIndex = PageIndex()
 
     #
     # PRIVATE
@@ -132,6 +139,11 @@ class Document(dict):
         if "Kids" not in self["Trailer"]["Root"]["Pages"]:
             self["Trailer"]["Root"]["Pages"][name("Kids")] = []
 
+    def _before_write(self) -> None:
+        # give every Page the opportunity to finish its content before the Document is written
+        for i in range(0, self.get_number_of_pages()):
+            self.get_page(i)._before_write()
+
     #
     # PUBLIC
     #
@@ -170,6 +182,9 @@ class Document(dict):
         self.__setup_document_skeleton()
 
         # add page
+        is_page_index_up_to_date: bool = self.__page_index.is_up_to_date(
+            self["Trailer"]["Root"]["Pages"]
+        )
         self["Trailer"]["Root"]["Pages"]["Kids"] += [page]
         self["Trailer"]["Root"]["Pages"]["Count"] += 1
 
@@ -179,6 +194,13 @@ class Document(dict):
         # link Page to Document
         page._Page__document = self  # type: ignore[attr-defined]
 
+        # IF the page index was up to date (before appending the Page)
+        # THEN update the page index (rather than rebuilding it)
+        if is_page_index_up_to_date:
+            self.__page_index.append_page(
+                page=page, parent=self["Trailer"]["Root"]["Pages"]
+            )
+
         # return
         return self
 
@@ -244,6 +266,22 @@ class Document(dict):
         """
         return self.get("Trailer", {}).get("Info", {}).get("Keywords", None)
 
+    def get_measurement_cache(self) -> "MeasurementCache":  # type: ignore[name-defined]
+        """
+        Retrieve the MeasurementCache of this Document.
+
+        The MeasurementCache stores the sizes of the LayoutElement objects that are laid out
+        on the pages of this Document. It is bounded, and lives (only) as long as the Document does.
+        Call its `clear` method to release the measurements early.
+
+        :return: The MeasurementCache of this Document
+        """
+        if self.__measurement_cache is None:
+            from borb.pdf.layout_element.measurement_cache import MeasurementCache
+
+            self.__measurement_cache = MeasurementCache()
+        return self.__measurement_cache
+
     def get_modification_date(self) -> typing.Optional[datetime.datetime]:
         """
         Retrieve the modification date of the PDF document, if available.
@@ -291,28 +329,9 @@ class Document(dict):
         :param index:   the index
         :return:        self
         """
-        pages_in_order = [self["Trailer"]["Root"]["Pages"]]
-        i: int = 0
-        while i < len(pages_in_order):
-            n = pages_in_order[i]
-
-            # page tree nodes are exploded and processed in next turn
-            if isinstance(n, dict) and "Kids" in n:
-                pages_in_order = (
-                    pages_in_order[0:i]
-                    + [x for x in n["Kids"]]
-                    + pages_in_order[i + 1 :]
-                )
-                continue
-
-            # IF we processed a Page
-            # THEN move ahead by 1
-            assert isinstance(n, Page), "Document contains an object that is not a Page"
-            if isinstance(n, Page):
-                i += 1
-
-        # return
-        return pages_in_order[index]
+        return self.__page_index.get_page(
+            index=index, pages=self["Trailer"]["Root"]["Pages"]
+        )
 
     def get_producer(self) -> typing.Optional[str]:
         """
@@ -373,41 +392,47 @@ class Document(dict):
         # check the index
         assert 0 <= index < self.get_number_of_pages()
 
-        # traverse the page-tree to insert the Page
-        page_id_to_parent: typing.Dict[int, PDFType] = {}
-        page_nr_to_page: typing.Dict[int, PDFType] = {}
-        todo: typing.List[PDFType] = [self["Trailer"]["Root"]["Pages"]]
-        while len(todo) > 0:
-            n: PDFType = todo.pop()
-            # thing has kids
-            if isinstance(n, dict) and ("Kids" in n):
-                for k in n["Kids"]:  # type: ignore[union-attr]
-                    todo = [k] + todo
-                    page_id_to_parent[id(k)] = n
-            # thing is a Page
-            if isinstance(n, Page):
-                page_nr_to_page[len(page_nr_to_page)] = n
-                continue
-
-        # determine where to insert (in the lowest level page-tree)
-        # fmt: off
-        prev_page_at_index = page_nr_to_page[index]
-        parent = page_id_to_parent[id(page_nr_to_page[index])]
-        index_in_kids: int = next(iter([(i, parent['Kids'][i]) for i in range(0, len(parent['Kids'])) if parent['Kids'][i] == prev_page_at_index]))[0] # type: ignore[arg-type, call-overload, index]
-        # fmt: on
+        # use the page index to find the Page (and its parent)
+        prev_page_at_index: Page = self.get_page(index)
+        parent: typing.Optional[PDFType] = self.__page_index.get_parent(
+            prev_page_at_index
+        )
+        assert isinstance(parent, dict)
+        kids: typing.List[PDFType] = parent["Kids"]  # type: ignore[assignment]
+        index_in_kids: int = next(
+            iter([i for i in range(0, len(kids)) if kids[i] is prev_page_at_index])
+        )
 
         # insert, change count
-        parent["Kids"].insert(index_in_kids, page)  # type: ignore[call-overload, index, union-attr]
-        parent["Count"] += 1  # type: ignore[call-overload, index, operator]
+        kids.insert(index_in_kids, page)
+        parent["Count"] += 1  # type: ignore[operator]
 
         # propagate up
-        while id(parent) in page_id_to_parent and ("Count" in parent):  # type: ignore[operator]
-            parent = page_id_to_parent[id(parent)]
-            parent["Count"] += 1  # type: ignore[call-overload, index, operator]
+        while "Count" in parent and self.__page_index.get_parent(parent) is not None:
+            parent = self.__page_index.get_parent(parent)
+            assert isinstance(parent, dict)
+            parent["Count"] += 1  # type: ignore[operator]
+
+        # the page index is no longer up to date
+        self.__page_index.invalidate()
 
         # return
         return self
 
+    def is_lazy(self) -> bool:
+        """
+        Determine whether this Document (still) resolves its objects on demand.
+
+        A Document that was read using `PDF.read(..., lazy=True)` only resolves
+        (indirect) objects the first time they are accessed. This method returns
+        True as long as such a Document has not been resolved entirely.
+
+        :return:    True if the Document resolves its objects on demand, False otherwise
+        """
+        # a lazily read Document is a LazyDict (which overrides this method),
+        # for as long as a LazyReferenceVisitor is attached to it
+        return False
+
     def pop_page(self, index: int) -> "Document":
         """
         Remove and return the Page object at the specified index.
@@ -425,37 +450,29 @@ class Document(dict):
         # check the index
         assert 0 <= index < self.get_number_of_pages()
 
-        # traverse the page-tree to remove the Page
-        page_id_to_parent: typing.Dict[int, PDFType] = {}
-        page_nr_to_page: typing.Dict[int, PDFType] = {}
-        todo: typing.List[PDFType] = [self["Trailer"]["Root"]["Pages"]]
-        while len(todo) > 0:
-            n: PDFType = todo.pop()
-            # thing has kids
-            if isinstance(n, dict) and ("Kids" in n):
-                for k in n["Kids"]:  # type: ignore[union-attr]
-                    todo = [k] + todo
-                    page_id_to_parent[id(k)] = n
-            # thing is a Page
-            if isinstance(n, Page):
-                page_nr_to_page[len(page_nr_to_page)] = n
-                continue
-
-        # determine where to remove (in the lowest level page-tree)
-        # fmt: off
-        prev_page_at_index = page_nr_to_page[index]
-        parent = page_id_to_parent[id(page_nr_to_page[index])]
-        index_in_kids: int = next(iter([(i, parent['Kids'][i]) for i in range(0, len(parent['Kids'])) if parent['Kids'][i] == prev_page_at_index]))[0] # type: ignore[arg-type, call-overload, index]
-        # fmt: on
-
-        # delete
-        del parent["Kids"][index_in_kids]  # type: ignore[arg-type, call-overload, index, union-attr]
-        parent["Count"] -= 1  # type: ignore[call-overload, index, operator]
+        # use the page index to find the Page (and its parent)
+        prev_page_at_index: Page = self.get_page(index)
+        parent: typing.Optional[PDFType] = self.__page_index.get_parent(
+            prev_page_at_index
+        )
+        assert isinstance(parent, dict)
+        kids: typing.List[PDFType] = parent["Kids"]  # type: ignore[assignment]
+        index_in_kids: int = next(
+            iter([i for i in range(0, len(kids)) if kids[i] is prev_page_at_index])
+        )
+
+        # delete, change count
+        del kids[index_in_kids]
+        parent["Count"] -= 1  # type: ignore[operator]
 
         # propagate up
-        while id(parent) in page_id_to_parent and ("Count" in parent):  # type: ignore[operator]
-            parent = page_id_to_parent[id(parent)]
-            parent["Count"] -= 1  # type: ignore[call-overload, index, operator]
+        while "Count" in parent and self.__page_index.get_parent(parent) is not None:
+            parent = self.__page_index.get_parent(parent)
+            assert isinstance(parent, dict)
+            parent["Count"] -= 1  # type: ignore[operator]
+
+        # the page index is no longer up to date
+        self.__page_index.invalidate()
 
         # return
         return self
@@ -46,10 +46,45 @@ class CIDType0Font(Font):
     # CONSTRUCTOR
     #
 
+    def __init__(self):
+        """
+        Initialize a CIDType0Font instance.
+
+        The `CIDType0Font` class represents a descendant font of a composite (Type 0) font.
+        The widths of its glyphs are stored (by CID) in its `/W` entry, which is parsed (only)
+        once, the first time a width is needed.
+        """
+        super().__init__()
+        self.__cid_to_width: typing.Dict[int, float] = {}
+
     #
     # PRIVATE
     #
 
+    def __get_cid_width(self, cid: int) -> float:
+
+        # IF the /W entry has not been parsed yet
+        # THEN parse it
+        # <cid> [<width> ... <width>]
+        # <cid> <cid> <width>
+        W: typing.List[typing.Any] = self.get("W", [])
+        if len(self.__cid_to_width) == 0 and len(W) > 0:
+            i: int = 0
+            while i + 1 < len(W):
+                if isinstance(W[i + 1], list):
+                    for j, w in enumerate(W[i + 1]):
+                        self.__cid_to_width[W[i] + j] = w
+                    i += 2
+                    continue
+                if i + 2 >= len(W):
+                    break
+                for j in range(W[i], W[i + 1] + 1):
+                    self.__cid_to_width[j] = W[i + 2]
+                i += 3
+
+        # Default value: none (the DW value shall be used for all glyphs).
+        return self.__cid_to_width.get(cid, self.get("DW", 1000))
+
     #
     # PUBLIC
     #
@@ -73,69 +108,15 @@ class CIDType0Font(Font):
         :param character_spacing:   The character spacing to be used for rendering
         :return:                    The width (in points) of the text in the specified font size.
         """
-        # Default value: none (the DW value shall be used for all glyphs).
-        if "W" not in self:
-            return self.get("DW", 1000)
-
-        assert "W" in self
-        W: typing.List[typing.Union[int, typing.List[int]]] = self.get("W", [])
-
-        # loop over cids to determine widths
-        cid_width_cache: typing.Dict[int, float] = {}
-        cid_widths: typing.List[float] = []
-        for cid, character_name in text:
-
-            # IF the item is cached
-            # THEN use the cache
-            if cid in cid_width_cache:
-                cid_widths += [cid_width_cache[cid]]
-                continue
-
-            # <cid> [<width> ... <width>]
-            index: typing.Optional[int] = next(
-                iter(
-                    [
-                        i
-                        for i in range(0, len(W))
-                        if isinstance(W[i], int)
-                        and (i + 1) < len(W)
-                        and isinstance(W[i + 1], list)
-                        and W[i] <= cid < W[i] + len(W[i + 1])  # type: ignore[arg-type, operator]
-                    ]
-                ),
-                None,
-            )
-            if index is not None:
-                cid_widths += [W[index + 1][cid - W[index]]]  # type: ignore[index, operator]
-                cid_width_cache[cid] = cid_widths[-1]
-                continue
-
-            # <cid> <cid> <width>
-            index = next(
-                iter(
-                    [
-                        i
-                        for i in range(0, len(W))
-                        if isinstance(W[i], int)
-                        and (i + 1) < len(W)
-                        and (isinstance(W[i + 1], float) or isinstance(W[i + 1], int))
-                        and (i + 2) < len(W)
-                        and (isinstance(W[i + 2], float) or isinstance(W[i + 2], int))
-                        and W[i] <= cid <= W[i + 1]  # type: ignore[operator]
-                    ]
-                )
-            )
-            if index is not None:
-                cid_widths += [W[index + 2]]  # type: ignore[list-item]
-                cid_width_cache[cid] = cid_widths[-1]
-                continue
-
-            # DW
-            cid_widths += [self.get("DW", 1000)]
-            cid_width_cache[cid] = cid_widths[-1]
-
-        # normalize
-        cid_widths = [w / 1000 for w in cid_widths]
+        # IF there is no text
+        # THEN the width is 0
+        if len(text) == 0:
+            return 0
+
+        # look up the width of each cid (and normalize)
+        cid_widths: typing.List[float] = [
+            self.__get_cid_width(cid) / 1000 for cid, _ in text
+        ]
 
         # apply character spacing
         cid_widths = [(w + character_spacing) for w in cid_widths]
@@ -14,7 +14,6 @@ for composite fonts. Composite fonts are often used in conjunction with encoding
 that support wide character sets.
 """
 
-from borb.pdf.font.adobe_glyph_list import AdobeGlyphList
 from borb.pdf.font.cmap import CMap
 from borb.pdf.font.composite_font.cid_type_0_font import CIDType0Font
 from borb.pdf.font.font import Font
@@ -43,41 +42,18 @@ class CompositeFont(Font):
     # PRIVATE
     #
 
-    #
-    # PUBLIC
-    #
-
-    def get_width(
-        self,
-        text: str,
-        character_spacing: float = 0,
-        font_size: float = 12,
-        word_spacing: float = 0,
-    ) -> int:
-        """
-        Return the total width of a text string when rendered with the font at a specific size.
-
-        This function calculates the width of the given text string when rendered with the font
-        at the specified font size.
-
-        :param font_size:           The font size to be used for rendering.
-        :param text:                The text string to calculate the width for.
-        :param word_spacing:        The word spacing to be used for rendering
-        :param character_spacing:   The character spacing to be used for rendering
-        :return:                    The width (in points) of the text in the specified font size.
-        """
-        descendant_font: CIDType0Font = self["DescendantFonts"][0]
+    def _get_character_width(self, character: str) -> float:
 
         # delegate to DescendantFonts
-        return descendant_font.get_width(
-            text=[
-                (
-                    self.get_character_code(c),
-                    AdobeGlyphList.ADOBE_CHARACTER_TO_CHARACTER_NAME.get(c, ".notdef"),
-                )
-                for c in text
-            ],
-            character_spacing=character_spacing,
-            font_size=font_size,
-            word_spacing=word_spacing,
+        # (the character code is the CID)
+        descendant_font: CIDType0Font = self["DescendantFonts"][0]
+        return (
+            descendant_font._CIDType0Font__get_cid_width(  # type: ignore[attr-defined]
+                self.get_character_code(character)
+            )
+            / 1000
         )
+
+    #
+    # PUBLIC
+    #
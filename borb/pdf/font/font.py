@@ -48,6 +48,9 @@ class Font(dict):
         self[name("Type")] = name("Font")
         self.__character_code_to_character: typing.Dict[int, str] = {}  # type: ignore[annotation-unchecked]
         self.__character_to_character_code: typing.Dict[str, int] = {}  # type: ignore[annotation-unchecked]
+        self.__character_to_width: typing.Dict[str, float] = {}  # type: ignore[annotation-unchecked]
+        self.__used_character_codes: typing.Set[int] = set()  # type: ignore[annotation-unchecked]
+        self.__subset: typing.Optional["Font"] = None  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
@@ -206,6 +209,43 @@ class Font(dict):
         # return
         return name("StandardEncoding")
 
+    def _add_used_characters(self, s: str) -> None:
+        """
+        Record that the given characters were painted (on a Page) using this `Font`.
+
+        Anything that paints text (using this `Font`) calls this method, so that the (embedded)
+        font file can be subset (to the characters that were actually used) when the Document is written.
+
+        :param s:   The characters that were painted.
+        :return:    None
+        """
+        self.__used_character_codes.update([self.get_character_code(c) for c in s])
+
+    def _get_character_width(self, character: str) -> float:
+        """
+        Return the width of a single character, as a fraction of the font size.
+
+        This method is called (only) once for every character, the result is stored in the
+        (precomputed) widths of the `Font`. Subclasses override this method to look up the width
+        of a character in their font program, `/Widths` or `/W` entry.
+
+        :param character:   The character to determine the width of.
+        :return:            The width of the character, as a fraction of the font size.
+        """
+        return 0
+
+    def _get_character_widths(self) -> typing.Dict[str, float]:
+        """
+        Return the (precomputed) widths of the characters of this `Font`.
+
+        This method returns a dictionary mapping each character (that has been measured before)
+        to its width, as a fraction of the font size. Fonts that always have the same widths
+        (e.g. the standard 14 fonts) may share this dictionary between instances.
+
+        :return:    The widths of the characters of this `Font`.
+        """
+        return self.__character_to_width
+
     #
     # PUBLIC
     #
@@ -270,4 +310,75 @@ class Font(dict):
         :param character_spacing:   The character spacing to be used for rendering
         :return:                    The width (in points) of the text in the specified font size.
         """
-        return 0
+        # IF there is no text
+        # THEN the width is 0
+        if len(text) == 0:
+            return 0
+
+        # look up the width of each character
+        # (determining the width of characters that were not measured before)
+        character_to_width: typing.Dict[str, float] = self._get_character_widths()
+        character_widths: typing.List[float] = []
+        try:
+            character_widths = [character_to_width[c] for c in text]
+        except KeyError:
+            for c in text:
+                if c not in character_to_width:
+                    character_to_width[c] = self._get_character_width(c)
+            character_widths = [character_to_width[c] for c in text]
+
+        import math
+
+        # IF there is no character spacing and no word spacing
+        # THEN the width is the sum of the character widths
+        if character_spacing == 0 and word_spacing == 0:
+            return math.ceil(sum(character_widths) * font_size)
+
+        # apply character spacing
+        character_widths = [(w + character_spacing) for w in character_widths]
+        character_widths[-1] -= character_spacing
+
+        # apply word spacing
+        character_widths = [
+            (w + word_spacing) if text[i] == " " else w
+            for i, w in enumerate(character_widths)
+        ]
+
+        # apply font size
+        return math.ceil(sum(character_widths) * font_size)
+
+    def get_widths(
+        self,
+        texts: typing.List[str],
+        character_spacing: float = 0,
+        font_size: float = 12,
+        word_spacing: float = 0,
+    ) -> typing.List[int]:
+        """
+        Return the width of each text string when rendered with the font at a specific size.
+
+        This function measures many text strings (e.g. all words of a paragraph) at once.
+        The width of each distinct character is determined (only) once.
+
+        :param font_size:           The font size to be used for rendering.
+        :param texts:               The text strings to calculate the width for.
+        :param word_spacing:        The word spacing to be used for rendering
+        :param character_spacing:   The character spacing to be used for rendering
+        :return:                    The width (in points) of each text in the specified font size.
+        """
+        # determine the width of the characters that were not measured before
+        character_to_width: typing.Dict[str, float] = self._get_character_widths()
+        for c in set("".join(texts)):
+            if c not in character_to_width:
+                character_to_width[c] = self._get_character_width(c)
+
+        # return
+        return [
+            self.get_width(
+                text=x,
+                character_spacing=character_spacing,
+                font_size=font_size,
+                word_spacing=word_spacing,
+            )
+            for x in texts
+        ]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A process-wide, bounded (LRU) cache of parsed `Font` objects.
+
+Building a `Font` from a font file (e.g., a TrueType font) means parsing that file,
+measuring all of its glyphs, and compressing the file to embed it in the PDF. The `FontCache`
+keeps the result (keyed by a hash of the font file), so that loading the same font file again
+(e.g., for another `Document`) does not repeat that work.
+
+Every `Document` needs its own `Font` (dictionary), so the `FontCache` never hands out the
+`Font` it holds, but a (deep) copy of it. The (immutable) bytes of the embedded font file
+are shared between these copies.
+"""
+
+import collections
+import copy
+import threading
+import typing
+
+from borb.pdf.font.font import Font
+
+
+class FontCache:
+    """
+    A process-wide, bounded (LRU) cache of parsed `Font` objects.
+
+    Building a `Font` from a font file (e.g., a TrueType font) means parsing that file,
+    measuring all of its glyphs, and compressing the file to embed it in the PDF. The `FontCache`
+    keeps the result (keyed by a hash of the font file), so that loading the same font file again
+    (e.g., for another `Document`) does not repeat that work.
+
+    Every `Document` needs its own `Font` (dictionary), so the `FontCache` never hands out the
+    `Font` it holds, but a (deep) copy of it. The (immutable) bytes of the embedded font file
+    are shared between these copies.
+    """
+
+    __ENTRIES: typing.OrderedDict[str, Font] = collections.OrderedDict()
+    __LOCK: threading.Lock = threading.Lock()
+    __MAX_SIZE: int = 32
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    #
+    # PUBLIC
+    #
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Remove all `Font` objects from the `FontCache`.
+
+        :return:    None
+        """
+        with FontCache.__LOCK:
+            FontCache.__ENTRIES.clear()
+
+    @staticmethod
+    def get(key: str) -> typing.Optional[Font]:
+        """
+        Look up a `Font` in the `FontCache`.
+
+        This method returns a (deep) copy of the `Font` that was stored under the given key,
+        or None if there is no such `Font`. On a hit, the `Font` becomes the most recently used one.
+
+        :param key: The key of the `Font` (e.g., a hash of the font file).
+        :return:    A copy of the `Font`, or None.
+        """
+        with FontCache.__LOCK:
+            font: typing.Optional[Font] = FontCache.__ENTRIES.get(key, None)
+            if font is None:
+                return None
+            FontCache.__ENTRIES.move_to_end(key)
+        return copy.deepcopy(font)
+
+    @staticmethod
+    def get_max_size() -> int:
+        """
+        Return the maximum number of `Font` objects held by the `FontCache`.
+
+        :return:    The maximum number of `Font` objects.
+        """
+        return FontCache.__MAX_SIZE
+
+    @staticmethod
+    def put(font: Font, key: str) -> None:
+        """
+        Store (a copy of) a `Font` in the `FontCache`.
+
+        If the `FontCache` is full, the least recently used `Font` is evicted.
+
+        :param font:    The `Font` to be stored.
+        :param key:     The key of the `Font` (e.g., a hash of the font file).
+        :return:        None
+        """
+        font_copy: Font = copy.deepcopy(font)
+        with FontCache.__LOCK:
+            FontCache.__ENTRIES[key] = font_copy
+            FontCache.__ENTRIES.move_to_end(key)
+            while len(FontCache.__ENTRIES) > FontCache.__MAX_SIZE:
+                FontCache.__ENTRIES.popitem(last=False)
+
+    @staticmethod
+    def set_max_size(max_size: int) -> None:
+        """
+        Set the maximum number of `Font` objects held by the `FontCache`.
+
+        If the `FontCache` holds more `Font` objects, the least recently used ones are evicted.
+
+        :param max_size:    The maximum number of `Font` objects.
+        :return:            None
+        """
+        assert max_size >= 0
+        with FontCache.__LOCK:
+            FontCache.__MAX_SIZE = max_size
+            while len(FontCache.__ENTRIES) > FontCache.__MAX_SIZE:
+                FontCache.__ENTRIES.popitem(last=False)
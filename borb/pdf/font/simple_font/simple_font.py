@@ -50,29 +50,7 @@ class SimpleFont(Font):
     # PRIVATE
     #
 
-    #
-    # PUBLIC
-    #
-
-    def get_width(
-        self,
-        text: str,
-        character_spacing: float = 0,
-        font_size: float = 12,
-        word_spacing: float = 0,
-    ) -> int:
-        """
-        Return the total width of a text string when rendered with the font at a specific size.
-
-        This function calculates the width of the given text string when rendered with the font
-        at the specified font size.
-
-        :param font_size:           The font size to be used for rendering.
-        :param text:                The text string to calculate the width for.
-        :param word_spacing:        The word spacing to be used for rendering
-        :param character_spacing:   The character spacing to be used for rendering
-        :return:                    The width (in points) of the text in the specified font size.
-        """
+    def _get_character_width(self, character: str) -> float:
         # first char
         first_char: int = self.get("FirstChar", 0)
 
@@ -85,29 +63,14 @@ class SimpleFont(Font):
         # missing_width
         missing_width: int = self.get("FontDescriptor", {}).get("MissingWidth", 0)
 
-        # look up individual character codes
-        # fmt: off
-        character_codes: typing.List[int] = [self.get_character_code(c) for c in text]
-        # fmt: on
+        # look up the character code
+        character_code: int = self.get_character_code(character)
 
         # look up character width
-        character_width: typing.List[float] = [
-            (widths[c - first_char] if first_char <= c <= last_char else missing_width)
-            for c in character_codes
-        ]
-        character_width = [w / 1000 for w in character_width]
-
-        # apply character spacing
-        character_width = [(w + character_spacing) for w in character_width]
-        character_width[-1] -= character_spacing
-
-        # apply word spacing
-        character_width = [
-            (w + word_spacing) if text[i] == " " else w
-            for i, w in enumerate(character_width)
-        ]
-
-        # apply font size
-        import math
-
-        return math.ceil(sum(character_width) * font_size)
+        if first_char <= character_code <= last_char:
+            return widths[character_code - first_char] / 1000
+        return missing_width / 1000
+
+    #
+    # PUBLIC
+    #
@@ -19,6 +19,7 @@ from borb.pdf import CompositeFont
 from borb.pdf.font.adobe_glyph_list import AdobeGlyphList
 from borb.pdf.font.composite_font.cid_type_0_font import CIDType0Font
 from borb.pdf.font.font import Font
+from borb.pdf.font.font_cache import FontCache
 from borb.pdf.font.simple_font.simple_font import SimpleFont
 from borb.pdf.primitives import name, stream, PDFType
 
@@ -48,18 +49,6 @@ class TrueTypeFont(SimpleFont):
     def __get_cmap_for_type_0_font(
         ttf_font_file: "fontTools.ttLib.ttFont.TTFont",  # type: ignore[name-defined]
     ) -> stream:
-        # fmt: off
-        cmap_prefix: str = ""
-        cmap_prefix += "/CIDInit /ProcSet findresource begin\n"
-        cmap_prefix += "12 dict begin\n"
-        cmap_prefix += "begincmap\n"
-        cmap_prefix += "/CIDSystemInfo <</Registry (Adobe) /Ordering (UCS) /Supplement 0>> def\n"
-        cmap_prefix += "/CMapName /Adobe-Identity-UCS def\n"
-        cmap_prefix += "/CMapType 2 def\n"
-        cmap_prefix += "1 begincodespacerange\n"
-        cmap_prefix += "<0000> <FFFF>\n"
-        cmap_prefix += "endcodespacerange\n"
-        # fmt: on
 
         # 1 beginbfchar
         # <0000> <0000>
@@ -83,6 +72,26 @@ class TrueTypeFont(SimpleFont):
                 i_hex = "0" + i_hex
             pairs.append((i_hex, g_hex))
 
+        # return
+        return TrueTypeFont.__get_cmap_for_type_0_font_from_pairs(pairs)
+
+    @staticmethod
+    def __get_cmap_for_type_0_font_from_pairs(
+        pairs: typing.List[typing.Tuple[str, str]],
+    ) -> stream:
+        # fmt: off
+        cmap_prefix: str = ""
+        cmap_prefix += "/CIDInit /ProcSet findresource begin\n"
+        cmap_prefix += "12 dict begin\n"
+        cmap_prefix += "begincmap\n"
+        cmap_prefix += "/CIDSystemInfo <</Registry (Adobe) /Ordering (UCS) /Supplement 0>> def\n"
+        cmap_prefix += "/CMapName /Adobe-Identity-UCS def\n"
+        cmap_prefix += "/CMapType 2 def\n"
+        cmap_prefix += "1 begincodespacerange\n"
+        cmap_prefix += "<0000> <FFFF>\n"
+        cmap_prefix += "endcodespacerange\n"
+        # fmt: on
+
         # split in lots of 100
         cmap_content: str = ""
         for i in range(0, len(pairs), 100):
@@ -221,12 +230,7 @@ class TrueTypeFont(SimpleFont):
         return font_name_without_special_chars
 
     @staticmethod
-    def __true_type_from_file(where_from: pathlib.Path) -> "Font":
-
-        # get the bytes
-        font_file_bytes: bytes = b""
-        with open(where_from, "rb") as font_file_handle:
-            font_file_bytes = font_file_handle.read()
+    def __true_type_from_bytes(font_file_bytes: bytes) -> "Font":
 
         # determine character_code_to_character_name
         # AND its inverse
@@ -262,8 +266,8 @@ class TrueTypeFont(SimpleFont):
         # IF the highest character_code is higher than 255
         # THEN we need something other than a TrueTypeFont
         if max(character_code_to_character_name.keys()) >= 256:
-            type_0_font: Font = TrueTypeFont.__type_0_font_from_file(
-                where_from=where_from
+            type_0_font: Font = TrueTypeFont.__type_0_font_from_ttf_font_file(
+                ttf_font_file=ttf_font_file
             )
             type_0_font[name("DescendantFonts")][0][name("FontDescriptor")][
                 name("FontFile2")
@@ -307,10 +311,9 @@ class TrueTypeFont(SimpleFont):
         with open(where_from, "rb") as font_file_handle:
             font_file_bytes = font_file_handle.read()
 
-        # determine character_code_to_character_name
-        # AND its inverse
-        # fmt: off
+        # parse
         import io
+
         try:
             from fontTools.ttLib import TTFont  # type: ignore[import-not-found]
         except ImportError:
@@ -318,7 +321,18 @@ class TrueTypeFont(SimpleFont):
                 "Please install the 'fontTools' library to use the TrueTypeFont class. "
                 "You can install it with 'pip install fonttools'."
             )
-        ttf_font_file: TTFont = TTFont(io.BytesIO(font_file_bytes))
+
+        # build Type0Font
+        return TrueTypeFont.__type_0_font_from_ttf_font_file(
+            ttf_font_file=TTFont(io.BytesIO(font_file_bytes))
+        )
+
+    @staticmethod
+    def __type_0_font_from_ttf_font_file(ttf_font_file: "fontTools.ttLib.ttFont.TTFont") -> "Font":  # type: ignore[name-defined]
+
+        # determine character_code_to_character_name
+        # AND its inverse
+        # fmt: off
         character_code_to_character_name: typing.Dict[int, str] = ttf_font_file.getBestCmap()
         character_name_to_character_code: typing.Dict[str, int] =  {v:k for k,v in character_code_to_character_name.items()}
         # fmt: on
@@ -402,5 +416,23 @@ class TrueTypeFont(SimpleFont):
             assert where_from.exists()
             assert where_from.name.endswith(".ttf")
 
+        # get the bytes
+        font_file_bytes: bytes = b""
+        with open(where_from, "rb") as font_file_handle:
+            font_file_bytes = font_file_handle.read()
+
+        # IF the same font file was loaded before
+        # THEN return a copy of the Font that was built then
+        import hashlib
+
+        key: str = hashlib.sha256(font_file_bytes).hexdigest()
+        font: typing.Optional[Font] = FontCache.get(key)
+        if font is not None:
+            return font
+
+        # build the Font
+        font = TrueTypeFont.__true_type_from_bytes(font_file_bytes=font_file_bytes)
+        FontCache.put(font=font, key=key)
+
         # return
-        return TrueTypeFont.__true_type_from_file(where_from=where_from)
+        return font
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Subsets (embedded) TrueType fonts, keeping only the glyphs that were used in the Document.
+
+An embedded TrueType font file typically holds (many) more glyphs than a Document uses.
+The `TrueTypeFontSubsetter` builds a copy of a `Font` whose embedded font file only holds the
+glyphs of the character codes that were painted (glyph IDs are retained, so that the
+content streams remain valid). The /W and /ToUnicode entries of Type0 fonts are reduced
+accordingly, and the name of the font gets a subset tag (e.g. ABCDEF+Helvetica).
+"""
+
+import typing
+
+from borb.pdf.font.font import Font
+from borb.pdf.font.simple_font.true_type.true_type_font import TrueTypeFont
+from borb.pdf.primitives import name, stream
+
+
+class TrueTypeFontSubsetter:
+    """
+    Subsets (embedded) TrueType fonts, keeping only the glyphs that were used in the Document.
+
+    An embedded TrueType font file typically holds (many) more glyphs than a Document uses.
+    The `TrueTypeFontSubsetter` builds a copy of a `Font` whose embedded font file only holds the
+    glyphs of the character codes that were painted (glyph IDs are retained, so that the
+    content streams remain valid). The /W and /ToUnicode entries of Type0 fonts are reduced
+    accordingly, and the name of the font gets a subset tag (e.g. ABCDEF+Helvetica).
+    """
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    @staticmethod
+    def __get_character_code_to_width(
+        widths_array: typing.List[typing.Any],
+    ) -> typing.Dict[int, typing.Any]:
+        character_code_to_width: typing.Dict[int, typing.Any] = {}
+        i: int = 0
+        while i + 1 < len(widths_array):
+            # c [w1 w2 ... wn]
+            if isinstance(widths_array[i + 1], list):
+                for j, w in enumerate(widths_array[i + 1]):
+                    character_code_to_width[widths_array[i] + j] = w
+                i += 2
+                continue
+            # c_first c_last w
+            if i + 2 >= len(widths_array):
+                break
+            for j in range(widths_array[i], widths_array[i + 1] + 1):
+                character_code_to_width[j] = widths_array[i + 2]
+            i += 3
+        return character_code_to_width
+
+    @staticmethod
+    def __get_subset_font_file_bytes(
+        descendant_font: typing.Optional[dict],
+        font: Font,
+        font_file: stream,
+        used_character_codes: typing.Set[int],
+    ) -> bytes:
+        import io
+        import logging
+        import zlib
+
+        try:
+            from fontTools import subset  # type: ignore[import-not-found, import-untyped]
+        except ImportError:
+            raise ImportError(
+                "Please install the 'fontTools' library to use the TrueTypeFont class. "
+                "You can install it with 'pip install fonttools'."
+            )
+        options = subset.Options()
+        options.notdef_outline = True
+        options.recalc_timestamp = False
+        options.retain_gids = True
+        ttf_font_file = subset.load_font(
+            io.BytesIO(zlib.decompress(font_file["Bytes"])), options
+        )
+        subsetter = subset.Subsetter(options)
+        if descendant_font is not None:
+            # CIDToGIDMap is Identity, so the character codes are the glyph IDs
+            subsetter.populate(gids=sorted(used_character_codes))
+        else:
+            # the /Differences map the character codes to glyph names
+            character_code_to_character_name: typing.Dict[int, str] = {}
+            character_code: int = 0
+            for x in font.get("Encoding", {}).get("Differences", []):
+                if isinstance(x, int):
+                    character_code = x
+                    continue
+                character_code_to_character_name[character_code] = str(x)
+                character_code += 1
+            subsetter.populate(
+                glyphs=[
+                    character_code_to_character_name[x]
+                    for x in used_character_codes
+                    if x in character_code_to_character_name
+                ],
+                unicodes=[
+                    ord(c)
+                    for c in [font.get_character(x) for x in used_character_codes]
+                    if len(c) == 1
+                ],
+            )
+
+        # fontTools logs a warning for every table it does not know how to subset (and drops),
+        # these tables are not needed to render the font in a PDF
+        subset_logger: logging.Logger = logging.getLogger(subset.__name__)
+        subset_logger_level: int = subset_logger.level
+        subset_logger.setLevel(logging.ERROR)
+        try:
+            subsetter.subset(ttf_font_file)
+        finally:
+            subset_logger.setLevel(subset_logger_level)
+        font_file_bytes_io = io.BytesIO()
+        subset.save_font(ttf_font_file, font_file_bytes_io, options)
+        return font_file_bytes_io.getvalue()
+
+    @staticmethod
+    def __get_subset_tag(used_character_codes: typing.Set[int]) -> str:
+        # 6 uppercase letters, derived from the character codes
+        import hashlib
+
+        return "".join(
+            [
+                chr(ord("A") + b % 26)
+                for b in hashlib.sha256(
+                    ",".join([str(x) for x in sorted(used_character_codes)]).encode()
+                ).digest()[0:6]
+            ]
+        )
+
+    #
+    # PUBLIC
+    #
+
+    @staticmethod
+    def subset(font: Font) -> Font:
+        """
+        Return a subset of the given `Font`, holding only the glyphs of the character codes that were used.
+
+        The given `Font` is left untouched (it may still be used to add content). If the `Font`
+        can not be subset (e.g. it does not embed a TrueType font file, it was subset before, or none
+        of its characters were used) the `Font` itself is returned. Subsetting the same `Font` (for the same
+        character codes) twice returns the same subset.
+
+        :param font:    the Font to be subset
+        :return:        the subset of the Font (or the Font itself)
+        """
+        # IF none of the characters of the Font were used
+        # THEN there is nothing to subset
+        used_character_codes: typing.Set[int] = set(
+            [x for x in font._Font__used_character_codes if x >= 0]  # type: ignore[attr-defined]
+        )
+        if len(used_character_codes) == 0:
+            return font
+
+        # IF the Font was subset before (for the same characters)
+        # THEN return that same subset (it may already have been written as part of the Document)
+        previous_subset: typing.Optional[Font] = font._Font__subset  # type: ignore[attr-defined]
+        if (
+            previous_subset is not None
+            and previous_subset._Font__used_character_codes == used_character_codes  # type: ignore[attr-defined]
+        ):
+            return previous_subset
+
+        # find the (embedded) font file
+        descendant_font: typing.Optional[dict] = None
+        font_descriptor: typing.Optional[dict] = None
+        if font.get("Subtype") == "Type0":
+            descendant_font = next(iter(font.get("DescendantFonts", [])), None)
+            if not isinstance(descendant_font, dict):
+                return font
+            if descendant_font.get("CIDToGIDMap") != "Identity":
+                return font
+            font_descriptor = descendant_font.get("FontDescriptor")
+        elif font.get("Subtype") == "TrueType":
+            font_descriptor = font.get("FontDescriptor")
+        if not isinstance(font_descriptor, dict):
+            return font
+        font_file: typing.Optional[stream] = font_descriptor.get("FontFile2")
+        if not isinstance(font_file, stream):
+            return font
+        if font_file.get("Filter") not in ["FL", "FlateDecode"]:
+            return font
+
+        # IF the Font has already been subset (its name has a subset tag, e.g. ABCDEF+Helvetica)
+        # THEN do not subset it (again)
+        base_font: str = str(font.get("BaseFont", ""))
+        if len(base_font) > 7 and base_font[6] == "+" and base_font[0:6].isupper():
+            return font
+
+        # subset the font file
+        # the glyph IDs are retained, so that the character codes (in the content streams) remain valid
+        font_file_bytes: bytes = TrueTypeFontSubsetter.__get_subset_font_file_bytes(
+            descendant_font=descendant_font,
+            font=font,
+            font_file=font_file,
+            used_character_codes=used_character_codes,
+        )
+        subset_tag: str = TrueTypeFontSubsetter.__get_subset_tag(used_character_codes)
+
+        # build the subset font
+        # (the original Font is left untouched, it may still be used to add content)
+        import copy
+
+        subset_font_descriptor: dict = copy.copy(font_descriptor)
+        subset_font_descriptor[name("FontFile2")] = TrueTypeFont._TrueTypeFont__get_font_file_stream(font_file_bytes)  # type: ignore[attr-defined]
+        if "FontName" in font_descriptor:
+            subset_font_descriptor[name("FontName")] = name(
+                f"{subset_tag}+{font_descriptor['FontName']}"
+            )
+        subset_font: Font = copy.copy(font)
+        subset_font._Font__used_character_codes = used_character_codes  # type: ignore[attr-defined]
+        subset_font._Font__subset = None  # type: ignore[attr-defined]
+        font._Font__subset = subset_font  # type: ignore[attr-defined]
+        if "BaseFont" in font:
+            subset_font[name("BaseFont")] = name(f"{subset_tag}+{font['BaseFont']}")
+        if descendant_font is None:
+            subset_font[name("FontDescriptor")] = subset_font_descriptor
+            return subset_font
+
+        # IF the Font is a Type0 font
+        # THEN rewrite /W (only the used character codes)
+        subset_descendant_font: dict = copy.copy(descendant_font)
+        subset_descendant_font[name("FontDescriptor")] = subset_font_descriptor
+        if "BaseFont" in subset_font:
+            subset_descendant_font[name("BaseFont")] = subset_font["BaseFont"]
+        character_code_to_width: typing.Dict[int, typing.Any] = (
+            TrueTypeFontSubsetter.__get_character_code_to_width(
+                descendant_font.get("W", [])
+            )
+        )
+        subset_descendant_font[name("W")] = []
+        for x in sorted(used_character_codes):
+            if x in character_code_to_width:
+                subset_descendant_font[name("W")] += [x, [character_code_to_width[x]]]
+        subset_font[name("DescendantFonts")] = [subset_descendant_font]
+
+        # IF the Font is a Type0 font
+        # THEN rewrite /ToUnicode (only the used character codes)
+        pairs: typing.List[typing.Tuple[str, str]] = []
+        for x in sorted(used_character_codes):
+            c: str = font.get_character(x)
+            if c == "�":
+                continue
+            pairs.append(("%04x" % x, c.encode("utf-16-be").hex()))
+        subset_font[name("ToUnicode")] = TrueTypeFont._TrueTypeFont__get_cmap_for_type_0_font_from_pairs(pairs)  # type: ignore[attr-defined]
+
+        # return
+        return subset_font
@@ -10,12 +10,12 @@ whether the annotation is a markup annotation, as detailed in Section 12.5.6.2,
 This class also provides information about the value of the Contents entry for different annotation types.
 """
 
-import functools
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.color.rgb_color import RGBColor
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.page import Page
 from borb.pdf.primitives import name
 
@@ -188,7 +188,7 @@ class Annotation(LayoutElement, dict):
     # PUBLIC
     #
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
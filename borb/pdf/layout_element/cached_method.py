@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The type of a (measurement) method that was decorated using `MeasurementCache.cache`.
+
+A cached method can be called like the original method. The original (uncached) method
+remains available as its `__wrapped__` attribute, e.g. to measure a `LayoutElement`
+without storing (or looking up) the result in the active `MeasurementCache`.
+"""
+
+import typing
+
+
+class CachedMethod(typing.Protocol):
+    """
+    The type of a (measurement) method that was decorated using `MeasurementCache.cache`.
+
+    A cached method can be called like the original method. The original (uncached) method
+    remains available as its `__wrapped__` attribute, e.g. to measure a `LayoutElement`
+    without storing (or looking up) the result in the active `MeasurementCache`.
+    """
+
+    __wrapped__: typing.Callable[..., typing.Any]
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        """Call the (cached) method."""
+        ...
+
+    #
+    # PUBLIC
+    #
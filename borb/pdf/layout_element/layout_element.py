@@ -15,6 +15,7 @@ from borb.pdf.color.color import Color
 from borb.pdf.color.rgb_color import RGBColor
 from borb.pdf.conformance import Conformance
 from borb.pdf.document import Document
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.page import Page
 
 
@@ -329,6 +330,32 @@ class LayoutElement:
         # inject "EMC"
         LayoutElement._append_to_content_stream(page=page, bytes_or_string=f"EMC\n")
 
+    @MeasurementCache.cache
+    def _get_min_and_max_width(self) -> typing.Tuple[int, int]:
+        # The narrowest width this LayoutElement can be laid out in (without overflowing),
+        # and the width it takes when it is given all the room it wants.
+        # Subclasses that know their content (e.g. text) can compute these directly,
+        # the default is to search for the narrowest width using get_size.
+        POSITIVE_INT_INFINITY: int = 2**64
+        max_width: int = self.get_size(
+            available_space=(POSITIVE_INT_INFINITY, POSITIVE_INT_INFINITY)
+        )[0]
+        width_upper: int = max_width
+        width_lower: int = 1
+        while abs(width_upper - width_lower) > 2:
+            width_midpoint: int = (width_upper + width_lower) // 2
+            w: int = self.get_size(
+                available_space=(width_midpoint, POSITIVE_INT_INFINITY)
+            )[0]
+            if w >= width_midpoint:
+                width_lower = width_midpoint
+            if w < width_midpoint:
+                width_upper = width_midpoint
+        min_width: int = self.get_size(
+            available_space=(width_upper, POSITIVE_INT_INFINITY)
+        )[0]
+        return min_width, max_width
+
     def _paint_background_and_borders(
         self, page: "Page", rectangle: typing.Tuple[int, int, int, int]
     ) -> None:
@@ -471,6 +498,16 @@ class LayoutElement:
         LayoutElement._append_to_content_stream(page=page, bytes_or_string="Q\n")
         return
 
+    def _split(
+        self,
+        available_space: typing.Tuple[int, int],
+        available_space_for_remainder: typing.Tuple[int, int],
+    ) -> typing.List["LayoutElement"]:
+        # Split this LayoutElement into parts, the first of which fits in available_space,
+        # the others each fit in available_space_for_remainder (e.g., an empty column or Page).
+        # LayoutElement objects that can not be split return themselves (as the only part).
+        return [self]
+
     #
     # PUBLIC
     #
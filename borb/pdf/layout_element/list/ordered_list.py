@@ -9,12 +9,12 @@ items are appended. This class is useful for managing structured content such as
 numbered lists in documents.
 """
 
-import functools
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.color.x11_color import X11Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.layout_element.list.list import List
 from borb.pdf.layout_element.text.chunk import Chunk
 from borb.pdf.layout_element.text.homogeneous_paragraph import HomogeneousParagraph
@@ -160,7 +160,7 @@ class OrderedList(List):
         # return
         return self
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
@@ -9,13 +9,13 @@ particularly useful for managing structured content where the order does not mat
 making it ideal for creating bulleted lists in documents.
 """
 
-import functools
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.color.x11_color import X11Color
 from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.layout_element.list.list import List
 from borb.pdf.layout_element.text.chunk import Chunk
 from borb.pdf.layout_element.text.homogeneous_paragraph import HomogeneousParagraph
@@ -203,7 +203,7 @@ class UnorderedList(List):
         # return
         return self
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
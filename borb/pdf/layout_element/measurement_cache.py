@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A bounded (LRU) cache for the measurements of `LayoutElement` objects.
+
+Measuring a `LayoutElement` (e.g., determining the size of a `Paragraph` or a `Table`)
+can be expensive, and layout code tends to measure the same element (with the same
+available space) several times. The `MeasurementCache` stores these measurements.
+
+Unlike a process-global cache, a `MeasurementCache` has an explicit scope. Every `Document`
+owns one (which is used whenever content is laid out on its pages), and a `MeasurementCache`
+can be activated for a single layout run by using it as a context manager. Each cache holds at
+most `max_size` entries, evicting the least recently used ones, keeps track of its hits and misses,
+and can be cleared.
+
+Measurements made outside any scope go to the default `MeasurementCache` of the `LayoutElement`
+being measured. These default caches are held in a `weakref.WeakKeyDictionary` (keyed on the
+`LayoutElement`), so they never keep a `LayoutElement` alive, and disappear along with it.
+"""
+
+import collections
+import contextvars
+import functools
+import threading
+import typing
+import weakref
+
+from borb.pdf.layout_element.cached_method import CachedMethod
+
+
+class MeasurementCache:
+    """
+    A bounded (LRU) cache for the measurements of `LayoutElement` objects.
+
+    Measuring a `LayoutElement` (e.g., determining the size of a `Paragraph` or a `Table`)
+    can be expensive, and layout code tends to measure the same element (with the same
+    available space) several times. The `MeasurementCache` stores these measurements.
+
+    Unlike a process-global cache, a `MeasurementCache` has an explicit scope. Every `Document`
+    owns one (which is used whenever content is laid out on its pages), and a `MeasurementCache`
+    can be activated for a single layout run by using it as a context manager. Each cache holds at
+    most `max_size` entries, evicting the least recently used ones, keeps track of its hits and misses,
+    and can be cleared.
+
+    Measurements made outside any scope go to the default `MeasurementCache` of the `LayoutElement`
+    being measured. These default caches are held in a `weakref.WeakKeyDictionary` (keyed on the
+    `LayoutElement`), so they never keep a `LayoutElement` alive, and disappear along with it.
+    """
+
+    __ACTIVE_MEASUREMENT_CACHE: contextvars.ContextVar[
+        typing.Optional["MeasurementCache"]
+    ] = contextvars.ContextVar("active_measurement_cache", default=None)
+    __DEFAULT_MEASUREMENT_CACHES: (
+        "weakref.WeakKeyDictionary[typing.Any, MeasurementCache]"
+    ) = weakref.WeakKeyDictionary()
+    __DEFAULT_MEASUREMENT_CACHES_LOCK: threading.Lock = threading.Lock()
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(self, max_size: int = 65536):
+        """
+        Initialize a new (empty) `MeasurementCache`.
+
+        :param max_size:    The maximum number of measurements held by this cache.
+                            Once this number is reached, the least recently used measurement is evicted.
+        """
+        assert max_size >= 1
+        self.__max_size: int = max_size
+        self.__entries: typing.OrderedDict[typing.Any, typing.Any] = (
+            collections.OrderedDict()
+        )
+        self.__lock: threading.Lock = threading.Lock()
+        self.__number_of_hits: int = 0
+        self.__number_of_misses: int = 0
+        self.__tokens: typing.List[contextvars.Token] = []
+
+    #
+    # PRIVATE
+    #
+
+    def __deepcopy__(self, memodict={}) -> "MeasurementCache":
+        """Return a (new, empty) MeasurementCache with the same maximum size."""
+        # the measurements are keyed on the (original) LayoutElement objects,
+        # so a copy starts out empty
+        return MeasurementCache(max_size=self.__max_size)
+
+    def __enter__(self) -> "MeasurementCache":
+        """Activate this MeasurementCache (until the matching __exit__)."""
+        self.__tokens += [MeasurementCache.__ACTIVE_MEASUREMENT_CACHE.set(self)]
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Deactivate this MeasurementCache, re-activating the previously active one."""
+        MeasurementCache.__ACTIVE_MEASUREMENT_CACHE.reset(self.__tokens.pop())
+
+    def __len__(self) -> int:
+        """Return the number of measurements held by this MeasurementCache."""
+        return len(self.__entries)
+
+    #
+    # PUBLIC
+    #
+
+    @staticmethod
+    def cache(method: typing.Callable) -> CachedMethod:
+        """
+        Decorate a (measurement) method of a `LayoutElement` so that its results are stored in the active `MeasurementCache`.
+
+        The result is keyed on the `LayoutElement`, the method and the arguments.
+        The arguments must therefore be hashable. If no `MeasurementCache` is active,
+        the result is stored in the default `MeasurementCache` of the `LayoutElement`.
+
+        :param method:  The method to be decorated.
+        :return:        The decorated method.
+        """
+        method_name: str = method.__qualname__
+
+        @functools.wraps(method)
+        def cached_method(self, *args, **kwargs):
+            # IF no MeasurementCache is active
+            # THEN use the default MeasurementCache of the LayoutElement
+            # (which must not hold the LayoutElement itself, or it would keep it alive)
+            key: tuple = (method_name, args, tuple(sorted(kwargs.items())))
+            measurement_cache: typing.Optional[MeasurementCache] = (
+                MeasurementCache.get_active()
+            )
+            if measurement_cache is None:
+                measurement_cache = MeasurementCache.get_default(self)
+            else:
+                key = (self,) + key
+            is_hit, value = measurement_cache.get(key)
+            if is_hit:
+                return value
+            value = method(self, *args, **kwargs)
+            measurement_cache.put(key, value)
+            return value
+
+        return cached_method  # type: ignore[return-value]
+
+    def clear(self) -> "MeasurementCache":
+        """
+        Remove all measurements from this `MeasurementCache`, and reset its hit/miss counters.
+
+        :return:    Self, this allows for method-chaining
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__number_of_hits = 0
+            self.__number_of_misses = 0
+        return self
+
+    def get(self, key: typing.Any) -> typing.Tuple[bool, typing.Any]:
+        """
+        Look up a measurement in this `MeasurementCache`.
+
+        This method returns a tuple (is_hit, value). On a hit, the measurement
+        becomes the most recently used one.
+
+        :param key: The key of the measurement.
+        :return:    A tuple containing whether the key was found, and its measurement (or None).
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                self.__number_of_hits += 1
+                return True, self.__entries[key]
+            self.__number_of_misses += 1
+            return False, None
+
+    @staticmethod
+    def get_active() -> typing.Optional["MeasurementCache"]:
+        """
+        Return the `MeasurementCache` that is currently active.
+
+        This is the innermost `MeasurementCache` that was entered (as a context manager),
+        or None if there is none.
+
+        :return:    The active `MeasurementCache`, or None.
+        """
+        return MeasurementCache.__ACTIVE_MEASUREMENT_CACHE.get()
+
+    @staticmethod
+    def get_default(layout_element: "LayoutElement") -> "MeasurementCache":  # type: ignore[name-defined]
+        """
+        Return the default `MeasurementCache` of the given `LayoutElement`.
+
+        The default `MeasurementCache` of a `LayoutElement` is used for all of its measurements
+        made outside of any explicit scope. It only lives as long as the `LayoutElement` does.
+
+        :param layout_element:  The LayoutElement.
+        :return:                The default `MeasurementCache` of the LayoutElement.
+        """
+        with MeasurementCache.__DEFAULT_MEASUREMENT_CACHES_LOCK:
+            measurement_cache: typing.Optional[MeasurementCache] = (
+                MeasurementCache.__DEFAULT_MEASUREMENT_CACHES.get(layout_element)
+            )
+            if measurement_cache is None:
+                measurement_cache = MeasurementCache()
+                MeasurementCache.__DEFAULT_MEASUREMENT_CACHES[layout_element] = (
+                    measurement_cache
+                )
+            return measurement_cache
+
+    def get_max_size(self) -> int:
+        """
+        Return the maximum number of measurements held by this `MeasurementCache`.
+
+        :return:    The maximum number of measurements.
+        """
+        return self.__max_size
+
+    def get_number_of_hits(self) -> int:
+        """
+        Return the number of lookups that were answered by this `MeasurementCache`.
+
+        :return:    The number of hits.
+        """
+        return self.__number_of_hits
+
+    def get_number_of_misses(self) -> int:
+        """
+        Return the number of lookups that were not answered by this `MeasurementCache`.
+
+        :return:    The number of misses.
+        """
+        return self.__number_of_misses
+
+    def put(self, key: typing.Any, value: typing.Any) -> "MeasurementCache":
+        """
+        Store a measurement in this `MeasurementCache`.
+
+        If this `MeasurementCache` is full, the least recently used measurement is evicted.
+
+        :param key:     The key of the measurement.
+        :param value:   The measurement.
+        :return:        Self, this allows for method-chaining
+        """
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+        return self
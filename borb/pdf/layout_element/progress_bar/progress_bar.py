@@ -8,13 +8,13 @@ status of a task or process within a PDF layout. The progress bar can be customi
 appearance, size, and percentage completion.
 """
 
-import functools
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.color.rgb_color import RGBColor
 from borb.pdf.color.x11_color import X11Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.page import Page
 
 
@@ -141,7 +141,7 @@ class ProgressBar(LayoutElement):
     # PUBLIC
     #
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
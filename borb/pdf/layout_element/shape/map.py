@@ -11,7 +11,6 @@ such as Europe or the entire globe.
 Use this class to generate maps, customize region appearances, and integrate geographic shapes into a PDF.
 """
 
-import functools
 import math
 import typing
 
@@ -19,6 +18,7 @@ from borb.pdf.color.color import Color
 from borb.pdf.color.rgb_color import RGBColor
 from borb.pdf.color.x11_color import X11Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.layout_element.shape.shape import Shape
 from borb.pdf.page import Page
 
@@ -225,7 +225,7 @@ class Map(Shape):
     # PUBLIC
     #
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
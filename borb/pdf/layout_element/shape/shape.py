@@ -15,7 +15,6 @@ It inherits from `LayoutElement`, allowing it to be integrated into a larger
 document structure.
 """
 
-import functools
 import math
 import typing
 
@@ -23,6 +22,7 @@ from borb.pdf.color.color import Color
 from borb.pdf.color.rgb_color import RGBColor
 from borb.pdf.color.x11_color import X11Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.page import Page
 
 PolygonType: typing.TypeAlias = typing.List[typing.Tuple[float, float]]
@@ -229,7 +229,7 @@ class Shape(LayoutElement):
         """
         return self.__coordinates
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
@@ -9,12 +9,12 @@ alignment and appearance across all rows, making it suitable for structured data
 uniformity in column width is important.
 """
 
-import functools
 import math
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.layout_element.table.table import Table
 from borb.pdf.page import Page
 
@@ -57,6 +57,7 @@ class FixedColumnWidthTable(Table):
         margin_left: int = 0,
         margin_right: int = 0,
         margin_top: int = 0,
+        number_of_header_rows: int = 0,
         padding_bottom: int = 0,
         padding_left: int = 0,
         padding_right: int = 0,
@@ -92,6 +93,7 @@ class FixedColumnWidthTable(Table):
         :param margin_left:             Space between the table and the left page margin.
         :param margin_right:            Space between the table and the right page margin.
         :param margin_top:              Space between the table and the element above it.
+        :param number_of_header_rows:   The number of (header) rows to be repeated when the table is split across pages.
         :param padding_bottom:          Padding inside the table at the bottom.
         :param padding_left:            Padding inside the table on the left side.
         :param padding_right:           Padding inside the table on the right side.
@@ -118,6 +120,7 @@ class FixedColumnWidthTable(Table):
             margin_left=margin_left,
             margin_right=margin_right,
             margin_top=margin_top,
+            number_of_header_rows=number_of_header_rows,
             padding_bottom=padding_bottom,
             padding_left=padding_left,
             padding_right=padding_right,
@@ -132,35 +135,19 @@ class FixedColumnWidthTable(Table):
     # PRIVATE
     #
 
-    #
-    # PUBLIC
-    #
-
-    @functools.cache
-    def get_size(
-        self, available_space: typing.Tuple[int, int]
-    ) -> typing.Tuple[int, int]:
-        """
-        Calculate and return the size of the layout element based on available space.
-
-        This function uses the available space to compute the size (width, height)
-        of the layout element in points.
-
-        :param available_space: Tuple representing the available space (width, height).
-        :return:                Tuple containing the size (width, height) in points.
-        """
-        # calculate column_widths
+    def __compute_column_widths(self, available_width: int) -> None:
         # IF we are a FlexibleColumnWidthTable
         # THEN avoid "normalizing" the widths (aka interpreting them as a ratio of the FULL page width)
         # fmt: off
         from borb.pdf.layout_element.table.flexible_column_width_table import \
             FlexibleColumnWidthTable
         if not isinstance(self, FlexibleColumnWidthTable):
-            w_avail: int = available_space[0] - self.get_padding_left() - self.get_padding_right()
+            w_avail: int = available_width - self.get_padding_left() - self.get_padding_right()
             self.__column_widths = [int((x / sum(self.__column_widths)) * w_avail) for x in self.__column_widths]
             self.__column_widths[0] += (w_avail - sum(self.__column_widths))
         # fmt: on
 
+    def __get_row_heights(self) -> typing.List[int]:
         # utility function to get the column_width for a given element
         def _get_available_width(e: Table.TableCell) -> int:
             # fmt: off
@@ -180,6 +167,100 @@ class FixedColumnWidthTable(Table):
                     for e in self.get_row(row_index)
                 ]
             )
+        return row_height
+
+    def _split(
+        self,
+        available_space: typing.Tuple[int, int],
+        available_space_for_remainder: typing.Tuple[int, int],
+    ) -> typing.List[LayoutElement]:
+        number_of_rows: int = self._Table__number_of_rows  # type: ignore[attr-defined]
+        number_of_header_rows: int = self.get_number_of_header_rows()
+
+        # measure (all rows of) the Table, once
+        self.__compute_column_widths(available_width=available_space[0])
+        row_heights: typing.List[int] = self.__get_row_heights()
+
+        # IF the Table fits in (an empty) available_space_for_remainder
+        # THEN it is kept together (and moved there by the PageLayout)
+        padding: int = self.get_padding_top() + self.get_padding_bottom()
+        if sum(row_heights) + padding <= available_space_for_remainder[1]:
+            return [self]
+
+        # The Table can only be split between rows that are not spanned by a single TableCell.
+        # The header rows are kept together with the row that follows them.
+        can_split_after: typing.List[bool] = [
+            r >= number_of_header_rows for r in range(0, number_of_rows)
+        ]
+        for v in self._Table__inner_layout_element_to_table_coordinates.values():  # type: ignore[attr-defined]
+            for r in range(min([r for r, _ in v]), max([r for r, _ in v])):
+                can_split_after[r] = False
+        groups_of_rows: typing.List[typing.List[int]] = [[]]
+        for r in range(0, number_of_rows):
+            groups_of_rows[-1] += [r]
+            if can_split_after[r] and r != number_of_rows - 1:
+                groups_of_rows += [[]]
+
+        # distribute the groups (greedily) over the parts
+        # each part (but the first) starts with the header rows
+        header_rows: typing.List[int] = [r for r in range(0, number_of_header_rows)]
+        header_height: int = sum(row_heights[:number_of_header_rows])
+        parts: typing.List[typing.List[int]] = [[]]
+        h_avail: int = available_space[1] - padding
+        h: int = 0
+        for group_of_rows in groups_of_rows:
+            h_group: int = sum([row_heights[r] for r in group_of_rows])
+
+            # IF not even the first group fits
+            # THEN the first part will be moved to the next column (by the PageLayout)
+            if len(parts) == 1 and len(parts[0]) == 0 and h_group > h_avail:
+                h_avail = available_space_for_remainder[1] - padding
+
+            # IF the group does not fit (and the part holds more than the header rows)
+            # THEN start a new part
+            if h + h_group > h_avail and len(parts[-1]) > (
+                0 if len(parts) == 1 else number_of_header_rows
+            ):
+                parts += [[r for r in header_rows]]
+                h = header_height
+                h_avail = available_space_for_remainder[1] - padding
+
+            parts[-1] += group_of_rows
+            h += h_group
+
+        # IF the Table fits
+        # THEN it does not need to be split
+        if len(parts) == 1:
+            return [self]
+
+        # build a Table for each part
+        out: typing.List[LayoutElement] = []
+        for rows in parts:
+            out += [self._Table__get_table_with_rows(rows)]  # type: ignore[attr-defined]
+        return out
+
+    #
+    # PUBLIC
+    #
+
+    @MeasurementCache.cache
+    def get_size(
+        self, available_space: typing.Tuple[int, int]
+    ) -> typing.Tuple[int, int]:
+        """
+        Calculate and return the size of the layout element based on available space.
+
+        This function uses the available space to compute the size (width, height)
+        of the layout element in points.
+
+        :param available_space: Tuple representing the available space (width, height).
+        :return:                Tuple containing the size (width, height) in points.
+        """
+        # calculate column_widths
+        self.__compute_column_widths(available_width=available_space[0])
+
+        # determine the height of each row
+        row_height: typing.List[int] = self.__get_row_heights()
 
         # return
         return (
@@ -9,12 +9,12 @@ This allows for flexible and adaptive layouts where the column widths expand or
 depending on the content they contain, ensuring that the table remains visually balanced.
 """
 
-import functools
 import math
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.layout_element.table.fixed_column_width_table import FixedColumnWidthTable
 
 
@@ -52,6 +52,7 @@ class FlexibleColumnWidthTable(FixedColumnWidthTable):
         margin_left: int = 0,
         margin_right: int = 0,
         margin_top: int = 0,
+        number_of_header_rows: int = 0,
         padding_bottom: int = 0,
         padding_left: int = 0,
         padding_right: int = 0,
@@ -86,6 +87,7 @@ class FlexibleColumnWidthTable(FixedColumnWidthTable):
         :param margin_left:             Space between the table and the left page margin.
         :param margin_right:            Space between the table and the right page margin.
         :param margin_top:              Space between the table and the element above it.
+        :param number_of_header_rows:   The number of (header) rows to be repeated when the table is split across pages.
         :param padding_bottom:          Padding inside the table at the bottom.
         :param padding_left:            Padding inside the table on the left side.
         :param padding_right:           Padding inside the table on the right side.
@@ -112,12 +114,14 @@ class FlexibleColumnWidthTable(FixedColumnWidthTable):
             margin_left=margin_left,
             margin_right=margin_right,
             margin_top=margin_top,
+            number_of_header_rows=number_of_header_rows,
             padding_bottom=padding_bottom,
             padding_left=padding_left,
             padding_right=padding_right,
             padding_top=padding_top,
             vertical_alignment=vertical_alignment,
         )
+        self.__has_final_column_widths: bool = False
 
     #
     # PRIVATE
@@ -126,56 +130,78 @@ class FlexibleColumnWidthTable(FixedColumnWidthTable):
     def __calculate_and_set_column_width(
         self, available_space: typing.Tuple[int, int]
     ) -> None:
-        # fmt: off
-        column_min_widths: typing.List[int] = [max([math.ceil(FlexibleColumnWidthTable.__narrowest_landscape_box(e)[0] / e.get_column_span()) for e in self.get_column(c)]) for c in range(0, self._Table__number_of_columns)]  # type: ignore[attr-defined]
-        column_max_widths: typing.List[int] = [max([math.ceil(FlexibleColumnWidthTable.__widest_landscape_box(e)[0] / e.get_column_span()) for e in self.get_column(c)]) for c in range(0, self._Table__number_of_columns)]     # type: ignore[attr-defined]
-        # fmt: on
-
-        # fmt: off
-        self._FixedColumnWidthTable__column_widths: typing.List[int] = [cw for cw in column_min_widths]
-        number_of_expandable_columns: int = sum([1 if cw < cmw else 0 for cw, cmw in zip(self._FixedColumnWidthTable__column_widths, column_max_widths)])
-        remaining_width: int = available_space[0] - sum(self._FixedColumnWidthTable__column_widths)
-        while remaining_width > 0 and 0 < number_of_expandable_columns <= remaining_width:
-            self._FixedColumnWidthTable__column_widths = [(cw + 1 if cw < cmw else cw) for cw, cmw in zip(self._FixedColumnWidthTable__column_widths, column_max_widths)]
-
-            # calculate number of expandable columns
-            number_of_expandable_columns = sum([1 if cw < cmw else 0 for cw, cmw in zip(self._FixedColumnWidthTable__column_widths, column_max_widths)])
-
-            # calculate remaining width
-            remaining_width = available_space[0] - sum(self._FixedColumnWidthTable__column_widths)
-
-        # fmt: on
-
-    @staticmethod
-    def __narrowest_landscape_box(e: LayoutElement) -> typing.Tuple[int, int]:
-        POSITIVE_INT_INFINITY: int = 2**64
-        width_upper: int = e.get_size(
-            available_space=(POSITIVE_INT_INFINITY, POSITIVE_INT_INFINITY)
-        )[0]
-        width_lower: int = 1
-        while abs(width_upper - width_lower) > 2:
-            width_midpoint: int = (width_upper + width_lower) // 2
-            w: int = e.get_size(
-                available_space=(width_midpoint, POSITIVE_INT_INFINITY)
-            )[0]
-            if w >= width_midpoint:
-                width_lower = width_midpoint
-            if w < width_midpoint:
-                width_upper = width_midpoint
-        return e.get_size(available_space=(width_upper, POSITIVE_INT_INFINITY))
-
-    @staticmethod
-    def __widest_landscape_box(e: LayoutElement) -> typing.Tuple[int, int]:
-        POSITIVE_INT_INFINITY: int = 2**64
-        return e.get_size(
-            available_space=(POSITIVE_INT_INFINITY, POSITIVE_INT_INFINITY)
+        # determine the min/max width of each column (measuring each cell only once)
+        number_of_columns: int = self._Table__number_of_columns  # type: ignore[attr-defined]
+        column_min_widths: typing.List[int] = [0 for _ in range(0, number_of_columns)]
+        column_max_widths: typing.List[int] = [0 for _ in range(0, number_of_columns)]
+        for e in self._Table__inner_layout_elements:  # type: ignore[attr-defined]
+            min_width, max_width = e._get_min_and_max_width()
+            min_width = math.ceil(min_width / e.get_column_span())
+            max_width = math.ceil(max_width / e.get_column_span())
+            for c in set([c for _, c in self._Table__inner_layout_element_to_table_coordinates[e]]):  # type: ignore[attr-defined]
+                column_min_widths[c] = max(column_min_widths[c], min_width)
+                column_max_widths[c] = max(column_max_widths[c], max_width)
+
+        # Each column starts at its min width. Then (in rounds) every column that has not yet
+        # reached its max width is widened by 1pt, for as long as there is (at least) 1pt left
+        # for each of those columns. Rather than going round by round, we jump ahead to the round
+        # in which the next column reaches its max width (or in which we run out of room).
+        gaps: typing.List[int] = sorted(
+            [
+                cmw - cw
+                for cw, cmw in zip(column_min_widths, column_max_widths)
+                if cw < cmw
+            ]
         )
+        remaining_width: int = available_space[0] - sum(column_min_widths)
+        number_of_rounds: int = 0
+        i: int = 0
+        while i < len(gaps):
+            number_of_expandable_columns: int = len(gaps) - i
+            if remaining_width < number_of_expandable_columns:
+                break
+            delta: int = min(
+                gaps[i] - number_of_rounds,
+                remaining_width // number_of_expandable_columns,
+            )
+            number_of_rounds += delta
+            remaining_width -= delta * number_of_expandable_columns
+            while i < len(gaps) and gaps[i] <= number_of_rounds:
+                i += 1
+
+        # set column widths
+        self._FixedColumnWidthTable__column_widths: typing.List[int] = [
+            min(cmw, cw + number_of_rounds) if cw < cmw else cw
+            for cw, cmw in zip(column_min_widths, column_max_widths)
+        ]
+
+    def _split(
+        self,
+        available_space: typing.Tuple[int, int],
+        available_space_for_remainder: typing.Tuple[int, int],
+    ) -> typing.List[LayoutElement]:
+        # determine the column widths (for the available width)
+        if not self.__has_final_column_widths:
+            self.__calculate_and_set_column_width(available_space=available_space)
+
+        parts: typing.List[LayoutElement] = super()._split(
+            available_space=available_space,
+            available_space_for_remainder=available_space_for_remainder,
+        )
+
+        # IF the Table was split
+        # THEN each part keeps the column widths of the (whole) Table
+        if len(parts) > 1:
+            for t in parts:
+                assert isinstance(t, FlexibleColumnWidthTable)
+                t.__has_final_column_widths = True
+        return parts
 
     #
     # PUBLIC
     #
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
@@ -188,5 +214,6 @@ class FlexibleColumnWidthTable(FixedColumnWidthTable):
         :param available_space: Tuple representing the available space (width, height).
         :return:                Tuple containing the size (width, height) in points.
         """
-        self.__calculate_and_set_column_width(available_space=available_space)
+        if not self.__has_final_column_widths:
+            self.__calculate_and_set_column_width(available_space=available_space)
         return super().get_size(available_space=available_space)
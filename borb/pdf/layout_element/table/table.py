@@ -10,12 +10,13 @@ organization and presentation of data in a structured format, allowing
 for the rendering of complex layouts.
 """
 
-import functools
+import collections
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.color.x11_color import X11Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.page import Page
 
 
@@ -138,6 +139,14 @@ class Table(LayoutElement):
         # PRIVATE
         #
 
+        @MeasurementCache.cache
+        def _get_min_and_max_width(self) -> typing.Tuple[int, int]:
+            min_width, max_width = self.__inner_layout_element._get_min_and_max_width()
+            return (
+                min_width + self.get_padding_left() + self.get_padding_right(),
+                max_width + self.get_padding_left() + self.get_padding_right(),
+            )
+
         #
         # PUBLIC
         #
@@ -164,7 +173,7 @@ class Table(LayoutElement):
             """
             return self.__row_span
 
-        @functools.cache
+        @MeasurementCache.cache
         def get_size(
             self, available_space: typing.Tuple[int, int]
         ) -> typing.Tuple[int, int]:
@@ -261,6 +270,7 @@ class Table(LayoutElement):
         margin_left: int = 0,
         margin_right: int = 0,
         margin_top: int = 0,
+        number_of_header_rows: int = 0,
         padding_bottom: int = 0,
         padding_left: int = 0,
         padding_right: int = 0,
@@ -294,6 +304,7 @@ class Table(LayoutElement):
         :param margin_left:              Space between the table and the left page margin.
         :param margin_right:             Space between the table and the right page margin.
         :param margin_top:               Space between the table and the element above it.
+        :param number_of_header_rows:    The number of (header) rows to be repeated when the table is split across pages.
         :param padding_bottom:           Padding inside the table at the bottom.
         :param padding_left:             Padding inside the table on the left side.
         :param padding_right:            Padding inside the table on the right side.
@@ -302,16 +313,25 @@ class Table(LayoutElement):
         """
         assert number_of_rows > 0
         assert number_of_columns > 0
+        assert 0 <= number_of_header_rows <= number_of_rows
         self.__number_of_rows: int = number_of_rows
         self.__number_of_columns: int = number_of_columns
+        self.__number_of_header_rows: int = number_of_header_rows
         self.__inner_layout_elements: typing.List[Table.TableCell] = []
         self.__inner_layout_element_to_table_coordinates: typing.Dict[
             Table.TableCell, typing.List[typing.Tuple[int, int]]
         ] = {}
-        self.__available_table_coordinates: typing.List[typing.Tuple[int, int]] = [
-            (i // self.__number_of_columns, i % self.__number_of_columns)
-            for i in range(self.__number_of_rows * self.__number_of_columns)
-        ]
+        self.__available_table_coordinates: typing.Deque[typing.Tuple[int, int]] = (
+            collections.deque(
+                [
+                    (i // self.__number_of_columns, i % self.__number_of_columns)
+                    for i in range(self.__number_of_rows * self.__number_of_columns)
+                ]
+            )
+        )
+        self.__cells_by_row: typing.Dict[int, typing.List[Table.TableCell]] = {}
+        self.__cells_by_column: typing.Dict[int, typing.List[Table.TableCell]] = {}
+        self.__cells_by_row_and_column_key: typing.Optional[int] = None
 
         super().__init__(
             background_color=background_color,
@@ -342,6 +362,53 @@ class Table(LayoutElement):
     # PRIVATE
     #
 
+    def __index_cells_by_row_and_column(self) -> None:
+        # IF no cells were added (or removed) since we last indexed them
+        # THEN the index is still valid
+        key: int = len(self.__inner_layout_element_to_table_coordinates)
+        if self.__cells_by_row_and_column_key == key:
+            return
+        self.__cells_by_row = {}
+        self.__cells_by_column = {}
+        for e, v in self.__inner_layout_element_to_table_coordinates.items():
+            for r in sorted(set([r for r, _ in v])):
+                self.__cells_by_row.setdefault(r, []).append(e)
+            for c in sorted(set([c for _, c in v])):
+                self.__cells_by_column.setdefault(c, []).append(e)
+        self.__cells_by_row_and_column_key = key
+
+    def __get_table_with_rows(self, rows: typing.List[int]) -> "Table":
+        # build a (shallow) copy of this Table, holding only the given rows
+        # the TableCell objects are shared (rather than copied), so are their measurements
+        # the containers (e.g. the column widths of a FixedColumnWidthTable) are copied,
+        # so that changing (the layout of) the copy does not change this Table
+        import copy
+
+        out: Table = copy.copy(self)
+        for k, v in list(vars(out).items()):
+            if isinstance(v, (collections.deque, dict, list, set)):
+                vars(out)[k] = copy.copy(v)
+        new_row_index: typing.Dict[int, int] = {r: i for i, r in enumerate(rows)}
+        out.__number_of_rows = len(rows)
+        out.__inner_layout_elements = []
+        out.__inner_layout_element_to_table_coordinates = {}
+        out.__available_table_coordinates = collections.deque()
+        out.__cells_by_row = {}
+        out.__cells_by_column = {}
+        out.__cells_by_row_and_column_key = None
+        out._LayoutElement__previous_paint_box = None  # type: ignore[attr-defined]
+        for r in rows:
+            for e in self.get_row(r):
+                if e in out.__inner_layout_element_to_table_coordinates:
+                    continue
+                out.__inner_layout_elements += [e]
+                out.__inner_layout_element_to_table_coordinates[e] = [
+                    (new_row_index[r2], c2)
+                    for r2, c2 in self.__inner_layout_element_to_table_coordinates[e]
+                    if r2 in new_row_index
+                ]
+        return out
+
     #
     # PUBLIC
     #
@@ -365,10 +432,8 @@ class Table(LayoutElement):
         self.__inner_layout_elements += [e2]
 
         # assign table grid coordinates
-        start_row, start_col = min(
-            self.__available_table_coordinates,
-            key=lambda x: x[0] * self.__number_of_columns + x[1],
-        )
+        # (the available coordinates are kept in row-major order)
+        start_row, start_col = self.__available_table_coordinates[0]
         self.__inner_layout_element_to_table_coordinates[e2] = []
         for r in range(start_row, start_row + e2.get_row_span()):
             for c in range(start_col, start_col + e2.get_column_span()):
@@ -391,11 +456,19 @@ class Table(LayoutElement):
                  that span multiple columns.
         :raises IndexError: If the specified column index is out of bounds.
         """
-        return [
-            k
-            for k, v in self.__inner_layout_element_to_table_coordinates.items()
-            if column in [c for _, c in v]
-        ]
+        self.__index_cells_by_row_and_column()
+        return [e for e in self.__cells_by_column.get(column, [])]
+
+    def get_number_of_header_rows(self) -> int:
+        """
+        Return the number of header rows of the table.
+
+        The header rows are repeated at the top of each part of the table, when the table
+        is split across pages (or columns).
+
+        :return: The number of header rows.
+        """
+        return self.__number_of_header_rows
 
     def get_row(self, row: int) -> typing.List[TableCell]:
         """
@@ -410,11 +483,8 @@ class Table(LayoutElement):
                     that span multiple rows.
         :raises IndexError: If the specified row index is out of bounds.
         """
-        return [
-            k
-            for k, v in self.__inner_layout_element_to_table_coordinates.items()
-            if row in [r for r, _ in v]
-        ]
+        self.__index_cells_by_row_and_column()
+        return [e for e in self.__cells_by_row.get(row, [])]
 
     def no_borders(self) -> "Table":
         """
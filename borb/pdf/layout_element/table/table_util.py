@@ -72,7 +72,7 @@ class TableUtil:
         :param header_col:              A boolean indicating if the first column should be treated as a header.
                                         Default is False.
         :param header_row:              A boolean indicating if the first row should be treated as a header.
-                                        Default is True.
+                                        The header row is repeated when the table is split across pages. Default is True.
         :param horizontal_alignment:    Specifies the horizontal alignment of table content.
                                         Can be LEFT, MIDDLE, or RIGHT. Default is LEFT.
         :param padding_bottom:          The amount of padding to apply to the bottom of each cell. Default is 0.
@@ -90,6 +90,7 @@ class TableUtil:
             table = FixedColumnWidthTable(
                 number_of_columns=nof_cols,
                 number_of_rows=nof_rows,
+                number_of_header_rows=1 if header_row else 0,
                 padding_top=padding_top,
                 padding_right=padding_right,
                 padding_bottom=padding_bottom,
@@ -101,6 +102,7 @@ class TableUtil:
             table = FlexibleColumnWidthTable(
                 number_of_columns=nof_cols,
                 number_of_rows=nof_rows,
+                number_of_header_rows=1 if header_row else 0,
                 padding_top=padding_top,
                 padding_right=padding_right,
                 padding_bottom=padding_bottom,
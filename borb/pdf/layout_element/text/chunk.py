@@ -8,7 +8,6 @@ in a `Chunk` starts and ends within the same line in a PDF document, making it t
 smallest unit of text within a layout.
 """
 
-import functools
 import typing
 
 from borb.pdf.color.color import Color
@@ -18,6 +17,7 @@ from borb.pdf.font.font import Font
 from borb.pdf.font.simple_font.helvetica.helvetica import Helvetica
 from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.page import Page
 from borb.pdf.primitives import name
 
@@ -203,6 +203,12 @@ class Chunk(LayoutElement):
         # return
         return s2
 
+    @MeasurementCache.cache
+    def _get_min_and_max_width(self) -> typing.Tuple[int, int]:
+        # a Chunk does not wrap, its width does not depend on the available space
+        w: int = self.get_size(available_space=(2**64, 2**64))[0]
+        return w, w
+
     #
     # PUBLIC
     #
@@ -253,7 +259,7 @@ class Chunk(LayoutElement):
         """
         return self.__font_size
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
@@ -363,7 +369,9 @@ class Chunk(LayoutElement):
         super()._paint_background_and_borders(
             page=page, rectangle=(background_x, background_y, w, h)
         )
-        self._LayoutElement__previous_paint_box = (background_x, background_y, w, h)
+        self._LayoutElement__previous_paint_box: typing.Optional[
+            typing.Tuple[int, int, int, int]
+        ] = (background_x, background_y, w, h)
 
         # leading newline (if needed)
         Chunk._append_newline_to_content_stream(page)
@@ -435,6 +443,12 @@ class Chunk(LayoutElement):
                 page=page, bytes_or_string=f"[{tj_arg}] TJ\n"
             )
 
+        # keep track of the characters that were used
+        # (so that the (embedded) Font can be subset when the Document is written)
+        page_font: Font = page["Resources"]["Font"][font_name]
+        if isinstance(page_font, Font):
+            page_font._add_used_characters(self.__text)
+
         # end text
         LayoutElement._append_to_content_stream(page=page, bytes_or_string="ET\n")
 
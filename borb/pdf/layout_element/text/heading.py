@@ -226,6 +226,14 @@ class Heading(Paragraph):
             * font_size
         )
 
+    def _split(
+        self,
+        available_space: typing.Tuple[int, int],
+        available_space_for_remainder: typing.Tuple[int, int],
+    ) -> typing.List[LayoutElement]:
+        # a Heading (and its outline) is kept together
+        return [self]
+
     #
     # PUBLIC
     #
@@ -9,13 +9,15 @@ fonts, sizes, colors, etc. The user can pass `Chunk` objects to form the
 paragraph, where each `Chunk` can have its own styling properties.
 """
 
-import functools
+import copy
 import math
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.layout_element.text.chunk import Chunk
+from borb.pdf.layout_element.text.line_breaker import LineBreaker
 from borb.pdf.page import Page
 
 
@@ -29,6 +31,9 @@ class HeterogeneousParagraph(LayoutElement):
     paragraph, where each `Chunk` can have its own styling properties.
     """
 
+    __MIN_NUMBER_OF_LINES_AT_BOTTOM_OF_COLUMN: int = 2  # orphan control
+    __MIN_NUMBER_OF_LINES_AT_TOP_OF_COLUMN: int = 2  # widow control
+
     #
     # CONSTRUCTOR
     #
@@ -50,11 +55,13 @@ class HeterogeneousParagraph(LayoutElement):
         border_width_top: int = 0,
         fixed_leading: typing.Optional[int] = None,
         horizontal_alignment: LayoutElement.HorizontalAlignment = LayoutElement.HorizontalAlignment.LEFT,
+        hyphenation: typing.Optional[typing.Callable[[str], typing.List[str]]] = None,
         margin_bottom: int = 0,
         margin_left: int = 0,
         margin_right: int = 0,
         margin_top: int = 0,
         multiplied_leading: typing.Optional[float] = 1.2,
+        optimal_line_breaking: bool = False,
         padding_bottom: int = 0,
         padding_left: int = 0,
         padding_right: int = 0,
@@ -89,10 +96,14 @@ class HeterogeneousParagraph(LayoutElement):
         :param border_width_right:      Width of the right border. Defaults to 0.
         :param border_width_top:        Width of the top border. Defaults to 0.
         :param horizontal_alignment:    Alignment of the paragraph within its containing element. Defaults to left alignment.
+        :param hyphenation:             Optional function that splits a word into the fragments between which it may be hyphenated
+                                        (e.g. "hyphenation" -> ["hy", "phen", "a", "tion"]). Only used with optimal line breaking.
         :param margin_bottom:           Bottom margin around the paragraph. Defaults to 0.
         :param margin_left:             Left margin around the paragraph. Defaults to 0.
         :param margin_right:            Right margin around the paragraph. Defaults to 0.
         :param margin_top:              Top margin around the paragraph. Defaults to 0.
+        :param optimal_line_breaking:   Whether to choose the line breaks for the paragraph as a whole (minimizing the unused space
+                                        on every line but the last), rather than filling each line greedily. Defaults to False.
         :param padding_bottom:          Padding inside the bottom of the paragraph. Defaults to 0.
         :param padding_left:            Padding inside the left of the paragraph. Defaults to 0.
         :param padding_right:           Padding inside the right of the paragraph. Defaults to 0.
@@ -124,107 +135,52 @@ class HeterogeneousParagraph(LayoutElement):
             vertical_alignment=vertical_alignment,
         )
         self.__fixed_leading: typing.Optional[float] = fixed_leading
+        self.__justify_last_line: bool = False
+        self.__lines: typing.Optional[typing.List[typing.List[Chunk]]] = None
         self.__multiplied_leading: typing.Optional[float] = multiplied_leading
+        self.__optimal_line_breaking: bool = optimal_line_breaking
         self.__preserve_whitespaces: bool = preserve_whitespaces
         self.__text_alignment: LayoutElement.TextAlignment = text_alignment
-        self.__split_chunk_to_original_chunk: typing.Dict[Chunk, Chunk] = {}
-        self.__chunks: typing.List[Chunk] = []
-        for i, ch in enumerate(chunks):
-            words: typing.List[str] = HeterogeneousParagraph.__split_str(
-                ch.get_text(), preserve_whitespaces=self.__preserve_whitespaces
-            )
-
-            # IF there are no words
-            # THEN skip
-            if len(words) == 0:
-                continue
-
-            # IF the chunk is NOT the last chunk
-            #   AND ends with whitespace
-            #   AND we don't need to preserve the original whitespace
-            # THEN force the chunk to end with a whitespace
-            if (
-                i != len(chunks) - 1
-                and ch.get_text().endswith(" ")
-                and (not preserve_whitespaces)
-            ):
-                words[-1] += " "
-
-            # IF the chunk is NOT the first chunk
-            #   AND starts with whitespace
-            #   AND the previous chunk does not end with a whitespace
-            #   AND we don't need to preserve the original whitespaces
-            # THEN force the chunk to start with a whitespace
-            if (
-                i != 0
-                and ch.get_text().startswith(" ")
-                and (not chunks[i - 1].get_text().endswith(" "))
-                and (not preserve_whitespaces)
-            ):
-                words[0] = " " + words[0]
-
-            for w in words:
-                # IF the chunk is empty
-                # THEN continue
-                if w == "":
-                    continue
-                # append a separate chunk for the word
-                self.__chunks += [
-                    Chunk(
-                        w,
-                        background_color=ch.get_background_color(),
-                        border_color=ch.get_border_color(),
-                        border_dash_pattern=ch.get_border_dash_pattern(),
-                        border_dash_phase=ch.get_border_dash_phase(),
-                        border_width_top=ch.get_border_width_top(),
-                        border_width_right=ch.get_border_width_right(),
-                        border_width_bottom=ch.get_border_width_bottom(),
-                        border_width_left=ch.get_border_width_left(),
-                        font=ch.get_font(),
-                        font_color=ch.get_font_color(),
-                        font_size=ch.get_font_size(),
-                        horizontal_alignment=ch.get_horizontal_alignment(),
-                        margin_bottom=ch.get_margin_bottom(),
-                        margin_left=ch.get_margin_left(),
-                        margin_right=ch.get_margin_right(),
-                        margin_top=ch.get_margin_top(),
-                        padding_bottom=ch.get_padding_bottom(),
-                        padding_left=ch.get_padding_left(),
-                        padding_right=ch.get_padding_right(),
-                        padding_top=ch.get_padding_top(),
-                        vertical_alignment=ch.get_vertical_alignment(),
-                        character_spacing=ch.get_character_spacing(),
-                    )
-                ]
-                self.__split_chunk_to_original_chunk[self.__chunks[-1]] = ch
+        self.__line_breaker: LineBreaker = LineBreaker(
+            chunks=chunks,
+            hyphenation=hyphenation,
+            preserve_whitespaces=preserve_whitespaces,
+        )
+        self.__chunks: typing.List[Chunk] = self.__line_breaker.get_chunks()
 
     #
     # PRIVATE
     #
 
-    @functools.cache
+    def __get_line_height(self, line: typing.List[Chunk]) -> int:
+        h: int = max(
+            [c.get_size(available_space=(2**64, 2**64))[1] for c in line] + [0]
+        )
+        return int(
+            math.ceil(
+                h * (self.__multiplied_leading or 1.0) + (self.__fixed_leading or 0.0)
+            )
+        )
+
+    @MeasurementCache.cache
     def __get_lines(
         self,
         available_space: typing.Tuple[int, int],
         preserve_whitespaces: bool = False,
     ) -> typing.List[typing.List[Chunk]]:
 
-        current_line_width: int = 0
-        lines: typing.List[typing.List[Chunk]] = [[]]
-        for c in self.__chunks:
-            w, h = c.get_size(available_space=available_space)
-
-            # IF the chunk fits on the line
-            # THEN append the chunk to the line
-            # THEN update the current_line_width
-            if current_line_width + w <= available_space[0]:
-                current_line_width += w
-                lines[-1] += [c]
-                continue
+        # IF this HeterogeneousParagraph is a part of a split HeterogeneousParagraph
+        # THEN its lines have already been determined
+        if self.__lines is not None:
+            return self.__lines
 
-            # start a new line
-            lines += [[c]]
-            current_line_width = w
+        # fmt: off
+        lines: typing.List[typing.List[Chunk]] = (
+            self.__line_breaker.get_optimal_lines(available_width=available_space[0], preserve_whitespaces=preserve_whitespaces)
+            if self.__optimal_line_breaking
+            else self.__line_breaker.get_greedy_lines(available_width=available_space[0])
+        )
+        # fmt: on
 
         # remove leading/trailing spaces
         if not preserve_whitespaces:
@@ -239,30 +195,114 @@ class HeterogeneousParagraph(LayoutElement):
         # return
         return lines
 
-    @staticmethod
-    def __split_str(s: str, preserve_whitespaces: bool = False) -> typing.List[str]:
-        import re
-
-        xs: typing.List[str] = []
-        if preserve_whitespaces:
-            for x in re.split(r"(\s+)", re.sub(r"\s", " ", s)):
-                xs.append(x)
-        else:
-            for x in re.split(r"\s+", s):
-                xs.append(x)
-                xs.append(" ")
-            xs = xs[:-1]
-            while len(xs) > 0 and (xs[0] == " " or xs[0] == ""):
-                xs = xs[1:]
-            while len(xs) > 0 and (xs[-1] == " " or xs[-1] == ""):
-                xs = xs[:-1]
-        return xs
+    @MeasurementCache.cache
+    def _get_min_and_max_width(self) -> typing.Tuple[int, int]:
+        # IF the text is justified
+        # THEN it consumes all available width, fall back to (searching with) get_size
+        if self.__text_alignment == LayoutElement.TextAlignment.JUSTIFIED:
+            return super()._get_min_and_max_width()
+
+        # the narrowest line holds (only) the widest Chunk,
+        # the widest line holds all Chunk objects (minus leading/trailing whitespace)
+        POSITIVE_INT_INFINITY: int = 2**64
+        chunks: typing.List[Chunk] = [c for c in self.__chunks]
+        if not self.__preserve_whitespaces:
+            while len(chunks) > 0 and chunks[0].get_text().isspace():
+                chunks.pop(0)
+            while len(chunks) > 0 and chunks[-1].get_text().isspace():
+                chunks.pop(-1)
+        min_width: int = 0
+        max_width: int = 0
+        for c in chunks:
+            w, _ = c.get_size(
+                available_space=(POSITIVE_INT_INFINITY, POSITIVE_INT_INFINITY)
+            )
+            if self.__preserve_whitespaces or not c.get_text().isspace():
+                min_width = max(min_width, w)
+            max_width += w
+        return (
+            min_width + self.get_padding_left() + self.get_padding_right(),
+            max_width + self.get_padding_left() + self.get_padding_right(),
+        )
+
+    def _split(
+        self,
+        available_space: typing.Tuple[int, int],
+        available_space_for_remainder: typing.Tuple[int, int],
+    ) -> typing.List["LayoutElement"]:
+        # determine the lines (once), and their heights
+        padding_vertical: int = self.get_padding_top() + self.get_padding_bottom()
+        lines: typing.List[typing.List[Chunk]] = self.__get_lines(
+            available_space=(
+                available_space[0] - self.get_padding_left() - self.get_padding_right(),
+                2**64,
+            ),
+            preserve_whitespaces=self.__preserve_whitespaces,
+        )
+        line_heights: typing.List[int] = [self.__get_line_height(l) for l in lines]
+
+        # distribute the lines over the parts
+        # the first part needs to fit in available_space,
+        # every other part needs to fit in available_space_for_remainder
+        parts: typing.List[typing.List[int]] = [[]]
+        h_avail: int = available_space[1] - padding_vertical
+        h: int = 0
+        for i, lh in enumerate(line_heights):
+            # IF the line does not fit in the current part
+            #   AND the current part is not (an empty part of) the remainder
+            # THEN start a new part
+            if h + lh > h_avail and (len(parts) == 1 or len(parts[-1]) > 0):
+                parts += [[]]
+                h_avail = available_space_for_remainder[1] - padding_vertical
+                h = 0
+            parts[-1] += [i]
+            h += lh
+
+        # IF the first part does not hold enough lines (orphan)
+        # THEN this HeterogeneousParagraph should not be split (here)
+        # fmt: off
+        if len(parts[0]) < HeterogeneousParagraph.__MIN_NUMBER_OF_LINES_AT_BOTTOM_OF_COLUMN:
+            return [self]
+        # fmt: on
+
+        # IF the last part does not hold enough lines (widow)
+        # THEN move lines from the part before it (if that part can spare them,
+        #      every part keeps at least __MIN_NUMBER_OF_LINES_AT_BOTTOM_OF_COLUMN lines)
+        # fmt: off
+        n: int = HeterogeneousParagraph.__MIN_NUMBER_OF_LINES_AT_TOP_OF_COLUMN - len(parts[-1])
+        if len(parts) > 1 and n > 0:
+            h_last: int = sum([line_heights[i] for i in parts[-2][-n:] + parts[-1]])
+            if len(parts[-2]) - n >= HeterogeneousParagraph.__MIN_NUMBER_OF_LINES_AT_BOTTOM_OF_COLUMN and h_last <= available_space_for_remainder[1] - padding_vertical:
+                parts[-1] = parts[-2][-n:] + parts[-1]
+                parts[-2] = parts[-2][:-n]
+
+            # IF the lines can not be moved, and there are only two parts
+            # THEN this HeterogeneousParagraph should not be split (here)
+            # (with more than two parts, the HeterogeneousParagraph does not fit in a single column anyway, the widow is kept)
+            elif len(parts) == 2:
+                return [self]
+        # fmt: on
+
+        # IF everything fits in one part
+        # THEN this HeterogeneousParagraph should not be split
+        if len(parts) == 1:
+            return [self]
+
+        # build the parts (re-using the lines that were already determined)
+        out: typing.List[LayoutElement] = []
+        for i, part in enumerate(parts):
+            e: HeterogeneousParagraph = copy.copy(self)
+            e.__lines = [lines[j] for j in part]
+            e.__justify_last_line = self.__justify_last_line or (i != len(parts) - 1)
+            e._LayoutElement__previous_paint_box = None
+            out += [e]
+        return out
 
     #
     # PUBLIC
     #
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
@@ -276,18 +316,18 @@ class HeterogeneousParagraph(LayoutElement):
         :return:                Tuple containing the size (width, height) in points.
         """
         # figure out how to lay out the Chunk(s)
+        # (the line breaks only depend on the available width)
         lines: typing.List[typing.List[Chunk]] = self.__get_lines(
             available_space=(
                 available_space[0] - self.get_padding_left() - self.get_padding_right(),
-                available_space[1] - self.get_padding_top() - self.get_padding_bottom(),
+                2**64,
             ),
             preserve_whitespaces=self.__preserve_whitespaces,
         )
 
-        # measure width, height
+        # measure width
         # fmt: off
         w = max([sum([l.get_size(available_space=available_space)[0] for l in line]) for line in lines])
-        hs = [max([l.get_size(available_space=available_space)[1] for l in line] + [0]) for line in lines]
         # fmt: on
 
         # IF the text is justified
@@ -295,19 +335,8 @@ class HeterogeneousParagraph(LayoutElement):
         if self.__text_alignment == LayoutElement.TextAlignment.JUSTIFIED:
             w = available_space[0] - self.get_padding_left() - self.get_padding_right()
 
-        # leading
-        hs = [
-            int(
-                math.ceil(
-                    h * (self.__multiplied_leading or 1.0)
-                    + (self.__fixed_leading or 0.0)
-                )
-            )
-            for h in hs
-        ]
-
-        # total height
-        h: int = int(sum(hs))
+        # total height (including leading)
+        h: int = sum([self.__get_line_height(line) for line in lines])
 
         # return
         return (
@@ -357,14 +386,17 @@ class HeterogeneousParagraph(LayoutElement):
         super()._paint_background_and_borders(
             page=page, rectangle=(background_x, background_y, w, h)
         )
-        self._LayoutElement__previous_paint_box = (background_x, background_y, w, h)
+        self._LayoutElement__previous_paint_box: typing.Optional[
+            typing.Tuple[int, int, int, int]
+        ] = (background_x, background_y, w, h)
 
         # start drawing chunks
         lines: typing.List[typing.List[Chunk]] = self.__get_lines(
             available_space=(
                 available_space[2] - self.get_padding_left() - self.get_padding_right(),
-                available_space[3] - self.get_padding_top() - self.get_padding_bottom(),
-            )
+                2**64,
+            ),
+            preserve_whitespaces=self.__preserve_whitespaces,
         )
 
         # paint lines
@@ -391,7 +423,7 @@ class HeterogeneousParagraph(LayoutElement):
             if self.__text_alignment == LayoutElement.TextAlignment.CENTERED:
                 line_x += (avail_w - line_width) // 2
             if self.__text_alignment == LayoutElement.TextAlignment.JUSTIFIED and (
-                line_nr != len(lines) - 1
+                line_nr != len(lines) - 1 or self.__justify_last_line
             ):
                 if len(line) > 1:
                     # fmt: off
@@ -423,7 +455,10 @@ class HeterogeneousParagraph(LayoutElement):
 
         # update bounding boxes of (original) Chunk objects
         min_max_x_y: typing.Dict[Chunk, typing.Tuple[int, int, int, int]] = {}
-        for k0, v0 in self.__split_chunk_to_original_chunk.items():
+        for k0 in [c for line in lines for c in line]:
+            v0: typing.Optional[Chunk] = self.__line_breaker.get_original_chunk(k0)
+            if v0 is None:
+                continue
             previous_paint_box: typing.Optional[typing.Tuple[int, int, int, int]] = (
                 k0.get_previous_paint_box()
             )
@@ -55,11 +55,13 @@ class HomogeneousParagraph(HeterogeneousParagraph):
         font_color: Color = X11Color.BLACK,
         font_size: int = 12,
         horizontal_alignment: LayoutElement.HorizontalAlignment = LayoutElement.HorizontalAlignment.LEFT,
+        hyphenation: typing.Optional[typing.Callable[[str], typing.List[str]]] = None,
         margin_bottom: int = 0,
         margin_left: int = 0,
         margin_right: int = 0,
         margin_top: int = 0,
         multiplied_leading: typing.Optional[float] = 1.2,
+        optimal_line_breaking: bool = False,
         padding_bottom: int = 0,
         padding_left: int = 0,
         padding_right: int = 0,
@@ -96,10 +98,14 @@ class HomogeneousParagraph(HeterogeneousParagraph):
         :param border_width_right:      Width of the right border. Defaults to 0.
         :param border_width_top:        Width of the top border. Defaults to 0.
         :param horizontal_alignment:    Alignment of the paragraph within its containing element. Defaults to left alignment.
+        :param hyphenation:             Optional function that splits a word into the fragments between which it may be hyphenated
+                                        (e.g. "hyphenation" -> ["hy", "phen", "a", "tion"]). Only used with optimal line breaking.
         :param margin_bottom:           Bottom margin around the paragraph. Defaults to 0.
         :param margin_left:             Left margin around the paragraph. Defaults to 0.
         :param margin_right:            Right margin around the paragraph. Defaults to 0.
         :param margin_top:              Top margin around the paragraph. Defaults to 0.
+        :param optimal_line_breaking:   Whether to choose the line breaks for the paragraph as a whole (minimizing the unused space
+                                        on every line but the last), rather than filling each line greedily. Defaults to False.
         :param padding_bottom:          Padding inside the bottom of the paragraph. Defaults to 0.
         :param padding_left:            Padding inside the left of the paragraph. Defaults to 0.
         :param padding_right:           Padding inside the right of the paragraph. Defaults to 0.
@@ -133,10 +139,12 @@ class HomogeneousParagraph(HeterogeneousParagraph):
             border_width_right=border_width_right,
             border_width_top=border_width_top,
             horizontal_alignment=horizontal_alignment,
+            hyphenation=hyphenation,
             margin_bottom=margin_bottom,
             margin_left=margin_left,
             margin_right=margin_right,
             margin_top=margin_top,
+            optimal_line_breaking=optimal_line_breaking,
             padding_bottom=padding_bottom,
             padding_left=padding_left,
             padding_right=padding_right,
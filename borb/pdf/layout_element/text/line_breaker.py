@@ -0,0 +1,399 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Breaks the Chunk objects of a HeterogeneousParagraph into lines.
+
+Every Chunk is first split into (word) Chunk objects.
+Lines can be filled greedily (each line holds as many Chunk objects as fit, before the next line starts),
+or chosen for the paragraph as a whole (total-fit line breaking, minimizing the unused space on every line
+but the last). The latter can also break a Chunk in between the fragments returned by a hyphenation function.
+The `LineBreaker` measures every Chunk (and fragment) only once, and (re-)uses these measurements for any
+available width.
+"""
+
+import copy
+import math
+import typing
+
+from borb.pdf.layout_element.text.chunk import Chunk
+
+
+class LineBreaker:
+    """
+    Breaks the Chunk objects of a HeterogeneousParagraph into lines.
+
+    Every Chunk is first split into (word) Chunk objects.
+    Lines can be filled greedily (each line holds as many Chunk objects as fit, before the next line starts),
+    or chosen for the paragraph as a whole (total-fit line breaking, minimizing the unused space on every line
+    but the last). The latter can also break a Chunk in between the fragments returned by a hyphenation function.
+    The `LineBreaker` measures every Chunk (and fragment) only once, and (re-)uses these measurements for any
+    available width.
+    """
+
+    __HYPHENATION_PENALTY: float = 0.01  # (as if the line was 10% too short)
+    __OVERFLOW_PENALTY: float = 10**6
+    __UNNATURAL_BREAK_PENALTY: float = 0.09  # (as if the line was 30% too short)
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(
+        self,
+        chunks: typing.List[Chunk],
+        hyphenation: typing.Optional[typing.Callable[[str], typing.List[str]]],
+        preserve_whitespaces: bool,
+    ):
+        """
+        Initialize a LineBreaker for the given Chunk objects.
+
+        Every Chunk is split into (word) Chunk objects, which are the smallest units (barring hyphenation) that are put on a line.
+
+        :param chunks:                  the Chunk objects of the paragraph
+        :param hyphenation:             an optional function that splits a word into the fragments between which it may be hyphenated
+        :param preserve_whitespaces:    whether to preserve the (original) whitespaces of the Chunk objects
+        """
+        self.__atoms: typing.Optional[
+            typing.Tuple[typing.List[typing.Tuple[int, int]], typing.List[int]]
+        ] = None
+        self.__chunk_widths: typing.Optional[typing.List[int]] = None
+        self.__fragments: typing.Dict[int, typing.List[str]] = {}
+        self.__hyphenation: typing.Optional[
+            typing.Callable[[str], typing.List[str]]
+        ] = hyphenation
+        self.__pieces: typing.Dict[typing.Tuple[int, int, int, bool], Chunk] = {}
+        self.__chunks: typing.List[Chunk] = []
+        self.__split_chunk_to_original_chunk: typing.Dict[Chunk, Chunk] = {}
+        for i, ch in enumerate(chunks):
+            words: typing.List[str] = LineBreaker.__split_str(
+                ch.get_text(), preserve_whitespaces=preserve_whitespaces
+            )
+
+            # IF there are no words
+            # THEN skip
+            if len(words) == 0:
+                continue
+
+            # IF the chunk is NOT the last chunk
+            #   AND ends with whitespace
+            #   AND we don't need to preserve the original whitespace
+            # THEN force the chunk to end with a whitespace
+            if (
+                i != len(chunks) - 1
+                and ch.get_text().endswith(" ")
+                and (not preserve_whitespaces)
+            ):
+                words[-1] += " "
+
+            # IF the chunk is NOT the first chunk
+            #   AND starts with whitespace
+            #   AND the previous chunk does not end with a whitespace
+            #   AND we don't need to preserve the original whitespaces
+            # THEN force the chunk to start with a whitespace
+            if (
+                i != 0
+                and ch.get_text().startswith(" ")
+                and (not chunks[i - 1].get_text().endswith(" "))
+                and (not preserve_whitespaces)
+            ):
+                words[0] = " " + words[0]
+
+            for w in words:
+                # IF the chunk is empty
+                # THEN continue
+                if w == "":
+                    continue
+                # append a separate chunk for the word
+                self.__chunks += [
+                    Chunk(
+                        w,
+                        background_color=ch.get_background_color(),
+                        border_color=ch.get_border_color(),
+                        border_dash_pattern=ch.get_border_dash_pattern(),
+                        border_dash_phase=ch.get_border_dash_phase(),
+                        border_width_top=ch.get_border_width_top(),
+                        border_width_right=ch.get_border_width_right(),
+                        border_width_bottom=ch.get_border_width_bottom(),
+                        border_width_left=ch.get_border_width_left(),
+                        font=ch.get_font(),
+                        font_color=ch.get_font_color(),
+                        font_size=ch.get_font_size(),
+                        horizontal_alignment=ch.get_horizontal_alignment(),
+                        margin_bottom=ch.get_margin_bottom(),
+                        margin_left=ch.get_margin_left(),
+                        margin_right=ch.get_margin_right(),
+                        margin_top=ch.get_margin_top(),
+                        padding_bottom=ch.get_padding_bottom(),
+                        padding_left=ch.get_padding_left(),
+                        padding_right=ch.get_padding_right(),
+                        padding_top=ch.get_padding_top(),
+                        vertical_alignment=ch.get_vertical_alignment(),
+                        character_spacing=ch.get_character_spacing(),
+                    )
+                ]
+                self.__split_chunk_to_original_chunk[self.__chunks[-1]] = ch
+
+    #
+    # PRIVATE
+    #
+
+    def __get_atoms(
+        self,
+    ) -> typing.Tuple[typing.List[typing.Tuple[int, int]], typing.List[int]]:
+        # an atom is a (hyphenation) fragment of a Chunk, (chunk index, fragment index)
+        # the atoms (and their widths) do not depend on the available space, determine them (only) once
+        if self.__atoms is not None:
+            return self.__atoms
+        atoms: typing.List[typing.Tuple[int, int]] = []
+        widths: typing.List[int] = []
+        for i, (c, w) in enumerate(zip(self.__chunks, self.get_chunk_widths())):
+            fragments: typing.List[str] = self.__get_fragments(i)
+            if len(fragments) == 1:
+                atoms += [(i, 0)]
+                widths += [w]
+                continue
+            for j in range(0, len(fragments)):
+                atoms += [(i, j)]
+                widths += [
+                    self.__get_piece(i, j, j + 1, False).get_size(
+                        available_space=(2**64, 2**64)
+                    )[0]
+                ]
+
+                # IF the fragment follows another fragment
+                # THEN account for the character spacing between both
+                if j > 0:
+                    widths[-1] += math.ceil(
+                        c.get_character_spacing() * c.get_font_size()
+                    )
+
+        self.__atoms = (atoms, widths)
+        return self.__atoms
+
+    def __get_fragments(self, chunk_index: int) -> typing.List[str]:
+        # the hyphenation function is called (only) once per Chunk
+        if chunk_index in self.__fragments:
+            return self.__fragments[chunk_index]
+        c: Chunk = self.__chunks[chunk_index]
+        text: str = c.get_text()
+
+        # IF there is no hyphenation function
+        #   OR the Chunk is not a single word
+        #   OR the Font can not render a hyphen
+        # THEN the Chunk can not be hyphenated
+        fragments: typing.List[str] = [text]
+        if (
+            self.__hyphenation is not None
+            and not any([x.isspace() for x in text])
+            and c.get_font().get_character_code("-") != -1
+        ):
+            fragments = [x for x in self.__hyphenation(text) if x != ""]
+
+        # IF the hyphenation function does not return fragments of the word
+        # THEN the Chunk can not be hyphenated
+        if "".join(fragments) != text:
+            fragments = [text]
+        self.__fragments[chunk_index] = fragments
+        return fragments
+
+    def __get_piece(
+        self, chunk_index: int, start: int, end: int, hyphenate: bool
+    ) -> Chunk:
+        # a piece is a Chunk holding (only) the fragments [start, end) of a (hyphenated) Chunk
+        key: typing.Tuple[int, int, int, bool] = (chunk_index, start, end, hyphenate)
+        if key not in self.__pieces:
+            c: Chunk = self.__chunks[chunk_index]
+            piece: Chunk = copy.copy(c)
+            # fmt: off
+            piece._Chunk__text = "".join(self.__get_fragments(chunk_index)[start:end]) + ("-" if hyphenate else "")  # type: ignore[attr-defined]
+            piece._LayoutElement__previous_paint_box = None
+            # fmt: on
+            self.__split_chunk_to_original_chunk[piece] = (
+                self.__split_chunk_to_original_chunk[c]
+            )
+            self.__pieces[key] = piece
+        return self.__pieces[key]
+
+    @staticmethod
+    def __split_str(s: str, preserve_whitespaces: bool = False) -> typing.List[str]:
+        import re
+
+        xs: typing.List[str] = []
+        if preserve_whitespaces:
+            for x in re.split(r"(\s+)", re.sub(r"\s", " ", s)):
+                xs.append(x)
+        else:
+            for x in re.split(r"\s+", s):
+                xs.append(x)
+                xs.append(" ")
+            xs = xs[:-1]
+            while len(xs) > 0 and (xs[0] == " " or xs[0] == ""):
+                xs = xs[1:]
+            while len(xs) > 0 and (xs[-1] == " " or xs[-1] == ""):
+                xs = xs[:-1]
+        return xs
+
+    #
+    # PUBLIC
+    #
+
+    def get_chunk_widths(self) -> typing.List[int]:
+        """
+        Return the width of every Chunk (measured only once, as it does not depend on the available space).
+
+        :return:    the width of every Chunk
+        """
+        if self.__chunk_widths is None:
+            self.__chunk_widths = [
+                c.get_size(available_space=(2**64, 2**64))[0] for c in self.__chunks
+            ]
+        return self.__chunk_widths
+
+    def get_chunks(self) -> typing.List[Chunk]:
+        """
+        Return the (word) Chunk objects of the paragraph.
+
+        :return:    the (word) Chunk objects
+        """
+        return self.__chunks
+
+    def get_greedy_lines(self, available_width: int) -> typing.List[typing.List[Chunk]]:
+        """
+        Break the Chunk objects into lines, filling each line (greedily) before starting the next one.
+
+        :param available_width: the width available for each line
+        :return:                the lines (each a list of Chunk objects)
+        """
+        current_line_width: int = 0
+        lines: typing.List[typing.List[Chunk]] = [[]]
+        for c, w in zip(self.__chunks, self.get_chunk_widths()):
+
+            # IF the chunk fits on the line
+            # THEN append the chunk to the line
+            # THEN update the current_line_width
+            if current_line_width + w <= available_width:
+                current_line_width += w
+                lines[-1] += [c]
+                continue
+
+            # start a new line
+            lines += [[c]]
+            current_line_width = w
+
+        # return
+        return lines
+
+    def get_optimal_lines(
+        self, available_width: int, preserve_whitespaces: bool
+    ) -> typing.List[typing.List[Chunk]]:
+        """
+        Break the Chunk objects into lines, choosing the line breaks for the paragraph as a whole.
+
+        This is total-fit (Knuth-Plass) line breaking. It minimizes the unused space on every line but
+        the last, taking into account the (hyphenation) fragments of each Chunk.
+
+        :param available_width:         the width available for each line
+        :param preserve_whitespaces:    whether whitespace counts towards the width of a line (at its start/end)
+        :return:                        the lines (each a list of Chunk objects)
+        """
+        atoms, widths = self.__get_atoms()
+        n: int = len(atoms)
+        if n == 0:
+            return [[]]
+
+        # determine which atoms are whitespace, and where lines (can naturally) break
+        texts: typing.List[str] = [self.__get_fragments(i)[j] for i, j in atoms]
+        is_space: typing.List[bool] = [
+            (not preserve_whitespaces) and t.isspace() for t in texts
+        ]
+        prefix_widths: typing.List[int] = [0]
+        for w in widths:
+            prefix_widths += [prefix_widths[-1] + w]
+        next_non_space: typing.List[int] = [n] * (n + 1)
+        for k in range(n - 1, -1, -1):
+            next_non_space[k] = next_non_space[k + 1] if is_space[k] else k
+        previous_non_space: typing.List[int] = [-1] * (n + 1)
+        for k in range(1, n + 1):
+            previous_non_space[k] = (
+                previous_non_space[k - 1] if is_space[k - 1] else k - 1
+            )
+
+        # total-fit (Knuth-Plass) line breaking,
+        # the line that ends before atom b starts at atom best_start[b],
+        # minimizing the sum of the squared (relative) unused space of every line but the last
+        w_avail: int = max(available_width, 1)
+        best_cost: typing.List[float] = [0.0] + [float("inf")] * n
+        best_start: typing.List[int] = [0] * (n + 1)
+        for b in range(1, n + 1):
+
+            # IF the line breaks in the middle of a Chunk
+            # THEN the line ends with a hyphen
+            # fmt: off
+            is_hyphenated: bool = b < n and atoms[b - 1][0] == atoms[b][0]
+            hyphen_width: int = self.__get_piece(atoms[b - 1][0], 0, 0, True).get_size(available_space=(2**64, 2**64))[0] if is_hyphenated else 0
+            is_natural_break: bool = b == n or is_hyphenated or texts[b - 1][-1:].isspace() or texts[b][:1].isspace()
+            # fmt: on
+
+            for a in range(b - 1, -1, -1):
+                # determine the width of the line (without leading/trailing whitespace)
+                line_width: int = hyphen_width
+                if next_non_space[a] < b:
+                    # fmt: off
+                    line_width += prefix_widths[previous_non_space[b] + 1] - prefix_widths[next_non_space[a]]
+                    # fmt: on
+
+                # IF the line does not fit
+                # THEN it only gets wider when we start it sooner
+                if line_width > available_width and a != b - 1:
+                    break
+
+                # determine the cost of the line
+                cost: float = 0.0
+                if line_width > available_width:
+                    cost = LineBreaker.__OVERFLOW_PENALTY
+                elif b != n:
+                    cost = ((available_width - line_width) / w_avail) ** 2
+                if is_hyphenated:
+                    cost += LineBreaker.__HYPHENATION_PENALTY
+                if not is_natural_break:
+                    cost += LineBreaker.__UNNATURAL_BREAK_PENALTY
+
+                # keep the cheapest way to get to b
+                if best_cost[a] + cost < best_cost[b]:
+                    best_cost[b] = best_cost[a] + cost
+                    best_start[b] = a
+
+        # determine the line breaks
+        breaks: typing.List[int] = [n]
+        while breaks[0] != 0:
+            breaks.insert(0, best_start[breaks[0]])
+
+        # build the lines, (re-)joining the fragments of each Chunk
+        lines: typing.List[typing.List[Chunk]] = []
+        for a, b in zip(breaks, breaks[1:]):
+            lines += [[]]
+            atom_index: int = a
+            while atom_index < b:
+                i, j0 = atoms[atom_index]
+                while atom_index + 1 < b and atoms[atom_index + 1][0] == i:
+                    atom_index += 1
+                j1: int = atoms[atom_index][1] + 1
+                atom_index += 1
+                if j0 == 0 and j1 == len(self.__get_fragments(i)):
+                    lines[-1] += [self.__chunks[i]]
+                    continue
+                # fmt: off
+                lines[-1] += [self.__get_piece(i, j0, j1, atom_index == b and b < n and atoms[b][0] == i)]
+                # fmt: on
+
+        # return
+        return lines
+
+    def get_original_chunk(self, chunk: Chunk) -> typing.Optional[Chunk]:
+        """
+        Return the (original) Chunk from which the given (word) Chunk (or piece of a hyphenated Chunk) was split.
+
+        :param chunk:   the (word) Chunk (or piece of a hyphenated Chunk)
+        :return:        the (original) Chunk, or None if the Chunk was not split from any Chunk
+        """
+        return self.__split_chunk_to_original_chunk.get(chunk, None)
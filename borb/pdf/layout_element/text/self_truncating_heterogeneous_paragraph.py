@@ -19,11 +19,11 @@ or inherited from the rendering context’s available space. All standard paragr
 styling parameters—alignment, padding, margins, and line spacing—are preserved.
 """
 
-import functools
 import typing
 
 from borb.pdf.color.color import Color
 from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.measurement_cache import MeasurementCache
 from borb.pdf.layout_element.text.chunk import Chunk
 from borb.pdf.layout_element.text.heterogeneous_paragraph import HeterogeneousParagraph
 
@@ -207,11 +207,24 @@ class SelfTruncatingHeterogeneousParagraph(HeterogeneousParagraph):
         # return
         return lines
 
+    @MeasurementCache.cache
+    def _get_min_and_max_width(self) -> typing.Tuple[int, int]:
+        # truncation depends on the available space, fall back to (searching with) get_size
+        return LayoutElement._get_min_and_max_width(self)
+
+    def _split(
+        self,
+        available_space: typing.Tuple[int, int],
+        available_space_for_remainder: typing.Tuple[int, int],
+    ) -> typing.List[LayoutElement]:
+        # a SelfTruncatingHeterogeneousParagraph truncates (rather than splits) its text
+        return [self]
+
     #
     # PUBLIC
     #
 
-    @functools.cache
+    @MeasurementCache.cache
     def get_size(
         self, available_space: typing.Tuple[int, int]
     ) -> typing.Tuple[int, int]:
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The `LazyDict` class is a `dict` whose values can be resolved on demand.
+
+A `Document` (and every `Page` in it) that was read using `PDF.read(..., lazy=True)`
+does not resolve its (indirect) objects up front. Instead, a `LazyReferenceVisitor`
+keeps track of which keys still need to be resolved, and resolves them the first time
+they are accessed. Every method of `dict` that exposes values goes through this class,
+so that no unresolved `reference` objects leak out of a lazily read `Document`.
+
+`Document` and `Page` are plain `dict` objects. Only when a `LazyReferenceVisitor`
+attaches itself to one of them, its class is swapped for a (lazy) subclass that also
+inherits from `LazyDict`. Once it is detached, the original class is restored. This way,
+a `Document` or `Page` that is not read lazily does not pay for the on-demand resolution.
+"""
+
+import typing
+
+
+class LazyDict(dict):
+    """
+    The `LazyDict` class is a `dict` whose values can be resolved on demand.
+
+    A `Document` (and every `Page` in it) that was read using `PDF.read(..., lazy=True)`
+    does not resolve its (indirect) objects up front. Instead, a `LazyReferenceVisitor`
+    keeps track of which keys still need to be resolved, and resolves them the first time
+    they are accessed. Every method of `dict` that exposes values goes through this class,
+    so that no unresolved `reference` objects leak out of a lazily read `Document`.
+
+    `Document` and `Page` are plain `dict` objects. Only when a `LazyReferenceVisitor`
+    attaches itself to one of them, its class is swapped for a (lazy) subclass that also
+    inherits from `LazyDict`. Once it is detached, the original class is restored. This way,
+    a `Document` or `Page` that is not read lazily does not pay for the on-demand resolution.
+    """
+
+    __LAZY_CLASSES: typing.Dict[type, type] = {}
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    def __getitem__(self, item):
+        """Return self[key]."""
+        self.__resolve(item)
+        return super().__getitem__(item)
+
+    def __iter__(self):
+        """Implement iter(self)."""
+        # overriding __iter__ makes dict(...) and {**...} go through __getitem__,
+        # rather than copying the (unresolved) values directly
+        return super().__iter__()
+
+    def __resolve(self, key: typing.Any) -> None:
+        # IF the key still needs to be resolved
+        # THEN resolve it (once)
+        if key in self.__lazy_keys:
+            self.__lazy_keys.discard(key)
+            self.__lazy_reference_visitor.visit_key(key=key, node=self)  # type: ignore[union-attr]
+
+    def __resolve_all_keys(self) -> None:
+        for k in list(self.__lazy_keys):
+            self.__resolve(k)
+
+    @staticmethod
+    def _attach(
+        lazy_keys: typing.Set[str],
+        lazy_reference_visitor: "LazyReferenceVisitor",  # type: ignore[name-defined]
+        node: dict,
+    ) -> "LazyDict":
+        """
+        Attach a `LazyReferenceVisitor` to a `dict` (e.g. a `Document` or `Page`).
+
+        The class of the `dict` is swapped for a (lazy) subclass, that resolves the
+        given keys (using the given `LazyReferenceVisitor`) the first time they are accessed.
+        Attaching the same `LazyReferenceVisitor` to the same `dict` twice does nothing.
+
+        :param lazy_keys:               the keys that need to be resolved on first access
+        :param lazy_reference_visitor:  the LazyReferenceVisitor that resolves these keys
+        :param node:                    the dict to attach to
+        :return:                        the (now lazy) dict
+        """
+        # IF the node is already attached to this LazyReferenceVisitor
+        # THEN do nothing
+        if isinstance(node, LazyDict):
+            if node.__lazy_reference_visitor is lazy_reference_visitor:
+                return node
+
+        # IF the node is not lazy
+        # THEN swap its class for a (lazy) subclass
+        if not isinstance(node, LazyDict):
+            node_class: type = node.__class__
+            if node_class not in LazyDict.__LAZY_CLASSES:
+                LazyDict.__LAZY_CLASSES[node_class] = type(
+                    f"Lazy{node_class.__name__}",
+                    (LazyDict, node_class),
+                    {"__module__": node_class.__module__},
+                )
+            node.__class__ = LazyDict.__LAZY_CLASSES[node_class]
+
+        # set the keys (and the visitor)
+        assert isinstance(node, LazyDict)
+        node.__lazy_keys = lazy_keys
+        node.__lazy_reference_visitor = lazy_reference_visitor
+        return node
+
+    def _detach(self) -> dict:
+        """
+        Detach the `LazyReferenceVisitor` from this `LazyDict`.
+
+        The keys that were not resolved yet are no longer resolved on access,
+        and the original (non-lazy) class of the `dict` is restored.
+
+        :return:    the (no longer lazy) dict
+        """
+        self.__lazy_keys: typing.Set[str] = set()
+        self.__lazy_reference_visitor: typing.Optional["LazyReferenceVisitor"] = None  # type: ignore[name-defined]
+        # the lazy subclass inherits from (LazyDict, original class)
+        self.__class__ = self.__class__.__bases__[1]
+        return self
+
+    def _resolve_all(self) -> None:
+        """
+        Resolve every (indirect) object beneath this `LazyDict`, including the objects of its `Page` objects.
+
+        Afterwards, the `LazyReferenceVisitor` is detached from this `LazyDict`
+        (and from every `Page` beneath it).
+
+        :return:    None
+        """
+        self.__lazy_reference_visitor.visit(self, stop_at_page=False)  # type: ignore[union-attr]
+
+    #
+    # PUBLIC
+    #
+
+    def copy(self):
+        """Return a shallow copy of the dictionary."""
+        self.__resolve_all_keys()
+        return super().copy()
+
+    def get(self, key, default=None):
+        """Return the value for key if key is in the dictionary, else default."""
+        if key not in self:
+            return default
+        return self[key]
+
+    def is_lazy(self) -> bool:
+        """
+        Determine whether this `LazyDict` (still) resolves its objects on demand.
+
+        :return:    True, a dict is only a LazyDict as long as a LazyReferenceVisitor is attached to it
+        """
+        return True
+
+    def items(self):
+        """Return a set-like object providing a view on the dictionary's items."""
+        self.__resolve_all_keys()
+        return super().items()
+
+    def pop(self, key, *args):
+        """Remove the specified key and return the corresponding value."""
+        self.__resolve(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        """Remove and return a (key, value) pair as a 2-tuple."""
+        self.__resolve_all_keys()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        """Insert key with a value of default if key is not in the dictionary, return the value for key."""
+        self.__resolve(key)
+        return super().setdefault(key, default)
+
+    def values(self):
+        """Return an object providing a view on the dictionary's values."""
+        self.__resolve_all_keys()
+        return super().values()
@@ -51,6 +51,12 @@ class Page(dict):
     # PRIVATE
     #
 
+    def _before_write(self) -> None:
+        # a Page has nothing to finish before it is written
+        # subclasses (e.g. TableOfContents) override this to finish their content,
+        # once the Document (and thus every page number) is complete
+        pass
+
     #
     # PUBLIC
     #
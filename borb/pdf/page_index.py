@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The `PageIndex` class keeps track of the (in order) pages of a page-tree, and of the parent of every page.
+
+Finding a `Page` in a `Document` means traversing its page-tree. A `PageIndex` traverses the
+page-tree once, and keeps the result for as long as the page-tree does not change. To know whether
+the page-tree changed, it keeps the /Kids (and their length) of every node in the page-tree. Replacing
+the /Kids of any node, or changing their length (e.g. appending, inserting or removing a kid) invalidates
+the index. A kid that is replaced (or moved) is detected when the Page beneath it is requested.
+"""
+
+import typing
+
+from borb.pdf.page import Page
+from borb.pdf.primitives import PDFType
+
+
+class PageIndex:
+    """
+    The `PageIndex` class keeps track of the (in order) pages of a page-tree, and of the parent of every page.
+
+    Finding a `Page` in a `Document` means traversing its page-tree. A `PageIndex` traverses the
+    page-tree once, and keeps the result for as long as the page-tree does not change. To know whether
+    the page-tree changed, it keeps the /Kids (and their length) of every node in the page-tree. Replacing
+    the /Kids of any node, or changing their length (e.g. appending, inserting or removing a kid) invalidates
+    the index. A kid that is replaced (or moved) is detected when the Page beneath it is requested.
+    """
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(self):
+        """
+        Initialize a new (empty) `PageIndex`.
+
+        The page-tree is traversed (and indexed) the first time a page is requested.
+        """
+        self.__kids: typing.Dict[int, typing.Tuple[PDFType, list, int]] = {}
+        self.__parent_and_index_in_kids: typing.Dict[
+            int, typing.Tuple[PDFType, int]
+        ] = {}
+        self.__pages: typing.Optional[PDFType] = None
+        self.__pages_in_order: typing.Optional[typing.List[Page]] = None
+
+    #
+    # PRIVATE
+    #
+
+    def __build(self, pages: PDFType) -> None:
+        kids: typing.Dict[int, typing.Tuple[PDFType, list, int]] = {}
+        parent_and_index_in_kids: typing.Dict[int, typing.Tuple[PDFType, int]] = {}
+        pages_in_order: typing.List[Page] = []
+
+        # traverse the page-tree (depth-first, in order)
+        stk: typing.List[PDFType] = [pages]
+        while len(stk) > 0:
+            n: PDFType = stk.pop()
+
+            # page tree nodes are exploded (in reverse, so the first kid is processed first)
+            # (keeping their /Kids and the length thereof, to detect changes)
+            if isinstance(n, dict) and "Kids" in n:
+                n_kids: list = n["Kids"]  # type: ignore[assignment]
+                kids[id(n)] = (n, n_kids, len(n_kids))
+                for i, k in enumerate(n_kids):
+                    parent_and_index_in_kids[id(k)] = (n, i)
+                stk += n_kids[::-1]
+                continue
+
+            # IF we processed a Page
+            # THEN add it
+            assert isinstance(n, Page), "Document contains an object that is not a Page"
+            pages_in_order += [n]
+
+        # store
+        self.__kids = kids
+        self.__parent_and_index_in_kids = parent_and_index_in_kids
+        self.__pages = pages
+        self.__pages_in_order = pages_in_order
+
+    def __is_in_page_tree(self, page_or_node: PDFType) -> bool:
+        # walk up the page-tree, checking every kid is (still) where it was indexed
+        while page_or_node is not self.__pages:
+            parent_and_index_in_kids: typing.Optional[typing.Tuple[PDFType, int]] = (
+                self.__parent_and_index_in_kids.get(id(page_or_node), None)
+            )
+            if parent_and_index_in_kids is None:
+                return False
+            parent, index_in_kids = parent_and_index_in_kids
+            parent_kids: list = self.__kids[id(parent)][1]
+            if (
+                index_in_kids >= len(parent_kids)
+                or parent_kids[index_in_kids] is not page_or_node
+            ):
+                return False
+            page_or_node = parent
+        return True
+
+    #
+    # PUBLIC
+    #
+
+    def append_page(self, page: Page, parent: PDFType) -> None:
+        """
+        Update the index after a `Page` was appended to the /Kids of the given parent.
+
+        This should only be called if the index was up to date before the `Page` was appended,
+        and the parent is the root of the page-tree. Otherwise, the index is invalidated.
+
+        :param page:    the Page that was appended
+        :param parent:  the page-tree node to which the Page was appended
+        :return:        None
+        """
+        if (
+            self.__pages_in_order is None
+            or parent is not self.__pages
+            or id(parent) not in self.__kids
+        ):
+            self.invalidate()
+            return
+        parent_kids: list = self.__kids[id(parent)][1]
+        parent_kids_len: int = self.__kids[id(parent)][2]
+        self.__kids[id(parent)] = (parent, parent_kids, parent_kids_len + 1)
+        self.__parent_and_index_in_kids[id(page)] = (parent, parent_kids_len)
+        self.__pages_in_order += [page]
+
+    def get_page(self, index: int, pages: PDFType) -> Page:
+        """
+        Retrieve the `Page` at the given index in the page-tree with the given root.
+
+        The page-tree is (re)traversed if it changed since the index was built.
+
+        :param index:   the (zero-based) index of the Page
+        :param pages:   the root of the page-tree (i.e. /Root /Pages)
+        :return:        the Page at the given index
+        """
+        # IF the index is not up to date
+        # THEN rebuild it
+        if not self.is_up_to_date(pages):
+            self.__build(pages)
+            assert self.__pages_in_order is not None
+            return self.__pages_in_order[index]
+
+        # IF the Page is not (or no longer) where it was indexed
+        # (e.g. a kid was replaced, or the kids were reordered)
+        # THEN rebuild the index
+        assert self.__pages_in_order is not None
+        page: Page = self.__pages_in_order[index]
+        if not self.__is_in_page_tree(page):
+            self.__build(pages)
+            page = self.__pages_in_order[index]
+
+        # return
+        return page
+
+    def get_parent(self, page_or_node: PDFType) -> typing.Optional[PDFType]:
+        """
+        Retrieve the page-tree node that holds the given `Page` (or page-tree node) in its /Kids.
+
+        :param page_or_node:    the Page (or page-tree node)
+        :return:                the parent (page-tree node), or None if it has no parent (in the index)
+        """
+        parent_and_index_in_kids: typing.Optional[typing.Tuple[PDFType, int]] = (
+            self.__parent_and_index_in_kids.get(id(page_or_node), None)
+        )
+        if parent_and_index_in_kids is None:
+            return None
+        return parent_and_index_in_kids[0]
+
+    def invalidate(self) -> None:
+        """
+        Invalidate the index, so that the page-tree is traversed the next time a page is requested.
+
+        :return:    None
+        """
+        self.__kids = {}
+        self.__parent_and_index_in_kids = {}
+        self.__pages = None
+        self.__pages_in_order = None
+
+    def is_up_to_date(self, pages: PDFType) -> bool:
+        """
+        Determine whether the index (still) matches the page-tree with the given root.
+
+        The index is up to date if the root is the same, and every node in the page-tree
+        (still) has the same /Kids, of the same length. The kids themselves are not compared
+        (that would make every call proportional to the number of pages). A kid that is replaced
+        (or moved) does not change the length of the /Kids, `get_page` checks the identity of
+        the kids (leading up to the requested Page) separately.
+
+        :param pages:   the root of the page-tree (i.e. /Root /Pages)
+        :return:        True if the index is up to date, False otherwise
+        """
+        if self.__pages_in_order is None or pages is not self.__pages:
+            return False
+        for n, n_kids, n_kids_len in self.__kids.values():
+            if n.get("Kids") is not n_kids:  # type: ignore[union-attr]
+                return False
+            if len(n_kids) != n_kids_len:
+                return False
+        return True
@@ -101,52 +101,9 @@ class MultiColumnLayout(PageLayout):
     # PRIVATE
     #
 
-    @staticmethod
-    def __get_calculated_margin_bottom(e: LayoutElement) -> int:
-        if e.get_margin_bottom() != 0:
-            return e.get_margin_bottom()
-        if isinstance(e, Chunk):
-            return int(e.get_font_size() * 1.2)
-        if isinstance(e, Paragraph):
-            return int(e.get_font_size() * 1.2)
-        if isinstance(e, Image) or isinstance(e, Shape):
-            return 14
-        if isinstance(e, List) or isinstance(e, Table):
-            return 14
-        return 14
-
-    @staticmethod
-    def __get_leading_or_margin_top(e: LayoutElement) -> int:
-        if e.get_margin_top() != 0:
-            return e.get_margin_top()
-        if isinstance(e, Chunk):
-            return int(e.get_font_size() * 1.2)
-        if isinstance(e, Paragraph):
-            return int(e.get_font_size() * 1.2)
-        if isinstance(e, Image) or isinstance(e, Shape):
-            return 14
-        if isinstance(e, List) or isinstance(e, Table):
-            return 14
-        return 14
-
-    #
-    # PUBLIC
-    #
-
-    def append_layout_element(
+    def __append_layout_element(
         self, layout_element: LayoutElement
     ) -> "MultiColumnLayout":
-        """
-        Append a layout element to the multi-column layout.
-
-        This method adds the specified layout element, such as text, images, or other
-        visual components, to the current multi-column layout. The element is
-        positioned within the available columns and will flow from one column to
-        the next if needed, maintaining the structured layout of the content.
-
-        :param layout_element:   the LayoutElement to be added
-        :return:    Self, this allows for method-chaining
-        """
         # IF no margin_top is specified
         # THEN calculate one
         margin_top: int = MultiColumnLayout.__get_leading_or_margin_top(layout_element)
@@ -174,9 +131,24 @@ class MultiColumnLayout(PageLayout):
             w <= w_avail
         ), f"{layout_element} is too wide, needed {w} pts, {w_avail} pts available"
 
-        # check height
+        # IF the LayoutElement does not fit in the current column
+        # THEN split it (if possible) and append its parts one by one
+        if h > h_avail:
+            parts: typing.List[LayoutElement] = layout_element._split(
+                available_space=(min(self.__column_widths), h_avail),
+                available_space_for_remainder=(
+                    min(self.__column_widths),
+                    h_avail_full,
+                ),
+            )
+            if len(parts) > 1:
+                for part in parts:
+                    self.__append_layout_element(part)
+                return self
+
+        # check height (unless the LayoutElement can still be split in an empty column)
         # fmt: off
-        assert h <= h_avail_full, f"{layout_element} is too tall, needed {h} pts, {h_avail_full} pts available"
+        assert h <= h_avail_full or h_avail < h_avail_full, f"{layout_element} is too tall, needed {h} pts, {h_avail_full} pts available"
         # fmt: on
 
         # IF we can fill the current column
@@ -216,12 +188,66 @@ class MultiColumnLayout(PageLayout):
         # THEN try the next one
         if h > h_avail:
             self.next_column()
-            return self.append_layout_element(layout_element)
+            return self.__append_layout_element(layout_element)
 
         # IF we got there
         # THEN something went wrong
         assert False
 
+    @staticmethod
+    def __get_calculated_margin_bottom(e: LayoutElement) -> int:
+        if e.get_margin_bottom() != 0:
+            return e.get_margin_bottom()
+        if isinstance(e, Chunk):
+            return int(e.get_font_size() * 1.2)
+        if isinstance(e, Paragraph):
+            return int(e.get_font_size() * 1.2)
+        if isinstance(e, Image) or isinstance(e, Shape):
+            return 14
+        if isinstance(e, List) or isinstance(e, Table):
+            return 14
+        return 14
+
+    @staticmethod
+    def __get_leading_or_margin_top(e: LayoutElement) -> int:
+        if e.get_margin_top() != 0:
+            return e.get_margin_top()
+        if isinstance(e, Chunk):
+            return int(e.get_font_size() * 1.2)
+        if isinstance(e, Paragraph):
+            return int(e.get_font_size() * 1.2)
+        if isinstance(e, Image) or isinstance(e, Shape):
+            return 14
+        if isinstance(e, List) or isinstance(e, Table):
+            return 14
+        return 14
+
+    #
+    # PUBLIC
+    #
+
+    def append_layout_element(
+        self, layout_element: LayoutElement
+    ) -> "MultiColumnLayout":
+        """
+        Append a layout element to the multi-column layout.
+
+        This method adds the specified layout element, such as text, images, or other
+        visual components, to the current multi-column layout. The element is
+        positioned within the available columns and will flow from one column to
+        the next if needed, maintaining the structured layout of the content.
+
+        :param layout_element:   the LayoutElement to be added
+        :return:    Self, this allows for method-chaining
+        """
+        # IF the Page belongs to a Document
+        # THEN measure the LayoutElement using the MeasurementCache of that Document
+        doc: typing.Optional[Document] = self.__page.get_document()
+        if doc is None:
+            return self.__append_layout_element(layout_element)
+        with doc.get_measurement_cache():
+            return self.__append_layout_element(layout_element)
+
     def next_column(self) -> "MultiColumnLayout":
         """
         Move to the next column in the layout, adding a new page if necessary.
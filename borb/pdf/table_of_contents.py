@@ -27,6 +27,7 @@ from borb.pdf.layout_element.text.paragraph import Paragraph
 from borb.pdf.page import Page
 from borb.pdf.page_layout.page_layout import PageLayout
 from borb.pdf.page_layout.single_column_layout import SingleColumnLayout
+from borb.pdf.primitives import stream
 
 
 class TableOfContents(Page):
@@ -69,14 +70,17 @@ class TableOfContents(Page):
         """
         # fmt: off
         super().__init__(height_in_points, width_in_points)
-        self.__end_page_index: typing.Optional[int] = None
-        self.__entries: typing.List[typing.Tuple[int, int, str]] = []
+        self.__entries: typing.List[typing.Tuple[int, int, str, str, int, int]] = []
+        self.__number_of_painted_entries: int = 0
+        self.__number: typing.List[int] = []
+        self.__pages: typing.List[Page] = [self]
         self.__persistent_document: typing.Optional[Document] = None
         self.__start_page_index: typing.Optional[int] = None
         self.__table_of_contents_font_color: Color = table_of_contents_font_color or HexColor("2F5496")
         self.__table_of_contents_font: Font = table_of_contents_font or Standard14Fonts.get("Helvetica") # type: ignore[assignment]
         self.__table_of_contents_font_size: int = table_of_contents_font_size
         self.__table_of_contents_title: str = table_of_contents_title
+        self.__used_height_per_page: typing.List[int] = []
         # fmt: on
 
     #
@@ -87,147 +91,90 @@ class TableOfContents(Page):
         self, outline_level: int, page_number: int, text: str
     ) -> "TableOfContents":
 
-        # append entry
-        self.__entries += [(outline_level, page_number, text)]
-
-        # store a reference to the Document
+        # store a reference to the Document (and where the TableOfContents starts)
         if self.__persistent_document is None:
             self.__persistent_document = self.get_document()
-
-        # calculate new page range
-        from borb.pdf import Table
-
-        W, H = self.get_size()
-        entries_per_page: typing.List[Table] = []
-
-        number_as_list = [1]
-        for i in range(0, len(self.__entries)):
-
-            if len(entries_per_page) == 0:
-                entries_per_page += [
-                    self.__create_initial_table(
-                        include_title=True,
-                        level=self.__entries[i][0],
-                        number=number_as_list,
-                        page_nr=self.__entries[i][1],
-                        text=self.__entries[i][2],
-                    )
-                ]
-                continue
-
-            existing_table = entries_per_page[-1]
-
-            # update numbers_as_list
-            if self.__entries[i][0] == self.__entries[i - 1][0]:
-                number_as_list[-1] += 1
-            elif self.__entries[i][0] > self.__entries[i - 1][0]:
-                number_as_list += [1]
-            elif self.__entries[i][0] < self.__entries[i - 1][0]:
-                number_as_list = number_as_list[:-1]
-                number_as_list[-1] += 1
-
-            # add the new data
-            existing_table = self.__update_table(
-                level=self.__entries[i][0],
-                number=number_as_list,
-                page_nr=self.__entries[i][1],
-                table=existing_table,
-                text=self.__entries[i][2],
-            )
-
-            # IF the table is now too big to fit on a page
-            # THEN undo
-            if existing_table.get_size((W, H))[1] > H * 0.8:
-
-                # UNDO
-                existing_table = self.__undo_update_table(existing_table)
-
-                # create a new Table
-                entries_per_page += [
-                    self.__create_initial_table(
-                        include_title=False,
-                        level=self.__entries[i][0],
-                        number=number_as_list,
-                        page_nr=self.__entries[i][1],
-                        text=self.__entries[i][2],
-                    )
-                ]
-
-        # determine how many pages we now need
-        new_nof_pages_needed: int = len(entries_per_page)
-
-        # initial setup of self.__start_page_index and self.__end_page_index
-        assert self.__persistent_document is not None
-        if self.__start_page_index is None:
-            self.__start_page_index = min(
-                [
-                    x
-                    for x, y in [
-                        (i, self.__persistent_document.get_page(i))
+            assert self.__persistent_document is not None
+            self.__start_page_index = next(
+                iter(
+                    [
+                        i
                         for i in range(
                             0, self.__persistent_document.get_number_of_pages()
                         )
+                        if self.__persistent_document.get_page(i) is self
                     ]
-                    if isinstance(y, TableOfContents)
-                ]
+                )
             )
-            self.__end_page_index = self.__start_page_index + new_nof_pages_needed - 1
-
-        # remove old page(s)
-        assert self.__end_page_index is not None
+        assert self.__persistent_document is not None
         assert self.__start_page_index is not None
-        old_nof_pages_needed: int = self.__end_page_index - self.__start_page_index + 1
-        for i in range(0, old_nof_pages_needed):
-            self.__persistent_document.pop_page(self.__start_page_index)
-
-        # previously we (the TOC) took up old_nof_pages_needed
-        # we now to take up new_nof_pages_needed
-        # shift everything, if needed
-        if new_nof_pages_needed > old_nof_pages_needed:
-            self.__end_page_index = self.__start_page_index + new_nof_pages_needed - 1
-            self.__shift_outlines(
-                document=self.__persistent_document,
-                delta=new_nof_pages_needed - old_nof_pages_needed,
-            )
-
-        # perform rendering
-        for i in range(0, new_nof_pages_needed):
 
-            # create Page
-            toc_page: Page = TableOfContents()
-            toc_page.__start_page_index = self.__start_page_index  # type: ignore[attr-defined]
-            toc_page.__end_page_index = self.__end_page_index  # type: ignore[attr-defined]
-            toc_page.__entries = self.__entries  # type: ignore[attr-defined]
-            toc_page.__persistent_document = self.__persistent_document  # type: ignore[attr-defined]
+        # update number
+        if len(self.__entries) == 0:
+            self.__number = [1]
+        elif outline_level == self.__entries[-1][0]:
+            self.__number[-1] += 1
+        elif outline_level > self.__entries[-1][0]:
+            self.__number += [1]
+        elif outline_level < self.__entries[-1][0]:
+            self.__number = self.__number[:-1]
+            self.__number[-1] += 1
 
-            # set PageLayout
-            layout_for_toc_page: PageLayout = SingleColumnLayout(toc_page)
+        # convert (list of) number(s) to legible text
+        number_as_str: str = ".".join([str(x) for x in self.__number])
 
-            # append Table
-            layout_for_toc_page.append_layout_element(entries_per_page[0])
-            entries_per_page = entries_per_page[1:]
+        # measure (only) the new row, with the space the SingleColumnLayout will offer
+        # fmt: off
+        W, H = self.get_size()
+        w_avail: int = W - 2 * int(W * 0.1)
+        h_avail: int = H - 2 * int(H * 0.1)
+        if len(self.__used_height_per_page) == 0:
+            self.__used_height_per_page += [self.__create_table(entries=[], include_title=True).get_size((w_avail, h_avail))[1]]
+        h: int = self.__create_table(entries=[(outline_level, page_number, text, number_as_str, 0, 0)], include_title=False).get_size((w_avail, h_avail))[1]
+        # fmt: on
 
-            # insert Page
+        # IF the row does not fit on the last Page of the TableOfContents
+        # THEN insert a new (empty) Page for it
+        number_of_pages: int = len(self.__pages)
+        if self.__used_height_per_page[-1] + h > h_avail:
+            toc_page: TableOfContents = TableOfContents(
+                height_in_points=H, width_in_points=W
+            )
             self.__persistent_document.insert_page(
-                page=toc_page, index=self.__start_page_index + i
+                page=toc_page, index=self.__start_page_index + len(self.__pages)
+            )
+            self.__pages += [toc_page]
+            self.__used_height_per_page += [0]
+        self.__used_height_per_page[-1] += h
+
+        # append entry
+        # the page number is resolved (taking into account Page(s) inserted later on)
+        # when the TableOfContents is painted
+        self.__entries += [
+            (
+                outline_level,
+                page_number,
+                text,
+                number_as_str,
+                number_of_pages,
+                len(self.__pages) - 1,
             )
+        ]
 
         # return
         return self
 
-    def __create_initial_table(
+    def __create_table(
         self,
+        entries: typing.List[typing.Tuple[int, int, str, str, int, int]],
         include_title: bool,
-        level: int,
-        number: typing.List[int],
-        page_nr: int,
-        text: str,
     ) -> Table:
-        t: typing.Optional[Table] = None
+        t: Table = FixedColumnWidthTable(
+            number_of_rows=len(entries) + (1 if include_title else 0),
+            number_of_columns=3,
+            column_widths=[10, 80, 10],
+        )
         if include_title:
-            t = FixedColumnWidthTable(
-                number_of_rows=2, number_of_columns=3, column_widths=[10, 80, 10]
-            )
             t.append_layout_element(
                 Table.TableCell(
                     Paragraph(
@@ -240,29 +187,23 @@ class TableOfContents(Page):
                     row_span=1,
                 )
             )
-        else:
-            t = FixedColumnWidthTable(
-                number_of_rows=1, number_of_columns=3, column_widths=[10, 80, 10]
-            )
-
-        # convert (list of) number(s) to legible text
-        number_as_str: str = ".".join([str(x) for x in number])
 
         # append new data
-        t.append_layout_element(Paragraph(f"{number_as_str}"))
-        t.append_layout_element(
-            Paragraph(
-                text,
-                padding_left=int(12 * 0.250 * 3 * level),
+        for level, page_nr, text, number_as_str, _, _ in entries:
+            t.append_layout_element(Paragraph(f"{number_as_str}"))
+            t.append_layout_element(
+                Paragraph(
+                    text,
+                    padding_left=int(12 * 0.250 * 3 * level),
+                )
             )
-        )
-        t.append_layout_element(
-            Paragraph(
-                f"{page_nr}",
-                text_alignment=LayoutElement.TextAlignment.RIGHT,
-                horizontal_alignment=LayoutElement.HorizontalAlignment.RIGHT,
+            t.append_layout_element(
+                Paragraph(
+                    f"{page_nr}",
+                    text_alignment=LayoutElement.TextAlignment.RIGHT,
+                    horizontal_alignment=LayoutElement.HorizontalAlignment.RIGHT,
+                )
             )
-        )
 
         # set global properties
         t.no_borders()
@@ -272,72 +213,33 @@ class TableOfContents(Page):
         # return
         return t
 
-    def __shift_outlines(self, document: Document, delta: int) -> None:
-        if delta == 0:
-            return
-        # TODO
-        pass
-
-    def __undo_update_table(self, table: Table) -> Table:
-
-        # decrease number of rows
-        table._Table__number_of_rows -= 1  # type: ignore[attr-defined]
-
-        # find elements to be removed
-        to_remove = table._Table__inner_layout_elements[-3:]  # type: ignore[attr-defined]
-
-        # remove the elements
-        table._Table__inner_layout_elements = table._Table__inner_layout_elements[:-3]  # type: ignore[attr-defined]
+    def _before_write(self) -> None:
 
-        # remove the mapping
-        for e in to_remove:
-            table._Table__inner_layout_element_to_table_coordinates.remove(e)  # type: ignore[attr-defined]
-
-        # return
-        return table
-
-    def __update_table(
-        self,
-        level: int,
-        number: typing.List[int],
-        page_nr: int,
-        table: Table,
-        text: str,
-    ) -> Table:
+        # IF nothing changed since the TableOfContents was last painted
+        # THEN do nothing
+        if self.__number_of_painted_entries == len(self.__entries):
+            return
+        self.__number_of_painted_entries = len(self.__entries)
+        assert self.__start_page_index is not None
 
-        # dangerous
+        # resolve the page numbers
+        # Page(s) that were added to the TableOfContents after an entry was made, shifted the Page of that entry
         # fmt: off
-        table._Table__number_of_rows += 1                                                                           # type: ignore[attr-defined]
-        table._Table__available_table_coordinates += [(table._Table__number_of_rows - 1, i) for i in range(0, 3)]   # type: ignore[attr-defined]
+        entries: typing.List[typing.Tuple[int, int, str, str, int, int]] = [
+            (level, page_nr + (len(self.__pages) - number_of_pages if page_nr >= self.__start_page_index else 0), text, number_as_str, number_of_pages, page_index)
+            for level, page_nr, text, number_as_str, number_of_pages, page_index in self.__entries
+        ]
         # fmt: on
 
-        # convert (list of) number(s) to legible text
-        number_as_str: str = ".".join([str(x) for x in number])
-
-        # append new data
-        table.append_layout_element(Paragraph(f"{number_as_str}"))
-        table.append_layout_element(
-            Paragraph(
-                text,
-                padding_left=int(12 * 0.250 * 3 * level),
-            )
-        )
-        table.append_layout_element(
-            Paragraph(
-                f"{page_nr}",
-                text_alignment=LayoutElement.TextAlignment.RIGHT,
-                horizontal_alignment=LayoutElement.HorizontalAlignment.RIGHT,
+        # paint each Page (from scratch)
+        for i, toc_page in enumerate(self.__pages):
+            toc_page["Contents"] = stream()
+            toc_page["Resources"] = {}
+            SingleColumnLayout(toc_page).append_layout_element(
+                self.__create_table(
+                    entries=[e for e in entries if e[5] == i], include_title=(i == 0)
+                )
             )
-        )
-
-        # set global properties
-        table.no_borders()
-        table.set_padding_on_all_cells(
-            padding_bottom=3, padding_left=3, padding_right=3, padding_top=3
-        )
-
-        # return
-        return table
 
     #
     # PUBLIC
@@ -55,10 +55,20 @@ class Event:
     needed, facilitating ongoing expansion and customization of the PDF processing pipeline.
     """
 
+    __slots__ = ("__page_nr",)
+
     #
     # CONSTRUCTOR
     #
 
+    def __init__(self, page_nr: int = -1):
+        """
+        Initialize an Event.
+
+        :param page_nr: The (0-based) number of the page where the Event occurred, -1 if it is not known (yet).
+        """
+        self.__page_nr: int = page_nr
+
     #
     # PRIVATE
     #
@@ -91,9 +101,15 @@ class Event:
 
         :return: The page nr in the document where the Event occurred.
         """
+        # IF the page nr was set when the Event was created
+        # THEN return it
+        if self.__page_nr != -1:
+            return self.__page_nr
+
+        # look up the page (once)
         page: Page = self.get_page()
         document: Document = self.get_document()
-        return next(
+        self.__page_nr = next(
             iter(
                 [
                     i
@@ -103,3 +119,4 @@ class Event:
             ),
             -1,
         )
+        return self.__page_nr
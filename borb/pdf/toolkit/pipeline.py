@@ -40,6 +40,8 @@ class Pipeline:
     transformation, or extraction tasks.
     """
 
+    __WORKER_STATE: typing.Optional[typing.Tuple["Pipeline", Document]] = None
+
     #
     # CONSTRUCTOR
     #
@@ -63,11 +65,118 @@ class Pipeline:
     # PRIVATE
     #
 
+    def __process_in_parallel(self, document: Document, workers: int) -> bool:
+        import multiprocessing
+
+        from borb.pdf.toolkit.sink.sink import Sink
+
+        # IF the final Pipe is not a Sink (that can merge partial outputs)
+        #   OR processes can not be forked (sharing the Document, rather than pickling it)
+        #   OR there is not enough work to go around
+        # THEN the Document can not be processed in parallel
+        sink: Pipe = self.__pipes[-1]
+        if (
+            not isinstance(sink, Sink)
+            or sink._get_partial_output() is None
+            or "fork" not in multiprocessing.get_all_start_methods()
+            or document.get_number_of_pages() < 2
+        ):
+            return False
+
+        # divide the pages in (contiguous) batches
+        number_of_pages: int = document.get_number_of_pages()
+        number_of_batches: int = min(number_of_pages, workers * 4)
+        batches: typing.List[typing.List[int]] = [
+            list(
+                range(
+                    i * number_of_pages // number_of_batches,
+                    (i + 1) * number_of_pages // number_of_batches,
+                )
+            )
+            for i in range(0, number_of_batches)
+        ]
+
+        # process the batches in (forked) worker processes,
+        # each running its own copy of the Pipeline
+        from concurrent.futures import ProcessPoolExecutor
+
+        Pipeline.__WORKER_STATE = (self, document)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork")
+            ) as process_pool_executor:
+                for partial_output in process_pool_executor.map(
+                    Pipeline._process_pages_in_worker, batches
+                ):
+                    sink._merge_partial_output(partial_output)
+        finally:
+            Pipeline.__WORKER_STATE = None
+        return True
+
+    def __process_page(self, page: Page, page_nr: int) -> None:
+        from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+
+        self.__pipes[0].process_page(page=page, page_nr=page_nr)  # type: ignore[attr-defined]
+        self.__pipes[0].process(EndPageEvent(page=page, page_nr=page_nr))
+
+    @staticmethod
+    def _process_pages_in_worker(page_nrs: typing.List[int]) -> typing.Any:
+        # this method runs in a (forked) worker process,
+        # which has its own copy of the Pipeline (and Document)
+        assert Pipeline.__WORKER_STATE is not None
+        pipeline, document = Pipeline.__WORKER_STATE
+        for page_nr in page_nrs:
+            pipeline.__process_page(page=document.get_page(page_nr), page_nr=page_nr)
+
+        # return (and drop) the partial output of this batch only
+        # (a worker may process several batches, the earlier ones have already been sent back)
+        partial_output: dict = pipeline.__pipes[-1]._get_partial_output()  # type: ignore[attr-defined]
+        return {
+            page_nr: partial_output.pop(page_nr)
+            for page_nr in page_nrs
+            if page_nr in partial_output
+        }
+
     #
     # PUBLIC
     #
 
-    def process(self, document_or_page: typing.Union[Document, Page]):
+    def iter_pages(
+        self, document: Document
+    ) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+        """
+        Process a PDF `Document` through the pipeline, one `Page` at a time.
+
+        Rather than returning the output of the final `Sink` once the entire `Document` has been processed,
+        this method yields the output of every page as soon as that page has been processed.
+        The `Sink` then drops whatever it holds for that page (e.g. its events),
+        so memory use does not grow with the number of pages in the `Document`.
+
+        :param document:    The `Document` to be processed by the pipeline.
+        :return:            An iterator of (page number, output of that page) tuples.
+        """
+        if len(self.__pipes) == 0:
+            return
+
+        from borb.pdf.toolkit.source.operator.source import Source
+
+        if not isinstance(self.__pipes[0], Source):
+            return
+
+        from borb.pdf.toolkit.sink.sink import Sink
+
+        for i in range(0, document.get_number_of_pages()):
+            self.__process_page(page=document.get_page(i), page_nr=i)
+
+            # IF the final element in the Pipe is a sink
+            # THEN get (and drop) the output of this page
+            sink: Pipe = self.__pipes[-1]
+            if isinstance(sink, Sink):
+                yield i, sink._pop_page_output(i)
+            else:
+                yield i, None
+
+    def process(self, document_or_page: typing.Union[Document, Page], workers: int = 1):
         """
         Process a PDF `Document` or `Page` through the pipeline.
 
@@ -75,7 +184,14 @@ class Pipeline:
         the content accordingly. If the first `Pipe` in the pipeline is a `Source`, it is
         responsible for initiating the processing of content streams.
 
+        The pages of a `Document` can be processed in parallel, by a pool of `workers` processes.
+        Each worker runs its own copy of the pipeline over some of the pages, and the final `Sink`
+        merges their (partial) outputs, producing the same output as processing the pages serially.
+        This requires the final `Sink` to support merging (e.g. `GetText`, `GetImages`, `GetColors`),
+        and processes to be forked; otherwise the pages are processed serially.
+
         :param document_or_page: A `Document` or `Page` object to be processed by the pipeline.
+        :param workers:          The number of worker processes. Defaults to 1 (serial processing).
         """
         if len(self.__pipes) == 0:
             return None
@@ -90,19 +206,32 @@ class Pipeline:
 
         # IF document_or_page is a Document
         # THEN iterate over all Page object(s) in the Document
-        from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
-
+        # (in parallel, if possible)
         if isinstance(document_or_page, Document):
-            for i in range(0, document_or_page.get_number_of_pages()):
-                page: Page = document_or_page.get_page(i)
-                source.process_page(page=page)
-                source.process(EndPageEvent(page=page))
+            if workers <= 1 or not self.__process_in_parallel(
+                document=document_or_page, workers=workers
+            ):
+                for i in range(0, document_or_page.get_number_of_pages()):
+                    self.__process_page(page=document_or_page.get_page(i), page_nr=i)
 
         # IF document_or_page is a Page
         # THEN process the Page
+        # (the page nr is determined once, rather than for every Event)
         if isinstance(document_or_page, Page):
-            source.process_page(page=document_or_page)
-            source.process(EndPageEvent(page=document_or_page))
+            page_nr: int = -1
+            document: typing.Optional[Document] = document_or_page.get_document()
+            if document is not None:
+                page_nr = next(
+                    iter(
+                        [
+                            i
+                            for i in range(0, document.get_number_of_pages())
+                            if document.get_page(i) is document_or_page
+                        ]
+                    ),
+                    -1,
+                )
+            self.__process_page(page=document_or_page, page_nr=page_nr)
 
         # IF the final element in the Pipe is a sink
         # THEN get its output
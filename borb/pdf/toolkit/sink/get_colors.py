@@ -122,6 +122,21 @@ class GetColors(Sink):
         assert min_color is not None
         return min_color
 
+    def _get_partial_output(self) -> typing.Any:
+        return self.__number_of_colored_points_per_page
+
+    def _merge_partial_output(self, partial_output: typing.Any) -> None:
+        self.__number_of_colored_points_per_page.update(partial_output)
+
+    def _pop_page_output(self, page_nr: int) -> typing.Any:
+        return {
+            k: v
+            for k, v in self.__number_of_colored_points_per_page.pop(
+                page_nr, {}
+            ).items()
+            if v != 0
+        }
+
     #
     # PUBLIC
     #
@@ -43,16 +43,37 @@ class GetImages(Sink):
 
         The `GetImages` class acts as a sink in the PDF processing pipeline, collecting and
         organizing image-related events (`ImageEvent`) from a PDF document. This constructor
-        initializes the internal data structure used to store these events, grouped by the page
-        on which they occur.
+        initializes the internal data structure used to store (the images of) these events,
+        grouped by the page on which they occur.
         """
         super().__init__()
-        self.__events_per_page: typing.Dict[int, typing.List[ImageEvent]] = {}  # type: ignore[annotation-unchecked]
+        self.__images_per_page: typing.Dict[int, typing.List[bytes]] = {}  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
     #
 
+    @staticmethod
+    def __open_images(images: typing.List[bytes]) -> typing.List[typing.Any]:
+        # PIL.Image
+        try:
+            import PIL.Image  # type: ignore[import-untyped, import-not-found]
+        except ImportError:
+            raise ImportError(
+                "Please install the 'Pillow' library to use the GetImages class. "
+                "You can install it with 'pip install Pillow'."
+            )
+        return [PIL.Image.open(io.BytesIO(i)) for i in images]
+
+    def _get_partial_output(self) -> typing.Any:
+        return self.__images_per_page
+
+    def _merge_partial_output(self, partial_output: typing.Any) -> None:
+        self.__images_per_page.update(partial_output)
+
+    def _pop_page_output(self, page_nr: int) -> typing.Any:
+        return GetImages.__open_images(self.__images_per_page.pop(page_nr, []))
+
     #
     # PUBLIC
     #
@@ -67,17 +88,8 @@ class GetImages(Sink):
 
         :return: The aggregated output from the pipeline, or `None` if not implemented.
         """
-        # PIL.Image
-        try:
-            import PIL.Image  # type: ignore[import-untyped, import-not-found]
-        except ImportError:
-            raise ImportError(
-                "Please install the 'Pillow' library to use the GetImages class. "
-                "You can install it with 'pip install Pillow'."
-            )
         return {
-            k: [PIL.Image.open(io.BytesIO(i.get_image())) for i in v]  # type: ignore[arg-type]
-            for k, v in self.__events_per_page.items()
+            k: GetImages.__open_images(v) for k, v in self.__images_per_page.items()
         }
 
     def process(self, event: Event) -> None:
@@ -92,7 +104,7 @@ class GetImages(Sink):
         if not isinstance(event, ImageEvent):
             return
 
-        # append ImageEvent
-        self.__events_per_page[event.get_page_nr()] = self.__events_per_page.get(
-            event.get_page_nr(), []
-        ) + [event]
+        # append (the bytes of) the image
+        self.__images_per_page.setdefault(event.get_page_nr(), []).append(
+            event.get_image()  # type: ignore[arg-type]
+        )
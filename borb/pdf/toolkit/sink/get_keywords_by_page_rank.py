@@ -52,6 +52,26 @@ class GetKeywordsByPageRank(GetText):
     # PRIVATE
     #
 
+    def __get_keywords(self, text: str) -> typing.Dict[str, float]:
+
+        # Normalize the text (convert to lowercase, remove punctuation, special characters, etc.).
+        text = GetKeywordsByPageRank.__normalize_text(text)
+
+        # Tokenizes text by splitting on whitespace.
+        # Assumes the text is already normalized (lowercased, punctuation removed).
+        words: typing.List[str] = text.split()
+
+        # Remove common stopwords (e.g., "the," "is," "and," "of") to filter out unimportant words.
+        words = [x for x in words if x not in GetKeywordsByPageRank.ENGLISH_STOPWORDS]
+
+        # Return
+        return GetKeywordsByPageRank.__text_rank(
+            max_number_of_iterations=self.__max_number_of_iterations,
+            number_of_keywords=self.__number_of_keywords,
+            tokens=words,
+            window_size=self.__window_size,
+        )
+
     @staticmethod
     def __normalize_text(s: str) -> str:
         """Normalize text by converting to lowercase, removing punctuation, and stripping special characters."""
@@ -123,6 +143,9 @@ class GetKeywordsByPageRank(GetText):
             ]
         )
 
+    def _pop_page_output(self, page_nr: int) -> typing.Any:
+        return self.__get_keywords(super()._pop_page_output(page_nr))
+
     #
     # PUBLIC
     #
@@ -138,32 +161,4 @@ class GetKeywordsByPageRank(GetText):
         :return: The aggregated output from the pipeline, or `None` if not implemented.
         """
         text_per_page: typing.Dict[int, str] = super().get_output()
-
-        # Normalize the text (convert to lowercase, remove punctuation, special characters, etc.).
-        text_per_page = {
-            k: GetKeywordsByPageRank.__normalize_text(v)
-            for k, v in text_per_page.items()
-        }
-
-        # Tokenizes text by splitting on whitespace.
-        # Assumes the text is already normalized (lowercased, punctuation removed).
-        words_per_page: typing.Dict[int, typing.List[str]] = {
-            k: v.split() for k, v in text_per_page.items()
-        }
-
-        # Remove common stopwords (e.g., "the," "is," "and," "of") to filter out unimportant words.
-        words_per_page = {
-            k: [x for x in v if x not in GetKeywordsByPageRank.ENGLISH_STOPWORDS]
-            for k, v in words_per_page.items()
-        }
-
-        # Return
-        return {
-            k: GetKeywordsByPageRank.__text_rank(
-                max_number_of_iterations=self.__max_number_of_iterations,
-                number_of_keywords=self.__number_of_keywords,
-                tokens=v,
-                window_size=self.__window_size,
-            )
-            for k, v in words_per_page.items()
-        }
+        return {k: self.__get_keywords(v) for k, v in text_per_page.items()}
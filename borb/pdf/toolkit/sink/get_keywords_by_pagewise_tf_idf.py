@@ -57,6 +57,11 @@ class GetKeywordsByPagewiseTFIDF(GetText):
         s = re.sub(r"\s+", " ", s).strip()  # Normalize whitespace
         return s
 
+    def _pop_page_output(self, page_nr: int) -> typing.Any:
+        # the keywords are scored across all pages of the Document,
+        # so there is no output (yet) for a single page, and nothing can be dropped
+        return None
+
     #
     # PUBLIC
     #
@@ -8,12 +8,14 @@ applies a specified regular expression to identify matches. For each match, meta
 such as bounding boxes, font properties, and the regex match object are stored.
 """
 
+import bisect
 import collections
+import math
 import typing
 
-from borb.pdf.page_size import PageSize
 from borb.pdf.toolkit.event import Event
 from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
 from borb.pdf.toolkit.source.event.text_event import TextEvent
 
 MatchType = collections.namedtuple(
@@ -34,7 +36,11 @@ class GetRegularExpression(Sink):
     # CONSTRUCTOR
     #
 
-    def __init__(self, pattern: typing.Union[str, "re.Pattern"]):  # type: ignore[name-defined]
+    def __init__(
+        self,
+        pattern: typing.Union[str, "re.Pattern"],  # type: ignore[name-defined]
+        reading_order: typing.Optional[typing.Callable[[TextEvent], typing.Any]] = None,
+    ):
         """
         Initialize the `GetRegularExpression` sink with a given regular expression pattern.
 
@@ -42,12 +48,18 @@ class GetRegularExpression(Sink):
         corresponding matches per page. The provided pattern is compiled into a `re.Pattern`
         object if it is passed as a string.
 
-        :param pattern: The regular expression pattern used for text extraction.
-                        Can be a compiled `re.Pattern` or a string that will be compiled.
+        :param pattern:         The regular expression pattern used for text extraction.
+                                Can be a compiled `re.Pattern` or a string that will be compiled.
+        :param reading_order:   Optional function that returns the sort key of a TextEvent, determining the order
+                                in which the text on a page is read. Defaults to top-to-bottom, left-to-right.
         """
         super().__init__()
         self.__events_per_page: typing.Dict[int, typing.List[TextEvent]] = {}
         self.__matches_per_page: typing.Dict[int, typing.List[MatchType]] = {}
+        self.__pages_to_assemble: typing.Set[int] = set()
+        self.__reading_order: typing.Callable[[TextEvent], typing.Any] = (
+            reading_order or GetRegularExpression.__indo_european_reading_order
+        )
         import re
 
         self.__pattern: re.Pattern = (
@@ -58,65 +70,26 @@ class GetRegularExpression(Sink):
     # PRIVATE
     #
 
-    #
-    # PUBLIC
-    #
-
-    def get_output(self) -> typing.Any:
-        """
-        Retrieve the aggregated results from the pipeline.
-
-        This method should be overridden by subclasses to provide the specific output
-        collected by the `Sink`. By default, it returns `None`, indicating that no
-        aggregation or processing has been implemented.
-
-        :return: The aggregated output from the pipeline, or `None` if not implemented.
-        """
-        return self.__matches_per_page
-
-    def process(self, event: Event) -> None:
-        """
-        Process the given event.
-
-        This base implementation is a no-op. Subclasses should override this method
-        to provide specific processing logic.
-
-        :param event: The event object to process.
-        """
-        if not isinstance(event, TextEvent):
-            return
-
-        if len(event.get_text().strip()) == 0:
-            return
-
-        page_nr: int = event.get_page_nr()
-        self.__events_per_page[page_nr] = self.__events_per_page.get(page_nr, []) + [
-            event
-        ]
-
-        # define sort function
-        def __indo_european_reading_order(e: TextEvent) -> int:
-            y_upside_down: int = int(PageSize.A4_PORTRAIT[1] - e.get_y())
-            # y_upside_down = y_upside_down - (y_upside_down % 12)
-            return int(y_upside_down * PageSize.A4_PORTRAIT[1] + e.get_x())
+    def __assemble_matches(self, page_nr: int) -> None:
+        self.__pages_to_assemble.discard(page_nr)
 
         # sort
-        self.__events_per_page[page_nr] = sorted(
+        events: typing.List[TextEvent] = sorted(
             self.__events_per_page[page_nr],
-            key=__indo_european_reading_order,
+            key=self.__reading_order,
         )
 
         # IF there are no events
         # THEN return
-        if len(self.__events_per_page[page_nr]) == 0:
+        if len(events) == 0:
             return
 
         # get text
-        prev_x: float = self.__events_per_page[page_nr][0].get_x()
-        prev_y: float = self.__events_per_page[page_nr][0].get_y()
+        prev_x: float = events[0].get_x()
+        prev_y: float = events[0].get_y()
         text: str = ""
         text_length_after_event: typing.Dict[TextEvent, int] = {}
-        for e in self.__events_per_page[page_nr]:
+        for e in events:
 
             # IF the difference in y-coordinate is too large
             # THEN add a <newline>
@@ -143,27 +116,83 @@ class GetRegularExpression(Sink):
         import re
 
         self.__matches_per_page[page_nr] = []
+        text_lengths: typing.List[int] = [text_length_after_event[e] for e in events]
         for m in re.finditer(self.__pattern, text):
-            event_start_index = len(
-                [k for k, v in text_length_after_event.items() if v <= m.start()]
-            )
-            event_stop_index = len(
-                [k for k, v in text_length_after_event.items() if v < m.end()]
-            )
+            event_start_index = bisect.bisect_right(text_lengths, m.start())
+            event_stop_index = bisect.bisect_left(text_lengths, m.end())
 
             # add match
-            events: typing.List[TextEvent] = self.__events_per_page[page_nr][
+            match_events: typing.List[TextEvent] = events[
                 event_start_index:event_stop_index
             ]
             self.__matches_per_page[page_nr] += [
                 MatchType(
                     bounding_boxes=[
                         (e.get_x(), e.get_y(), e.get_width(), e.get_height())
-                        for e in events
+                        for e in match_events
                     ],
-                    font_color=events[0].get_font_color(),
-                    font_size=events[0].get_font_size(),
-                    font=events[0].get_font(),
+                    font_color=match_events[0].get_font_color(),
+                    font_size=match_events[0].get_font_size(),
+                    font=match_events[0].get_font(),
                     re_match=m,
                 )
             ]
+
+    @staticmethod
+    def __indo_european_reading_order(e: TextEvent) -> typing.Tuple[int, int]:
+        # top-to-bottom, left-to-right
+        return -math.ceil(e.get_y()), math.floor(e.get_x())
+
+    def _pop_page_output(self, page_nr: int) -> typing.Any:
+        if page_nr in self.__pages_to_assemble:
+            self.__assemble_matches(page_nr)
+        self.__events_per_page.pop(page_nr, None)
+        return self.__matches_per_page.pop(page_nr, [])
+
+    #
+    # PUBLIC
+    #
+
+    def get_output(self) -> typing.Any:
+        """
+        Retrieve the aggregated results from the pipeline.
+
+        This method should be overridden by subclasses to provide the specific output
+        collected by the `Sink`. By default, it returns `None`, indicating that no
+        aggregation or processing has been implemented.
+
+        :return: The aggregated output from the pipeline, or `None` if not implemented.
+        """
+        # IF some pages did not end (e.g. their EndPageEvent was filtered out)
+        # THEN assemble their matches now
+        for page_nr in sorted(self.__pages_to_assemble):
+            self.__assemble_matches(page_nr)
+        return self.__matches_per_page
+
+    def process(self, event: Event) -> None:
+        """
+        Process the given event.
+
+        This base implementation is a no-op. Subclasses should override this method
+        to provide specific processing logic.
+
+        :param event: The event object to process.
+        """
+        # IF the page ended
+        # THEN assemble its text and matches (once)
+        if isinstance(event, EndPageEvent):
+            if event.get_page_nr() in self.__pages_to_assemble:
+                self.__assemble_matches(event.get_page_nr())
+            return
+
+        if not isinstance(event, TextEvent):
+            return
+
+        if len(event.get_text().strip()) == 0:
+            return
+
+        # append TextEvent
+        # (the text and matches are assembled when the page ends)
+        page_nr: int = event.get_page_nr()
+        self.__events_per_page.setdefault(page_nr, []).append(event)
+        self.__pages_to_assemble.add(page_nr)
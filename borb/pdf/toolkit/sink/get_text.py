@@ -9,11 +9,12 @@ for easy retrieval of the extracted text content on a per-page basis. This class
 useful for applications that need to analyze or extract text from specific pages of a PDF.
 """
 
+import math
 import typing
 
-from borb.pdf.page_size import PageSize
 from borb.pdf.toolkit.event import Event
 from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
 from borb.pdf.toolkit.source.event.text_event import TextEvent
 
 
@@ -31,7 +32,10 @@ class GetText(Sink):
     # CONSTRUCTOR
     #
 
-    def __init__(self):
+    def __init__(
+        self,
+        reading_order: typing.Optional[typing.Callable[[TextEvent], typing.Any]] = None,
+    ):
         """
         Initialize the GetText filter.
 
@@ -39,15 +43,79 @@ class GetText(Sink):
         text content from each page of a PDF. It prepares the filter to capture
         text-related events during the PDF processing pipeline, allowing for text
         extraction based on the processed content streams.
+
+        :param reading_order:   Optional function that returns the sort key of a TextEvent, determining the order
+                                in which the text on a page is read. Defaults to top-to-bottom, left-to-right.
         """
         super().__init__()
         self.__events_per_page: typing.Dict[int, typing.List[TextEvent]] = {}  # type: ignore[annotation-unchecked]
+        self.__pages_to_assemble: typing.Set[int] = set()  # type: ignore[annotation-unchecked]
+        self.__reading_order: typing.Callable[[TextEvent], typing.Any] = (  # type: ignore[annotation-unchecked]
+            reading_order or GetText.__indo_european_reading_order
+        )
         self.__text_per_page: typing.Dict[int, str] = {}  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
     #
 
+    def __assemble_text(self, page_nr: int) -> None:
+        self.__pages_to_assemble.discard(page_nr)
+
+        # sort
+        events: typing.List[TextEvent] = sorted(
+            self.__events_per_page[page_nr],
+            key=self.__reading_order,
+        )
+
+        # convert to text
+        prev_x: float = events[0].get_x()
+        prev_y: float = events[0].get_y()
+        text: str = ""
+        for e in events:
+
+            # IF the difference in y-coordinate is too large
+            # THEN add a <newline>
+            y: float = e.get_y()
+            if abs(prev_y - y) > e.get_height() // 2:
+                text += "\n"
+                prev_y = y
+                prev_x = e.get_x()
+
+            # IF the difference in x-coordinate is too large
+            # THEN add a <space>
+            x: float = e.get_x()
+            if abs(prev_x - x) > (0.250 * e.get_font_size()):
+                text += " "
+
+            # add text
+            text += e.get_text() or ""
+
+            # calculate prev_x
+            prev_x = e.get_x() + e.get_width()
+
+        # store
+        self.__text_per_page[page_nr] = text
+
+    @staticmethod
+    def __indo_european_reading_order(e: TextEvent) -> typing.Tuple[int, int]:
+        # top-to-bottom, left-to-right
+        return -math.ceil(e.get_y()), math.floor(e.get_x())
+
+    def _get_partial_output(self) -> typing.Any:
+        for page_nr in sorted(self.__pages_to_assemble):
+            self.__assemble_text(page_nr)
+        return self.__text_per_page
+
+    def _merge_partial_output(self, partial_output: typing.Any) -> None:
+        self.__text_per_page.update(partial_output)
+
+    def _pop_page_output(self, page_nr: int) -> typing.Any:
+        if page_nr in self.__pages_to_assemble:
+            self.__assemble_text(page_nr)
+        self.__events_per_page.pop(page_nr, None)
+        return self.__text_per_page.pop(page_nr, "")
+
     #
     # PUBLIC
     #
@@ -62,6 +130,10 @@ class GetText(Sink):
 
         :return: The aggregated output from the pipeline, or `None` if not implemented.
         """
+        # IF some pages did not end (e.g. their EndPageEvent was filtered out)
+        # THEN assemble their text now
+        for page_nr in sorted(self.__pages_to_assemble):
+            self.__assemble_text(page_nr)
         return self.__text_per_page
 
     def process(self, event: Event) -> None:
@@ -73,6 +145,13 @@ class GetText(Sink):
 
         :param event: The event object to process.
         """
+        # IF the page ended
+        # THEN assemble its text (once)
+        if isinstance(event, EndPageEvent):
+            if event.get_page_nr() in self.__pages_to_assemble:
+                self.__assemble_text(event.get_page_nr())
+            return
+
         if not isinstance(event, TextEvent):
             return
 
@@ -80,47 +159,7 @@ class GetText(Sink):
             return
 
         # append TextEvent
+        # (the text is assembled when the page ends)
         page_nr: int = event.get_page_nr()
-        self.__events_per_page[page_nr] = self.__events_per_page.get(page_nr, []) + [
-            event
-        ]
-
-        # define sort function
-        def __indo_european_reading_order(e: TextEvent) -> int:
-            y_upside_down: int = int(PageSize.A4_PORTRAIT[1] - e.get_y())
-            return int(y_upside_down * PageSize.A4_PORTRAIT[1] + e.get_x())
-
-        # sort
-        self.__events_per_page[page_nr] = sorted(
-            self.__events_per_page[page_nr],
-            key=__indo_european_reading_order,
-        )
-
-        # convert to text
-        prev_x: float = self.__events_per_page[page_nr][0].get_x()
-        prev_y: float = self.__events_per_page[page_nr][0].get_y()
-        text: str = ""
-        for e in self.__events_per_page[page_nr]:
-
-            # IF the difference in y-coordinate is too large
-            # THEN add a <newline>
-            y: float = e.get_y()
-            if abs(prev_y - y) > e.get_height() // 2:
-                text += "\n"
-                prev_y = y
-                prev_x = e.get_x()
-
-            # IF the difference in x-coordinate is too large
-            # THEN add a <space>
-            x: float = e.get_x()
-            if abs(prev_x - x) > (0.250 * e.get_font_size()):
-                text += " "
-
-            # add text
-            text += e.get_text() or ""
-
-            # calculate prev_x
-            prev_x = e.get_x() + e.get_width()
-
-        # store
-        self.__text_per_page[page_nr] = text
+        self.__events_per_page.setdefault(page_nr, []).append(event)
+        self.__pages_to_assemble.add(page_nr)
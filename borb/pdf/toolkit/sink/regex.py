@@ -13,12 +13,13 @@ aggregates matches across the page, and exposes their positional information for
 downstream processing, analysis, or extraction workflows.
 """
 
+import math
 import re
 import typing
 
 from borb.pdf.toolkit.event import Event
-from borb.pdf.page_size import PageSize
 from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
 from borb.pdf.toolkit.source.event.text_event import TextEvent
 
 # define a Rectangle
@@ -154,7 +155,11 @@ class Regex(Sink):
     # CONSTRUCTOR
     #
 
-    def __init__(self, pattern: typing.Union[str, re.Pattern]):
+    def __init__(
+        self,
+        pattern: typing.Union[str, re.Pattern],
+        reading_order: typing.Optional[typing.Callable[[TextEvent], typing.Any]] = None,
+    ):
         """
         Initialize the Regex filter.
 
@@ -162,79 +167,31 @@ class Regex(Sink):
         text content from each page of a PDF. It prepares the filter to capture
         text-related events during the PDF processing pipeline, allowing for text
         extraction based on the processed content streams.
+
+        :param pattern:         The regular expression pattern (or a string that will be compiled).
+        :param reading_order:   Optional function that returns the sort key of a TextEvent, determining the order
+                                in which the text on a page is read. Defaults to top-to-bottom, left-to-right.
         """
         super().__init__()
         self.__events_per_page: typing.Dict[int, typing.List[TextEvent]] = {}  # type: ignore[annotation-unchecked]
+        self.__pages_to_assemble: typing.Set[int] = set()  # type: ignore[annotation-unchecked]
         self.__pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
-        self.__text_per_page: typing.Dict[int, str] = {}  # type: ignore[annotation-unchecked]
+        self.__reading_order: typing.Callable[[TextEvent], typing.Any] = (  # type: ignore[annotation-unchecked]
+            reading_order or Regex.__indo_european_reading_order
+        )
         self.__rectangles_per_page: typing.Dict[int, typing.List[Match]] = {}
 
     #
     # PRIVATE
     #
 
-    @staticmethod
-    def __indo_european_reading_order(e: TextEvent) -> int:
-        y_upside_down: int = int(PageSize.A4_PORTRAIT[1] - e.get_y())
-        return int(y_upside_down * PageSize.A4_PORTRAIT[1] + e.get_x())
-
-    @staticmethod
-    def __split_event_into_rectangles(e: TextEvent) -> typing.List[RectangleType]:
-        out: typing.List[RectangleType] = []
-        x: float = e.get_x()
-        y: float = e.get_y()
-        w: float = e.get_width()
-        h: float = e.get_height()
-        for c in e.get_text():
-            cw: float = e.get_font().get_width(text=c)
-            out += [(x, y, cw, h)]
-            # move to the next x
-            x += cw
-
-        # return
-        return out
-
-    #
-    # PUBLIC
-    #
-
-    def get_output(self) -> typing.Any:
-        """
-        Retrieve the aggregated results from the pipeline.
-
-        This method should be overridden by subclasses to provide the specific output
-        collected by the `Sink`. By default, it returns `None`, indicating that no
-        aggregation or processing has been implemented.
-
-        :return: The aggregated output from the pipeline, or `None` if not implemented.
-        """
-        return self.__rectangles_per_page
-
-    def process(self, event: Event):
-        """
-        Process the given event.
-
-        This base implementation is a no-op. Subclasses should override this method
-        to provide specific processing logic.
-
-        :param event: The event object to process.
-        """
-        if not isinstance(event, TextEvent):
-            return
-
-        if len(event.get_text().strip()) == 0:
-            return
-
-        # append TextEvent
-        page_nr: int = event.get_page_nr()
-        self.__events_per_page[page_nr] = self.__events_per_page.get(page_nr, []) + [
-            event
-        ]
+    def __assemble_matches(self, page_nr: int) -> None:
+        self.__pages_to_assemble.discard(page_nr)
 
         # sort
-        self.__events_per_page[page_nr] = sorted(
+        events: typing.List[TextEvent] = sorted(
             self.__events_per_page[page_nr],
-            key=Regex.__indo_european_reading_order,
+            key=self.__reading_order,
         )
 
         # split the TextEvent into RectangleType objects
@@ -242,7 +199,7 @@ class Regex(Sink):
         # this is important to match the regex indices to the RectangleType objects
         char_rectangles: typing.List[typing.Optional[RectangleType]] = []
         text: str = ""
-        for evt in self.__events_per_page[page_nr]:
+        for evt in events:
 
             # IF we do not yet have any text (and thus rectangles)
             # THEN simply add the new text (and rectangles)
@@ -331,3 +288,78 @@ class Regex(Sink):
             self.__rectangles_per_page[page_nr] += [
                 Match(inner_match=re_match, rectangles=match_rectangles)
             ]
+
+    @staticmethod
+    def __indo_european_reading_order(e: TextEvent) -> typing.Tuple[int, int]:
+        # top-to-bottom, left-to-right
+        return -math.ceil(e.get_y()), math.floor(e.get_x())
+
+    def _pop_page_output(self, page_nr: int) -> typing.Any:
+        if page_nr in self.__pages_to_assemble:
+            self.__assemble_matches(page_nr)
+        self.__events_per_page.pop(page_nr, None)
+        return self.__rectangles_per_page.pop(page_nr, [])
+
+    @staticmethod
+    def __split_event_into_rectangles(e: TextEvent) -> typing.List[RectangleType]:
+        out: typing.List[RectangleType] = []
+        x: float = e.get_x()
+        y: float = e.get_y()
+        w: float = e.get_width()
+        h: float = e.get_height()
+        text: str = e.get_text()
+        for c, cw in zip(text, e.get_font().get_widths(texts=[c for c in text])):
+            out += [(x, y, cw, h)]
+            # move to the next x
+            x += cw
+
+        # return
+        return out
+
+    #
+    # PUBLIC
+    #
+
+    def get_output(self) -> typing.Any:
+        """
+        Retrieve the aggregated results from the pipeline.
+
+        This method should be overridden by subclasses to provide the specific output
+        collected by the `Sink`. By default, it returns `None`, indicating that no
+        aggregation or processing has been implemented.
+
+        :return: The aggregated output from the pipeline, or `None` if not implemented.
+        """
+        # IF some pages did not end (e.g. their EndPageEvent was filtered out)
+        # THEN assemble their matches now
+        for page_nr in sorted(self.__pages_to_assemble):
+            self.__assemble_matches(page_nr)
+        return self.__rectangles_per_page
+
+    def process(self, event: Event):
+        """
+        Process the given event.
+
+        This base implementation is a no-op. Subclasses should override this method
+        to provide specific processing logic.
+
+        :param event: The event object to process.
+        """
+        # IF the page ended
+        # THEN assemble its text and matches (once)
+        if isinstance(event, EndPageEvent):
+            if event.get_page_nr() in self.__pages_to_assemble:
+                self.__assemble_matches(event.get_page_nr())
+            return
+
+        if not isinstance(event, TextEvent):
+            return
+
+        if len(event.get_text().strip()) == 0:
+            return
+
+        # append TextEvent
+        # (the text and matches are assembled when the page ends)
+        page_nr: int = event.get_page_nr()
+        self.__events_per_page.setdefault(page_nr, []).append(event)
+        self.__pages_to_assemble.add(page_nr)
@@ -40,6 +40,47 @@ class Sink(Pipe):
     # PRIVATE
     #
 
+    def _get_partial_output(self) -> typing.Any:
+        """
+        Return the results collected by this `Sink`, in a form that can be merged into another `Sink`.
+
+        When a `Pipeline` processes the pages of a `Document` in parallel, every worker process
+        runs its own copy of the `Pipeline` over some of the pages. The partial output of each
+        worker is sent back (pickled) and merged into the `Sink` of the `Pipeline` by `_merge_partial_output`.
+        The partial output is a dict, keyed by page number. After every batch of pages, the worker pops the
+        pages of that batch from it, so that every page is only sent back once.
+        By default, a `Sink` does not support this, and returns `None` (the pages are then processed serially).
+
+        :return: The (picklable) partial output of this `Sink` (keyed by page number), or `None` if it can not be merged.
+        """
+        return None
+
+    def _merge_partial_output(self, partial_output: typing.Any) -> None:
+        """
+        Merge the partial output of another `Sink` (that processed other pages) into this `Sink`.
+
+        :param partial_output: The partial output, as returned by `_get_partial_output`.
+        :return: None
+        """
+        pass
+
+    def _pop_page_output(self, page_nr: int) -> typing.Any:
+        """
+        Return the output of a single (ended) page, and drop whatever this `Sink` holds for that page.
+
+        When a `Pipeline` iterates over the pages of a `Document` (`Pipeline.iter_pages`), this method
+        is called after every page, so the (events of the) page can be released as soon as its output is known.
+        By default, the output of the page is looked up in `get_output` (if that is keyed by page number),
+        and nothing is dropped.
+
+        :param page_nr: The number of the page.
+        :return: The output of the page, or `None` if there is none.
+        """
+        output: typing.Any = self.get_output()
+        if isinstance(output, dict):
+            return output.get(page_nr)
+        return None
+
     #
     # PUBLIC
     #
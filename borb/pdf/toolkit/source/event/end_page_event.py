@@ -25,17 +25,20 @@ class EndPageEvent(Event):
     generation pipeline to handle post-processing or cleanup tasks associated with the page.
     """
 
+    __slots__ = ("__page",)
+
     #
     # CONSTRUCTOR
     #
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, page_nr: int = -1):
         """
         Initialize an EndPageEvent instance.
 
-        :param page: The page that has finished rendering.
+        :param page:    The page that has finished rendering.
+        :param page_nr: The (0-based) number of the page, -1 if it is not known (yet).
         """
-        super().__init__()
+        super().__init__(page_nr=page_nr)
         self.__page: Page = page
 
     #
@@ -22,6 +22,16 @@ class ImageEvent(Event):
     the event to be processed or handled by other components in the PDF generation pipeline.
     """
 
+    __slots__ = (
+        "__height",
+        "__image",
+        "__page",
+        "__width",
+        "__x",
+        "__xobject_resource",
+        "__y",
+    )
+
     #
     # CONSTRUCTOR
     #
@@ -35,6 +45,7 @@ class ImageEvent(Event):
         x: float,
         xobject_resource: name,
         y: float,
+        page_nr: int = -1,
     ):
         """
         Initialize an ImageEvent instance.
@@ -42,11 +53,13 @@ class ImageEvent(Event):
         :param height:              The height of the image in user space.
         :param image:               The image (of type PDFType) to be placed on the page.
         :param page:                The page on which the image will be placed.
+        :param page_nr:             The (0-based) number of the page, -1 if it is not known (yet).
         :param width:               The width of the image in user space.
         :param x:                   The x-coordinate where the image will be placed.
         :param xobject_resource:    The name of the XObject resource representing the image.
         :param y:                   The y-coordinate where the image will be placed.
         """
+        super().__init__(page_nr=page_nr)
         self.__height: float = height
         self.__image: PDFType = image
         self.__page: Page = page
@@ -25,6 +25,13 @@ class ShapeFillEvent(Event):
     can be used by other components to process or render the filled shape on the page.
     """
 
+    __slots__ = (
+        "__fill_color",
+        "__page",
+        "__shape",
+        "__use_even_odd_rule",
+    )
+
     #
     # CONSTRUCTOR
     #
@@ -34,17 +41,19 @@ class ShapeFillEvent(Event):
         page: Page,
         shape: ShapeType,
         use_even_odd_rule: bool,
+        page_nr: int = -1,
     ):
         """
         Initialize a ShapeFillEvent instance.
 
         :param fill_color: The color used to fill the shape.
         :param page: The page on which the shape is being filled.
+        :param page_nr: The (0-based) number of the page, -1 if it is not known (yet).
         :param shape: The shape being filled.
         :param use_even_odd_rule: Flag indicating whether the even-odd rule is used
                                    for filling the shape.
         """
-        super().__init__()
+        super().__init__(page_nr=page_nr)
         self.__fill_color: Color = fill_color
         self.__page: Page = page
         self.__shape: ShapeType = shape
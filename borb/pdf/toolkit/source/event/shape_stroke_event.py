@@ -25,6 +25,13 @@ class ShapeStrokeEvent(Event):
     processed, analyzed, or modified by components in the PDF processing pipeline.
     """
 
+    __slots__ = (
+        "__line_width",
+        "__page",
+        "__shape",
+        "__stroke_color",
+    )
+
     #
     # CONSTRUCTOR
     #
@@ -34,6 +41,7 @@ class ShapeStrokeEvent(Event):
         page: Page,
         shape: ShapeType,
         stroke_color: Color,
+        page_nr: int = -1,
     ):
         """
         Initialize a new instance of the ShapeStrokeEvent class.
@@ -44,10 +52,11 @@ class ShapeStrokeEvent(Event):
 
         :param line_width:   The width of the line used for stroking the shape. Determines the thickness of the stroke outline.
         :param page:         The specific page of the document where the shape is stroked. Defines the placement context for the event.
+        :param page_nr:      The (0-based) number of the page, -1 if it is not known (yet).
         :param shape:        The shape to be stroked. Represents the geometric outline or path being rendered with a stroke.
         :param stroke_color: The color used for stroking the shape. Defines the visual appearance of the stroke.
         """
-        super().__init__()
+        super().__init__(page_nr=page_nr)
         self.__line_width: float = line_width
         self.__page: Page = page
         self.__shape: ShapeType = shape
@@ -25,6 +25,18 @@ class TextEvent(Event):
     components in the PDF processing pipeline.
     """
 
+    __slots__ = (
+        "__font",
+        "__font_color",
+        "__font_size",
+        "__height",
+        "__page",
+        "__s",
+        "__width",
+        "__x",
+        "__y",
+    )
+
     #
     # CONSTRUCTOR
     #
@@ -39,6 +51,7 @@ class TextEvent(Event):
         font_color: Color,
         font_size: float,
         page: Page,
+        page_nr: int = -1,
     ):
         """
         Initialize a new instance of the TextEvent class.
@@ -57,8 +70,9 @@ class TextEvent(Event):
         :param font_color:  The color of the text. Defines the visual appearance of the text color.
         :param font_size:   The size of the font used for rendering the text. Controls the scaling of the text content.
         :param page:        The specific page of the document where the text is rendered. Defines the placement context for the event.
+        :param page_nr:     The (0-based) number of the page, -1 if it is not known (yet).
         """
-        super().__init__()
+        super().__init__(page_nr=page_nr)
         self.__page: Page = page
         self.__s: str = s
         self.__x: float = x
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A single-pass lexer that splits a PDF content stream into (operands, operator) tuples.
+
+A content stream is a sequence of instructions, each consisting of zero or more
+operands followed by an operator (e.g. `/F1 12 Tf` or `BT`). The `ContentStreamLexer`
+walks the content stream exactly once, keeping track of its position by offset rather
+than by slicing, and yields every operator (by name) along with the operands that
+preceded it.
+
+Simple operands (numbers, names, booleans) are lexed directly. Compound operands
+(strings, hexadecimal strings, arrays and dictionaries) are handed to a `FacadeVisitor`
+that reads from the same content stream, at the same offset.
+"""
+
+import re
+import typing
+
+from borb.pdf.primitives import PDFType, name
+
+
+class ContentStreamLexer:
+    """
+    A single-pass lexer that splits a PDF content stream into (operands, operator) tuples.
+
+    A content stream is a sequence of instructions, each consisting of zero or more
+    operands followed by an operator (e.g. `/F1 12 Tf` or `BT`). The `ContentStreamLexer`
+    walks the content stream exactly once, keeping track of its position by offset rather
+    than by slicing, and yields every operator (by name) along with the operands that
+    preceded it.
+
+    Simple operands (numbers, names, booleans) are lexed directly. Compound operands
+    (strings, hexadecimal strings, arrays and dictionaries) are handed to a `FacadeVisitor`
+    that reads from the same content stream, at the same offset.
+    """
+
+    __DELIMITERS: bytes = b"()<>[]{}/%"
+    __END_OF_INLINE_IMAGE: re.Pattern = re.compile(
+        rb"[\x00\x09\x0a\x0c\x0d\x20]EI(?=[\x00\x09\x0a\x0c\x0d\x20]|$)"
+    )
+    __WHITESPACE: bytes = b"\x00\x09\x0a\x0c\x0d\x20"
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(self, content_stream_bytes: bytes):
+        """
+        Initialize a `ContentStreamLexer` for the given (decoded) content stream.
+
+        :param content_stream_bytes: the (decoded) bytes of the content stream
+        """
+        from borb.pdf.visitor.read.bool_visitor import BoolVisitor
+        from borb.pdf.visitor.read.dict_visitor import DictVisitor
+        from borb.pdf.visitor.read.facade_visitor import FacadeVisitor
+        from borb.pdf.visitor.read.float_visitor import FloatVisitor
+        from borb.pdf.visitor.read.hex_str_visitor import HexStrVisitor
+        from borb.pdf.visitor.read.int_visitor import IntVisitor
+        from borb.pdf.visitor.read.list_visitor import ListVisitor
+        from borb.pdf.visitor.read.name_visitor import NameVisitor
+        from borb.pdf.visitor.read.str_visitor import StrVisitor
+
+        self.__content_stream_bytes: bytes = content_stream_bytes
+
+        # the FacadeVisitor reads (compound operands) from the content stream by offset
+        self.__operand_visitor: FacadeVisitor = FacadeVisitor()
+        self.__operand_visitor._FacadeVisitor__visitors = [  # type: ignore [attr-defined]
+            # aggregation types
+            DictVisitor(root=self.__operand_visitor),
+            ListVisitor(root=self.__operand_visitor),
+            # primitive types
+            StrVisitor(root=self.__operand_visitor),
+            HexStrVisitor(root=self.__operand_visitor),
+            NameVisitor(root=self.__operand_visitor),
+            BoolVisitor(root=self.__operand_visitor),
+            FloatVisitor(root=self.__operand_visitor),
+            IntVisitor(root=self.__operand_visitor),
+        ]
+        self.__operand_visitor._FacadeVisitor__source = content_stream_bytes  # type: ignore [attr-defined]
+
+    #
+    # PRIVATE
+    #
+
+    def __get_end_of_token(self, i: int) -> int:
+        j: int = i
+        n: int = len(self.__content_stream_bytes)
+        while (
+            j < n
+            and self.__content_stream_bytes[j] not in ContentStreamLexer.__WHITESPACE
+            and self.__content_stream_bytes[j] not in ContentStreamLexer.__DELIMITERS
+        ):
+            j += 1
+        return j
+
+    @staticmethod
+    def __get_number(token: bytes) -> typing.Optional[typing.Union[int, float]]:
+        try:
+            if b"." in token:
+                return float(token)
+            return int(token)
+        except ValueError:
+            return None
+
+    #
+    # PUBLIC
+    #
+
+    def __iter__(
+        self,
+    ) -> typing.Iterator[typing.Tuple[typing.List[typing.Optional[PDFType]], str]]:
+        """
+        Iterate over the content stream, yielding (operands, operator) tuples.
+
+        Every operator is yielded (by name) along with all operands that were encountered
+        since the previous operator. Comments are skipped, and the binary data of
+        inline images (between `ID` and `EI`) is never interpreted as operands.
+
+        :return: an iterator of (operands, operator) tuples
+        """
+        bts: bytes = self.__content_stream_bytes
+        n: int = len(bts)
+        operands: typing.List[typing.Optional[PDFType]] = []
+        i: int = 0
+        while i < n:
+            c: int = bts[i]
+
+            # whitespace
+            if c in ContentStreamLexer.__WHITESPACE:
+                i += 1
+                continue
+
+            # comment
+            if c == 0x25:
+                while i < n and bts[i] not in b"\r\n":
+                    i += 1
+                continue
+
+            # name
+            if c == 0x2F:
+                j: int = self.__get_end_of_token(i + 1)
+                operands += [name(bts[i + 1 : j].decode())]
+                i = j
+                continue
+
+            # string, hexadecimal string, array, dictionary
+            if c in b"(<[":
+                operand_and_pos = self.__operand_visitor.visit(i)
+                if operand_and_pos is None:
+                    i += 1
+                    continue
+                operands += [operand_and_pos[0]]
+                i = operand_and_pos[1]
+                continue
+
+            # stray delimiter
+            if c in ContentStreamLexer.__DELIMITERS:
+                i += 1
+                continue
+
+            # number, boolean, null or operator
+            j = self.__get_end_of_token(i)
+            token: bytes = bts[i:j]
+            i = j
+            if c in b"+-.0123456789":
+                number: typing.Optional[typing.Union[int, float]] = (
+                    ContentStreamLexer.__get_number(token)
+                )
+                if number is not None:
+                    operands += [number]
+                continue
+            if token == b"true":
+                operands += [True]
+                continue
+            if token == b"false":
+                operands += [False]
+                continue
+            if token == b"null":
+                operands += [None]
+                continue
+            yield operands, token.decode("latin-1")
+            operands = []
+
+            # IF we have just yielded ID
+            # THEN skip the (binary) data of the inline image, up to EI
+            if token == b"ID":
+                m = ContentStreamLexer.__END_OF_INLINE_IMAGE.search(bts, i + 1)
+                i = n if m is None else m.start() + 1
@@ -106,9 +106,7 @@ class OperatorTd(Operator):
             m0=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [tx, ty, 1.0]],
             m1=source.text_line_matrix,
         )
-        import copy
-
-        source.text_matrix = copy.deepcopy(source.text_line_matrix)
+        source.text_matrix = [r[:] for r in source.text_line_matrix]
         pass
 
     def get_name(self) -> str:
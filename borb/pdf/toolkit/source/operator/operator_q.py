@@ -74,8 +74,6 @@ class Operatorq(Operator):
         :param source: The `Source` object managing the content stream.
         :param operands: A list of `PDFType` objects representing the operator's operands.
         """
-        import copy
-
         source.graphics_state_stack += [
             {
                 "character_spacing": source.character_spacing,
@@ -86,9 +84,9 @@ class Operatorq(Operator):
                 "miter_limit": source.miter_limit,
                 "stroke_color": source.stroke_color,
                 "stroke_color_space": source.stroke_color_space,
-                "text_line_matrix": copy.deepcopy(source.text_line_matrix),
-                "text_matrix": copy.deepcopy(source.text_matrix),
-                "transformation_matrix": copy.deepcopy(source.transformation_matrix),
+                "text_line_matrix": [r[:] for r in source.text_line_matrix],
+                "text_matrix": [r[:] for r in source.text_matrix],
+                "transformation_matrix": [r[:] for r in source.transformation_matrix],
             }
         ]
         pass
@@ -49,7 +49,9 @@ class Source(Pipe):
     # CONSTRUCTOR
     #
 
-    def __init__(self):
+    def __init__(
+        self, event_types: typing.Optional[typing.Iterable[typing.Type[Event]]] = None
+    ):
         """
         Initialize a `Source` instance.
 
@@ -59,6 +61,10 @@ class Source(Pipe):
 
         :param p:  The `Page` object that represents the PDF page to be processed.
                    It contains the page content that will be the target of the processing.
+        :param event_types: Optional types of `Event` the rest of the pipeline consumes (e.g. only `TextEvent`).
+                            Operators that only lead to other types of `Event` (e.g. building and painting paths,
+                            when no `ShapeFillEvent` or `ShapeStrokeEvent` is consumed) are then skipped.
+                            Defaults to None (all types of `Event` are produced).
 
         The `Source` class can be extended to implement specific
         processing behaviors, and the page passed to the constructor will be the subject
@@ -237,7 +243,9 @@ class Source(Pipe):
         self.path: typing.List[ShapeType] = []  # type: ignore[annotation-unchecked]
         self.stroke_color: Color = X11Color.BLACK  # type: ignore[annotation-unchecked]
         self.stroke_color_space: name = name("DeviceRGB")  # type: ignore[annotation-unchecked]
-        self.font: Font = Standard14Fonts.get("Helvetica")  # type: ignore[annotation-unchecked]
+        helvetica: typing.Optional[Font] = Standard14Fonts.get("Helvetica")
+        assert helvetica is not None
+        self.font: Font = helvetica
         self.text_line_matrix: typing.List[typing.List[float]] = [  # type: ignore[annotation-unchecked]
             [1.0, 0.0, 0.0],
             [0.0, 1.0, 0.0],
@@ -255,12 +263,70 @@ class Source(Pipe):
             [0.0, 1.0, 0.0],
             [0.0, 0.0, 1.0],
         ]
+        self.__event_types: typing.Optional[typing.List[typing.Type[Event]]] = (  # type: ignore[annotation-unchecked]
+            list(event_types) if event_types is not None else None
+        )
         self.__page: typing.Optional[Page] = None  # type: ignore[annotation-unchecked]
+        self.__page_nr: int = -1  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
     #
 
+    @staticmethod
+    def __get_event_types_per_operator() -> (
+        typing.Dict[str, typing.List[typing.Type[Event]]]
+    ):
+        from borb.pdf.toolkit.source.event.image_event import ImageEvent
+        from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+        from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
+        from borb.pdf.toolkit.source.event.text_event import TextEvent
+
+        # fmt: off
+        # the Operator(s) that only lead to (some) types of Event
+        # Operator(s) that are not listed (e.g. q, Q, cm, BT, ET, Tf, Tm) always apply
+        operator_names_and_event_types: typing.List[typing.Tuple[typing.List[str], typing.List[typing.Type[Event]]]] = [
+            # path construction and painting
+            (["B", "B*", "b", "b*", "c", "F", "f", "f*", "h", "l", "m", "n", "re", "S", "s", "v", "y"], [ShapeFillEvent, ShapeStrokeEvent]),
+            # stroke color and line style
+            (["CS", "d", "G", "J", "j", "K", "M", "RG", "SC", "SCN", "w"], [ShapeStrokeEvent]),
+            # non-stroke color
+            (["cs", "g", "k", "rg", "sc", "scn"], [ShapeFillEvent, TextEvent]),
+            # text showing
+            (["'", '"', "Tj", "TJ"], [TextEvent]),
+            # images (Form XObjects are not processed by Do)
+            (["BI", "Do", "EI", "ID"], [ImageEvent]),
+        ]
+        # fmt: on
+        event_types_per_operator: typing.Dict[str, typing.List[typing.Type[Event]]] = {}
+        for operator_names, operator_event_types in operator_names_and_event_types:
+            for operator_name in operator_names:
+                event_types_per_operator[operator_name] = operator_event_types
+        return event_types_per_operator
+
+    def __is_operator_needed(
+        self,
+        operator_name: str,
+        event_types_per_operator: typing.Dict[str, typing.List[typing.Type[Event]]],
+    ) -> bool:
+        # IF all types of Event are consumed
+        #   OR the Operator does not lead to a specific type of Event
+        # THEN the Operator is needed
+        if self.__event_types is None:
+            return True
+        if operator_name not in event_types_per_operator:
+            return True
+
+        # IF the Operator leads to a type of Event that is consumed
+        # THEN the Operator is needed
+        return any(
+            [
+                issubclass(t0, t1)
+                for t0 in event_types_per_operator[operator_name]
+                for t1 in self.__event_types
+            ]
+        )
+
     #
     # PUBLIC
     #
@@ -297,6 +363,7 @@ class Source(Pipe):
                 shape=shape,
                 use_even_odd_rule=use_even_odd_rule,
                 page=self.__page,
+                page_nr=self.__page_nr,
             )
         )
 
@@ -340,6 +407,7 @@ class Source(Pipe):
                 image=image,
                 xobject_resource=xobject_resource,
                 page=self.__page,
+                page_nr=self.__page_nr,
             )
         )
 
@@ -356,7 +424,7 @@ class Source(Pipe):
         if next is not None:
             next.process(event)
 
-    def process_page(self, page: Page) -> None:
+    def process_page(self, page: Page, page_nr: int = -1) -> None:
         """
         Process the content stream of a PDF page, executing operations based on the PDF operators encountered.
 
@@ -369,19 +437,33 @@ class Source(Pipe):
         streams, enabling extensions to define custom processing logic while leveraging this base
         implementation.
 
-        :param page: The Page
+        :param page:    The Page
+        :param page_nr: The (0-based) number of the Page, -1 if it is not known
         """
-        # fmt: off
+        from borb.pdf.toolkit.source.operator.content_stream_lexer import (
+            ContentStreamLexer,
+        )
         from borb.pdf.toolkit.source.operator.operator import Operator
-        self.operators = sorted(self.operators, key=lambda x: x.get_name())
-        self.operators = sorted(self.operators, key=lambda x: len(x.get_name()), reverse=True)
-        # fmt: on
 
-        # set __page
+        # build a lookup table (name -> Operator)
+        # skipping the Operator(s) that only lead to types of Event that are not consumed
+        event_types_per_operator: typing.Dict[str, typing.List[typing.Type[Event]]] = (
+            Source.__get_event_types_per_operator()
+        )
+        operators: typing.Dict[str, Operator] = {
+            x.get_name(): x
+            for x in self.operators
+            if self.__is_operator_needed(
+                operator_name=x.get_name(),
+                event_types_per_operator=event_types_per_operator,
+            )
+        }
+
+        # set __page, __page_nr
         self.__page = page
+        self.__page_nr = page_nr
 
         # decompress /Contents /Bytes
-
         content_stream_bytes: bytes = b""
         if isinstance(page["Contents"], list):
             content_stream_bytes = b"".join(
@@ -392,93 +474,22 @@ class Source(Pipe):
                 "DecodedBytes", b""
             )
 
-        # re-use the visitor(s)
-        from borb.pdf.visitor.read.bool_visitor import BoolVisitor
-        from borb.pdf.visitor.read.dict_visitor import DictVisitor
-        from borb.pdf.visitor.read.float_visitor import FloatVisitor
-        from borb.pdf.visitor.read.hex_str_visitor import HexStrVisitor
-        from borb.pdf.visitor.read.int_visitor import IntVisitor
-        from borb.pdf.visitor.read.list_visitor import ListVisitor
-        from borb.pdf.visitor.read.name_visitor import NameVisitor
-        from borb.pdf.visitor.read.facade_visitor import FacadeVisitor
-        from borb.pdf.visitor.read.str_visitor import StrVisitor
-
-        operand_visitor: FacadeVisitor = FacadeVisitor()
-        operand_visitor._FacadeVisitor__visitors = [  # type: ignore [attr-defined]
-            # aggregation types
-            DictVisitor(root=operand_visitor),
-            ListVisitor(root=operand_visitor),
-            # primitive types
-            StrVisitor(root=operand_visitor),
-            HexStrVisitor(root=operand_visitor),
-            NameVisitor(root=operand_visitor),
-            BoolVisitor(root=operand_visitor),
-            FloatVisitor(root=operand_visitor),
-            IntVisitor(root=operand_visitor),
-        ]
-
-        operands: typing.List[
-            typing.Union[PDFType, typing.Literal[b"<<"], typing.Literal[b"["]]
-        ] = []
-        i: int = 0
-        while i < len(content_stream_bytes):
-
-            # process things using FacadeVisitor
-            operand_visitor._FacadeVisitor__source = b""  # type: ignore [attr-defined]
-            operand_and_pos = operand_visitor.visit(content_stream_bytes[i:])
-            if operand_and_pos is not None:
-                operands += [operand_and_pos[0]]
-                i += operand_and_pos[1]
+        # process (operands, operator) tuples
+        for operands, operator_name in ContentStreamLexer(content_stream_bytes):
+            operator: typing.Optional[Operator] = operators.get(operator_name, None)
+            if operator is None:
                 continue
 
-            # space
-            if content_stream_bytes[i : i + 1] == b" ":
-                i += 1
+            # IF there are not enough operands
+            # THEN the operator can not be applied
+            number_of_operands: int = operator.get_number_of_operands()
+            if len(operands) < number_of_operands:
                 continue
-
-            # newline
-            if content_stream_bytes[i : i + 2] == b"\n\r":
-                i += 2
-                continue
-            if content_stream_bytes[i : i + 2] == b"\r\n":
-                i += 2
-                continue
-            if content_stream_bytes[i : i + 1] == b"\n":
-                i += 1
-                continue
-            if content_stream_bytes[i : i + 1] == b"\r":
-                i += 1
-                continue
-
-            # operators
-            j = i + 1
-            while any(
-                [
-                    x.get_name().startswith(content_stream_bytes[i:j].decode())
-                    for x in self.operators
-                ]
-            ):
-                j += 1
-            j -= 1
-            operator_code: str = content_stream_bytes[i:j].decode()
-            operator: typing.Optional[Operator] = next(
-                iter([x for x in self.operators if x.get_name() == operator_code]), None
+            operator.apply(
+                operands=operands[len(operands) - number_of_operands :],  # type: ignore[arg-type]
+                page=page,
+                source=self,
             )
-            if operator is not None:
-                args: typing.List[PDFType] = []
-                for _ in range(0, operator.get_number_of_operands()):
-                    args += [operands.pop(-1)]  # type: ignore[list-item]
-                args.reverse()
-                operator.apply(
-                    operands=args,  # type: ignore[arg-type]
-                    page=page,
-                    source=self,
-                )
-                i = j
-                continue
-
-            # move ahead 1 byte
-            i += 1
 
     def stroke(self, line_width: float, shape: ShapeType, stroke_color: Color):
         """
@@ -506,6 +517,7 @@ class Source(Pipe):
                 shape=shape,
                 stroke_color=stroke_color,
                 page=self.__page,
+                page_nr=self.__page_nr,
             )
         )
 
@@ -555,5 +567,6 @@ class Source(Pipe):
                 font_color=font_color,
                 font_size=font_size,
                 page=self.__page,
+                page_nr=self.__page_nr,
             )
         )
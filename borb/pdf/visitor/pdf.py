@@ -8,11 +8,14 @@ writing, and managing content within PDF documents. It abstracts the complexitie
 of PDF structure, allowing users to easily manipulate documents.
 """
 
-import io
+import mmap
+import os
 import pathlib
 import typing
+import weakref
 
 from borb.pdf.document import Document
+from borb.pdf.visitor.read.pdf_bytes import Buffer
 
 
 class PDF:
@@ -32,12 +35,151 @@ class PDF:
     # PRIVATE
     #
 
+    @staticmethod
+    def __get_source(what: Document) -> typing.Optional[Buffer]:
+
+        # IF the Document was read from a file
+        # THEN (re)open that file
+        source_path: typing.Optional[pathlib.Path] = what._Document__source_path  # type: ignore[attr-defined]
+        if source_path is None or not source_path.exists():
+            return what._Document__source  # type: ignore[attr-defined]
+        source: Buffer = PDF.__open(source_path)
+
+        # IF the file does not start with '%PDF-'
+        # THEN (left) trim it, as was done when reading it
+        from borb.pdf.visitor.read.pdf_bytes import PDFBytes
+
+        pdf_start_byte_pos: int = PDFBytes.next_start_of_pdf_keyword(
+            pdf_bytes=source, start=0
+        )
+        if pdf_start_byte_pos > 0:
+            trimmed_source: bytes = source[pdf_start_byte_pos:]
+            if isinstance(source, mmap.mmap):
+                source.close()
+            return trimmed_source
+
+        # return
+        return source
+
+    @staticmethod
+    def __open(where_from: pathlib.Path) -> Buffer:
+        with open(where_from, "rb") as pdf_file_handle:
+            try:
+                return mmap.mmap(pdf_file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return pdf_file_handle.read()
+
+    @staticmethod
+    def __subset_fonts(
+        what: Document,
+    ) -> typing.List[typing.Tuple[dict, str, typing.Any]]:
+        from borb.pdf.font.font import Font
+        from borb.pdf.font.simple_font.true_type.true_type_font_subsetter import (
+            TrueTypeFontSubsetter,
+        )
+
+        # replace every (used) Font by its subset
+        # (a Font that appears on several Page objects is only subset once)
+        subset_fonts: typing.Dict[int, Font] = {}
+        fonts_to_restore: typing.List[typing.Tuple[dict, str, typing.Any]] = []
+        for i in range(0, what.get_number_of_pages()):
+            page_resources = what.get_page(i).get("Resources", {})
+            if not isinstance(page_resources, dict):
+                continue
+            font_resources = page_resources.get("Font", {})
+            if not isinstance(font_resources, dict):
+                continue
+            for font_name, font in font_resources.items():
+                if not isinstance(font, Font):
+                    continue
+                if id(font) not in subset_fonts:
+                    subset_fonts[id(font)] = TrueTypeFontSubsetter.subset(font)
+                if subset_fonts[id(font)] is font:
+                    continue
+                fonts_to_restore += [(font_resources, font_name, font)]
+                font_resources[font_name] = subset_fonts[id(font)]
+
+        # return
+        return fonts_to_restore
+
+    @staticmethod
+    def __write(
+        what: Document,
+        where_to: typing.BinaryIO,
+        use_object_streams: bool,
+        compression_level: int,
+        compression_threads: typing.Optional[int],
+        incremental: bool,
+        append: bool,
+        subset_fonts: bool,
+    ) -> None:
+
+        # instantiate FacadeVisitor
+        # the bytes are streamed to where_to as they are produced
+        rv: typing.Any = None
+        source: typing.Optional[Buffer] = None
+        if incremental:
+            from borb.pdf.visitor.write_existing.facade_visitor import (
+                FacadeVisitor as WriteExistingFacadeVisitor,
+            )
+
+            # (re)open the bytes the Document was read from
+            # (for as long as the Document is being written)
+            source = PDF.__get_source(what)
+            rv = WriteExistingFacadeVisitor(
+                destination=where_to,
+                append=append,
+                compression_level=compression_level,
+                compression_threads=compression_threads,
+                source=source,
+            )
+        else:
+            from borb.pdf.visitor.write_new.facade_visitor import (
+                FacadeVisitor as WriteNewFacadeVisitor,
+            )
+
+            rv = WriteNewFacadeVisitor(
+                destination=where_to,
+                use_object_streams=use_object_streams,
+                compression_level=compression_level,
+                compression_threads=compression_threads,
+            )
+
+        # IF the (embedded) fonts need to be subset
+        # THEN replace them by their subset (for as long as the Document is being written)
+        fonts_to_restore: typing.List[typing.Tuple[dict, str, typing.Any]] = []
+        if subset_fonts and not incremental:
+            fonts_to_restore = PDF.__subset_fonts(what)
+
+        # convert everything to bytes using visitor design pattern
+        try:
+            rv.visit(node=what)
+        finally:
+            for font_resources, font_name, font in fonts_to_restore:
+                font_resources[font_name] = font
+            if isinstance(source, mmap.mmap) and source is not what._Document__source:  # type: ignore[attr-defined]
+                source.close()
+
+        # UsageStatistics
+        try:
+            from borb.pdf import UsageStatistics
+
+            UsageStatistics.event(
+                what="PDF.write",
+                number_of_documents=1,
+                number_of_pages=what.get_number_of_pages(),
+            )
+        except:
+            pass
+
     #
     # PUBLIC
     #
 
     @staticmethod
-    def read(where_from: typing.Union[str, pathlib.Path]) -> typing.Optional[Document]:
+    def read(
+        where_from: typing.Union[str, pathlib.Path], lazy: bool = False
+    ) -> typing.Optional[Document]:
         """
         Read a PDF file from the specified location and convert it to a `Document` object.
 
@@ -47,7 +189,12 @@ class PDF:
         `Document` object allows further manipulation and analysis of the PDF’s content
         within the application.
 
+        When `lazy` is True, (indirect) objects are only resolved when they are first
+        accessed, through the `Document` or one of its `Page` objects. Opening a large
+        file and accessing a single `Page` then only costs time proportional to that `Page`.
+
         :param where_from: The file path to the PDF, specified as a string or `pathlib.Path` object, indicating the location of the PDF file to read.
+        :param lazy: Whether (indirect) objects should be resolved on demand, rather than upon reading.
         :return: A `Document` object containing the parsed contents of the PDF, structured for further processing or display.
         """
         if isinstance(where_from, str):
@@ -55,19 +202,35 @@ class PDF:
         assert isinstance(where_from, pathlib.Path)
         assert where_from.exists()
 
-        # read all bytes
-        bts: bytes = b""
-        with open(where_from, "rb") as pdf_file_handle:
-            bts = pdf_file_handle.read()
+        # map the file into memory (rather than reading all bytes)
+        # this lets the operating system page in only those parts of the file that are accessed
+        bts: Buffer = PDF.__open(where_from)
 
         # instantiate FacadeVisitor
         from borb.pdf.visitor.read.facade_visitor import FacadeVisitor
 
-        rv = FacadeVisitor()
-        document_and_index = rv.visit(bts)
-        if document_and_index is None:
+        document: typing.Optional[Document] = None
+        try:
+            document_and_index = FacadeVisitor(lazy=lazy).visit(bts)
+            if document_and_index is not None:
+                assert isinstance(document_and_index[0], Document)
+                document = document_and_index[0]
+        finally:
+            # IF the Document was read eagerly (or could not be read)
+            # THEN its bytes are no longer needed (they are re-opened for an incremental update)
+            if document is None or not document.is_lazy():
+                if document is not None:
+                    document._Document__source = None  # type: ignore[attr-defined]
+                if isinstance(bts, mmap.mmap):
+                    bts.close()
+        if document is None:
             return None
-        assert isinstance(document_and_index[0], Document)
+        document._Document__source_path = where_from  # type: ignore[attr-defined]
+
+        # IF the Document was read lazily
+        # THEN its bytes are needed (to resolve objects) for as long as the Document is alive
+        if document.is_lazy() and isinstance(bts, mmap.mmap):
+            weakref.finalize(document, bts.close)
 
         # UsageStatistics
         try:
@@ -76,18 +239,23 @@ class PDF:
             UsageStatistics.event(
                 what="PDF.read",
                 number_of_documents=1,
-                number_of_pages=document_and_index[0].get_number_of_pages(),
+                number_of_pages=document.get_number_of_pages(),
             )
         except:
             pass
 
         # return
-        return document_and_index[0]
+        return document
 
     @staticmethod
     def write(
         what: Document,
         where_to: typing.Union[pathlib.Path, str, typing.BinaryIO],
+        compression_level: int = 9,
+        compression_threads: typing.Optional[int] = None,
+        incremental: bool = False,
+        subset_fonts: bool = True,
+        use_object_streams: bool = False,
     ) -> None:
         """
         Write the specified Document to a PDF file.
@@ -96,47 +264,107 @@ class PDF:
         location specified by the file path. The file path can be a string or
         a pathlib.Path object. If the file already exists, it will be overwritten.
 
-        :param where_to:    the path (or pathlib.Path) where the Document needs to be stored
-        :param what:        the document to be stored
-        :return:    None
-        """
-        # instantiate FacadeVisitor
-        from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+        When a (binary) file handle is given, the bytes of the PDF are written to it
+        as they are produced, so the serialized Document is never held in memory as a whole.
 
-        rv: FacadeVisitor = FacadeVisitor()
+        When `use_object_streams` is True, (small) objects are packed into compressed object
+        streams, and a cross-reference stream is written rather than a plaintext cross-reference
+        table. This typically produces (much) smaller files, but requires a PDF 1.5 (or later) reader.
 
-        # convert everything to bytes using visitor design pattern
-        rv.visit(node=what)
+        When `incremental` is True, the Document (which must have been read) is saved as an
+        incremental update: the original bytes are kept as they are, and only the objects that
+        were modified or added are appended, along with a new cross-reference section. When
+        writing to the file the Document was read from, only the update itself is written.
 
-        # UsageStatistics
-        try:
-            from borb.pdf import UsageStatistics
+        Streams are compressed (once) before the Document is written, using `compression_level`.
+        Larger streams are compressed concurrently, using at most `compression_threads` threads.
 
-            UsageStatistics.event(
-                what="PDF.write",
-                number_of_documents=1,
-                number_of_pages=what.get_number_of_pages(),
-            )
-        except:
-            pass
+        When `subset_fonts` is True, embedded (TrueType) fonts only contain the glyphs that were
+        actually used in the Document (rather than the entire font file). This typically makes
+        the PDF (much) smaller, especially for fonts with a large number of glyphs (e.g. CJK fonts).
 
-        # handle typing.BinaryIO
-        if isinstance(where_to, io.BytesIO):
-            where_to.write(rv.bytes())
+        :param where_to:            the path (or pathlib.Path, or binary file handle) where the Document needs to be stored
+        :param what:                the document to be stored
+        :param compression_level:   the zlib compression level (0-9) used to compress streams
+        :param compression_threads: the (maximum) number of threads used to compress streams (None for the number of CPUs)
+        :param incremental:         whether to append an incremental update to the original PDF
+        :param subset_fonts:        whether to only embed the glyphs (of TrueType fonts) that were used
+        :param use_object_streams:  whether to pack (small) objects into object streams
+        :return:    None
+        """
+        # IF the Document was read lazily
+        # THEN resolve all of its objects before writing
+        # (an incremental update only needs the objects that were loaded)
+        from borb.pdf.lazy_dict import LazyDict
 
-        # handle pathlib.path
-        if isinstance(where_to, pathlib.Path):
-            if not where_to.parent.exists():
-                where_to.parent.mkdir(parents=True)
-            assert where_to.parent.exists()
-            with open(where_to, "wb") as pdf_file_handle:
-                pdf_file_handle.write(rv.bytes())
+        if isinstance(what, LazyDict) and not incremental:
+            what._resolve_all()
+
+        # let every Page (e.g. a TableOfContents) finish its content (now that all page numbers are known)
+        what._before_write()
 
         # handle str
         if isinstance(where_to, str):
             where_to = pathlib.Path(where_to)
+
+        # handle pathlib.path
+        if isinstance(where_to, pathlib.Path):
             if not where_to.parent.exists():
                 where_to.parent.mkdir(parents=True)
             assert where_to.parent.exists()
+
+            # IF we are writing to the file the Document was read from
+            source_path = what._Document__source_path  # type: ignore[attr-defined]
+            if (
+                source_path is not None
+                and where_to.exists()
+                and os.path.samefile(where_to, source_path)
+            ):
+
+                # IF we are writing an incremental update
+                # THEN append (only) the update to the file
+                if incremental:
+                    with open(where_to, "ab") as pdf_file_handle:
+                        PDF.__write(
+                            what=what,
+                            where_to=pdf_file_handle,
+                            use_object_streams=use_object_streams,
+                            compression_level=compression_level,
+                            compression_threads=compression_threads,
+                            incremental=True,
+                            append=True,
+                            subset_fonts=subset_fonts,
+                        )
+                    return
+
+                # IF the file is (still) memory-mapped (e.g. the Document was read lazily)
+                # THEN release the memory map, as the file is about to be overwritten
+                source = what._Document__source  # type: ignore[attr-defined]
+                if isinstance(source, mmap.mmap):
+                    what._Document__source = None  # type: ignore[attr-defined]
+                    source.close()
+
             with open(where_to, "wb") as pdf_file_handle:
-                pdf_file_handle.write(rv.bytes())
+                PDF.__write(
+                    what=what,
+                    where_to=pdf_file_handle,
+                    use_object_streams=use_object_streams,
+                    compression_level=compression_level,
+                    compression_threads=compression_threads,
+                    incremental=incremental,
+                    append=False,
+                    subset_fonts=subset_fonts,
+                )
+            return
+
+        # handle typing.BinaryIO
+        PDF.__write(
+            what=what,
+            where_to=where_to,
+            use_object_streams=use_object_streams,
+            compression_level=compression_level,
+            compression_threads=compression_threads,
+            incremental=incremental,
+            append=False,
+            subset_fonts=subset_fonts,
+        )
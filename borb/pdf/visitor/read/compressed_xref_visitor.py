@@ -191,6 +191,7 @@ class CompressedXRefVisitor(XRefVisitor):
         # process decoded bytes
         decoded_xref_bytes: bytes = tmp_stream["DecodedBytes"]
         xref: typing.List[reference] = []
+        decoded_xref_byte_pointer: int = 0
         for k in range(0, len(indices), 2):
             start = indices[k]
             length = indices[k + 1]
@@ -201,7 +202,6 @@ class CompressedXRefVisitor(XRefVisitor):
             # type (see Table 18). In PDF 1.5 through PDF 1.7, only types 0, 1, and 2 are allowed. Any other value shall be
             # interpreted as a reference to the null object, thus permitting new entry types to be defined in the future.
 
-            decoded_xref_byte_pointer: int = 0
             for l in range(0, length):
 
                 # object number
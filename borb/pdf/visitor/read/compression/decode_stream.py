@@ -101,6 +101,7 @@ def decode_stream(stream_to_decode: stream) -> stream:
         if filter_name in ["FlateDecode", "Fl"]:
             transformed_bytes = FlateDecode.decode(
                 bytes_in=transformed_bytes,
+                colors=int(decode_params[filter_index].get("Colors", 1)),
                 columns=int(decode_params[filter_index].get("Columns", 1)),
                 predictor=int(decode_params[filter_index].get("Predictor", 1)),
                 bits_per_component=int(
@@ -46,6 +46,135 @@ class FlateDecode:
     # PRIVATE
     #
 
+    @staticmethod
+    def __apply_png_filter_to_row(
+        filter_type: int,
+        current_row: memoryview,
+        prior_row: memoryview,
+        bytes_per_pixel: int,
+    ) -> None:
+        bytes_per_row: int = len(current_row)
+
+        # PNG_FILTER_SUB
+        # Predicts the same as the sample to the left
+        if filter_type == 1:
+            for i in range(bytes_per_pixel, bytes_per_row):
+                current_row[i] = (
+                    current_row[i] + current_row[i - bytes_per_pixel]
+                ) & 0xFF
+
+        # PNG_FILTER_UP
+        # Predicts the same as the sample above
+        elif filter_type == 2:
+            current_row[:] = bytes(
+                [(x + y) & 0xFF for x, y in zip(current_row, prior_row)]
+            )
+
+        # PNG_FILTER_AVERAGE
+        # Predicts the average of the sample to the left and the sample above
+        elif filter_type == 3:
+            for i in range(0, bytes_per_pixel):
+                current_row[i] = (current_row[i] + (prior_row[i] >> 1)) & 0xFF
+            for i in range(bytes_per_pixel, bytes_per_row):
+                current_row[i] = (
+                    current_row[i]
+                    + ((current_row[i - bytes_per_pixel] + prior_row[i]) >> 1)
+                ) & 0xFF
+
+        # PNG_FILTER_PAETH
+        # Predicts whichever of left, above, upper-left is closest to (left + above - upper-left)
+        elif filter_type == 4:
+            for i in range(0, bytes_per_pixel):
+                current_row[i] = (current_row[i] + prior_row[i]) & 0xFF
+            for i in range(bytes_per_pixel, bytes_per_row):
+                a: int = current_row[i - bytes_per_pixel]
+                b: int = prior_row[i]
+                c: int = prior_row[i - bytes_per_pixel]
+                pa: int = abs(b - c)
+                pb: int = abs(a - c)
+                pc: int = abs(a + b - c - c)
+                if pa <= pb and pa <= pc:
+                    current_row[i] = (current_row[i] + a) & 0xFF
+                elif pb <= pc:
+                    current_row[i] = (current_row[i] + b) & 0xFF
+                else:
+                    current_row[i] = (current_row[i] + c) & 0xFF
+
+    @staticmethod
+    def __apply_png_predictor(
+        bytes_in: bytes, bytes_per_pixel: int, bytes_per_row: int
+    ) -> bytes:
+        # each row is preceded by a (PNG) filter type byte
+        number_of_rows: int = len(bytes_in) // (bytes_per_row + 1)
+        bytes_out: bytearray = bytearray(number_of_rows * bytes_per_row)
+        bytes_out_view: memoryview = memoryview(bytes_out)
+        prior_row: memoryview = memoryview(bytearray(bytes_per_row))
+        for row_index in range(0, number_of_rows):
+            row_start: int = row_index * bytes_per_row
+            current_row: memoryview = bytes_out_view[
+                row_start : row_start + bytes_per_row
+            ]
+            current_row[:] = bytes_in[
+                row_index * (bytes_per_row + 1)
+                + 1 : (row_index + 1) * (bytes_per_row + 1)
+            ]
+            FlateDecode.__apply_png_filter_to_row(
+                filter_type=bytes_in[row_index * (bytes_per_row + 1)],
+                current_row=current_row,
+                prior_row=prior_row,
+                bytes_per_pixel=bytes_per_pixel,
+            )
+
+            # the (decoded) current row is the prior row of the next row
+            prior_row = current_row
+
+        # return
+        return bytes(bytes_out)
+
+    @staticmethod
+    def __apply_tiff_predictor(
+        bytes_in: bytes,
+        bits_per_component: int,
+        colors: int,
+        columns: int,
+        bytes_per_row: int,
+    ) -> bytes:
+        number_of_rows: int = len(bytes_in) // bytes_per_row
+        number_of_components: int = columns * colors
+        mask: int = (1 << bits_per_component) - 1
+        bytes_out: bytearray = bytearray(bytes_in[: number_of_rows * bytes_per_row])
+        for row_index in range(0, number_of_rows):
+            row_start: int = row_index * bytes_per_row
+
+            # unpack the components of the row
+            row_as_int: int = int.from_bytes(
+                bytes_out[row_start : row_start + bytes_per_row], "big"
+            )
+            padding: int = bytes_per_row * 8 - number_of_components * bits_per_component
+            components: typing.List[int] = [
+                (
+                    row_as_int
+                    >> (padding + (number_of_components - 1 - i) * bits_per_component)
+                )
+                & mask
+                for i in range(0, number_of_components)
+            ]
+
+            # each component predicts the same component of the pixel to the left
+            for i in range(colors, number_of_components):
+                components[i] = (components[i] + components[i - colors]) & mask
+
+            # pack the components of the row
+            row_as_int = 0
+            for c in components:
+                row_as_int = (row_as_int << bits_per_component) | c
+            bytes_out[row_start : row_start + bytes_per_row] = (
+                row_as_int << padding
+            ).to_bytes(bytes_per_row, "big")
+
+        # return
+        return bytes(bytes_out)
+
     #
     # PUBLIC
     #
@@ -54,6 +183,7 @@ class FlateDecode:
     def decode(
         bytes_in: bytes,
         bits_per_component: int = 8,
+        colors: int = 1,
         columns: int = 1,
         predictor: int = 1,
     ) -> bytes:
@@ -70,6 +200,7 @@ class FlateDecode:
 
         :param bytes_in:              The input byte sequence to be decompressed. It should represent Flate-compressed data.
         :param bits_per_component:    The number of bits per sample/component of the data (default is 8). This parameter affects how the data is processed after decompression.
+        :param colors:                The number of (interleaved) color components per sample (default is 1).
         :param columns:               The number of columns in the data. This is relevant when applying certain predictor functions that need to know the structure of the data (default is 1).
         :param predictor:             The type of predictor function applied to the data before compression. Default is 1 (no prediction). Other possible values, such as 2, correspond to the TIFF Predictor 2.
         :return:                      The decompressed byte sequence, which may have had a predictor applied and been compressed with the Flate algorithm.
@@ -85,7 +216,7 @@ class FlateDecode:
 
         # check /BitsPerComponent
         # fmt: off
-        assert bits_per_component in [1, 2, 4, 8], "Illegal argument exception. bits_per_component must be in [1, 2, 4, 8]."
+        assert bits_per_component in [1, 2, 4, 8, 16], "Illegal argument exception. bits_per_component must be in [1, 2, 4, 8, 16]."
         # fmt: on
 
         # initial transform
@@ -124,103 +255,27 @@ class FlateDecode:
         if predictor == 1:
             return bytes_after_zlib
 
-        # set up everything to do PNG prediction
-        bytes_per_row: int = int((columns * bits_per_component + 7) / 8)
-        bytes_per_pixel = int(bits_per_component / 8)
+        # set up everything to do prediction
+        bytes_per_row: int = (columns * colors * bits_per_component + 7) // 8
+        bytes_per_pixel: int = (colors * bits_per_component + 7) // 8
 
-        current_row: typing.List[int] = [0 for _ in range(0, bytes_per_row)]
-        prior_row: typing.List[int] = [0 for _ in range(0, bytes_per_row)]
-        number_of_rows = int(len(bytes_after_zlib) / bytes_per_row)
+        # the predictors are implemented in pure Python (working on memoryview/bytearray objects),
+        # NumPy is not a dependency of borb (nor one of its extras)
 
-        # easy case
-        bytes_after_predictor = [int(x) for x in bytes_after_zlib]
+        # TIFF Predictor 2
         if predictor == 2:
-            if bits_per_component == 8:
-                for row in range(0, number_of_rows):
-                    row_start_index = row * bytes_per_row
-                    for col in range(1, bytes_per_row):
-                        bytes_after_predictor[row_start_index + col] = (
-                            bytes_after_predictor[row_start_index + col]
-                            + bytes_after_predictor[row_start_index + col - 1]
-                        ) % 256
-                return bytes([(int(x) % 256) for x in bytes_after_predictor])
-
-        # harder cases
-        bytes_after_predictor = []
-        pos = 0
-        while pos + bytes_per_row <= len(bytes_after_zlib):
-            # Read the filter type byte and a row of data
-            filter_type = bytes_after_zlib[pos]
-            pos += 1
-
-            current_row = [x for x in bytes_after_zlib[pos : pos + bytes_per_row]]
-            pos += bytes_per_row
-
-            # PNG_FILTER_NONE
-            if filter_type == 0:
-                # DO NOTHING
-                pass
-
-            # PNG_FILTER_SUB
-            # Predicts the same as the sample to the left
-            if filter_type == 1:
-                for i in range(bytes_per_pixel, bytes_per_row):
-                    current_row[i] = (
-                        current_row[i] + current_row[i - bytes_per_pixel]
-                    ) % 256
-
-            # PNG_FILTER_UP
-            # Predicts the same as the sample above
-            if filter_type == 2:
-                for i in range(0, bytes_per_row):
-                    current_row[i] = (current_row[i] + prior_row[i]) % 256
-
-            # PNG_FILTER_AVERAGE
-            # Predicts the average of the sample to the left and the
-            # sample above
-            if filter_type == 3:
-                for i in range(0, bytes_per_pixel):
-                    current_row[i] += int(prior_row[i] / 2)
-
-                for i in range(bytes_per_pixel, bytes_per_row):
-                    current_row[i] += (int)(
-                        (current_row[i - bytes_per_pixel] + prior_row[i]) / 2
-                    )
-                    current_row[i] %= 256
-
-            # PNG_FILTER_PAETH
-            if filter_type == 4:
-                for i in range(0, bytes_per_pixel):
-                    current_row[i] += prior_row[i]
-
-                for i in range(bytes_per_pixel, bytes_per_row):
-                    a = current_row[i - bytes_per_pixel]
-                    b = prior_row[i]
-                    c = prior_row[i - bytes_per_pixel]
-
-                    p = a + b - c
-                    pa = abs(p - a)
-                    pb = abs(p - b)
-                    pc = abs(p - c)
-
-                    ret = 0
-                    if pa <= pb and pa <= pc:
-                        ret = a
-                    elif pb <= pc:
-                        ret = b
-                    else:
-                        ret = c
-
-                    current_row[i] = (current_row[i] + ret) % 256
-
-            # write current row
-            for i in range(0, len(current_row)):
-                bytes_after_predictor.append(current_row[i])
-
-            # Swap curr and prior
-            import copy
-
-            prior_row = copy.deepcopy(current_row)
-
-        # return
-        return bytes([(int(x) % 256) for x in bytes_after_predictor])
+            return FlateDecode.__apply_tiff_predictor(
+                bytes_after_zlib,
+                bits_per_component=bits_per_component,
+                colors=colors,
+                columns=columns,
+                bytes_per_row=bytes_per_row,
+            )
+
+        # PNG predictors
+        # (the filter type is specified per row, so any of the PNG predictors is handled the same way)
+        return FlateDecode.__apply_png_predictor(
+            bytes_after_zlib,
+            bytes_per_pixel=bytes_per_pixel,
+            bytes_per_row=bytes_per_row,
+        )
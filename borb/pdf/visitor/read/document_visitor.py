@@ -159,6 +159,20 @@ class DocumentVisitor(ReadVisitor):
         retval["XRef"] = self._ReadVisitor__parent._FacadeVisitor__xref  # type: ignore[attr-defined]
         retval["Trailer"] = trailer_dictionary
 
+        # keep track of the source (and its xref) to allow incremental updates
+        retval._Document__source = self.get_bytes()  # type: ignore[attr-defined]
+        retval._Document__source_startxref = start_of_xref  # type: ignore[attr-defined]
+
+        # IF references are resolved on demand
+        # THEN attach a LazyReferenceVisitor to the Document AND return
+        if self._ReadVisitor__parent._FacadeVisitor__lazy:  # type: ignore[attr-defined]
+            from borb.pdf.visitor.read.reference_visitor.lazy_reference_visitor import (
+                LazyReferenceVisitor,
+            )
+
+            LazyReferenceVisitor(self._ReadVisitor__parent).attach_to_document(retval)  # type: ignore[attr-defined]
+            return retval, len(self.get_bytes())
+
         # handle recursive references
         from borb.pdf.visitor.read.reference_visitor.deferred_reference_visitor import (
             DeferredReferenceVisitor,
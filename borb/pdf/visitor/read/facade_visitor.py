@@ -23,9 +23,11 @@ Key responsibilities:
 """
 
 import logging
+import mmap
 import typing
 
 from borb.pdf.primitives import PDFType, reference
+from borb.pdf.visitor.read.pdf_bytes import Buffer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 from borb.pdf.visitor.read.reference_visitor.byte_offset_reference_visitor import (
     ByteOffsetReferenceVisitor,
@@ -62,7 +64,7 @@ class FacadeVisitor(ReadVisitor):
     # CONSTRUCTOR
     #
 
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
         """
         Initialize the FacadeVisitor instance and set up the necessary visitors for processing a PDF document.
 
@@ -76,6 +78,8 @@ class FacadeVisitor(ReadVisitor):
         PDF document, including processing objects, dictionaries, lists, strings,
         and primitive types. The `FacadeVisitor` acts as the central coordinator
         for dispatching PDF nodes to the appropriate visitor.
+
+        :param lazy:    whether (indirect) references should be resolved on demand, rather than upon reading
         """
         super().__init__(root=None)
         from borb.pdf.visitor.read.read_visitor import ReadVisitor
@@ -115,10 +119,11 @@ class FacadeVisitor(ReadVisitor):
             FloatVisitor(root=self),
             IntVisitor(root=self),
         ]
-        self.__source: bytes = b""  # type: ignore[annotation-unchecked]
+        self.__source: Buffer = b""  # type: ignore[annotation-unchecked]
         self.__references_being_resolved: typing.Set[int] = set()  # type: ignore[annotation-unchecked]
         self.__xref: typing.List[reference] = []  # type: ignore[annotation-unchecked]
         self.__cache: typing.Dict[int, typing.Any] = {}
+        self.__lazy: bool = lazy
 
     #
     # PRIVATE
@@ -140,7 +145,7 @@ class FacadeVisitor(ReadVisitor):
     #
 
     def visit(
-        self, node: typing.Union[bytes, PDFType]
+        self, node: typing.Union[Buffer, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
         """
         Traverse the PDF document tree using the visitor pattern.
@@ -156,7 +161,7 @@ class FacadeVisitor(ReadVisitor):
         """
         if (
             isinstance(self, FacadeVisitor)
-            and isinstance(node, bytes)
+            and (isinstance(node, bytes) or isinstance(node, mmap.mmap))
             and self.__source == b""
         ):
             self.__source = node
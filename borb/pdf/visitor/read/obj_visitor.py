@@ -18,7 +18,7 @@ supporting detailed and low-level PDF content processing.
 
 import typing
 
-from borb.pdf.primitives import PDFType, stream
+from borb.pdf.primitives import PDFType, stream, reference
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -179,6 +179,16 @@ class ObjVisitor(ReadVisitor):
         # read the bytes of the stream
         assert isinstance(obj_or_dict, dict)
         assert "Length" in obj_or_dict
+
+        # IF the /Length is a reference (which happens when references are resolved on demand)
+        # THEN resolve it now
+        if isinstance(obj_or_dict["Length"], reference):
+            self.root_generic_visit(obj_or_dict["Length"])  # type: ignore[arg-type]
+            length_obj: typing.Optional[PDFType] = obj_or_dict[
+                "Length"
+            ].get_referenced_object()
+            assert length_obj is not None
+            obj_or_dict["Length"] = length_obj
         assert isinstance(obj_or_dict["Length"], int)
         length: int = obj_or_dict["Length"]
         stream_bytes: bytes = self.get_bytes()[i : i + length]
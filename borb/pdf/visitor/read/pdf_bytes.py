@@ -16,8 +16,12 @@ header indicator, which are important for tasks like validation, content extract
 and structural analysis.
 """
 
+import mmap
 import typing
 
+# the bytes of a PDF, either read into memory or memory-mapped from a file
+Buffer: typing.TypeAlias = typing.Union[bytes, mmap.mmap]
+
 
 class PDFBytes:
     """
@@ -47,7 +51,7 @@ class PDFBytes:
     @staticmethod
     def __find_next(
         look_for_bytes: typing.List[bytes],
-        look_in_bytes: bytes,
+        look_in_bytes: Buffer,
         start: typing.Optional[int] = None,
         end: typing.Optional[int] = None,
     ) -> int:
@@ -76,7 +80,7 @@ class PDFBytes:
     @staticmethod
     def __find_previous(
         look_for_bytes: typing.List[bytes],
-        look_in_bytes: bytes,
+        look_in_bytes: Buffer,
         start: typing.Optional[int] = None,
         end: typing.Optional[int] = None,
     ) -> int:
@@ -108,7 +112,7 @@ class PDFBytes:
 
     @staticmethod
     def next_integer(
-        pdf_bytes: bytes,
+        pdf_bytes: Buffer,
         start: typing.Optional[int] = None,
         end: typing.Optional[int] = None,
     ):
@@ -121,7 +125,7 @@ class PDFBytes:
         file. The search can be restricted to a specific range using the `start`
         and `end` parameters.
 
-        :param pdf_bytes: The byte sequence representing the PDF file.
+        :param pdf_bytes: The byte sequence (or memory map) representing the PDF file.
         :param start: An optional integer specifying the starting position of the search range. Defaults to the beginning of `pdf_bytes` if not provided.
         :param end: An optional integer specifying the end position of the search range. Defaults to the end of `pdf_bytes` if not provided.
         :return: The byte index position of the first occurrence of an integer within the defined range, or -1 if no integer is found.
@@ -141,7 +145,7 @@ class PDFBytes:
 
     @staticmethod
     def next_newline(
-        pdf_bytes: bytes,
+        pdf_bytes: Buffer,
         start: typing.Optional[int] = None,
         end: typing.Optional[int] = None,
     ):
@@ -153,7 +157,7 @@ class PDFBytes:
         of line boundaries within the PDF's byte data. Users can define the search range
         with the optional `start` and `end` parameters.
 
-        :param pdf_bytes: The byte sequence representing the PDF file.
+        :param pdf_bytes: The byte sequence (or memory map) representing the PDF file.
         :param start: An optional integer specifying the starting position of the search range. Defaults to the beginning of `pdf_bytes` if not provided.
         :param end: An optional integer specifying the end position of the search range. Defaults to the end of `pdf_bytes` if not provided.
         :return: The byte index position of the next newline character sequence (`\\n` or `\\r\\n`) within the defined range, or -1 if no newline is found.
@@ -167,7 +171,7 @@ class PDFBytes:
 
     @staticmethod
     def next_space(
-        pdf_bytes: bytes,
+        pdf_bytes: Buffer,
         start: typing.Optional[int] = None,
         end: typing.Optional[int] = None,
     ) -> int:
@@ -179,7 +183,7 @@ class PDFBytes:
         The search can be restricted to a specific range using the `start` and
         `end` parameters.
 
-        :param pdf_bytes: The byte sequence representing the PDF file.
+        :param pdf_bytes: The byte sequence (or memory map) representing the PDF file.
         :param start: An optional integer specifying the starting position of the search range. Defaults to the beginning of `pdf_bytes` if not provided.
         :param end: An optional integer specifying the end position of the search range. Defaults to the end of `pdf_bytes` if not provided.
         :return: The byte index position of the first occurrence of a space character within the defined range, or -1 if no space character is found.
@@ -190,7 +194,7 @@ class PDFBytes:
 
     @staticmethod
     def next_start_of_dictionary(
-        pdf_bytes: bytes,
+        pdf_bytes: Buffer,
         start: typing.Optional[int] = None,
         end: typing.Optional[int] = None,
     ) -> int:
@@ -201,7 +205,7 @@ class PDFBytes:
         the next dictionary, marked by the `<<` starting delimiter. The search
         can be restricted to a specific range using the `start` and `end` parameters.
 
-        :param pdf_bytes: The byte sequence representing the PDF file.
+        :param pdf_bytes: The byte sequence (or memory map) representing the PDF file.
         :param start: An optional integer specifying the starting position of the search range. Defaults to the beginning of `pdf_bytes` if not provided.
         :param end: An optional integer specifying the end position of the search range. Defaults to the end of `pdf_bytes` if not provided.
         :return: The byte index position of the first occurrence of a dictionary (`<<`) within the defined range, or -1 if no dictionary is found.
@@ -212,7 +216,7 @@ class PDFBytes:
 
     @staticmethod
     def next_start_of_pdf_keyword(
-        pdf_bytes: bytes,
+        pdf_bytes: Buffer,
         start: typing.Optional[int] = None,
         end: typing.Optional[int] = None,
     ) -> int:
@@ -225,7 +229,7 @@ class PDFBytes:
         of the PDF content or verifying the file structure. The search range can be
         specified with optional `start` and `end` parameters.
 
-        :param pdf_bytes: The byte sequence representing the PDF file.
+        :param pdf_bytes: The byte sequence (or memory map) representing the PDF file.
         :param start: An optional integer specifying the starting position of the search range. Defaults to the beginning of `pdf_bytes` if not provided.
         :param end: An optional integer specifying the end position of the search range. Defaults to the end of `pdf_bytes` if not provided.
         :return: The byte index position of the first occurrence of "PDF" within the defined range, or -1 if "PDF" is not found.
@@ -236,7 +240,7 @@ class PDFBytes:
 
     @staticmethod
     def previous_eof_keyword(
-        pdf_bytes: bytes,
+        pdf_bytes: Buffer,
         start: typing.Optional[int] = None,
         end: typing.Optional[int] = None,
     ) -> int:
@@ -248,7 +252,7 @@ class PDFBytes:
         can be used to verify the file's structure or identify the end marker within a PDF
         document. The search range can be restricted using optional `start` and `end` parameters.
 
-        :param pdf_bytes: The byte sequence representing the PDF file.
+        :param pdf_bytes: The byte sequence (or memory map) representing the PDF file.
         :param start: An optional integer specifying the starting position to search backward from. Defaults to the end of `pdf_bytes` if not provided.
         :param end: An optional integer specifying the lower limit of the search range. Defaults to 1024 bytes before the `start` position if not provided.
         :return: The byte index position of the last occurrence of "%%EOF" within the defined range, or -1 if "%%EOF" is not found.
@@ -100,44 +100,59 @@ class PlaintextXRefVisitor(XRefVisitor):
         if self.get_bytes()[node : node + 4] != b"xref":
             return None
 
-        # read the start object nr
-        i: int = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=node)
-        j: int = PDFBytes.next_space(pdf_bytes=self.get_bytes(), start=i + 1)
-        start_object_nr: int = int(self.get_bytes()[i:j].decode())
-
-        # read how many objects the XREF contains
-        i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j + 1)
-        j = PDFBytes.next_newline(pdf_bytes=self.get_bytes(), start=i + 1)
-        number_of_objects: int = int(self.get_bytes()[i:j].decode())
-
-        # process each line of the XREF
+        # process each subsection of the XREF
+        # (an XREF may consist of several subsections, e.g. after an incremental update)
         xref: typing.List[PDFType] = []
-        for object_nr in range(start_object_nr, start_object_nr + number_of_objects):
+        j: int = node + 4
+        while True:
+
+            # IF the next (non-whitespace) bytes are not a number
+            # THEN we have reached the end of the XREF
+            i: int = j
+            while i < len(self.get_bytes()) and self.get_bytes()[i] in b" \t\r\n":
+                i += 1
+            if i >= len(self.get_bytes()) or self.get_bytes()[i] not in b"0123456789":
+                break
 
-            # read first number of each XREF line
-            i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j)
+            # read the start object nr
+            i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=i)
             j = PDFBytes.next_space(pdf_bytes=self.get_bytes(), start=i + 1)
-            byte_offset: int = int(self.get_bytes()[i:j].decode())
+            start_object_nr: int = int(self.get_bytes()[i:j].decode())
 
-            # read second nr
+            # read how many objects the XREF (subsection) contains
             i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j + 1)
-            j = PDFBytes.next_space(pdf_bytes=self.get_bytes(), start=i + 1)
-            generation_number: int = int(self.get_bytes()[i:j].decode())
-
-            # read 'f' or 'n'
-            i = j + 1
             j = PDFBytes.next_newline(pdf_bytes=self.get_bytes(), start=i + 1)
-            f_or_n: str = self.get_bytes()[i : i + 1].decode()
-
-            # add to XREF
-            xref += [
-                reference(
-                    object_nr=object_nr,
-                    generation_nr=generation_number,
-                    byte_offset=byte_offset,
-                    is_in_use=(f_or_n == "n"),
-                )
-            ]
+            number_of_objects: int = int(self.get_bytes()[i:j].decode())
+
+            # process each line of the XREF (subsection)
+            for object_nr in range(
+                start_object_nr, start_object_nr + number_of_objects
+            ):
+
+                # read first number of each XREF line
+                i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j)
+                j = PDFBytes.next_space(pdf_bytes=self.get_bytes(), start=i + 1)
+                byte_offset: int = int(self.get_bytes()[i:j].decode())
+
+                # read second nr
+                i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j + 1)
+                j = PDFBytes.next_space(pdf_bytes=self.get_bytes(), start=i + 1)
+                generation_number: int = int(self.get_bytes()[i:j].decode())
+
+                # read 'f' or 'n'
+                i = j + 1
+                j = PDFBytes.next_newline(pdf_bytes=self.get_bytes(), start=i + 1)
+                f_or_n: str = self.get_bytes()[i : i + 1].decode()
+
+                # add to XREF
+                xref += [
+                    reference(
+                        object_nr=object_nr,
+                        generation_nr=generation_number,
+                        byte_offset=byte_offset,
+                        is_in_use=(f_or_n == "n"),
+                    )
+                ]
 
         # add to (root) xref tables
         self._ReadVisitor__parent._FacadeVisitor__xref += xref  # type: ignore[attr-defined]
@@ -17,6 +17,7 @@ import typing
 
 from borb.pdf.primitives import PDFType
 from borb.pdf.visitor.node_visitor import NodeVisitor
+from borb.pdf.visitor.read.pdf_bytes import Buffer
 
 
 class ReadVisitor(NodeVisitor):
@@ -61,7 +62,7 @@ class ReadVisitor(NodeVisitor):
     # PUBLIC
     #
 
-    def get_bytes(self) -> bytes:
+    def get_bytes(self) -> Buffer:
         """
         Retrieve the raw PDF byte data being processed.
 
@@ -70,7 +71,7 @@ class ReadVisitor(NodeVisitor):
         and can be accessed through this method. It allows subclasses of `ReadVisitor`
         to access the PDF content for further processing or analysis.
 
-        :return: The raw PDF byte data as a `bytes` object.
+        :return: The raw PDF byte data as a `bytes` (or memory-mapped) object.
         """
         # go to FIRST root visitor
         # this is to ensure that when we are working with an object stream
@@ -89,6 +89,9 @@ class RebuiltXREFVisitor(ReadVisitor):
             i += 1
 
         # add to (root) xref tables
+        # the most recent definition of an object (i.e. the last one in the file) comes first,
+        # just as the most recent xref section is read first
+        xref = xref[::-1]
         self._ReadVisitor__parent._FacadeVisitor__xref += xref  # type: ignore[attr-defined]
 
         # return
@@ -71,8 +71,10 @@ class GenericReferenceVisitor(ReadVisitor):
         while root_visitor._ReadVisitor__parent is not None:  # type: ignore[attr-defined]
             root_visitor = root_visitor._ReadVisitor__parent  # type: ignore[attr-defined]
 
-        # loop over its xref(s) in reverse order
-        for xref_table_entry in root_visitor._FacadeVisitor__xref[::-1]:  # type: ignore[attr-defined]
+        # loop over its xref(s)
+        # the most recent xref section is read first (older sections are found through /Prev)
+        # so the first matching entry takes into account any incremental updates
+        for xref_table_entry in root_visitor._FacadeVisitor__xref:  # type: ignore[attr-defined]
             if (
                 xref_table_entry.get_object_nr() == r.get_object_nr()
                 and xref_table_entry.get_generation_nr() == r.get_generation_nr()
@@ -91,6 +93,15 @@ class GenericReferenceVisitor(ReadVisitor):
         # lookup
         return id(r) in root_visitor._FacadeVisitor__references_being_resolved  # type: ignore[attr-defined]
 
+    def _is_lazy(self) -> bool:
+        # go to root visitor
+        root_visitor: ReadVisitor = self
+        while root_visitor._ReadVisitor__parent is not None:  # type: ignore[attr-defined]
+            root_visitor = root_visitor._ReadVisitor__parent  # type: ignore[attr-defined]
+
+        # lookup
+        return root_visitor._FacadeVisitor__lazy  # type: ignore[attr-defined]
+
     def _mark_as_being_resolved(self, r: reference) -> None:
         # go to root visitor
         root_visitor: ReadVisitor = self
@@ -159,6 +170,11 @@ class GenericReferenceVisitor(ReadVisitor):
                 i,
             )
 
+        # IF references are resolved on demand
+        # THEN return the (document bound) reference itself
+        if self._is_lazy():
+            return ref, i
+
         # delegate
         referenced_object_and_blank = self._visit_from_object(node=ref)
         if referenced_object_and_blank is None:
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The `LazyReferenceVisitor` class resolves references in a PDF document on demand.
+
+The `LazyReferenceVisitor` is the lazy counterpart of the `DeferredReferenceVisitor`.
+Rather than resolving every reference in the document right after it has been read,
+it is attached to the `Document` (and to every `Page` it encounters) and resolves
+the references underneath a key only when that key is first accessed.
+
+Resolution never descends into a `Page` object. Instead, each `Page` that is reached
+gets the visitor attached to it, so that its own keys are resolved when they are
+first touched. This keeps the cost of accessing a single page proportional to the
+size of that page, rather than to the size of the file.
+"""
+
+import typing
+
+from borb.pdf.primitives import PDFType, reference
+from borb.pdf.visitor.node_visitor import NodeVisitor
+from borb.pdf.visitor.read.read_visitor import ReadVisitor
+
+
+class LazyReferenceVisitor(ReadVisitor):
+    """
+    The `LazyReferenceVisitor` class resolves references in a PDF document on demand.
+
+    The `LazyReferenceVisitor` is the lazy counterpart of the `DeferredReferenceVisitor`.
+    Rather than resolving every reference in the document right after it has been read,
+    it is attached to the `Document` (and to every `Page` it encounters) and resolves
+    the references underneath a key only when that key is first accessed.
+
+    Resolution never descends into a `Page` object. Instead, each `Page` that is reached
+    gets the visitor attached to it, so that its own keys are resolved when they are
+    first touched. This keeps the cost of accessing a single page proportional to the
+    size of that page, rather than to the size of the file.
+    """
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(self, root: typing.Optional[NodeVisitor] = None) -> None:
+        """
+        Initialize a LazyReferenceVisitor instance.
+
+        The root visitor (`FacadeVisitor`) is kept alive for as long as this visitor
+        is, since it owns the bytes of the PDF and the cross-reference table that are
+        needed to resolve references later on.
+
+        :param root: An optional reference to the root visitor (`FacadeVisitor`)
+                     which will be used to delegate the visiting of PDF nodes.
+        """
+        super().__init__(root=root)
+        from borb.pdf.document import Document
+
+        self.__document: typing.Optional[Document] = None
+        self.__resolved_objects: typing.Dict[int, PDFType] = {}
+
+    #
+    # PRIVATE
+    #
+
+    def __attach_to_page(self, page: "Page") -> None:  # type: ignore[name-defined]
+        from borb.pdf.lazy_dict import LazyDict
+
+        if isinstance(page, LazyDict):
+            return
+        page._Page__document = self.__document  # type: ignore[attr-defined]
+        LazyDict._attach(
+            lazy_keys=set(dict.keys(page)), lazy_reference_visitor=self, node=page
+        )
+
+    def __resolve(self, r: reference) -> typing.Optional[PDFType]:
+        if r.get_referenced_object() is None:
+            self.root_generic_visit(node=r)  # type: ignore[arg-type]
+        return r.get_referenced_object()
+
+    #
+    # PUBLIC
+    #
+
+    def attach_to_document(self, document: "Document") -> None:  # type: ignore[name-defined]
+        """
+        Attach this visitor to a `Document`, deferring the resolution of its /Trailer.
+
+        Once attached, the first access to the /Trailer of the `Document` resolves
+        the (non-page) objects beneath it. Pages are only resolved when they are
+        accessed themselves.
+
+        :param document:    the Document to attach to
+        :return:            None
+        """
+        from borb.pdf.lazy_dict import LazyDict
+
+        self.__document = document
+        LazyDict._attach(
+            lazy_keys={"Trailer"}, lazy_reference_visitor=self, node=document
+        )
+
+    def visit(
+        self, node: typing.Any, stop_at_page: bool = True
+    ) -> typing.Optional[typing.Any]:
+        """
+        Resolve every reference beneath the given node.
+
+        The node itself may be a reference, in which case it is resolved first.
+        When `stop_at_page` is True, `Page` objects are not descended into, but are
+        instead attached to this visitor, so that they can resolve their own keys
+        when these are first accessed.
+
+        :param node:            the node (PDFType) to be processed
+        :param stop_at_page:    whether to stop resolving at (nested) `Page` objects
+        :return:                the node, with all references beneath it resolved
+        """
+        from borb.pdf.document import Document
+        from borb.pdf.font.font import Font
+        from borb.pdf.lazy_dict import LazyDict
+        from borb.pdf.page import Page
+
+        if isinstance(node, reference):
+            node = self.__resolve(node)
+
+        # IF the node is a Document
+        # THEN resolve its /Trailer AND detach from the Document (if we did not stop at pages)
+        if isinstance(node, Document):
+            if not stop_at_page and isinstance(node, LazyDict):
+                node._detach()
+            if "Trailer" in node:
+                dict.__setitem__(
+                    node,
+                    "Trailer",
+                    self.visit(dict.__getitem__(node, "Trailer"), stop_at_page),
+                )
+            return node
+
+        # IF we are not stopping at pages
+        # THEN every object needs to be (re)visited
+        resolved_objects: typing.Dict[int, PDFType] = (
+            self.__resolved_objects if stop_at_page else {}
+        )
+
+        # stack
+        fonts: typing.List[Font] = []
+        stk: typing.List[PDFType] = [node]
+        while len(stk) > 0:
+            m: PDFType = stk.pop()
+
+            # IF the node is a Page (and we should stop there)
+            # THEN attach to it, so it resolves its own keys later on
+            if isinstance(m, Page) and stop_at_page:
+                self.__attach_to_page(m)
+                continue
+
+            # avoid circles
+            if id(m) in resolved_objects:
+                continue
+            resolved_objects[id(m)] = m
+
+            # IF we are descending into a Page
+            # THEN it no longer needs to resolve anything itself
+            if isinstance(m, Page):
+                m._Page__document = self.__document  # type: ignore[attr-defined]
+                if isinstance(m, LazyDict):
+                    m._detach()
+
+            # keep track of Font objects
+            if isinstance(m, Font):
+                fonts += [m]
+
+            # handle dictionaries
+            if isinstance(m, dict):
+                for k, v in dict.items(m):
+                    if isinstance(v, reference):
+                        v = self.__resolve(v)
+                        m[k] = v  # type: ignore[assignment]
+                    if isinstance(v, dict) or isinstance(v, list):
+                        stk += [v]
+
+            # handle lists
+            if isinstance(m, list):
+                for i, v in enumerate(m):
+                    if isinstance(v, reference):
+                        v = self.__resolve(v)
+                        m[i] = v  # type: ignore[assignment]
+                    if isinstance(v, dict) or isinstance(v, list):
+                        stk += [v]
+
+        # convert /ToUnicode to CMap (now that it has been resolved)
+        from borb.pdf.font.cmap import CMap
+        from borb.pdf.visitor.read.dict_visitor import DictVisitor
+
+        for f in fonts:
+            if isinstance(f.get("ToUnicode", None), CMap):
+                continue
+            DictVisitor._DictVisitor__convert_to_unicode_to_cmap_in_font(f)  # type: ignore[attr-defined]
+
+        # return
+        return node
+
+    def visit_key(self, key: typing.Any, node: dict) -> None:
+        """
+        Resolve every reference beneath `node[key]`, and store the result in `node`.
+
+        This method is called by `Document` and `Page` (`LazyDict`) the first time a key is accessed.
+        They keep track of which keys still need to be resolved, so that subsequent
+        accesses do not incur any overhead.
+
+        :param key:     the key being accessed
+        :param node:    the Document or Page being accessed
+        :return:        None
+        """
+        if key not in node:
+            return
+        dict.__setitem__(node, key, self.visit(dict.__getitem__(node, key)))
@@ -79,24 +79,7 @@ class ObjStmReferenceVisitor(GenericReferenceVisitor):
     # PRIVATE
     #
 
-    def __get_references_related_to_parent_object_stream(
-        self, object_nr: int
-    ) -> typing.List[reference]:
-        # go to root visitor
-        root_visitor: ReadVisitor = self
-        while root_visitor._ReadVisitor__parent is not None:  # type: ignore[attr-defined]
-            root_visitor = root_visitor._ReadVisitor__parent  # type: ignore[attr-defined]
-
-        # loop over its xref(s) in reverse order
-        refs = []
-        for xref_table_entry in root_visitor._FacadeVisitor__xref[::-1]:  # type: ignore[attr-defined]
-            if xref_table_entry.get_parent_stream_object_nr() == object_nr:
-                refs += [xref_table_entry]
-
-        # return
-        return refs
-
-    def __root_generic_visit_bytes(self, b: bytes) -> typing.Tuple[PDFType, int]:
+    def __build_obj_stm_root_visitor(self, b: bytes) -> "FacadeVisitor":  # type: ignore[name-defined]
 
         # build a copy of the FacadeVisitor
         from borb.pdf.visitor.read.facade_visitor import FacadeVisitor
@@ -131,11 +114,45 @@ class ObjStmReferenceVisitor(GenericReferenceVisitor):
         # chain it in the hierarchy
         obj_stm_root_visitor._ReadVisitor__parent = self._ReadVisitor__parent  # type: ignore[attr-defined]
 
+        # set its source
+        # the objects in the stream are visited by their offset in these bytes,
+        # so that the (decoded) stream never needs to be copied
+        obj_stm_root_visitor._FacadeVisitor__source = b  # type: ignore[attr-defined]
+
+        # return
+        return obj_stm_root_visitor
+
+    def __get_references_related_to_parent_object_stream(
+        self, object_nr: int
+    ) -> typing.List[reference]:
+        # go to root visitor
+        root_visitor: ReadVisitor = self
+        while root_visitor._ReadVisitor__parent is not None:  # type: ignore[attr-defined]
+            root_visitor = root_visitor._ReadVisitor__parent  # type: ignore[attr-defined]
+
+        # loop over its xref(s) in reverse order
+        refs = []
+        for xref_table_entry in root_visitor._FacadeVisitor__xref[::-1]:  # type: ignore[attr-defined]
+            if xref_table_entry.get_parent_stream_object_nr() == object_nr:
+                refs += [xref_table_entry]
+
+        # return
+        return refs
+
+    def __root_generic_visit_bytes(
+        self, obj_stm_root_visitor: "FacadeVisitor", i: int  # type: ignore[name-defined]
+    ) -> typing.Tuple[PDFType, int]:
+
         # call visit
-        retval_and_blank = obj_stm_root_visitor.visit(b)
+        retval_and_blank = obj_stm_root_visitor.visit(i)
         assert (
             retval_and_blank is not None
-        ), f"Unable to process (parent) object stream '{b[0:32].decode()} ... {b[-32:].decode()}'"
+        ), f"Unable to process (parent) object stream at offset {i}"
+
+        # IF references are resolved on demand
+        # THEN do not look up the references mentioned in the object
+        if self._is_lazy():
+            return retval_and_blank
 
         # find all references mentioned in the object
         objs_to_scan: typing.List[PDFType] = [retval_and_blank[0]]
@@ -227,44 +244,43 @@ class ObjStmReferenceVisitor(GenericReferenceVisitor):
         # read the header
         # fmt: off
         header_offset: int = parent_stream_obj.get("First", 0)
-        object_stm_header: bytes = parent_stream_obj["DecodedBytes"][:header_offset]
-        object_stm_bytes_without_header: bytes = parent_stream_obj["DecodedBytes"][header_offset:]
+        object_stm_bytes: bytes = parent_stream_obj["DecodedBytes"]
+        obj_stm_root_visitor = self.__build_obj_stm_root_visitor(object_stm_bytes)
         # fmt: on
 
         # read the objects in the stream
         objs: typing.List[PDFType] = []
-        while len(object_stm_bytes_without_header) > 0:
+        i: int = header_offset
+        while i < len(object_stm_bytes):
 
             # IF we see a space
             # THEN skip
-            if object_stm_bytes_without_header[0:1] == b" ":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[1:]
+            if object_stm_bytes[i : i + 1] == b" ":
+                i += 1
                 continue
 
             # IF we see a newline (\n\r)
             # THEN skip
-            if object_stm_bytes_without_header[0:2] == b"\n\r":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[2:]
+            if object_stm_bytes[i : i + 2] == b"\n\r":
+                i += 2
                 continue
-            if object_stm_bytes_without_header[0:2] == b"\r\n":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[2:]
+            if object_stm_bytes[i : i + 2] == b"\r\n":
+                i += 2
                 continue
-            if object_stm_bytes_without_header[0:1] == b"\n":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[1:]
+            if object_stm_bytes[i : i + 1] == b"\n":
+                i += 1
                 continue
-            if object_stm_bytes_without_header[0:1] == b"\r":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[1:]
+            if object_stm_bytes[i : i + 1] == b"\r":
+                i += 1
                 continue
 
             referenced_object_and_i = self.__root_generic_visit_bytes(
-                object_stm_bytes_without_header
+                obj_stm_root_visitor, i
             )
             if referenced_object_and_i is None:
                 break
             objs += [referenced_object_and_i[0]]
-            object_stm_bytes_without_header = object_stm_bytes_without_header[
-                referenced_object_and_i[1] :
-            ]
+            i = referenced_object_and_i[1]
 
         # set objects in xref
         for ref_to_update in self.__get_references_related_to_parent_object_stream(
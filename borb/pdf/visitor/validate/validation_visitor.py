@@ -152,20 +152,17 @@ class ValidationVisitor(NodeVisitor):
             pass
         # fmt: on
 
+        # build a lookup table (id -> reference)
+        id_to_reference: typing.Dict[int, reference] = {}
+        if len(all_checks) > 0:
+            for x in node.get("XRef", []):
+                id_to_reference.setdefault(id(x.get_referenced_object()), x)
+
         # perform checks
         for obj in all_objects:
             for check in all_checks:
                 if check.check_whether_object_violates_clause(obj):
-                    obj_ref = next(
-                        iter(
-                            [
-                                x
-                                for x in node.get("XRef", [])
-                                if id(x.get_referenced_object()) == id(obj)
-                            ]
-                        ),
-                        None,
-                    )
+                    obj_ref = id_to_reference.get(id(obj), None)
                     if on_non_conformance_print_warning:
                         ValidationVisitor.__print_warning(c=check, r=obj_ref)
                     if on_non_conformance_throw_assert:
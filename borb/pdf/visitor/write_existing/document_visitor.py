@@ -0,0 +1,443 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A visitor class for appending an incremental update to an existing PDF.
+
+Rather than (re)writing every object in the `Document`, this visitor only writes the
+objects that were modified (or added) since the `Document` was read. These objects are
+followed by a new cross-reference section and a trailer that points back (/Prev) to the
+cross-reference section of the original file, as described in the PDF specification
+(section 7.5.6, "Incremental Updates"). When the original file ends in a cross-reference
+stream, so does the update.
+
+An object is considered modified when it differs from the object that is stored
+(at the same object number) in the original file. Objects that were never loaded
+(e.g. when the `Document` was read lazily) can not have been modified, and are skipped.
+"""
+
+import typing
+
+from borb.pdf.document import Document
+from borb.pdf.primitives import PDFType, hexstr, name, reference, stream
+from borb.pdf.visitor.read.pdf_bytes import Buffer
+from borb.pdf.visitor.write_new.write_new_visitor import WriteNewVisitor
+
+
+class DocumentVisitor(WriteNewVisitor):
+    """
+    A visitor class for appending an incremental update to an existing PDF.
+
+    Rather than (re)writing every object in the `Document`, this visitor only writes the
+    objects that were modified (or added) since the `Document` was read. These objects are
+    followed by a new cross-reference section and a trailer that points back (/Prev) to the
+    cross-reference section of the original file, as described in the PDF specification
+    (section 7.5.6, "Incremental Updates"). When the original file ends in a cross-reference
+    stream, so does the update.
+
+    An object is considered modified when it differs from the object that is stored
+    (at the same object number) in the original file. Objects that were never loaded
+    (e.g. when the `Document` was read lazily) can not have been modified, and are skipped.
+    """
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    @staticmethod
+    def __get_modified_references(
+        document: Document,
+        id_to_reference: typing.Dict[int, reference],
+        source: Buffer,
+    ) -> typing.List[reference]:
+
+        # (re)read objects from the original bytes
+        # using a separate FacadeVisitor that does not resolve references
+        # reading sets the referenced object of (document bound) references,
+        # so this FacadeVisitor gets its own copy of the XRef
+        from borb.pdf.visitor.read.facade_visitor import FacadeVisitor
+        from borb.pdf.visitor.write_existing.object_comparator import ObjectComparator
+
+        xref: typing.List[reference] = document["XRef"]
+        xref_copy: typing.List[reference] = [
+            reference(
+                object_nr=x.get_object_nr(),
+                generation_nr=x.get_generation_nr(),
+                byte_offset=x.get_byte_offset(),
+                index_in_parent_stream=x.get_index_in_parent_stream(),
+                is_in_use=x.is_in_use(),
+                parent_stream_object_nr=x.get_parent_stream_object_nr(),
+            )
+            for x in xref
+        ]
+        read_visitor: FacadeVisitor = FacadeVisitor(lazy=True)
+        read_visitor._FacadeVisitor__source = source  # type: ignore[attr-defined]
+        read_visitor._FacadeVisitor__xref = xref_copy  # type: ignore[attr-defined]
+
+        modified_references: typing.List[reference] = []
+        for xref_entry, original_reference in zip(xref, xref_copy):
+
+            # IF the xref entry is not in use
+            # THEN skip
+            if not xref_entry.is_in_use():
+                continue
+
+            # IF the object was never loaded
+            # THEN it can not have been modified
+            current_object: typing.Optional[PDFType] = (
+                xref_entry.get_referenced_object()
+            )
+            if current_object is None:
+                continue
+
+            # IF the xref entry does not belong to the object (anymore)
+            # THEN skip
+            if id_to_reference.get(id(current_object), None) is not xref_entry:
+                continue
+
+            # IF the object is not in the original bytes (e.g. it was added by an earlier update)
+            # THEN it needs to be written
+            if (
+                original_reference.get_byte_offset() is None
+                and original_reference.get_parent_stream_object_nr() is None
+            ):
+                modified_references += [xref_entry]
+                continue
+
+            # (re)read the original object, and compare
+            # (reading an object from an object stream reads all objects in that stream)
+            # IF the original object can not be (re)read (or decoded)
+            # THEN the object is written (as if it were modified)
+            try:
+                original_object: typing.Optional[PDFType] = (
+                    original_reference.get_referenced_object()
+                )
+                if original_object is None:
+                    original_object_and_blank = read_visitor.visit(original_reference)
+                    if original_object_and_blank is not None:
+                        original_object = original_object_and_blank[0]
+                if original_object is not None and ObjectComparator.is_equal(
+                    current=current_object,
+                    id_to_reference=id_to_reference,
+                    original=original_object,
+                ):
+                    continue
+            except Exception:
+                pass
+            modified_references += [xref_entry]
+
+        # return
+        return modified_references
+
+    @staticmethod
+    def __get_new_references(
+        roots: typing.List[typing.Tuple[PDFType, typing.Optional[PDFType]]],
+        id_to_reference: typing.Dict[int, reference],
+        next_object_nr: int,
+    ) -> typing.List[reference]:
+        from borb.pdf.visitor.write_new.build_xref_visitor import BuildXRefVisitor
+
+        new_references: typing.List[reference] = []
+        ids_done: typing.Set[int] = set()
+        stk: typing.List[typing.Tuple[PDFType, typing.Optional[PDFType]]] = roots
+        while len(stk) > 0:
+            m, p = stk.pop()
+
+            # IF the object is not a dictionary, list or stream
+            # THEN it does not need an object number
+            if not isinstance(m, dict) and not isinstance(m, list):
+                continue
+
+            # IF the object is already in the (original) XRef
+            # THEN it does not need a (new) object number
+            if id(m) in id_to_reference:
+                continue
+
+            # avoid circles
+            if id(m) in ids_done:
+                continue
+            ids_done.add(id(m))
+
+            # IF the object should not be a direct object
+            # THEN assign the next available object number
+            if isinstance(m, stream) or not BuildXRefVisitor._BuildXRefVisitor__is_direct_object(m, p):  # type: ignore[attr-defined]
+                new_reference: reference = reference(
+                    object_nr=next_object_nr,
+                    generation_nr=0,
+                    id=id(m),
+                    referenced_object=m,
+                )
+                id_to_reference[id(m)] = new_reference
+                new_references += [new_reference]
+                next_object_nr += 1
+
+            # recurse
+            if isinstance(m, dict):
+                stk += [(v, m) for v in dict.values(m)]
+            if isinstance(m, list):
+                stk += [(v, m) for v in m]
+
+        # return
+        return new_references
+
+    @staticmethod
+    def __get_number_of_bytes(n: int) -> int:
+        return max(1, (n.bit_length() + 7) // 8)
+
+    def __write_xref_stream(
+        self,
+        trailer: typing.Dict[typing.Union[name, str], PDFType],
+        written_references: typing.List[reference],
+        xref_stream_nr: int,
+    ) -> int:
+
+        # the cross-reference stream (itself) is part of the cross-reference section
+        xref_stream_byte_offset: int = self.tell()
+        byte_offsets: typing.Dict[int, typing.Tuple[int, int]] = {
+            x.get_object_nr(): (x.get_byte_offset() or 0, x.get_generation_nr())
+            for x in written_references
+        }
+        byte_offsets[xref_stream_nr] = (xref_stream_byte_offset, 0)
+
+        # one subsection (/Index) per run of consecutive object numbers
+        object_nrs: typing.List[int] = sorted(byte_offsets.keys())
+        index: typing.List[PDFType] = []
+        for i, object_nr in enumerate(object_nrs):
+            if i > 0 and object_nr == object_nrs[i - 1] + 1:
+                index[-1] += 1  # type: ignore[operator]
+                continue
+            index += [object_nr, 1]
+
+        # build the entries
+        w1: int = DocumentVisitor.__get_number_of_bytes(
+            max([x[0] for x in byte_offsets.values()])
+        )
+        w2: int = DocumentVisitor.__get_number_of_bytes(
+            max([x[1] for x in byte_offsets.values()])
+        )
+        xref_stream_bytes: bytearray = bytearray()
+        for object_nr in object_nrs:
+            xref_stream_bytes += b"\x01"
+            xref_stream_bytes += byte_offsets[object_nr][0].to_bytes(w1, "big")
+            xref_stream_bytes += byte_offsets[object_nr][1].to_bytes(w2, "big")
+
+        # the cross-reference stream also acts as the trailer dictionary
+        xref_stream: stream = stream()
+        for k, v in trailer.items():
+            xref_stream[k] = v
+        xref_stream[name("Type")] = name("XRef")
+        xref_stream[name("Index")] = index
+        xref_stream[name("W")] = [1, w1, w2]
+        xref_stream[name("DecodedBytes")] = bytes(xref_stream_bytes)
+
+        # write the cross-reference stream
+        # (this is not wrapped in ReferencedObjectType, since its byte offset is already in the stream itself)
+        self._append_bytes_or_str(f"{xref_stream_nr} 0 obj\n")
+        self.go_to_root_and_visit(xref_stream)
+        self._append_newline_to_output_stream()
+        self._append_bytes_or_str("endobj\n")
+
+        # return
+        return xref_stream_byte_offset
+
+    def __write_xref_table(
+        self,
+        trailer: typing.Dict[typing.Union[name, str], PDFType],
+        written_references: typing.List[reference],
+    ) -> int:
+
+        # write the xref section (one subsection per run of consecutive object numbers)
+        xref_tell: int = self.tell()
+        self._append_bytes_or_str(b"xref\n")
+        self._append_bytes_or_str(b"0 1\n")
+        self._append_bytes_or_str(b"0000000000 65535 f\r\n")
+        written_references = sorted(written_references, key=lambda x: x.get_object_nr())
+        i: int = 0
+        while i < len(written_references):
+            j: int = i + 1
+            while (
+                j < len(written_references)
+                and written_references[j].get_object_nr()
+                == written_references[j - 1].get_object_nr() + 1
+            ):
+                j += 1
+            self._append_bytes_or_str(
+                f"{written_references[i].get_object_nr()} {j - i}\n"
+            )
+            for xref_entry in written_references[i:j]:
+                self._append_bytes_or_str(
+                    f"{xref_entry.get_byte_offset():010d} {xref_entry.get_generation_nr():05d} n\r\n"
+                )
+            i = j
+
+        # write the trailer
+        self._append_bytes_or_str(b"trailer\n")
+        self.go_to_root_and_visit(trailer)
+        self._append_bytes_or_str(b"\n")
+
+        # return
+        return xref_tell
+
+    #
+    # PUBLIC
+    #
+
+    def visit(self, node: typing.Any) -> bool:
+        """
+        Traverse the PDF document tree using the visitor pattern.
+
+        This method is called when a node does not have a specialized handler.
+        Subclasses can override this method to provide default behavior or logging
+        for unsupported nodes. If any operation is performed on the node (e.g.,
+        writing or persisting), the method returns `True`. Otherwise, it returns
+        `False` to indicate that the visitor did not process the node.
+
+        :param node:    the node (PDFType) to be processed
+        :return:        True if the visitor processed the node False otherwise
+        """
+        # check whether this is a document
+        if not isinstance(node, Document):
+            return False
+        if "XRef" not in node:
+            return False
+        if "Trailer" not in node:
+            return False
+        source: typing.Optional[Buffer] = self._WriteNewVisitor__root._FacadeVisitor__source  # type: ignore[attr-defined]
+        if source is None:
+            return False
+
+        # build a lookup table (id -> reference)
+        id_to_reference: typing.Dict[int, reference] = {}
+        for x in node["XRef"]:
+            if x.get_referenced_object() is not None:
+                id_to_reference.setdefault(id(x.get_referenced_object()), x)
+
+        # determine which objects have been modified
+        modified_references: typing.List[reference] = (
+            DocumentVisitor.__get_modified_references(
+                document=node, id_to_reference=id_to_reference, source=source
+            )
+        )
+
+        # IF any of the modified objects still has keys that need to be resolved
+        # THEN resolve them (these objects will be written) and update the lookup table
+        for xref_entry in modified_references:
+            obj: PDFType = xref_entry.get_referenced_object()  # type: ignore[assignment]
+            if isinstance(obj, dict):
+                obj.items()
+        for x in node["XRef"]:
+            if x.get_referenced_object() is not None:
+                id_to_reference.setdefault(id(x.get_referenced_object()), x)
+
+        # build the (new) trailer
+        trailer: typing.Dict[typing.Union[name, str], PDFType] = {
+            name(k): v
+            for k, v in node["Trailer"].items()
+            if k in ["Encrypt", "ID", "Info", "Root"]
+        }
+
+        # (the /ID is read as a str, but written as a hexadecimal string)
+        if isinstance(trailer.get(name("ID"), None), list):
+            trailer[name("ID")] = [
+                (
+                    hexstr(x)
+                    if isinstance(x, str)
+                    and all([c in "0123456789abcdefABCDEF" for c in x])
+                    else x
+                )
+                for x in trailer[name("ID")]  # type: ignore[union-attr]
+            ]
+
+        # determine which objects have been added
+        # (and assign them an object number)
+        next_object_nr: int = (
+            max(
+                [x.get_object_nr() for x in node["XRef"]]
+                + [node["Trailer"].get("Size", 0) - 1]
+            )
+            + 1
+        )
+        roots: typing.List[typing.Tuple[PDFType, typing.Optional[PDFType]]] = [
+            (v, trailer) for v in trailer.values()
+        ]
+        for xref_entry in modified_references:
+            obj = xref_entry.get_referenced_object()  # type: ignore[assignment]
+            if isinstance(obj, dict):
+                roots += [(v, obj) for v in dict.values(obj)]
+            if isinstance(obj, list):
+                roots += [(v, obj) for v in obj]
+        new_references: typing.List[reference] = DocumentVisitor.__get_new_references(
+            roots=roots,
+            id_to_reference=id_to_reference,
+            next_object_nr=next_object_nr,
+        )
+
+        # the new objects are (from now on) part of the XRef
+        node["XRef"] += new_references
+
+        # write the modified and new objects
+        from borb.pdf.visitor.write_new.document_visitor import ReferencedObjectType
+
+        self._append_newline_to_output_stream()
+        written_references: typing.List[reference] = []
+        for xref_entry in modified_references + new_references:
+
+            # (the original xref entry keeps pointing to the original object)
+            ref: reference = reference(
+                object_nr=xref_entry.get_object_nr(),
+                generation_nr=xref_entry.get_generation_nr(),
+                byte_offset=self.tell(),
+                referenced_object=xref_entry.get_referenced_object(),
+                id=xref_entry.get_id(),
+            )
+            self.go_to_root_and_visit(
+                ReferencedObjectType(reference=ref, object=ref.get_referenced_object())  # type: ignore[call-arg]
+            )
+            written_references += [ref]
+
+        # build the trailer
+        # (which points back to the most recent cross-reference section of the original bytes)
+        trailer[name("Size")] = (
+            max(
+                [x.get_object_nr() for x in node["XRef"]]
+                + [node["Trailer"].get("Size", 0) - 1]
+            )
+            + 1
+        )
+        prev: int = node._Document__source_startxref  # type: ignore[attr-defined]
+        trailer[name("Prev")] = prev
+
+        # IF the original bytes end in a cross-reference stream
+        # THEN write a cross-reference stream (a cross-reference table can not point back to it)
+        # ELSE write a cross-reference table
+        xref_tell: int = -1
+        if source[prev : prev + 4] != b"xref":
+            xref_stream_nr: int = trailer[name("Size")]  # type: ignore[assignment]
+            trailer[name("Size")] = xref_stream_nr + 1
+            xref_tell = self.__write_xref_stream(
+                trailer=trailer,
+                written_references=written_references,
+                xref_stream_nr=xref_stream_nr,
+            )
+        else:
+            xref_tell = self.__write_xref_table(
+                trailer=trailer, written_references=written_references
+            )
+
+        # IF the update is appended to the original bytes
+        # THEN the next update should point back to this cross-reference section
+        if self._WriteNewVisitor__root._FacadeVisitor__append:  # type: ignore[attr-defined]
+            node._Document__source_startxref = xref_tell  # type: ignore[attr-defined]
+
+        # write startxref
+        self._append_bytes_or_str(b"startxref\n")
+        self._append_bytes_or_str(f"{xref_tell}\n")
+
+        # write EOF
+        self._append_bytes_or_str(b"%%EOF\n")
+
+        # return
+        return True
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A facade class bundling the `WriteNewVisitor` objects needed for an incremental update.
+
+The `FacadeVisitor` (for existing documents) writes the bytes of the original PDF
+(unless these are already present in the destination), followed by an incremental
+update containing only the objects that were modified or added since the `Document`
+was read. Objects are serialized by the same visitors that are used to write new
+documents; only the handling of the `Document` itself differs.
+"""
+
+import typing
+
+from borb.pdf.visitor.read.pdf_bytes import Buffer
+from borb.pdf.visitor.write_new.facade_visitor import (
+    FacadeVisitor as WriteNewFacadeVisitor,
+)
+
+
+class FacadeVisitor(WriteNewFacadeVisitor):
+    """
+    A facade class bundling the `WriteNewVisitor` objects needed for an incremental update.
+
+    The `FacadeVisitor` (for existing documents) writes the bytes of the original PDF
+    (unless these are already present in the destination), followed by an incremental
+    update containing only the objects that were modified or added since the `Document`
+    was read. Objects are serialized by the same visitors that are used to write new
+    documents; only the handling of the `Document` itself differs.
+    """
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(
+        self,
+        destination: typing.Optional[typing.BinaryIO] = None,
+        append: bool = False,
+        compression_level: int = 9,
+        compression_threads: typing.Optional[int] = None,
+        source: typing.Optional[Buffer] = None,
+    ):
+        """
+        Initialize the FacadeVisitor object to manage and coordinate the visitors needed for an incremental update.
+
+        When `append` is True, the destination is expected to already contain the bytes
+        of the original PDF (e.g. a file that was opened in append mode). In that case
+        only the incremental update is written. Otherwise, the bytes of the original PDF
+        are written first.
+
+        :param destination:         An optional (binary) file handle to which the PDF is streamed.
+        :param append:              Whether the destination already contains the original PDF.
+        :param compression_level:   The zlib compression level (0-9) used to compress (modified) streams.
+        :param compression_threads: The (maximum) number of threads used to compress streams, None for the number of CPUs.
+        :param source:              The bytes of the original PDF (i.e. the bytes the Document was read from).
+        """
+        super().__init__(destination=destination)
+        # imports
+        # fmt: off
+        from borb.pdf.visitor.write_existing.document_visitor import DocumentVisitor
+        from borb.pdf.visitor.write_new.bool_visitor import BoolVisitor
+        from borb.pdf.visitor.write_new.default_stream_compression_visitor import DefaultStreamCompressionVisitor
+        from borb.pdf.visitor.write_new.dict_visitor import DictVisitor
+        from borb.pdf.visitor.write_new.float_visitor import FloatVisitor
+        from borb.pdf.visitor.write_new.hex_str_visitor import HexStrVisitor
+        from borb.pdf.visitor.write_new.int_visitor import IntVisitor
+        from borb.pdf.visitor.write_new.list_visitor import ListVisitor
+        from borb.pdf.visitor.write_new.referenced_object_visitor import ReferencedObjectVisitor
+        from borb.pdf.visitor.write_new.reference_visitor import ReferenceVisitor
+        from borb.pdf.visitor.write_new.stream_visitor import StreamVisitor
+        from borb.pdf.visitor.write_new.str_visitor import StrVisitor
+        # fmt: on
+
+        # replace the visitors of the (write_new) FacadeVisitor
+        self._FacadeVisitor__visitors = [  # type: ignore[attr-defined]
+            # Usability
+            DefaultStreamCompressionVisitor(
+                root=self,
+                compression_level=compression_level,
+                compression_threads=compression_threads,
+            ),
+            # Types (prio)
+            DocumentVisitor(root=self),
+            ReferencedObjectVisitor(root=self),
+            # Types
+            BoolVisitor(root=self),
+            DictVisitor(root=self),
+            FloatVisitor(root=self),
+            HexStrVisitor(root=self),
+            IntVisitor(root=self),
+            ListVisitor(root=self),
+            ReferenceVisitor(root=self),
+            StreamVisitor(root=self),
+            StrVisitor(root=self),
+        ]
+        self.__append: bool = append  # type: ignore[annotation-unchecked]
+        self.__has_written_source: bool = False  # type: ignore[annotation-unchecked]
+        self.__source: typing.Optional[Buffer] = source  # type: ignore[annotation-unchecked]
+
+    #
+    # PRIVATE
+    #
+
+    #
+    # PUBLIC
+    #
+
+    def visit(self, node: typing.Any) -> bool:
+        """
+        Traverse the PDF document tree using the visitor pattern.
+
+        This method is called when a node does not have a specialized handler.
+        Subclasses can override this method to provide default behavior or logging
+        for unsupported nodes. If any operation is performed on the node (e.g.,
+        writing or persisting), the method returns `True`. Otherwise, it returns
+        `False` to indicate that the visitor did not process the node.
+
+        :param node:    the node (PDFType) to be processed
+        :return:        True if the visitor processed the node False otherwise
+        """
+        from borb.pdf.document import Document
+
+        # IF we are visiting the Document (for the first time)
+        # THEN write (or skip past) the bytes of the original PDF
+        if isinstance(node, Document) and not self.__has_written_source:
+            self.__has_written_source = True
+            assert (
+                self.__source is not None
+            ), "Only a Document that was read can be written incrementally."
+            if self.__append:
+                self._FacadeVisitor__number_of_bytes_written = len(self.__source)  # type: ignore[attr-defined]
+                self._FacadeVisitor__last_byte = self.__source[-1] if len(self.__source) > 0 else None  # type: ignore[attr-defined]
+            else:
+                self._append_bytes(self.__source)  # type: ignore[arg-type]
+
+        # delegate
+        return super().visit(node)
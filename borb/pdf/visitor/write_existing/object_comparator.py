@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A utility class for comparing an object read from an existing PDF with its current counterpart.
+
+When an incremental update is written, only the objects that were modified since the `Document`
+was read need to be written. This class determines whether an object (as it is stored in the
+original bytes) is equal to the object that is currently in the `Document`. References in the
+original object are compared by object number, as the current object may hold the (resolved)
+object itself rather than a reference to it.
+"""
+
+import typing
+
+from borb.pdf.primitives import PDFType, reference, stream
+
+
+class ObjectComparator:
+    """
+    A utility class for comparing an object read from an existing PDF with its current counterpart.
+
+    When an incremental update is written, only the objects that were modified since the `Document`
+    was read need to be written. This class determines whether an object (as it is stored in the
+    original bytes) is equal to the object that is currently in the `Document`. References in the
+    original object are compared by object number, as the current object may hold the (resolved)
+    object itself rather than a reference to it.
+    """
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    #
+    # PUBLIC
+    #
+
+    @staticmethod
+    def is_equal(
+        current: PDFType,
+        id_to_reference: typing.Dict[int, reference],
+        original: PDFType,
+    ) -> bool:
+        """
+        Determine whether an object read from the original bytes equals the current object.
+
+        :param current:         the object, as it currently is in the Document
+        :param id_to_reference: a lookup table (id -> reference) of the objects in the Document
+        :param original:        the object, as it was read from the original bytes
+        :return:                True if the objects are equal, False otherwise
+        """
+        # IF the original object is a reference
+        # THEN the current object should be (or point to) the same reference
+        if isinstance(original, reference):
+            r: typing.Optional[reference] = (
+                current
+                if isinstance(current, reference)
+                else id_to_reference.get(id(current), None)
+            )
+            return (
+                r is not None
+                and r.get_object_nr() == original.get_object_nr()
+                and r.get_generation_nr() == original.get_generation_nr()
+            )
+
+        # IF the current object is (now) a reference
+        # THEN the objects are not equal
+        if isinstance(current, reference):
+            return False
+
+        # IF the types differ
+        # THEN the objects are not equal
+        if type(original) is not type(current):
+            return False
+
+        # streams
+        if isinstance(original, stream):
+            assert isinstance(current, stream)
+            keys_to_ignore: typing.List[str] = ["Bytes", "DecodedBytes", "Length"]
+            if {k for k in dict.keys(original) if k not in keys_to_ignore} != {
+                k for k in dict.keys(current) if k not in keys_to_ignore
+            }:
+                return False
+            if not all(
+                [
+                    ObjectComparator.is_equal(
+                        current=dict.__getitem__(current, k),
+                        id_to_reference=id_to_reference,
+                        original=dict.__getitem__(original, k),
+                    )
+                    for k in dict.keys(original)
+                    if k not in keys_to_ignore
+                ]
+            ):
+                return False
+
+            # IF the current stream has been decoded
+            # THEN compare the decoded bytes (as /Bytes may be re-compressed)
+            if "DecodedBytes" in current:
+                from borb.pdf.visitor.read.compression.decode_stream import (
+                    decode_stream,
+                )
+
+                decode_stream(original)
+                return original["DecodedBytes"] == current["DecodedBytes"]
+            return original["Bytes"] == current["Bytes"]
+
+        # dictionaries
+        # (bypassing the lazy resolution of Page objects, unresolved keys are unmodified)
+        if isinstance(original, dict):
+            assert isinstance(current, dict)
+            if set(dict.keys(original)) != set(dict.keys(current)):
+                return False
+            return all(
+                [
+                    ObjectComparator.is_equal(
+                        current=dict.__getitem__(current, k),
+                        id_to_reference=id_to_reference,
+                        original=dict.__getitem__(original, k),
+                    )
+                    for k in dict.keys(original)
+                ]
+            )
+
+        # lists
+        if isinstance(original, list):
+            assert isinstance(current, list)
+            if len(original) != len(current):
+                return False
+            return all(
+                [
+                    ObjectComparator.is_equal(
+                        current=y, id_to_reference=id_to_reference, original=x
+                    )
+                    for x, y in zip(original, current)
+                ]
+            )
+
+        # default
+        return original == current
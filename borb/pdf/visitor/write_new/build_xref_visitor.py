@@ -52,6 +52,7 @@ class BuildXRefVisitor(WriteNewVisitor):
     def __build_xref(document: Document) -> typing.List[reference]:
 
         id_to_parent_dict: typing.Dict[int, PDFType] = {}
+        ids_in_xref: typing.Set[int] = set()
         xref: typing.List[reference] = []
         stk: typing.List[PDFType] = [document]
         while len(stk) > 0:
@@ -61,13 +62,14 @@ class BuildXRefVisitor(WriteNewVisitor):
 
             # IF the object is already in the XREF
             # THEN skip
-            if any([id(x.get_referenced_object()) == id(m) for x in xref]):
+            if id(m) in ids_in_xref:
                 continue
 
             # handle parent link for dictionaries
+            # (bypassing stream.__getitem__, which would (re)compress /Bytes on demand)
             if isinstance(m, dict):
                 for k in sorted(m.keys()):
-                    v = m[k]
+                    v = dict.__getitem__(m, k)
                     id_to_parent_dict[id(v)] = m
                     stk += [v]
 
@@ -94,13 +96,12 @@ class BuildXRefVisitor(WriteNewVisitor):
 
             # IF the object is not a direct object
             # THEN get the next available reference
+            # (object numbers are handed out sequentially, starting at 1)
             if isinstance(m, list) or isinstance(m, dict):
-                max_obj_nr = max(
-                    [xref_entry.get_object_nr() for xref_entry in xref] + [0]
-                )
+                ids_in_xref.add(id(m))
                 xref += [
                     reference(
-                        object_nr=max_obj_nr + 1,
+                        object_nr=len(xref) + 1,
                         generation_nr=0,
                         id=id(m),
                         referenced_object=m,
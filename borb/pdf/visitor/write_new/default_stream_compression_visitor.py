@@ -4,10 +4,15 @@
 A visitor that compresses the streams within a PDF document using the 'FlateDecode' filter and zlib compression algorithm.
 
 This visitor is designed to compress streams that are decoded but have
-no existing compressed byte data. It only works on streams that contain
+no existing (or no up-to-date) compressed byte data. It only works on streams that contain
 the appropriate 'DecodedBytes' and 'Filter' attributes for the stream objects.
+
+Streams are independent of each other, and zlib releases the GIL while compressing,
+so (larger) streams are compressed concurrently using a thread pool. Each stream is
+compressed exactly once per write; the result is stored in its /Bytes.
 """
 
+import os
 import typing
 
 from borb.pdf import Document
@@ -21,22 +26,39 @@ class DefaultStreamCompressionVisitor(WriteNewVisitor):
     A visitor that compresses the streams within a PDF document using the 'FlateDecode' filter and zlib compression algorithm.
 
     This visitor is designed to compress streams that are decoded but have
-    no existing compressed byte data. It only works on streams that contain
+    no existing (or no up-to-date) compressed byte data. It only works on streams that contain
     the appropriate 'DecodedBytes' and 'Filter' attributes for the stream objects.
+
+    Streams are independent of each other, and zlib releases the GIL while compressing,
+    so (larger) streams are compressed concurrently using a thread pool. Each stream is
+    compressed exactly once per write; the result is stored in its /Bytes.
     """
 
+    __MIN_NUMBER_OF_BYTES_FOR_THREAD_POOL: int = 64 * 1024
+
     #
     # CONSTRUCTOR
     #
 
-    def __init__(self, root: typing.Optional[NodeVisitor] = None) -> None:
+    def __init__(
+        self,
+        root: typing.Optional[NodeVisitor] = None,
+        compression_level: int = 9,
+        compression_threads: typing.Optional[int] = None,
+    ) -> None:
         """
         Initialize the DefaultStreamCompressionVisitor.
 
-        :param root: Optional root visitor to start the traversal of the document.
+        :param root:                Optional root visitor to start the traversal of the document.
+        :param compression_level:   The zlib compression level (0-9) to be used.
+        :param compression_threads: The (maximum) number of threads used to compress streams, None for the number of CPUs.
         """
         super().__init__(root=root)
+        assert 0 <= compression_level <= 9
+        assert compression_threads is None or compression_threads >= 1
         self.__has_been_used: bool = False
+        self.__compression_level: int = compression_level
+        self.__compression_threads: typing.Optional[int] = compression_threads
 
     #
     # PRIVATE
@@ -65,27 +87,72 @@ class DefaultStreamCompressionVisitor(WriteNewVisitor):
 
         import zlib
 
+        # gather the streams that need to be compressed
+        streams_to_compress: typing.List[stream] = []
+        ids_done: typing.Set[int] = set()
         for ref in node.get("XRef", []):
             if not isinstance(ref, reference):
                 continue
             obj = ref.get_referenced_object()
             if not isinstance(obj, stream):
                 continue
+            if id(obj) in ids_done:
+                continue
+            ids_done.add(id(obj))
             if "DecodedBytes" not in obj:
                 continue
+            if "Filter" in obj and obj["Filter"] not in ["FL", "FlateDecode"]:
+                continue
+
+            # IF /Bytes is present (and up to date with /DecodedBytes)
+            # THEN the stream does not need to be compressed
             if (
                 "Bytes" in obj
-                and isinstance(obj.get("Bytes"), bytes)
-                and len(obj.get("Bytes")) != 0  # type: ignore[arg-type]
+                and isinstance(dict.get(obj, "Bytes"), bytes)
+                and len(dict.get(obj, "Bytes")) != 0  # type: ignore[arg-type]
+                and getattr(obj, "_stream__bytes_is_up_to_date", True)
             ):
                 continue
-            if "Filter" in obj and obj["Filter"] not in ["FL", "FlateDecode"]:
-                continue
-
-            # compression
-            obj[name("Bytes")] = zlib.compress(obj["DecodedBytes"], level=9)
+            streams_to_compress += [obj]
+
+        # compression
+        # IF there is enough work to go around
+        # THEN compress (independent) streams concurrently
+        compression_level: int = self.__compression_level
+        decoded_bytes: typing.List[bytes] = [
+            x["DecodedBytes"] for x in streams_to_compress
+        ]
+        compressed_bytes: typing.List[bytes] = []
+        number_of_threads: int = self.__compression_threads or (os.cpu_count() or 1)
+        if (
+            len(decoded_bytes) > 1
+            and number_of_threads > 1
+            and sum([len(x) for x in decoded_bytes])
+            >= DefaultStreamCompressionVisitor.__MIN_NUMBER_OF_BYTES_FOR_THREAD_POOL
+        ):
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(
+                max_workers=number_of_threads
+            ) as thread_pool_executor:
+                compressed_bytes = list(
+                    thread_pool_executor.map(
+                        lambda x: zlib.compress(x, level=compression_level),
+                        decoded_bytes,
+                    )
+                )
+        else:
+            compressed_bytes = [
+                zlib.compress(x, level=compression_level) for x in decoded_bytes
+            ]
+
+        # store the compressed bytes
+        # (both /Bytes and /DecodedBytes are now up to date, so neither needs to be recomputed)
+        for obj, bts in zip(streams_to_compress, compressed_bytes):
+            obj[name("Bytes")] = bts
+            obj._stream__decoded_bytes_is_up_to_date = True  # type: ignore[attr-defined]
             obj[name("Filter")] = name("FlateDecode")
-            obj[name("Length")] = len(obj["Bytes"])
+            obj[name("Length")] = len(bts)
 
         # call root
         self.__has_been_used = True
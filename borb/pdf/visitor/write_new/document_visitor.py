@@ -6,13 +6,17 @@ A visitor class for handling the writing or persistence of document-level struct
 This class is responsible for traversing and processing the top-level components of a PDF
 document, such as metadata, pages, and overall structure. It ensures that all essential
 elements of the document are correctly written and formatted in accordance with PDF standards.
+
+When object streams are enabled, small (non-stream) objects are packed into compressed
+`/ObjStm` object streams, and a `/XRef` cross-reference stream is written instead of
+a plaintext cross-reference table.
 """
 
 import collections
 import typing
 
 from borb.pdf.document import Document
-from borb.pdf.primitives import reference
+from borb.pdf.primitives import name, reference, stream
 from borb.pdf.visitor.write_new.write_new_visitor import WriteNewVisitor
 
 ReferencedObjectType = collections.namedtuple(
@@ -27,8 +31,14 @@ class DocumentVisitor(WriteNewVisitor):
     This class is responsible for traversing and processing the top-level components of a PDF
     document, such as metadata, pages, and overall structure. It ensures that all essential
     elements of the document are correctly written and formatted in accordance with PDF standards.
+
+    When object streams are enabled, small (non-stream) objects are packed into compressed
+    `/ObjStm` object streams, and a `/XRef` cross-reference stream is written instead of
+    a plaintext cross-reference table.
     """
 
+    __MAX_NUMBER_OF_OBJECTS_PER_OBJECT_STREAM: int = 100
+
     #
     # CONSTRUCTOR
     #
@@ -37,6 +47,158 @@ class DocumentVisitor(WriteNewVisitor):
     # PRIVATE
     #
 
+    @staticmethod
+    def __get_number_of_bytes(n: int) -> int:
+        return max(1, (n.bit_length() + 7) // 8)
+
+    def __write_objects_and_xref_stream(self, node: Document) -> None:
+
+        # split the XRef into objects that can be stored in an object stream
+        # and objects that need to be written at the top level (e.g. streams)
+        xref: typing.List[reference] = node["XRef"]
+        compressed_xref_entries: typing.List[reference] = []
+        top_level_xref_entries: typing.List[reference] = []
+        for xref_entry in xref:
+            if (
+                xref_entry.get_object_nr() == 0
+                and xref_entry.get_generation_nr() == 65535
+            ):
+                continue
+            if not xref_entry.is_in_use():
+                continue
+            if xref_entry.get_referenced_object() is None:
+                continue
+            if xref_entry.get_generation_nr() == 0 and not isinstance(
+                xref_entry.get_referenced_object(), stream
+            ):
+                compressed_xref_entries += [xref_entry]
+                continue
+            top_level_xref_entries += [xref_entry]
+
+        # serialize the objects that are to be stored in an object stream
+        # (using a separate FacadeVisitor, that shares the XRef of the Document)
+        from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+
+        compressed_object_visitor: FacadeVisitor = FacadeVisitor()
+        compressed_object_visitor._FacadeVisitor__document = node  # type: ignore[attr-defined]
+        compressed_object_byte_offsets: typing.List[int] = []
+        for xref_entry in compressed_xref_entries:
+            compressed_object_byte_offsets += [compressed_object_visitor.tell()]
+            compressed_object_visitor.visit(xref_entry.get_referenced_object())
+            compressed_object_visitor._append_bytes(b"\n")
+        compressed_object_byte_offsets += [compressed_object_visitor.tell()]
+        compressed_object_bytes: bytes = compressed_object_visitor.bytes()
+
+        # build the object streams
+        next_object_nr: int = max([x.get_object_nr() for x in xref] + [0]) + 1
+        object_streams: typing.List[reference] = []
+        object_stream_nr_and_index: typing.Dict[int, typing.Tuple[int, int]] = {}
+        n: int = DocumentVisitor.__MAX_NUMBER_OF_OBJECTS_PER_OBJECT_STREAM
+        for i in range(0, len(compressed_xref_entries), n):
+            j: int = min(i + n, len(compressed_xref_entries))
+            start: int = compressed_object_byte_offsets[i]
+            header: bytes = b" ".join(
+                [
+                    f"{compressed_xref_entries[k].get_object_nr()} {compressed_object_byte_offsets[k] - start}".encode()
+                    for k in range(i, j)
+                ]
+            )
+            header += b"\n"
+            object_stream: stream = stream()
+            object_stream[name("Type")] = name("ObjStm")
+            object_stream[name("N")] = j - i
+            object_stream[name("First")] = len(header)
+            object_stream[name("DecodedBytes")] = (
+                header
+                + compressed_object_bytes[start : compressed_object_byte_offsets[j]]
+            )
+            for k in range(i, j):
+                object_stream_nr_and_index[
+                    compressed_xref_entries[k].get_object_nr()
+                ] = (next_object_nr, k - i)
+            object_streams += [
+                reference(
+                    object_nr=next_object_nr,
+                    generation_nr=0,
+                    referenced_object=object_stream,
+                )
+            ]
+            next_object_nr += 1
+
+        # write the top-level objects (and object streams)
+        byte_offsets: typing.Dict[int, typing.Tuple[int, int]] = {}
+        for xref_entry in top_level_xref_entries + object_streams:
+            ref: reference = reference(
+                object_nr=xref_entry.get_object_nr(),
+                generation_nr=xref_entry.get_generation_nr(),
+                byte_offset=self.tell(),
+                referenced_object=xref_entry.get_referenced_object(),
+                id=xref_entry.get_id(),
+            )
+            self.go_to_root_and_visit(
+                ReferencedObjectType(reference=ref, object=ref.get_referenced_object())  # type: ignore[call-arg]
+            )
+            byte_offsets[ref.get_object_nr()] = (
+                ref.get_byte_offset() or 0,
+                ref.get_generation_nr(),
+            )
+
+        # build the cross-reference stream
+        xref_stream_nr: int = next_object_nr
+        xref_stream_byte_offset: int = self.tell()
+        byte_offsets[xref_stream_nr] = (xref_stream_byte_offset, 0)
+        size: int = xref_stream_nr + 1
+        w1: int = DocumentVisitor.__get_number_of_bytes(
+            max([x[0] for x in byte_offsets.values()] + [xref_stream_nr])
+        )
+        w2: int = DocumentVisitor.__get_number_of_bytes(
+            max([x[1] for x in byte_offsets.values()] + [n, 65535])
+        )
+        xref_stream_bytes: bytearray = bytearray()
+        for object_nr in range(0, size):
+            if object_nr in byte_offsets:
+                xref_stream_bytes += b"\x01"
+                xref_stream_bytes += byte_offsets[object_nr][0].to_bytes(w1, "big")
+                xref_stream_bytes += byte_offsets[object_nr][1].to_bytes(w2, "big")
+                continue
+            if object_nr in object_stream_nr_and_index:
+                xref_stream_bytes += b"\x02"
+                xref_stream_bytes += object_stream_nr_and_index[object_nr][0].to_bytes(
+                    w1, "big"
+                )
+                xref_stream_bytes += object_stream_nr_and_index[object_nr][1].to_bytes(
+                    w2, "big"
+                )
+                continue
+            xref_stream_bytes += b"\x00"
+            xref_stream_bytes += (0).to_bytes(w1, "big")
+            xref_stream_bytes += (65535 if object_nr == 0 else 0).to_bytes(w2, "big")
+
+        # the cross-reference stream also acts as the trailer dictionary
+        xref_stream: stream = stream()
+        for k, v in node["Trailer"].items():
+            if k in ["Size", "Prev", "XRefStm"]:
+                continue
+            xref_stream[k] = v
+        xref_stream[name("Type")] = name("XRef")
+        xref_stream[name("Size")] = size
+        xref_stream[name("W")] = [1, w1, w2]
+        xref_stream[name("DecodedBytes")] = bytes(xref_stream_bytes)
+
+        # write the cross-reference stream
+        # (this is not wrapped in ReferencedObjectType, since its byte offset is already in the stream itself)
+        self._append_bytes_or_str(f"{xref_stream_nr} 0 obj\n")
+        self.go_to_root_and_visit(xref_stream)
+        self._append_newline_to_output_stream()
+        self._append_bytes_or_str("endobj\n\n")
+
+        # write_new startxref
+        self._append_bytes_or_str(b"startxref\n")
+        self._append_bytes_or_str(f"{xref_stream_byte_offset}\n")
+
+        # write_new EOF
+        self._append_bytes_or_str(b"%%EOF\n")
+
     #
     # PUBLIC
     #
@@ -74,6 +236,12 @@ class DocumentVisitor(WriteNewVisitor):
         self._append_bytes_or_str(b"\n")
         # fmt: on
 
+        # IF object streams are to be used
+        # THEN write objects (in object streams) and a cross-reference stream
+        if self.uses_object_streams():
+            self.__write_objects_and_xref_stream(node)
+            return True
+
         # write_new objects
         xref: typing.List[reference] = node["XRef"]
         for i, xref_entry in enumerate(xref):
@@ -16,6 +16,7 @@ modification of document writing behavior by coordinating multiple visitors.
 import typing
 
 from borb.pdf.primitives import PDFType, reference
+from borb.pdf.visitor.node_visitor import NodeVisitor
 from borb.pdf.visitor.write_new.write_new_visitor import WriteNewVisitor
 
 
@@ -40,7 +41,13 @@ class FacadeVisitor(WriteNewVisitor):
     # CONSTRUCTOR
     #
 
-    def __init__(self):
+    def __init__(
+        self,
+        destination: typing.Optional[typing.BinaryIO] = None,
+        use_object_streams: bool = False,
+        compression_level: int = 9,
+        compression_threads: typing.Optional[int] = None,
+    ):
         """
         Initialize the FacadeVisitor object to manage and coordinate multiple WriteNewVisitor instances.
 
@@ -50,6 +57,14 @@ class FacadeVisitor(WriteNewVisitor):
         initialization process enables the `FacadeVisitor` to serve as the central
         controller for document writing and persistence, ensuring that all sections
         of the PDF are handled by the appropriate visitor.
+
+        When a destination is given, bytes are written to it as soon as they are produced,
+        rather than being kept in memory. In that case `bytes()` returns an empty `bytes` object.
+
+        :param destination:         An optional (binary) file handle to which the PDF is streamed.
+        :param use_object_streams:  Whether (small) objects should be packed into object streams, with a cross-reference stream.
+        :param compression_level:   The zlib compression level (0-9) used to compress streams.
+        :param compression_threads: The (maximum) number of threads used to compress streams, None for the number of CPUs.
         """
         super().__init__()
         from borb.pdf.document import Document
@@ -77,11 +92,10 @@ class FacadeVisitor(WriteNewVisitor):
         from borb.pdf.visitor.write_new.replace_str_by_name_visitor import ReplaceStrByNameVisitor
         from borb.pdf.visitor.write_new.stream_visitor import StreamVisitor
         from borb.pdf.visitor.write_new.str_visitor import StrVisitor
-        from borb.pdf.visitor.write_new.write_new_visitor import WriteNewVisitor
         # fmt: on
 
-        # build typing.List[WriteNewVisitor]
-        self.__visitors: typing.List[WriteNewVisitor] = [  # type: ignore[annotation-unchecked]
+        # build typing.List[NodeVisitor]
+        self.__visitors: typing.List[NodeVisitor] = [  # type: ignore[annotation-unchecked]
             # PDF/A
             InjectMarkInfoVisitor(root=self),
             InjectsRGBOutputIntentVisitor(root=self),
@@ -91,7 +105,11 @@ class FacadeVisitor(WriteNewVisitor):
             BuildXRefVisitor(root=self),
             # Usability
             ReplaceStrByNameVisitor(root=self),
-            DefaultStreamCompressionVisitor(root=self),
+            DefaultStreamCompressionVisitor(
+                root=self,
+                compression_level=compression_level,
+                compression_threads=compression_threads,
+            ),
             # Conformance
             ValidationVisitor(root=self),
             # Types (prio)
@@ -110,16 +128,33 @@ class FacadeVisitor(WriteNewVisitor):
             StrVisitor(root=self),
         ]
 
-        self.__destination: bytes = b""  # type: ignore[annotation-unchecked]
+        self.__id_to_reference: typing.Dict[int, reference] = {}  # type: ignore[annotation-unchecked]
+        self.__xref: typing.Optional[typing.List[reference]] = None  # type: ignore[annotation-unchecked]
+        self.__xref_len: int = 0  # type: ignore[annotation-unchecked]
+        self.__use_object_streams: bool = use_object_streams  # type: ignore[annotation-unchecked]
+        self.__destination: typing.Optional[typing.BinaryIO] = destination  # type: ignore[annotation-unchecked]
+        self.__buffer: bytearray = bytearray()  # type: ignore[annotation-unchecked]
+        self.__last_byte: typing.Optional[int] = None  # type: ignore[annotation-unchecked]
+        self.__number_of_bytes_written: int = 0  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
     #
 
     def _append_bytes(self, b: bytes) -> "FacadeVisitor":
-        self.__destination += b
+        if len(b) == 0:
+            return self
+        if self.__destination is not None:
+            self.__destination.write(b)
+        else:
+            self.__buffer += b
+        self.__last_byte = b[-1]
+        self.__number_of_bytes_written += len(b)
         return self
 
+    def _get_last_byte(self) -> typing.Optional[int]:
+        return self.__last_byte
+
     #
     # PUBLIC
     #
@@ -135,7 +170,7 @@ class FacadeVisitor(WriteNewVisitor):
 
         :return: A `bytes` object containing the written PDF content.
         """
-        return self.__destination
+        return bytes(self.__buffer)
 
     def get_reference(self, node: PDFType) -> PDFType:
         """
@@ -151,13 +186,19 @@ class FacadeVisitor(WriteNewVisitor):
         """
         if self.__document is None:
             return node
-        xref = self.__document.get("XRef", [])
-        matching_reference: typing.Optional[reference] = next(
-            iter([x for x in xref if id(x.get_referenced_object()) == id(node)]), None
-        )
-        if matching_reference is None:
-            return node
-        return matching_reference
+
+        # IF the XRef has changed (since we last built the lookup table)
+        # THEN (re)build the lookup table (id -> reference)
+        xref: typing.List[reference] = self.__document.get("XRef", [])
+        if self.__xref is not xref or self.__xref_len != len(xref):
+            self.__id_to_reference = {}
+            for x in xref:
+                self.__id_to_reference.setdefault(id(x.get_referenced_object()), x)
+            self.__xref = xref
+            self.__xref_len = len(xref)
+
+        # lookup
+        return self.__id_to_reference.get(id(node), node)
 
     def tell(self) -> int:
         """
@@ -170,7 +211,19 @@ class FacadeVisitor(WriteNewVisitor):
 
         :return: The current position in the PDF byte stream as an integer.
         """
-        return len(self.__destination)
+        return self.__number_of_bytes_written
+
+    def uses_object_streams(self) -> bool:
+        """
+        Return whether (small) objects are to be written in (compressed) object streams.
+
+        When object streams are used, objects that are not streams themselves are packed into
+        `/ObjStm` object streams, and a `/XRef` cross-reference stream is written
+        instead of a plaintext cross-reference table.
+
+        :return: True if object streams (and a cross-reference stream) are to be used, False otherwise.
+        """
+        return self.__use_object_streams
 
     def visit(self, node: typing.Any) -> bool:
         """
@@ -98,7 +98,7 @@ class InjectVersionAsCommentVisitor(WriteNewVisitor):
 
         # IF we are in the first 1Kb
         # THEN do nothing
-        N: int = len(self.bytes())
+        N: int = self.tell()
         if N < 1024:
             return False
 
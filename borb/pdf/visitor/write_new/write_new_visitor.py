@@ -99,12 +99,12 @@ class WriteNewVisitor(NodeVisitor):
 
         # IF we have not yet persisted any bytes
         # THEN the space is not needed
-        if len(root.bytes()) == 0:
+        if root.tell() == 0:
             return self
 
         # IF the last character persisted was a newline
         # THEN newline is not needed
-        if root.bytes()[-1] == b"\n"[0]:
+        if root._get_last_byte() == b"\n"[0]:
             return self
 
         root._append_bytes(b"\n")
@@ -126,12 +126,12 @@ class WriteNewVisitor(NodeVisitor):
 
         # IF we have not yet persisted any bytes
         # THEN the space is not needed
-        if len(root.bytes()) == 0:
+        if root.tell() == 0:
             return self
 
         # IF the last character persisted was a newline
         # THEN newline is not needed
-        if root.bytes()[-1] == b" "[0]:
+        if root._get_last_byte() == b" "[0]:
             return self
 
         root._append_bytes(b" ")
@@ -214,3 +214,20 @@ class WriteNewVisitor(NodeVisitor):
         if r is not None and isinstance(r, FacadeVisitor):
             return r.tell()
         return -1
+
+    def uses_object_streams(self) -> bool:
+        """
+        Return whether (small) objects are to be written in (compressed) object streams.
+
+        When object streams are used, objects that are not streams themselves are packed into
+        `/ObjStm` object streams, and a `/XRef` cross-reference stream is written
+        instead of a plaintext cross-reference table.
+
+        :return: True if object streams (and a cross-reference stream) are to be used, False otherwise.
+        """
+        r: typing.Optional[NodeVisitor] = self.__root
+        from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+
+        if r is not None and isinstance(r, FacadeVisitor):
+            return r.uses_object_streams()
+        return False
@@ -0,0 +1,133 @@
+import pathlib
+import typing
+
+from borb.pdf import (
+    Document,
+    Font,
+    Paragraph,
+    TrueTypeFont,
+)
+from borb.pdf.visitor.pdf import PDF
+from tests.test_case import TestCase
+
+
+class TestSubsetFontOnWrite(TestCase):
+
+    FONT_FILE: pathlib.Path = (
+        pathlib.Path(__file__).parent / "BitcountGridDouble-Regular.ttf"
+    )
+
+    def test_subset_font_on_write(self):
+        font: Font = TrueTypeFont.from_file(TestSubsetFontOnWrite.FONT_FILE)
+        d: Document = TestCase.build_document([[Paragraph("Hello World!", font=font)]])
+
+        # write (with and without subsetting)
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir() / "test_subset_font_on_write.pdf",
+        )
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir() / "test_do_not_subset_font_on_write.pdf",
+            subset_fonts=False,
+        )
+        size_with_subset: int = (
+            (TestCase.get_assets_dir() / "test_subset_font_on_write.pdf").stat().st_size
+        )
+        size_without_subset: int = (
+            (TestCase.get_assets_dir() / "test_do_not_subset_font_on_write.pdf")
+            .stat()
+            .st_size
+        )
+        print(f"subset: {size_with_subset}, full: {size_without_subset}")
+        assert size_with_subset < size_without_subset // 2
+
+        # the Font itself is left untouched
+        assert "+" not in font["BaseFont"]
+        assert len(font["DescendantFonts"][0]["W"]) > 2 * len(set("Hello World!"))
+
+        # read
+        d2: typing.Optional[Document] = PDF.read(
+            TestCase.get_assets_dir() / "test_subset_font_on_write.pdf"
+        )
+        assert d2 is not None
+        font2: Font = next(iter(d2.get_page(0)["Resources"]["Font"].values()))
+        assert font2["BaseFont"][6] == "+"
+        assert len(font2["DescendantFonts"][0]["W"]) == 2 * len(set("Hello World!"))
+        for c in "Hello World!":
+            assert font2.get_character(font.get_character_code(c)) == c
+
+    def test_subset_font_on_write_is_repeatable(self):
+        font: Font = TrueTypeFont.from_file(TestSubsetFontOnWrite.FONT_FILE)
+        d: Document = TestCase.build_document([[Paragraph("Hello World!", font=font)]])
+
+        # write (twice)
+        for _ in range(0, 2):
+            TestCase.write(
+                what=d, where_to="test_subset_font_on_write_is_repeatable.pdf"
+            )
+            d2: typing.Optional[Document] = PDF.read(
+                TestCase.get_assets_dir()
+                / "test_subset_font_on_write_is_repeatable.pdf"
+            )
+            assert d2 is not None
+            font2: Font = next(iter(d2.get_page(0)["Resources"]["Font"].values()))
+            assert font2["BaseFont"][6] == "+"
+            assert len(font2["DescendantFonts"][0]["W"]) == 2 * len(set("Hello World!"))
+
+    def test_subset_simple_true_type_font_on_write(self):
+
+        # create a font file that only maps (ASCII) character codes below 256
+        # (so that TrueTypeFont.from_file builds a simple TrueType font, using /Differences)
+        from fontTools import subset  # type: ignore[import-not-found,import-untyped]
+
+        options = subset.Options()
+        options.recalc_timestamp = False
+        ttf_font_file = subset.load_font(TestSubsetFontOnWrite.FONT_FILE, options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=range(32, 127))
+        subsetter.subset(ttf_font_file)
+        font_file: pathlib.Path = (
+            TestCase.get_assets_dir() / "BitcountGridDouble-Regular-ascii.ttf"
+        )
+        subset.save_font(ttf_font_file, font_file, options)
+        font: Font = TrueTypeFont.from_file(font_file)
+        assert font["Subtype"] == "TrueType"
+        d: Document = TestCase.build_document([[Paragraph("Hello World!", font=font)]])
+
+        # write
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_subset_simple_true_type_font_on_write.pdf",
+        )
+
+        # read
+        d2: typing.Optional[Document] = PDF.read(
+            TestCase.get_assets_dir() / "test_subset_simple_true_type_font_on_write.pdf"
+        )
+        assert d2 is not None
+        font2: Font = next(iter(d2.get_page(0)["Resources"]["Font"].values()))
+        assert font2["BaseFont"][6] == "+"
+        assert len(font2["FontDescriptor"]["FontFile2"]["DecodedBytes"]) < len(
+            font_file.read_bytes()
+        )
+
+        # the subset font file holds (only) the (non-empty) glyphs that were used
+        import io
+
+        ttf_font_file2 = subset.load_font(
+            io.BytesIO(font2["FontDescriptor"]["FontFile2"]["DecodedBytes"]), options
+        )
+        used_glyph_names: typing.Set[str] = set(
+            [ttf_font_file.getBestCmap()[ord(c)] for c in "HelloWorld!"]
+        )
+        glyph_names2: typing.Set[str] = set(
+            [
+                k
+                for k in ttf_font_file2.getGlyphOrder()
+                if ttf_font_file2["glyf"][k].numberOfContours != 0
+            ]
+        )
+        assert used_glyph_names.issubset(glyph_names2)
+        assert "A" not in glyph_names2
@@ -0,0 +1,81 @@
+import pathlib
+import time
+
+from borb.pdf import (
+    Document,
+    Font,
+    FontCache,
+    Page,
+    PageLayout,
+    Paragraph,
+    SingleColumnLayout,
+    Standard14Fonts,
+    TrueTypeFont,
+)
+from borb.pdf.primitives import name
+from tests.test_case import TestCase
+
+
+class TestFontCache(TestCase):
+
+    FONT_FILE: pathlib.Path = (
+        pathlib.Path(__file__).parent
+        / "subsetting_tests"
+        / "BitcountGridDouble-Regular.ttf"
+    )
+
+    def test_true_type_font_is_parsed_once(self):
+        FontCache.clear()
+        delta0: float = time.time()
+        f0: Font = TrueTypeFont.from_file(TestFontCache.FONT_FILE)
+        delta0 = time.time() - delta0
+        delta1: float = time.time()
+        f1: Font = TrueTypeFont.from_file(TestFontCache.FONT_FILE)
+        delta1 = time.time() - delta1
+        print(f"parse: {round(delta0, 5)}s, cache: {round(delta1, 5)}s")
+        assert delta1 < delta0
+        assert f0 == f1
+
+    def test_true_type_font_is_not_shared_between_documents(self):
+        f0: Font = TrueTypeFont.from_file(TestFontCache.FONT_FILE)
+        f1: Font = TrueTypeFont.from_file(TestFontCache.FONT_FILE)
+        assert f0 is not f1
+        f0[name("BaseFont")] = name("Something-Else")
+        assert f1["BaseFont"] != f0["BaseFont"]
+
+        # write a Document for each Font
+        for i, f in enumerate([f0, f1]):
+            d: Document = Document()
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph("Hello World!", font=f))
+            TestCase.write(
+                what=d,
+                where_to=f"test_true_type_font_is_not_shared_between_documents_{i}.pdf",
+            )
+
+    def test_standard_14_font_metrics_are_shared(self):
+        f0: Font = Standard14Fonts.get("Helvetica")  # type: ignore[assignment]
+        f1: Font = Standard14Fonts.get("Helvetica")  # type: ignore[assignment]
+        assert f0 is not f1
+        assert (
+            f0._Helvetica__character_name_to_width  # type: ignore[attr-defined]
+            is f1._Helvetica__character_name_to_width  # type: ignore[attr-defined]
+        )
+        assert f0.get_width("Hello World!", font_size=12) == f1.get_width(
+            "Hello World!", font_size=12
+        )
+
+    def test_font_cache_eviction(self):
+        max_size: int = FontCache.get_max_size()
+        try:
+            FontCache.clear()
+            FontCache.set_max_size(1)
+            FontCache.put(font=Standard14Fonts.get("Helvetica"), key="a")  # type: ignore[arg-type]
+            FontCache.put(font=Standard14Fonts.get("Courier"), key="b")  # type: ignore[arg-type]
+            assert FontCache.get("a") is None
+            assert FontCache.get("b") is not None
+        finally:
+            FontCache.set_max_size(max_size)
+            FontCache.clear()
@@ -0,0 +1,58 @@
+import pathlib
+import time
+import typing
+
+from borb.pdf import Font, Standard14Fonts, TrueTypeFont
+from tests.test_case import TestCase
+
+
+class TestGetWidths(TestCase):
+
+    FONT_FILE: pathlib.Path = (
+        pathlib.Path(__file__).parent
+        / "subsetting_tests"
+        / "BitcountGridDouble-Regular.ttf"
+    )
+
+    WORDS: typing.List[str] = (
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor "
+        "incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam"
+    ).split(" ")
+
+    def test_get_widths_standard_14_font(self):
+        f: Font = Standard14Fonts.get("Helvetica")  # type: ignore[assignment]
+        assert f.get_width("") == 0
+        assert f.get_width("Hello World!", font_size=12) == 66
+        assert f.get_widths(TestGetWidths.WORDS, font_size=12) == [
+            f.get_width(x, font_size=12) for x in TestGetWidths.WORDS
+        ]
+        assert f.get_widths(
+            TestGetWidths.WORDS, character_spacing=0.5, word_spacing=2, font_size=12
+        ) == [
+            f.get_width(x, character_spacing=0.5, word_spacing=2, font_size=12)
+            for x in TestGetWidths.WORDS
+        ]
+
+    def test_get_widths_are_shared_by_standard_14_fonts(self):
+        f0: Font = Standard14Fonts.get("Times-Roman")  # type: ignore[assignment]
+        f1: Font = Standard14Fonts.get("Times-Roman")  # type: ignore[assignment]
+        assert f0._get_character_widths() is f1._get_character_widths()
+        f0.get_width("Lorem Ipsum")
+        assert "L" in f1._get_character_widths()
+
+    def test_get_widths_true_type_font(self):
+        f: Font = TrueTypeFont.from_file(TestGetWidths.FONT_FILE)
+        assert f.get_width("") == 0
+        assert f.get_width("Hello World!", font_size=12) == 87
+        assert f.get_widths(TestGetWidths.WORDS, font_size=12) == [
+            f.get_width(x, font_size=12) for x in TestGetWidths.WORDS
+        ]
+
+    def test_get_widths_speed(self):
+        f: Font = TrueTypeFont.from_file(TestGetWidths.FONT_FILE)
+        delta: float = time.time()
+        for _ in range(0, 100):
+            f.get_widths(TestGetWidths.WORDS, font_size=12)
+        delta = time.time() - delta
+        print(f"measured {100 * len(TestGetWidths.WORDS)} words in {round(delta, 5)}s")
+        assert delta < 1
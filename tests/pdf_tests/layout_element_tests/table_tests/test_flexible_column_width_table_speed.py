@@ -0,0 +1,66 @@
+import random
+import time
+import typing
+
+from borb.pdf.layout_element.table.flexible_column_width_table import (
+    FlexibleColumnWidthTable,
+)
+from borb.pdf.layout_element.text.paragraph import Paragraph
+from borb.pdf.lipsum.lipsum import Lipsum
+from tests.test_case import TestCase
+
+
+class TestFlexibleColumnWidthTableSpeed(TestCase):
+
+    @staticmethod
+    def _build_table(
+        number_of_rows: int, number_of_columns: int
+    ) -> FlexibleColumnWidthTable:
+        random.seed(0)
+        words: typing.List[str] = Lipsum.generate_lorem_ipsum(1024).split(" ")
+        t: FlexibleColumnWidthTable = FlexibleColumnWidthTable(
+            number_of_rows=number_of_rows, number_of_columns=number_of_columns
+        )
+        for _ in range(0, number_of_rows * number_of_columns):
+            t.append_layout_element(
+                Paragraph(
+                    " ".join(
+                        [random.choice(words) for _ in range(random.randint(1, 6))]
+                    )
+                )
+            )
+        return t
+
+    def test_flexible_column_width_table_column_widths(self):
+        t: FlexibleColumnWidthTable = TestFlexibleColumnWidthTableSpeed._build_table(
+            number_of_rows=20, number_of_columns=4
+        )
+        w, _ = t.get_size(available_space=(400, 2**64))
+        column_widths: typing.List[int] = t._FixedColumnWidthTable__column_widths  # type: ignore[attr-defined]
+
+        # each column is at least as wide as its widest word, at most as wide as its widest cell
+        for c in range(0, 4):
+            min_max_widths = [e._get_min_and_max_width() for e in t.get_column(c)]
+            assert max([x for x, _ in min_max_widths]) <= column_widths[c]
+            assert column_widths[c] <= max([y for _, y in min_max_widths])
+
+        # the table uses (nearly) all available width
+        assert 400 - 4 < w <= 400
+
+    def test_flexible_column_width_table_speed(self):
+        for number_of_rows in [10, 100]:
+            for number_of_columns in [2, 10]:
+                t: FlexibleColumnWidthTable = (
+                    TestFlexibleColumnWidthTableSpeed._build_table(
+                        number_of_rows=number_of_rows,
+                        number_of_columns=number_of_columns,
+                    )
+                )
+                delta: float = time.time()
+                t.get_size(available_space=(2**16, 2**64))
+                delta = time.time() - delta
+                print(
+                    f"{number_of_rows:4d} x {number_of_columns:2d}: {round(delta, 5)}s, "
+                    f"{round(delta / (number_of_rows * number_of_columns) * 1000, 5)}ms per cell"
+                )
+                assert delta / (number_of_rows * number_of_columns) < 0.005
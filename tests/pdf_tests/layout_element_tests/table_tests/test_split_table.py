@@ -0,0 +1,86 @@
+import re
+import typing
+
+from borb.pdf.document import Document
+from borb.pdf.layout_element.table.fixed_column_width_table import FixedColumnWidthTable
+from borb.pdf.layout_element.table.flexible_column_width_table import (
+    FlexibleColumnWidthTable,
+)
+from borb.pdf.layout_element.table.table import Table
+from borb.pdf.layout_element.text.paragraph import Paragraph
+from borb.pdf.page import Page
+from borb.pdf.page_layout.page_layout import PageLayout
+from borb.pdf.page_layout.single_column_layout import SingleColumnLayout
+from borb.pdf.visitor.pdf import PDF
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestSplitTable(TestCase):
+
+    @staticmethod
+    def _build_table(table: Table, number_of_rows: int) -> Table:
+        table.append_layout_element(Paragraph("Date"))
+        table.append_layout_element(Paragraph("Description"))
+        table.append_layout_element(Paragraph("Amount"))
+        for i in range(0, number_of_rows):
+            table.append_layout_element(Paragraph(f"2025-01-{i % 28 + 1:02d}"))
+            table.append_layout_element(Paragraph(f"Item {i}"))
+            table.append_layout_element(Paragraph(f"{i * 3.5:.2f}"))
+        return table
+
+    def _test_split_table(self, table: Table, where_to: str) -> None:
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        l.append_layout_element(Paragraph("Ledger"))
+        l.append_layout_element(TestSplitTable._build_table(table, 200))
+        l.append_layout_element(Paragraph("Total"))
+        assert d.get_number_of_pages() > 1
+        PDF.write(what=d, where_to=TestCase.get_assets_dir() / where_to)
+
+        # read
+        d2: typing.Optional[Document] = PDF.read(TestCase.get_assets_dir() / where_to)
+        assert d2 is not None
+        text: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(d2)
+        assert text[0].startswith("Ledger")
+        for i in range(1, d.get_number_of_pages()):
+            assert text[i].split("\n")[0].replace(" ", "") == "DateDescriptionAmount"
+        assert text[d.get_number_of_pages() - 1].endswith("Total")
+        assert set(
+            [int(x) for x in re.findall(r"Item (\d+)", "\n".join(text.values()))]
+        ) == set(range(0, 200))
+
+    def test_split_fixed_column_width_table(self):
+        self._test_split_table(
+            FixedColumnWidthTable(
+                number_of_rows=201, number_of_columns=3, number_of_header_rows=1
+            ),
+            "test_split_fixed_column_width_table.pdf",
+        )
+
+    def test_split_flexible_column_width_table(self):
+        self._test_split_table(
+            FlexibleColumnWidthTable(
+                number_of_rows=201, number_of_columns=3, number_of_header_rows=1
+            ),
+            "test_split_flexible_column_width_table.pdf",
+        )
+
+    def test_split_table_does_not_split_row_span(self):
+        t: Table = FixedColumnWidthTable(number_of_rows=100, number_of_columns=2)
+        for i in range(0, 50):
+            t.append_layout_element(Table.TableCell(Paragraph(f"{i}"), row_span=2))
+            t.append_layout_element(Paragraph(f"{i} (a)"))
+            t.append_layout_element(Paragraph(f"{i} (b)"))
+        parts = t._split(
+            available_space=(400, 500), available_space_for_remainder=(400, 700)
+        )
+        assert len(parts) > 1
+        for part in parts:
+            assert part._Table__number_of_rows % 2 == 0
+            assert part.get_size(available_space=(400, 2**64))[1] <= 700
+        assert sum([part._Table__number_of_rows for part in parts]) == 100
@@ -0,0 +1,73 @@
+import gc
+import weakref
+
+from borb.pdf import (
+    Chunk,
+    Document,
+    Lipsum,
+    MeasurementCache,
+    Page,
+    PageLayout,
+    Paragraph,
+    SingleColumnLayout,
+)
+from tests.test_case import TestCase
+
+
+class TestMeasurementCache(TestCase):
+
+    def test_measurement_cache_hit_miss(self):
+        c: Chunk = Chunk("Hello World!")
+        with MeasurementCache() as cache:
+            s0 = c.get_size(available_space=(100, 100))
+            s1 = c.get_size(available_space=(100, 100))
+            assert s0 == s1
+            assert cache.get_number_of_misses() == 1
+            assert cache.get_number_of_hits() == 1
+            assert len(cache) == 1
+
+        # clear
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get_number_of_hits() == 0
+        assert cache.get_number_of_misses() == 0
+
+    def test_measurement_cache_eviction(self):
+        with MeasurementCache(max_size=8) as cache:
+            for _ in range(0, 100):
+                Chunk("Hello World!").get_size(available_space=(100, 100))
+            assert len(cache) == 8
+            assert cache.get_number_of_misses() == 100
+
+    def test_measurement_cache_is_scoped(self):
+        with MeasurementCache() as outer_cache:
+            with MeasurementCache() as inner_cache:
+                assert MeasurementCache.get_active() is inner_cache
+                Chunk("Hello World!").get_size(available_space=(100, 100))
+            assert MeasurementCache.get_active() is outer_cache
+            assert len(outer_cache) == 0
+            assert len(inner_cache) == 1
+        assert MeasurementCache.get_active() is None
+
+    def test_measurement_cache_default_does_not_keep_layout_element_alive(self):
+        c: Chunk = Chunk("Hello World!")
+        c.get_size(available_space=(100, 100))
+        c.get_size(available_space=(100, 100))
+        assert len(MeasurementCache.get_default(c)) == 1
+        assert MeasurementCache.get_default(c).get_number_of_hits() == 1
+
+        # the default MeasurementCache does not keep the Chunk alive
+        r: weakref.ref = weakref.ref(c)
+        del c
+        gc.collect()
+        assert r() is None
+
+    def test_measurement_cache_per_document(self):
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        for _ in range(0, 5):
+            l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(512)))
+        assert len(d.get_measurement_cache()) > 0
+        assert d.get_measurement_cache().get_number_of_hits() > 0
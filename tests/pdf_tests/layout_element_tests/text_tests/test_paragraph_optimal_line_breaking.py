@@ -0,0 +1,109 @@
+import typing
+
+from borb.pdf.document import Document
+from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.text.chunk import Chunk
+from borb.pdf.layout_element.text.paragraph import Paragraph
+from borb.pdf.page import Page
+from borb.pdf.page_layout.page_layout import PageLayout
+from borb.pdf.page_layout.single_column_layout import SingleColumnLayout
+from tests.test_case import TestCase
+
+
+class TestParagraphOptimalLineBreaking(TestCase):
+
+    TEXT: str = (
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, "
+        "sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. "
+        "Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. "
+        "Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. "
+        "Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum."
+    )
+
+    @staticmethod
+    def _hyphenate(word: str) -> typing.List[str]:
+        return [word[i : i + 3] for i in range(0, len(word), 3)]
+
+    @staticmethod
+    def _get_lines(
+        p: Paragraph, available_width: int
+    ) -> typing.List[typing.List[Chunk]]:
+        return p._HeterogeneousParagraph__get_lines(  # type: ignore[attr-defined]
+            available_space=(available_width, 2**64)
+        )
+
+    @staticmethod
+    def _get_line_widths(lines: typing.List[typing.List[Chunk]]) -> typing.List[int]:
+        return [
+            sum([c.get_size(available_space=(2**64, 2**64))[0] for c in line])
+            for line in lines
+        ]
+
+    def test_optimal_line_breaking_is_at_least_as_good_as_greedy(self):
+        p0: Paragraph = Paragraph(TestParagraphOptimalLineBreaking.TEXT)
+        p1: Paragraph = Paragraph(
+            TestParagraphOptimalLineBreaking.TEXT, optimal_line_breaking=True
+        )
+        for available_width in range(150, 450, 10):
+            lines0 = TestParagraphOptimalLineBreaking._get_lines(p0, available_width)
+            lines1 = TestParagraphOptimalLineBreaking._get_lines(p1, available_width)
+
+            # the same text
+            assert "".join([c.get_text() for l in lines0 for c in l]).replace(
+                " ", ""
+            ) == "".join([c.get_text() for l in lines1 for c in l]).replace(" ", "")
+
+            # every line fits
+            widths0 = TestParagraphOptimalLineBreaking._get_line_widths(lines0)
+            widths1 = TestParagraphOptimalLineBreaking._get_line_widths(lines1)
+            assert max(widths1) <= available_width
+
+            # less (squared) unused space on every line but the last
+            assert sum([(available_width - w) ** 2 for w in widths1[:-1]]) <= sum(
+                [(available_width - w) ** 2 for w in widths0[:-1]]
+            )
+
+    def test_optimal_line_breaking_with_hyphenation(self):
+        p: Paragraph = Paragraph(
+            TestParagraphOptimalLineBreaking.TEXT,
+            optimal_line_breaking=True,
+            hyphenation=TestParagraphOptimalLineBreaking._hyphenate,
+        )
+        lines = TestParagraphOptimalLineBreaking._get_lines(p, 200)
+        assert max(TestParagraphOptimalLineBreaking._get_line_widths(lines)) <= 200
+        assert any([l[-1].get_text().endswith("-") for l in lines])
+        assert "".join(
+            [
+                (
+                    c.get_text()[:-1]
+                    if i == len(l) - 1 and c.get_text().endswith("-")
+                    else c.get_text()
+                )
+                for l in lines
+                for i, c in enumerate(l)
+            ]
+        ).replace(" ", "") == TestParagraphOptimalLineBreaking.TEXT.replace(" ", "")
+
+    def test_optimal_line_breaking_measures_each_word_once(self):
+        p: Paragraph = Paragraph(
+            TestParagraphOptimalLineBreaking.TEXT, optimal_line_breaking=True
+        )
+        TestParagraphOptimalLineBreaking._get_lines(p, 200)
+        widths: typing.List[int] = p._HeterogeneousParagraph__line_breaker._LineBreaker__chunk_widths  # type: ignore[attr-defined]
+        TestParagraphOptimalLineBreaking._get_lines(p, 300)
+        assert p._HeterogeneousParagraph__line_breaker._LineBreaker__chunk_widths is widths  # type: ignore[attr-defined]
+
+    def test_optimal_line_breaking_justified(self):
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        l.append_layout_element(
+            Paragraph(
+                TestParagraphOptimalLineBreaking.TEXT,
+                hyphenation=TestParagraphOptimalLineBreaking._hyphenate,
+                optimal_line_breaking=True,
+                text_alignment=LayoutElement.TextAlignment.JUSTIFIED,
+            )
+        )
+        TestCase.write(what=d, where_to="test_optimal_line_breaking_justified.pdf")
@@ -0,0 +1,87 @@
+import typing
+
+from borb.pdf.document import Document
+from borb.pdf.layout_element.layout_element import LayoutElement
+from borb.pdf.layout_element.text.paragraph import Paragraph
+from borb.pdf.lipsum.lipsum import Lipsum
+from borb.pdf.page import Page
+from borb.pdf.page_layout.multi_column_layout import MultiColumnLayout
+from borb.pdf.page_layout.page_layout import PageLayout
+from borb.pdf.page_layout.single_column_layout import SingleColumnLayout
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+from borb.pdf.visitor.pdf import PDF
+from tests.test_case import TestCase
+
+
+class TestSplitParagraph(TestCase):
+
+    def test_split_paragraph_across_pages(self):
+        s: str = Lipsum.generate_lorem_ipsum(8192)
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        l.append_layout_element(Paragraph("Lorem Ipsum"))
+        l.append_layout_element(
+            Paragraph(s, text_alignment=LayoutElement.TextAlignment.JUSTIFIED)
+        )
+        assert d.get_number_of_pages() > 1
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_split_paragraph_across_pages.pdf",
+        )
+
+        # read
+        text: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(
+            PDF.read(
+                TestCase.get_assets_dir() / "test_split_paragraph_across_pages.pdf"
+            )
+        )
+        assert text[0].startswith("Lorem Ipsum")
+        assert "".join([text[i] for i in range(0, d.get_number_of_pages())]).replace(
+            " ", ""
+        ).replace("\n", "") == ("Lorem Ipsum" + s).replace(" ", "")
+
+    def test_split_paragraph_across_columns(self):
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = MultiColumnLayout(p)
+        for _ in range(0, 4):
+            l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(2048)))
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_split_paragraph_across_columns.pdf",
+        )
+
+    def test_split_paragraph_widow_and_orphan_control(self):
+        paragraph: Paragraph = Paragraph(Lipsum.generate_lorem_ipsum(2048))
+        _, h = paragraph.get_size(available_space=(200, 2**64))
+        line_height: int = h // len(
+            paragraph._HeterogeneousParagraph__get_lines(  # type: ignore[attr-defined]
+                available_space=(200, 2**64)
+            )
+        )
+
+        # not enough space for 2 lines at the bottom of the column
+        assert paragraph._split(
+            available_space=(200, int(line_height * 1.5)),
+            available_space_for_remainder=(200, 2**16),
+        ) == [paragraph]
+
+        # the parts never start or end with a single line
+        for i in range(2, 20):
+            parts: typing.List[LayoutElement] = paragraph._split(
+                available_space=(200, line_height * i),
+                available_space_for_remainder=(200, line_height * 20),
+            )
+            assert len(parts) > 1
+            for part in parts:
+                assert len(part._HeterogeneousParagraph__lines) >= 2  # type: ignore[attr-defined]
+                assert part.get_size(available_space=(200, 2**64))[1] <= max(
+                    line_height * 20, line_height * i
+                )
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+import time
+import typing
+
+from tests.test_case import TestCase
+
+
+class TestLazyImports(TestCase):
+
+    @staticmethod
+    def _get_loaded_modules(statement: str) -> typing.List[str]:
+        # run in a fresh interpreter, so that no module has been imported yet
+        return subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                f"import sys; {statement}; print('\\n'.join(sys.modules.keys()))",
+            ],
+            text=True,
+        ).split("\n")
+
+    def test_import_does_not_load_large_modules(self):
+        large_modules: typing.List[str] = [
+            "borb.pdf.color.pantone_color",
+            "borb.pdf.font.adobe_glyph_list",
+            "borb.pdf.layout_element.image.emoji_a_k",
+            "borb.pdf.layout_element.image.emoji_l_z",
+            "borb.pdf.layout_element.shape.line_art",
+        ]
+        for statement in [
+            "import borb.pdf",
+            "from borb.pdf import Document, Page, PDF, SingleColumnLayout, Paragraph",
+        ]:
+            loaded_modules: typing.List[str] = TestLazyImports._get_loaded_modules(
+                statement
+            )
+            for m in large_modules:
+                assert m not in loaded_modules, f"{statement} loads {m}"
+
+    def test_all_names_can_be_resolved(self):
+        import borb.pdf
+
+        for x in borb.pdf.__all__:
+            assert getattr(borb.pdf, x) is not None
+            assert x in dir(borb.pdf)
+        with self.assertRaises(AttributeError):
+            borb.pdf.DoesNotExist  # type: ignore[attr-defined]
+
+    def test_import_speed(self):
+        deltas: typing.Dict[str, float] = {}
+        for statement in [
+            "import borb.pdf",
+            "from borb.pdf import Document, Page, PDF, SingleColumnLayout, Paragraph",
+            "from borb.pdf import Emoji",
+        ]:
+            delta: float = time.time()
+            subprocess.check_call([sys.executable, "-c", statement])
+            delta = time.time() - delta
+            print(f"{statement}: {round(delta, 5)}s")
+            deltas[statement] = delta
+        assert deltas["import borb.pdf"] < 1
+
+    def test_submodules_can_be_resolved(self):
+        # run in a fresh interpreter, so that no submodule has been imported yet
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-c",
+                "import borb.pdf; "
+                "assert borb.pdf.toolkit.pipeline.Pipeline is borb.pdf.Pipeline; "
+                "assert borb.pdf.page.Page is borb.pdf.Page; "
+                "assert 'visitor' in dir(borb.pdf)",
+            ]
+        )
@@ -0,0 +1,115 @@
+import timeit
+
+from borb.pdf import Document, Page
+from borb.pdf.primitives import name
+from tests.test_case import TestCase
+
+
+class TestPageIndex(TestCase):
+
+    def test_append_insert_pop_page(self):
+        d: Document = Document()
+        pages: list = [Page() for _ in range(0, 10)]
+        for p in pages:
+            d.append_page(p)
+        assert all([d.get_page(i) is pages[i] for i in range(0, 10)])
+
+        # insert
+        p: Page = Page()
+        d.insert_page(p, 5)
+        pages.insert(5, p)
+        assert d.get_number_of_pages() == 11
+        assert all([d.get_page(i) is pages[i] for i in range(0, 11)])
+
+        # pop
+        d.pop_page(0)
+        pages.pop(0)
+        assert d.get_number_of_pages() == 10
+        assert all([d.get_page(i) is pages[i] for i in range(0, 10)])
+
+        # append
+        p = Page()
+        d.append_page(p)
+        pages.append(p)
+        assert all([d.get_page(i) is pages[i] for i in range(0, 11)])
+
+    def test_nested_page_tree(self):
+        d: Document = Document()
+        d.append_page(Page())
+
+        # build a nested page-tree
+        pages_root: dict = d["Trailer"]["Root"]["Pages"]
+        pages: list = [Page() for _ in range(0, 4)]
+        kids_001: dict = {
+            name("Type"): name("Pages"),
+            name("Kids"): pages[0:2],
+            name("Count"): 2,
+        }
+        kids_002: dict = {
+            name("Type"): name("Pages"),
+            name("Kids"): pages[2:4],
+            name("Count"): 2,
+        }
+        pages_root[name("Kids")] = [kids_001, kids_002]
+        pages_root[name("Count")] = 4
+        assert all([d.get_page(i) is pages[i] for i in range(0, 4)])
+
+        # insert (in the second subtree)
+        p: Page = Page()
+        d.insert_page(p, 3)
+        assert d.get_page(3) is p
+        assert d.get_page(4) is pages[3]
+        assert kids_002["Count"] == 3
+        assert pages_root["Count"] == 5
+
+        # pop (from the first subtree)
+        d.pop_page(0)
+        assert d.get_page(0) is pages[1]
+        assert kids_001["Count"] == 1
+        assert pages_root["Count"] == 4
+
+    def test_get_page_does_not_grow_with_number_of_pages(self):
+
+        # build a small and a large Document
+        d0: Document = Document()
+        for _ in range(0, 256):
+            d0.append_page(Page())
+        d1: Document = Document()
+        for _ in range(0, 16384):
+            d1.append_page(Page())
+
+        # time get_page (on an up to date index)
+        # the large Document has 64 times as many pages,
+        # a get_page that checks every page would be (about) 64 times as slow
+        t0: float = min(timeit.repeat(lambda: d0.get_page(128), number=1000, repeat=5))
+        t1: float = min(timeit.repeat(lambda: d1.get_page(8192), number=1000, repeat=5))
+        assert t1 < t0 * 8
+
+    def test_kids_modified_directly(self):
+        d: Document = Document()
+        pages: list = [Page() for _ in range(0, 4)]
+        for p in pages:
+            d.append_page(p)
+        assert d.get_page(3) is pages[3]
+
+        # replace a kid (without changing /Count)
+        p: Page = Page()
+        p[name("Rotate")] = 90
+        d["Trailer"]["Root"]["Pages"]["Kids"][1] = p
+        assert d.get_page(1) is p
+
+        # reorder the kids (without changing /Count)
+        d["Trailer"]["Root"]["Pages"]["Kids"].reverse()
+        assert d.get_page(0) is pages[3]
+        assert d.get_page(2) is p
+
+        # replace the kids of a nested page-tree node
+        kids_001: dict = {
+            name("Type"): name("Pages"),
+            name("Kids"): [pages[0]],
+            name("Count"): 1,
+        }
+        d["Trailer"]["Root"]["Pages"]["Kids"][3] = kids_001
+        assert d.get_page(3) is pages[0]
+        kids_001["Kids"][0] = pages[1]
+        assert d.get_page(3) is pages[1]
@@ -1,4 +1,6 @@
 import random
+import re
+import typing
 
 from borb.pdf import (
     Document,
@@ -10,6 +12,10 @@ from borb.pdf import (
     TableOfContents,
     Heading,
 )
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+from borb.pdf.visitor.pdf import PDF
 from tests.test_case import TestCase
 
 
@@ -54,3 +60,43 @@ class TestTableOfContents(TestCase):
                     )
 
         TestCase.write(what=d, where_to="test_table_of_contents_002.pdf")
+
+    def test_table_of_contents_003(self):
+        d: Document = Document()
+        d.append_page(TableOfContents())
+
+        p: Page = Page()
+        d.append_page(p)
+
+        l: PageLayout = SingleColumnLayout(p)
+        for i in range(0, 60):
+            l.append_layout_element(Heading(f"Heading {i+1}"))
+            l.append_layout_element(
+                Paragraph(Lipsum.generate_lorem_ipsum(1024), font_size=12)
+            )
+
+        # the TableOfContents takes up (and was inserted as) more than one Page
+        assert isinstance(d.get_page(0), TableOfContents)
+        assert isinstance(d.get_page(1), TableOfContents)
+        TestCase.write(what=d, where_to="test_table_of_contents_003.pdf")
+
+        # read
+        text: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(
+            PDF.read(TestCase.get_assets_dir() / "test_table_of_contents_003.pdf")
+        )
+        number_of_toc_pages: int = len(
+            [
+                i
+                for i in range(0, d.get_number_of_pages())
+                if isinstance(d.get_page(i), TableOfContents)
+            ]
+        )
+
+        # each entry refers to the Page the Heading is on
+        toc: str = "\n".join([text[i] for i in range(0, number_of_toc_pages)])
+        entries = re.findall(r"(Heading \d+)\s*(\d+)\s*$", toc, re.MULTILINE)
+        assert len(entries) == 60
+        for heading, page_nr in entries:
+            assert (
+                re.search(f"^{heading}$", text[int(page_nr)], re.MULTILINE) is not None
+            )
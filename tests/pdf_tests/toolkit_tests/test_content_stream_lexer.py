@@ -0,0 +1,25 @@
+from borb.pdf.toolkit.source.operator.content_stream_lexer import ContentStreamLexer
+from tests.test_case import TestCase
+
+
+class TestContentStreamLexer(TestCase):
+
+    def test_content_stream_lexer(self):
+        content_stream_bytes: bytes = (
+            b"q 1 0 0 1 10.5 -3 cm\n"
+            b"BT /F1 12 Tf (Hello\\) World) Tj [(W) 120 (orld)] TJ ET\n"
+            b"% comment Tj\n"
+            b"Q"
+        )
+        tokens = [x for x in ContentStreamLexer(content_stream_bytes)]
+        assert [x[1] for x in tokens] == ["q", "cm", "BT", "Tf", "Tj", "TJ", "ET", "Q"]
+        assert tokens[1][0] == [1, 0, 0, 1, 10.5, -3]
+        assert tokens[3][0] == ["F1", 12]
+        assert tokens[4][0] == ["Hello) World"]
+        assert tokens[5][0] == [["W", 120, "orld"]]
+
+    def test_content_stream_lexer_skips_inline_image_data(self):
+        content_stream_bytes: bytes = b"BI /W 1 /H 1 /BPC 8 /CS /G ID \x28\x5b\x2f EI Q"
+        tokens = [x for x in ContentStreamLexer(content_stream_bytes)]
+        assert [x[1] for x in tokens] == ["BI", "ID", "EI", "Q"]
+        assert tokens[1][0] == ["W", 1, "H", 1, "BPC", 8, "CS", "G"]
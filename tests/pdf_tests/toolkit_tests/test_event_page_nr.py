@@ -0,0 +1,81 @@
+import typing
+
+from borb.pdf import Document, Paragraph
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestEventPageNr(TestCase):
+
+    class GetPageNrs(Sink):
+
+        def __init__(self):
+            super().__init__()
+            self.__page_nrs: typing.List[typing.Tuple[str, int]] = []
+
+        def get_output(self) -> typing.Any:
+            return self.__page_nrs
+
+        def process(self, event: Event) -> None:
+            self.__page_nrs += [(event.__class__.__name__, event.get_page_nr())]
+
+    def test_events_carry_page_nr(self):
+        d: Document = TestCase.build_document(
+            [[Paragraph(f"Page {i}")] for i in range(0, 3)],
+            where_to="test_events_carry_page_nr.pdf",
+        )
+        page_nrs: typing.List[typing.Tuple[str, int]] = Pipeline(
+            [Source(), TestEventPageNr.GetPageNrs()]
+        ).process(d)
+        assert [x for x in page_nrs if x[0] == "EndPageEvent"] == [
+            ("EndPageEvent", 0),
+            ("EndPageEvent", 1),
+            ("EndPageEvent", 2),
+        ]
+        assert set([x[1] for x in page_nrs if x[0] == "TextEvent"]) == {0, 1, 2}
+
+        # the text ends up on the right page
+        text: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(d)
+        assert text == {0: "Page 0", 1: "Page 1", 2: "Page 2"}
+
+    def test_events_carry_page_nr_when_processing_a_page(self):
+        d: Document = TestCase.build_document(
+            [[Paragraph(f"Page {i}")] for i in range(0, 3)],
+            where_to="test_events_carry_page_nr_when_processing_a_page.pdf",
+        )
+        page_nrs: typing.List[typing.Tuple[str, int]] = Pipeline(
+            [Source(), TestEventPageNr.GetPageNrs()]
+        ).process(d.get_page(1))
+        assert len(page_nrs) > 1
+        assert all([x[1] == 1 for x in page_nrs])
+
+    def test_event_looks_up_page_nr_if_not_known(self):
+        d: Document = TestCase.build_document(
+            [[Paragraph(f"Page {i}")] for i in range(0, 2)]
+        )
+        e: EndPageEvent = EndPageEvent(page=d.get_page(1))
+        assert e.get_page_nr() == 1
+        assert EndPageEvent(page=d.get_page(0), page_nr=0).get_page_nr() == 0
+
+    def test_events_are_slotted(self):
+        d: Document = TestCase.build_document([[Paragraph("Page 0")]])
+        e: TextEvent = TextEvent(
+            s="Hello World!",
+            x=0,
+            y=0,
+            width=100,
+            height=12,
+            font=None,  # type: ignore[arg-type]
+            font_color=None,  # type: ignore[arg-type]
+            font_size=12,
+            page=d.get_page(0),
+            page_nr=0,
+        )
+        assert not hasattr(e, "__dict__")
+        assert e.get_page_nr() == 0
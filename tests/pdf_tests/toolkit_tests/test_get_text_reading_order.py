@@ -0,0 +1,83 @@
+import typing
+
+from borb.pdf import Document, Paragraph
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.pipe import Pipe
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_regular_expression import GetRegularExpression
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.regex import Regex
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestGetTextReadingOrder(TestCase):
+
+    class OnlyTextEvents(Pipe):
+
+        def process(self, event: Event) -> None:
+            next: typing.Optional[Pipe] = self.get_next()
+            if next is not None and isinstance(event, TextEvent):
+                next.process(event)
+
+    def test_get_text_default_reading_order(self):
+        d: Document = TestCase.build_document(
+            [[Paragraph("Hello"), Paragraph("World")]],
+            where_to="test_get_text_reading_order.pdf",
+        )
+        text: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(d)
+        assert text == {0: "Hello\nWorld"}
+
+    def test_get_text_custom_reading_order(self):
+        d: Document = TestCase.build_document(
+            [[Paragraph("Hello"), Paragraph("World")]],
+            where_to="test_get_text_reading_order.pdf",
+        )
+        text: typing.Dict[int, str] = Pipeline(
+            [Source(), GetText(reading_order=lambda e: (e.get_y(), e.get_x()))]
+        ).process(d)
+        assert text == {0: "World\nHello"}
+
+    def test_regex_custom_reading_order(self):
+        d: Document = TestCase.build_document(
+            [[Paragraph("Hello"), Paragraph("World")]],
+            where_to="test_get_text_reading_order.pdf",
+        )
+        matches = Pipeline(
+            [
+                Source(),
+                Regex(
+                    pattern="World\nHello",
+                    reading_order=lambda e: (e.get_y(), e.get_x()),
+                ),
+            ]
+        ).process(d)
+        assert len(matches[0]) == 1
+        assert len(matches[0][0].rectangles) == 2
+
+    def test_get_regular_expression_custom_reading_order(self):
+        d: Document = TestCase.build_document(
+            [[Paragraph("Hello"), Paragraph("World")]],
+            where_to="test_get_text_reading_order.pdf",
+        )
+        matches = Pipeline(
+            [
+                Source(),
+                GetRegularExpression(
+                    pattern="World\nHello",
+                    reading_order=lambda e: (e.get_y(), e.get_x()),
+                ),
+            ]
+        ).process(d)
+        assert len(matches[0]) == 1
+
+    def test_get_text_without_end_page_event(self):
+        d: Document = TestCase.build_document(
+            [[Paragraph("Hello"), Paragraph("World")]],
+            where_to="test_get_text_reading_order.pdf",
+        )
+        text: typing.Dict[int, str] = Pipeline(
+            [Source(), TestGetTextReadingOrder.OnlyTextEvents(), GetText()]
+        ).process(d)
+        assert text == {0: "Hello\nWorld"}
@@ -0,0 +1,79 @@
+import typing
+
+from borb.pdf import (
+    Document,
+    Lipsum,
+    Paragraph,
+    X11Color,
+)
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_colors import GetColors
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.regex import Regex
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestPipelineIterPages(TestCase):
+
+    def test_iter_pages_produces_the_same_output(self):
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        Lipsum.generate_lorem_ipsum(256),
+                        font_color=[X11Color.BLACK, X11Color.DARK_RED][i % 2],
+                    )
+                ]
+                for i in range(0, 4)
+            ],
+            where_to="test_pipeline_iter_pages.pdf",
+        )
+        for sink_type in [GetText, GetColors]:
+            output0: typing.Any = Pipeline([Source(), sink_type()]).process(d)
+            output1: typing.Any = dict(Pipeline([Source(), sink_type()]).iter_pages(d))
+            assert len(output0) == 4
+            assert output0 == output1
+
+    def test_iter_pages_drops_the_events_of_every_page(self):
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        Lipsum.generate_lorem_ipsum(256),
+                        font_color=[X11Color.BLACK, X11Color.DARK_RED][i % 2],
+                    )
+                ]
+                for i in range(0, 4)
+            ],
+            where_to="test_pipeline_iter_pages.pdf",
+        )
+        sink: GetText = GetText()
+        page_nrs: typing.List[int] = []
+        for page_nr, text in Pipeline([Source(), sink]).iter_pages(d):
+            page_nrs += [page_nr]
+            assert len(text) > 0
+            assert len(sink._GetText__events_per_page) == 0  # type: ignore[attr-defined]
+            assert len(sink._GetText__text_per_page) == 0  # type: ignore[attr-defined]
+        assert page_nrs == [0, 1, 2, 3]
+
+    def test_iter_pages_regex(self):
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        Lipsum.generate_lorem_ipsum(256),
+                        font_color=[X11Color.BLACK, X11Color.DARK_RED][i % 2],
+                    )
+                ]
+                for i in range(0, 4)
+            ],
+            where_to="test_pipeline_iter_pages.pdf",
+        )
+        output0: typing.Any = Pipeline([Source(), Regex("[Ll]orem")]).process(d)
+        output1: typing.Any = dict(
+            Pipeline([Source(), Regex("[Ll]orem")]).iter_pages(d)
+        )
+        assert [len(output0.get(k, [])) for k in range(0, 4)] == [
+            len(output1[k]) for k in range(0, 4)
+        ]
@@ -0,0 +1,131 @@
+import random
+import typing
+
+import PIL.Image  # type: ignore[import-untyped, import-not-found]
+
+from borb.pdf import (
+    Document,
+    Image,
+    Lipsum,
+    Paragraph,
+    X11Color,
+)
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_colors import GetColors
+from borb.pdf.toolkit.sink.get_images import GetImages
+from borb.pdf.toolkit.sink.get_keywords_by_pagewise_tf_idf import (
+    GetKeywordsByPagewiseTFIDF,
+)
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.regex import Regex
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestPipelineWorkers(TestCase):
+
+    def test_pipeline_workers_produce_the_same_output(self):
+        random.seed(0)
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        Lipsum.generate_lorem_ipsum(512),
+                        font_color=[X11Color.BLACK, X11Color.DARK_RED][i % 2],
+                    ),
+                    Image(
+                        PIL.Image.new("RGB", (32, 32), (i * 40, 0, 0)),
+                        size=(32, 32),
+                    ),
+                ]
+                for i in range(0, 6)
+            ],
+            where_to="test_pipeline_workers.pdf",
+        )
+        for sink_type in [GetText, GetColors, GetKeywordsByPagewiseTFIDF]:
+            output0: typing.Any = Pipeline([Source(), sink_type()]).process(d)
+            output1: typing.Any = Pipeline([Source(), sink_type()]).process(
+                d, workers=2
+            )
+            assert len(output0) > 0
+            assert output0 == output1
+
+    def test_pipeline_workers_only_return_their_current_batch(self):
+        random.seed(0)
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        Lipsum.generate_lorem_ipsum(512),
+                        font_color=[X11Color.BLACK, X11Color.DARK_RED][i % 2],
+                    ),
+                    Image(
+                        PIL.Image.new("RGB", (32, 32), (i * 40, 0, 0)),
+                        size=(32, 32),
+                    ),
+                ]
+                for i in range(0, 6)
+            ],
+            where_to="test_pipeline_workers.pdf",
+        )
+        pipeline: Pipeline = Pipeline([Source(), GetText()])
+        Pipeline._Pipeline__WORKER_STATE = (pipeline, d)  # type: ignore[attr-defined]
+        try:
+            partial_output_0: dict = Pipeline._process_pages_in_worker([0, 1])
+            partial_output_1: dict = Pipeline._process_pages_in_worker([2, 3])
+        finally:
+            Pipeline._Pipeline__WORKER_STATE = None  # type: ignore[attr-defined]
+        assert sorted(partial_output_0.keys()) == [0, 1]
+        assert sorted(partial_output_1.keys()) == [2, 3]
+
+    def test_pipeline_workers_get_images(self):
+        random.seed(0)
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        Lipsum.generate_lorem_ipsum(512),
+                        font_color=[X11Color.BLACK, X11Color.DARK_RED][i % 2],
+                    ),
+                    Image(
+                        PIL.Image.new("RGB", (32, 32), (i * 40, 0, 0)),
+                        size=(32, 32),
+                    ),
+                ]
+                for i in range(0, 6)
+            ],
+            where_to="test_pipeline_workers.pdf",
+        )
+        output0: typing.Any = Pipeline([Source(), GetImages()]).process(d)
+        output1: typing.Any = Pipeline([Source(), GetImages()]).process(d, workers=2)
+        assert sorted(output0.keys()) == sorted(output1.keys()) == list(range(0, 6))
+        for k in output0.keys():
+            assert [x.tobytes() for x in output0[k]] == [
+                x.tobytes() for x in output1[k]
+            ]
+
+    def test_pipeline_workers_fall_back_to_serial_processing(self):
+        random.seed(0)
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        Lipsum.generate_lorem_ipsum(512),
+                        font_color=[X11Color.BLACK, X11Color.DARK_RED][i % 2],
+                    ),
+                    Image(
+                        PIL.Image.new("RGB", (32, 32), (i * 40, 0, 0)),
+                        size=(32, 32),
+                    ),
+                ]
+                for i in range(0, 6)
+            ],
+            where_to="test_pipeline_workers.pdf",
+        )
+        output0: typing.Any = Pipeline([Source(), Regex("[Ll]orem")]).process(d)
+        output1: typing.Any = Pipeline([Source(), Regex("[Ll]orem")]).process(
+            d, workers=2
+        )
+        assert [len(output0[k]) for k in sorted(output0.keys())] == [
+            len(output1[k]) for k in sorted(output1.keys())
+        ]
@@ -0,0 +1,115 @@
+import typing
+
+import PIL.Image  # type: ignore[import-untyped, import-not-found]
+
+from borb.pdf import (
+    Document,
+    Image,
+    Paragraph,
+    X11Color,
+)
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.image_event import ImageEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestSourceEventTypes(TestCase):
+
+    class GetEventTypes(Sink):
+
+        def __init__(self):
+            super().__init__()
+            self.__event_types: typing.Set[str] = set()
+
+        def get_output(self) -> typing.Any:
+            return self.__event_types
+
+        def process(self, event: Event) -> None:
+            self.__event_types.add(event.__class__.__name__)
+
+    def test_source_produces_all_event_types_by_default(self):
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        "Hello World!",
+                        background_color=X11Color.YELLOW,
+                        border_color=X11Color.RED,
+                        border_width_top=1,
+                        border_width_right=1,
+                        border_width_bottom=1,
+                        border_width_left=1,
+                    ),
+                    Image(PIL.Image.new("RGB", (32, 32), (255, 0, 0)), size=(32, 32)),
+                ]
+            ],
+            where_to="test_source_event_types.pdf",
+        )
+        event_types: typing.Set[str] = Pipeline(
+            [Source(), TestSourceEventTypes.GetEventTypes()]
+        ).process(d)
+        assert event_types == {
+            "EndPageEvent",
+            "ImageEvent",
+            "ShapeFillEvent",
+            "ShapeStrokeEvent",
+            "TextEvent",
+        }
+
+    def test_source_produces_only_text_events(self):
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        "Hello World!",
+                        background_color=X11Color.YELLOW,
+                        border_color=X11Color.RED,
+                        border_width_top=1,
+                        border_width_right=1,
+                        border_width_bottom=1,
+                        border_width_left=1,
+                    ),
+                    Image(PIL.Image.new("RGB", (32, 32), (255, 0, 0)), size=(32, 32)),
+                ]
+            ],
+            where_to="test_source_event_types.pdf",
+        )
+        event_types: typing.Set[str] = Pipeline(
+            [Source(event_types=[TextEvent]), TestSourceEventTypes.GetEventTypes()]
+        ).process(d)
+        assert event_types == {"EndPageEvent", "TextEvent"}
+
+        # the text is the same
+        text0: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(d)
+        text1: typing.Dict[int, str] = Pipeline(
+            [Source(event_types=[TextEvent]), GetText()]
+        ).process(d)
+        assert text0 == text1 == {0: "Hello World!"}
+
+    def test_source_produces_only_image_events(self):
+        d: Document = TestCase.build_document(
+            [
+                [
+                    Paragraph(
+                        "Hello World!",
+                        background_color=X11Color.YELLOW,
+                        border_color=X11Color.RED,
+                        border_width_top=1,
+                        border_width_right=1,
+                        border_width_bottom=1,
+                        border_width_left=1,
+                    ),
+                    Image(PIL.Image.new("RGB", (32, 32), (255, 0, 0)), size=(32, 32)),
+                ]
+            ],
+            where_to="test_source_event_types.pdf",
+        )
+        event_types: typing.Set[str] = Pipeline(
+            [Source(event_types=[ImageEvent]), TestSourceEventTypes.GetEventTypes()]
+        ).process(d)
+        assert event_types == {"EndPageEvent", "ImageEvent"}
@@ -0,0 +1,74 @@
+import random
+import zlib
+
+from borb.pdf.visitor.read.compression.flate_decode import FlateDecode
+from tests.test_case import TestCase
+
+
+class TestFlateDecode(TestCase):
+
+    @staticmethod
+    def _png_encode(
+        raw: bytes, bytes_per_row: int, bytes_per_pixel: int, filter_type: int
+    ) -> bytes:
+        out: bytearray = bytearray()
+        prior_row: bytes = bytes(bytes_per_row)
+        for i in range(0, len(raw), bytes_per_row):
+            row: bytes = raw[i : i + bytes_per_row]
+            out += bytes([filter_type])
+            for j in range(0, bytes_per_row):
+                a: int = row[j - bytes_per_pixel] if j >= bytes_per_pixel else 0
+                b: int = prior_row[j]
+                c: int = prior_row[j - bytes_per_pixel] if j >= bytes_per_pixel else 0
+                p: int = a + b - c
+                paeth: int = (
+                    a
+                    if abs(p - a) <= abs(p - b) and abs(p - a) <= abs(p - c)
+                    else (b if abs(p - b) <= abs(p - c) else c)
+                )
+                out += bytes(
+                    [(row[j] - [0, a, b, (a + b) // 2, paeth][filter_type]) % 256]
+                )
+            prior_row = row
+        return zlib.compress(bytes(out))
+
+    def _test_png_predictor(self):
+        random.seed(0)
+        raw: bytes = bytes([random.randint(0, 255) for _ in range(0, 3 * 16 * 8)])
+        for filter_type in [0, 1, 2, 3, 4]:
+            assert (
+                FlateDecode.decode(
+                    TestFlateDecode._png_encode(
+                        raw,
+                        bytes_per_row=3 * 16,
+                        bytes_per_pixel=3,
+                        filter_type=filter_type,
+                    ),
+                    bits_per_component=8,
+                    colors=3,
+                    columns=16,
+                    predictor=15,
+                )
+                == raw
+            )
+
+    def _test_tiff_predictor(self):
+        # 2 colors, 4 bits per component, 3 columns
+        raw: bytes = bytes([0x12, 0x34, 0x56])
+        encoded: bytes = bytes([0x12, 0x22, 0x22])
+        assert (
+            FlateDecode.decode(
+                zlib.compress(encoded),
+                bits_per_component=4,
+                colors=2,
+                columns=3,
+                predictor=2,
+            )
+            == raw
+        )
+
+    def test_png_predictor(self):
+        self._test_png_predictor()
+
+    def test_tiff_predictor(self):
+        self._test_tiff_predictor()
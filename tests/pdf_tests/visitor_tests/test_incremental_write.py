@@ -0,0 +1,173 @@
+import shutil
+
+from borb.pdf import (
+    Paragraph,
+    Lipsum,
+    PDF,
+)
+from borb.pdf.primitives import name
+from tests.test_case import TestCase
+
+
+class TestIncrementalWrite(TestCase):
+
+    def test_incremental_write_to_same_file(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 5)]
+            ),
+            where_to=TestCase.get_assets_dir()
+            / "test_incremental_write_to_same_file.pdf",
+        )
+        with open(
+            TestCase.get_assets_dir() / "test_incremental_write_to_same_file.pdf", "rb"
+        ) as pdf_file_handle:
+            original_bytes: bytes = pdf_file_handle.read()
+
+        # read, modify, write
+        d = PDF.read(
+            TestCase.get_assets_dir() / "test_incremental_write_to_same_file.pdf"
+        )
+        d.get_page(2)[name("Rotate")] = 90
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_incremental_write_to_same_file.pdf",
+            incremental=True,
+        )
+
+        # check
+        with open(
+            TestCase.get_assets_dir() / "test_incremental_write_to_same_file.pdf", "rb"
+        ) as pdf_file_handle:
+            pdf_bytes: bytes = pdf_file_handle.read()
+        assert pdf_bytes.startswith(original_bytes)
+        assert len(pdf_bytes) - len(original_bytes) < 1024
+        assert b"/Prev" in pdf_bytes[len(original_bytes) :]
+
+        # read
+        d = PDF.read(
+            TestCase.get_assets_dir() / "test_incremental_write_to_same_file.pdf"
+        )
+        assert d.get_number_of_pages() == 5
+        assert d.get_page(2)["Rotate"] == 90
+        assert d.get_page(3)["Rotate"] == 0
+
+    def test_incremental_write_lazy_document(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 5)]
+            ),
+            where_to=TestCase.get_assets_dir()
+            / "test_incremental_write_lazy_document_001.pdf",
+        )
+        shutil.copy(
+            TestCase.get_assets_dir() / "test_incremental_write_lazy_document_001.pdf",
+            TestCase.get_assets_dir() / "test_incremental_write_lazy_document_002.pdf",
+        )
+
+        # read, modify, write
+        d = PDF.read(
+            TestCase.get_assets_dir() / "test_incremental_write_lazy_document_002.pdf",
+            lazy=True,
+        )
+        d.get_page(0)[name("Rotate")] = 180
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_incremental_write_lazy_document_003.pdf",
+            incremental=True,
+        )
+
+        # read
+        d = PDF.read(
+            TestCase.get_assets_dir() / "test_incremental_write_lazy_document_003.pdf"
+        )
+        assert d.get_number_of_pages() == 5
+        assert d.get_page(0)["Rotate"] == 180
+        assert d.get_page(1)["Rotate"] == 0
+
+    def test_incremental_write_without_modifications(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 5)]
+            ),
+            where_to=TestCase.get_assets_dir()
+            / "test_incremental_write_without_modifications_001.pdf",
+        )
+
+        # read, write
+        d = PDF.read(
+            TestCase.get_assets_dir()
+            / "test_incremental_write_without_modifications_001.pdf"
+        )
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_incremental_write_without_modifications_002.pdf",
+            incremental=True,
+        )
+
+        # read
+        d = PDF.read(
+            TestCase.get_assets_dir()
+            / "test_incremental_write_without_modifications_002.pdf"
+        )
+        assert d.get_number_of_pages() == 5
+
+    def test_incremental_write_object_streams(self):
+
+        # write (using object streams, and a cross-reference stream)
+        path = TestCase.get_assets_dir() / "test_incremental_write_object_streams.pdf"
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 5)]
+            ),
+            where_to=path,
+            use_object_streams=True,
+        )
+        with open(path, "rb") as pdf_file_handle:
+            original_bytes: bytes = pdf_file_handle.read()
+
+        # read, modify, write (twice)
+        d = PDF.read(path)
+        root = d["Trailer"]["Root"]
+        d.get_page(2)[name("Rotate")] = 90
+        PDF.write(what=d, where_to=path, incremental=True)
+        with open(path, "rb") as pdf_file_handle:
+            first_update_bytes: bytes = pdf_file_handle.read()
+        d.get_page(3)[name("Rotate")] = 180
+        PDF.write(what=d, where_to=path, incremental=True)
+        with open(path, "rb") as pdf_file_handle:
+            pdf_bytes: bytes = pdf_file_handle.read()
+
+        # the XRef of the Document still points to the same objects
+        assert d["Trailer"]["Root"] is root
+        assert any([x.get_referenced_object() is root for x in d["XRef"]])
+
+        # the updates end in a cross-reference stream, pointing back to the previous one
+        assert pdf_bytes.startswith(first_update_bytes)
+        assert first_update_bytes.startswith(original_bytes)
+        for previous_bytes, update_bytes in [
+            (original_bytes, first_update_bytes[len(original_bytes) :]),
+            (first_update_bytes, pdf_bytes[len(first_update_bytes) :]),
+        ]:
+            assert b"trailer" not in update_bytes
+            assert b"/Type /XRef" in update_bytes
+            previous_startxref: int = int(
+                previous_bytes.split(b"startxref")[-1].split(b"%%EOF")[0].strip()
+            )
+            assert f"/Prev {previous_startxref} ".encode() in update_bytes
+
+        # read
+        d = PDF.read(path)
+        assert d.get_number_of_pages() == 5
+        assert d.get_page(2)["Rotate"] == 90
+        assert d.get_page(3)["Rotate"] == 180
+        assert d.get_page(4)["Rotate"] == 0
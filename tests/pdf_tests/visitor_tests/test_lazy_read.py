@@ -0,0 +1,190 @@
+import typing
+
+from borb.pdf import (
+    Document,
+    Page,
+    Paragraph,
+    Lipsum,
+    PDF,
+)
+from borb.pdf.lazy_dict import LazyDict
+from borb.pdf.primitives import reference
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestLazyRead(TestCase):
+
+    def test_lazy_read_get_page(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 10)]
+            ),
+            where_to=TestCase.get_assets_dir() / "test_lazy_read_get_page.pdf",
+        )
+
+        # read (lazily)
+        d: Document = PDF.read(
+            TestCase.get_assets_dir() / "test_lazy_read_get_page.pdf", lazy=True
+        )
+        assert d.is_lazy()
+        assert d.get_number_of_pages() == 10
+
+        # the page is linked to the Document, and resolves its own keys
+        p: Page = d.get_page(0)
+        assert p.get_document() is d
+        assert p.get_size() == (595, 842)
+        assert len(p["Contents"]["Bytes"]) > 0
+
+    def test_lazy_read_matches_eager_read(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 5)]
+            ),
+            where_to=TestCase.get_assets_dir()
+            / "test_lazy_read_matches_eager_read.pdf",
+        )
+
+        # read
+        d0: Document = PDF.read(
+            TestCase.get_assets_dir() / "test_lazy_read_matches_eager_read.pdf"
+        )
+        d1: Document = PDF.read(
+            TestCase.get_assets_dir() / "test_lazy_read_matches_eager_read.pdf",
+            lazy=True,
+        )
+
+        # compare text
+        text0: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(d0)
+        text1: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(d1)
+        assert text0 == text1
+
+    def test_lazy_read_does_not_resolve_untouched_pages(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 3)]
+            ),
+            where_to=TestCase.get_assets_dir()
+            / "test_lazy_read_does_not_resolve_untouched_pages.pdf",
+        )
+
+        # read (lazily)
+        d: Document = PDF.read(
+            TestCase.get_assets_dir()
+            / "test_lazy_read_does_not_resolve_untouched_pages.pdf",
+            lazy=True,
+        )
+
+        # touch the first Page
+        assert len(d.get_page(0)["Contents"]["Bytes"]) > 0
+
+        # the other Page objects still hold (unresolved) references
+        for i in [1, 2]:
+            assert any([isinstance(v, reference) for v in dict.values(d.get_page(i))])
+
+    def test_lazy_read_dict_methods_resolve_values(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 4)]
+            ),
+            where_to=TestCase.get_assets_dir()
+            / "test_lazy_read_dict_methods_resolve_values.pdf",
+        )
+
+        # read (lazily)
+        d: Document = PDF.read(
+            TestCase.get_assets_dir()
+            / "test_lazy_read_dict_methods_resolve_values.pdf",
+            lazy=True,
+        )
+
+        # values()
+        assert not any([isinstance(v, reference) for v in d.get_page(0).values()])
+
+        # dict(...)
+        assert not any([isinstance(v, reference) for v in dict(d.get_page(1)).values()])
+
+        # pop(...), setdefault(...)
+        p: Page = d.get_page(2)
+        assert isinstance(dict.__getitem__(p, "Contents"), reference)
+        assert not isinstance(p.setdefault("Contents", None), reference)
+        p = d.get_page(3)
+        assert isinstance(dict.__getitem__(p, "Contents"), reference)
+        assert not isinstance(p.pop("Contents"), reference)
+
+    def test_lazy_read_write_calls_before_write(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 2)]
+            ),
+            where_to=TestCase.get_assets_dir()
+            / "test_lazy_read_write_calls_before_write.pdf",
+        )
+
+        # read (lazily)
+        d: Document = PDF.read(
+            TestCase.get_assets_dir() / "test_lazy_read_write_calls_before_write.pdf",
+            lazy=True,
+        )
+        assert d.is_lazy()
+
+        # every Page (e.g. a TableOfContents) is finished before a lazy Document is written
+        before_write_calls: typing.List[int] = []
+        for i in range(0, 2):
+            d.get_page(i)._before_write = lambda: before_write_calls.append(1)  # type: ignore[method-assign]
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_lazy_read_write_calls_before_write_out.pdf",
+        )
+        assert len(before_write_calls) == 2
+
+    def test_lazy_read_only_lazy_while_attached(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 2)]
+            ),
+            where_to=TestCase.get_assets_dir()
+            / "test_lazy_read_only_lazy_while_attached.pdf",
+        )
+
+        # read (eagerly)
+        d: Document = PDF.read(
+            TestCase.get_assets_dir() / "test_lazy_read_only_lazy_while_attached.pdf"
+        )
+        assert not d.is_lazy()
+        assert type(d) is Document
+        assert type(d.get_page(0)) is Page
+
+        # read (lazily)
+        d = PDF.read(
+            TestCase.get_assets_dir() / "test_lazy_read_only_lazy_while_attached.pdf",
+            lazy=True,
+        )
+        assert d.is_lazy()
+        assert isinstance(d, LazyDict)
+        assert isinstance(d.get_page(0), LazyDict)
+
+        # write (which resolves, and detaches from, the Document)
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_lazy_read_only_lazy_while_attached_out.pdf",
+        )
+        assert not d.is_lazy()
+        assert type(d) is Document
+        assert type(d.get_page(0)) is Page
@@ -0,0 +1,77 @@
+import gc
+import mmap
+
+from borb.pdf import (
+    Paragraph,
+    Lipsum,
+    PDF,
+)
+from borb.pdf.primitives import name
+from tests.test_case import TestCase
+
+
+class TestReadMemoryMap(TestCase):
+
+    def test_read_releases_memory_map(self):
+        path = TestCase.get_assets_dir() / "test_read_releases_memory_map_001.pdf"
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 3)]
+            ),
+            where_to=path,
+        )
+
+        # read
+        d = PDF.read(path)
+        assert d is not None
+        assert d.get_number_of_pages() == 3
+        assert d._Document__source is None  # type: ignore[attr-defined]
+
+        # the file is re-opened to write an incremental update
+        d.get_page(1)[name("Rotate")] = 90
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_read_releases_memory_map_002.pdf",
+            incremental=True,
+        )
+        d = PDF.read(
+            TestCase.get_assets_dir() / "test_read_releases_memory_map_002.pdf"
+        )
+        assert d is not None
+        assert d.get_number_of_pages() == 3
+        assert d.get_page(1)["Rotate"] == 90
+
+        # the file can be overwritten (it is no longer mapped)
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 3)]
+            ),
+            where_to=path,
+        )
+
+    def test_read_lazy_keeps_memory_map_until_document_is_collected(self):
+        path = (
+            TestCase.get_assets_dir()
+            / "test_read_lazy_keeps_memory_map_until_document_is_collected.pdf"
+        )
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(256))] for _ in range(0, 3)]
+            ),
+            where_to=path,
+        )
+
+        # read
+        d = PDF.read(path, lazy=True)
+        assert d is not None
+        m = d._Document__source  # type: ignore[attr-defined]
+        assert isinstance(m, mmap.mmap)
+        assert not m.closed
+        assert d.get_number_of_pages() == 3
+        assert "Contents" in d.get_page(2)
+
+        # collect
+        del d
+        gc.collect()
+        assert m.closed
@@ -0,0 +1,48 @@
+import io
+
+from borb.pdf import (
+    Document,
+    Page,
+    PageLayout,
+    SingleColumnLayout,
+    Paragraph,
+    Lipsum,
+    PDF,
+)
+from tests.test_case import TestCase
+
+
+class TestStreamingWrite(TestCase):
+
+    def test_write_to_file_handle(self):
+
+        # write
+        d: Document = Document()
+        for _ in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(256)))
+        with open(
+            TestCase.get_assets_dir() / "test_write_to_file_handle.pdf", "wb"
+        ) as pdf_file_handle:
+            PDF.write(what=d, where_to=pdf_file_handle)
+
+        # read
+        d = PDF.read(TestCase.get_assets_dir() / "test_write_to_file_handle.pdf")
+        assert d.get_number_of_pages() == 10
+
+    def test_write_to_bytes_io(self):
+
+        # write
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(256)))
+        bytes_io: io.BytesIO = io.BytesIO()
+        PDF.write(what=d, where_to=bytes_io)
+
+        # check
+        assert bytes_io.getvalue().startswith(b"%PDF-")
+        assert bytes_io.getvalue().rstrip().endswith(b"%%EOF")
@@ -0,0 +1,81 @@
+import typing
+
+from borb.pdf import (
+    Document,
+    Paragraph,
+    Lipsum,
+    PDF,
+)
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestWriteCompression(TestCase):
+
+    def test_write_compression_level(self):
+
+        # write
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(1024))] for _ in range(0, 10)]
+            ),
+            where_to=TestCase.get_assets_dir() / "test_write_compression_level_001.pdf",
+            compression_level=0,
+        )
+        PDF.write(
+            what=TestCase.build_document(
+                [[Paragraph(Lipsum.generate_lorem_ipsum(1024))] for _ in range(0, 10)]
+            ),
+            where_to=TestCase.get_assets_dir() / "test_write_compression_level_002.pdf",
+            compression_level=9,
+        )
+
+        # check
+        assert (
+            TestCase.get_assets_dir() / "test_write_compression_level_001.pdf"
+        ).stat().st_size > (
+            TestCase.get_assets_dir() / "test_write_compression_level_002.pdf"
+        ).stat().st_size
+
+        # read
+        d = PDF.read(TestCase.get_assets_dir() / "test_write_compression_level_001.pdf")
+        assert d.get_number_of_pages() == 10
+        text: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(d)
+        assert len(text[9]) > 0
+
+    def test_write_compression_threads(self):
+
+        # write
+        d: Document = TestCase.build_document(
+            [[Paragraph(Lipsum.generate_lorem_ipsum(1024))] for _ in range(0, 10)]
+        )
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_write_compression_threads_001.pdf",
+            compression_threads=1,
+        )
+        d = TestCase.build_document(
+            [[Paragraph(Lipsum.generate_lorem_ipsum(1024))] for _ in range(0, 10)]
+        )
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir()
+            / "test_write_compression_threads_002.pdf",
+            compression_threads=4,
+        )
+
+        # read
+        text_001: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(
+            PDF.read(
+                TestCase.get_assets_dir() / "test_write_compression_threads_001.pdf"
+            )
+        )
+        text_002: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(
+            PDF.read(
+                TestCase.get_assets_dir() / "test_write_compression_threads_002.pdf"
+            )
+        )
+        assert len(text_001) == len(text_002) == 10
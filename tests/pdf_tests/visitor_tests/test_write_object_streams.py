@@ -0,0 +1,48 @@
+import typing
+
+from borb.pdf import (
+    Document,
+    Page,
+    PageLayout,
+    SingleColumnLayout,
+    Paragraph,
+    Lipsum,
+    PDF,
+)
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+from tests.test_case import TestCase
+
+
+class TestWriteObjectStreams(TestCase):
+
+    def test_write_object_streams(self):
+
+        # write
+        d: Document = Document()
+        for _ in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(256)))
+        PDF.write(
+            what=d,
+            where_to=TestCase.get_assets_dir() / "test_write_object_streams.pdf",
+            use_object_streams=True,
+        )
+
+        # check
+        with open(
+            TestCase.get_assets_dir() / "test_write_object_streams.pdf", "rb"
+        ) as pdf_file_handle:
+            pdf_bytes: bytes = pdf_file_handle.read()
+        assert b"/ObjStm" in pdf_bytes
+        assert b"/XRef" in pdf_bytes
+        assert b"\nxref\n" not in pdf_bytes
+
+        # read
+        d = PDF.read(TestCase.get_assets_dir() / "test_write_object_streams.pdf")
+        assert d.get_number_of_pages() == 10
+        text: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(d)
+        assert len(text[9]) > 0
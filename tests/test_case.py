@@ -2,7 +2,14 @@ import pathlib
 import typing
 import unittest
 
-from borb.pdf import Document, PDF
+from borb.pdf import (
+    Document,
+    LayoutElement,
+    Page,
+    PageLayout,
+    PDF,
+    SingleColumnLayout,
+)
 from tests.pdf_tests.visual_assert import VisualAssert
 
 
@@ -20,6 +27,32 @@ class TestCase(unittest.TestCase):
     # PUBLIC
     #
 
+    @staticmethod
+    def build_document(
+        layout_elements_per_page: typing.List[typing.List[LayoutElement]],
+        where_to: typing.Optional[str] = None,
+    ) -> Document:
+
+        # build
+        d: Document = Document()
+        for layout_elements in layout_elements_per_page:
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            for e in layout_elements:
+                l.append_layout_element(e)
+
+        # IF the Document does not need to be written
+        # THEN return it
+        if where_to is None:
+            return d
+
+        # write, read
+        TestCase.write(what=d, where_to=where_to)
+        d2: typing.Optional[Document] = TestCase.read(where_to)
+        assert d2 is not None
+        return d2
+
     @staticmethod
     def get_assets_dir() -> pathlib.Path:
         return TestCase.get_project_dir() / "tests" / "assets"